@@ -16,6 +16,7 @@ from .core.Dendrite import Dendrite
 from .core.Random import Uniform, DiscreteUniform, Normal, LogNormal, Gamma, Exponential
 from .core.IO import save, load, load_parameter, load_parameters, save_parameters
 from .core.Utils import sparse_random_matrix
+from .core.Timings import compile_timings
 from .core.Monitor import Monitor, raster_plot, histogram, population_rate, smoothed_rate, mean_fr
 from .core.Network import Network, parallel_run
 from .parser.report.Report import report
@@ -36,7 +37,7 @@ Warning: Cython modules can not be imported. If you are installing ANNarchy, thi
 """)
 
 # ANNarchy compilation
-from .generator import compile
+from .generator import compile, check_rebuild
 
 # Automatically call ANNarchy.core.Global.clear()
 # if the script terminates
@@ -0,0 +1,310 @@
+#===============================================================================
+#
+#     ConnectivityCache.py
+#
+#     This file is part of ANNarchy.
+#
+#     Copyright (C) 2013-2022  Julien Vitay <julien.vitay@gmail.com>,
+#     Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     ANNarchy is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#===============================================================================
+import os
+import json
+import time
+import pickle
+import hashlib
+import tempfile
+
+import numpy as np
+
+import ANNarchy
+import ANNarchy.core.Global as Global
+from ANNarchy.core.Random import RandomDistribution
+from ANNarchy.core.PopulationView import PopulationView
+from ANNarchy.core.IO import _save_connectivity_binary, _load_connectivity_binary
+
+try:
+    import fcntl
+except ImportError:
+    # e. g. Windows, concurrent eviction is then not synchronized
+    fcntl = None
+
+# Default settings, can be overwritten by the "cache" section in annarchy.json
+_default_cache_config = {
+    'path': "~/.cache/ANNarchy",
+    'connectivity_max_size': 1024,  # in MB
+}
+
+class ConnectivityCache(object):
+    """
+    User-level cache for the connectivity generated by the pre-defined patterns
+    (``setup(connectivity_cache=True)``), shared across processes.
+
+    An entry is addressed by a hash over the connector name and arguments, the
+    geometry and ranks of the pre- and post-synaptic populations, dt, the seed
+    and the state of numpy's random generator before the generation. The
+    connectivity is stored in the binary format of ``save_connectivity()``
+    (extension .ann) together with the state of the generator after the
+    generation, which is restored when the entry is used. A network using the
+    cache therefore draws the same random numbers as without cache.
+
+    The cache is only used if a seed is set. Entries are inserted atomically
+    (write to a temporary file, then rename). If the total size exceeds
+    "connectivity_max_size" (in MB, "cache" section of annarchy.json), the least
+    recently used entries are removed, the eviction is serialized by a lock file.
+    """
+    def __init__(self, user_config=None):
+        """
+        :param user_config: content of annarchy.json, by default read from ~/.config/ANNarchy/annarchy.json.
+        """
+        if user_config is None:
+            user_config = self._read_user_config()
+
+        config = dict(_default_cache_config)
+        if 'cache' in user_config.keys():
+            config.update(user_config['cache'])
+
+        self.path = os.path.expanduser(config['path'])
+        self.max_size = float(config['connectivity_max_size']) * 1024 * 1024
+        self._entry_dir = self.path + '/connectivity'
+
+    @staticmethod
+    def _read_user_config():
+        json_path = os.path.expanduser('~/.config/ANNarchy/annarchy.json')
+        try:
+            with open(json_path, 'r') as rfile:
+                user_config = json.load(rfile)
+        except (OSError, ValueError):
+            return {}
+        return user_config if isinstance(user_config, dict) else {}
+
+    @staticmethod
+    def cacheable(proj):
+        "Only the patterns of cython_ext.Connector with a fixed seed are cached."
+        if Global.config['seed'] == -1:
+            return False
+        return getattr(proj._connection_method, '__module__', None) == 'ANNarchy.core.cython_ext.Connector'
+
+    @staticmethod
+    def compute_key(proj):
+        """
+        Hash over the connector, its arguments, the populations, dt, the seed and
+        the current state of numpy's random generator.
+        """
+        key = hashlib.sha256()
+        def add(item):
+            key.update((repr(item) + ';').encode('utf-8'))
+
+        add(ANNarchy.__release__)
+        add(proj.connector_name)
+        add(getattr(proj._connection_method, '__name__', None))
+        for arg in proj._connection_args:
+            add(_argument_key(arg))
+
+        for pop in [proj.pre, proj.post]:
+            population = pop.population if isinstance(pop, PopulationView) else pop
+            add(population.geometry)
+            key.update(np.ascontiguousarray(pop.ranks, dtype=np.int64).tobytes())
+
+        add(Global.config['dt'])
+        add(Global.config['seed'])
+        # the parallel generation draws from other streams
+        add(Global.config['connectivity_threads'] is None)
+
+        state = np.random.get_state()
+        add(state[0])
+        key.update(np.ascontiguousarray(state[1]).tobytes())
+        add(state[2:])
+
+        return key.hexdigest()
+
+    def generate(self, proj):
+        """
+        Returns the connectivity of the projection, loaded from the cache if
+        available, otherwise generated by the connector method and stored.
+        """
+        if not self.cacheable(proj):
+            return proj._connection_method(*((proj.pre, proj.post,) + proj._connection_args))
+
+        key = self.compute_key(proj)
+        synapses = self.lookup(key)
+        if synapses is not None:
+            Global._debug('ConnectivityCache: connectivity of', proj.name, 'loaded from the cache.')
+            return synapses
+
+        synapses = proj._connection_method(*((proj.pre, proj.post,) + proj._connection_args))
+        self.store(key, synapses)
+        return synapses
+
+    def _entry_path(self, key):
+        return self._entry_dir + '/' + key
+
+    def lookup(self, key):
+        """
+        Loads the entry and restores the state of numpy's random generator.
+
+        :return: a CSRConnectivity, None if the entry does not exist.
+        """
+        from ANNarchy.core.cython_ext import CSRConnectivity
+
+        entry = self._entry_path(key)
+        try:
+            with open(entry + '.rng', 'rb') as rfile:
+                state = pickle.load(rfile)
+            data = _load_connectivity_binary(entry + '.ann')
+
+            synapses = CSRConnectivity()
+            delay = data['delay'] if data['nb_delays'] > 0 else max(data['uniform_delay'], 0)
+            synapses.from_arrays(data['post_ranks'], data['row_ptr'], data['col_idx'], data['w'], delay, True)
+
+            # mark the entry as recently used (the precise clock, file writes use a coarser one)
+            now = time.time_ns()
+            os.utime(entry + '.ann', ns=(now, now))
+        except Exception as e:
+            # does not exist, evicted by another process in the meantime or corrupted
+            Global._debug('ConnectivityCache.lookup():', e)
+            return None
+
+        np.random.set_state(state)
+        return synapses
+
+    def store(self, key, synapses):
+        """
+        Inserts the connectivity (only CSRConnectivity) together with the current
+        state of numpy's random generator and applies the eviction policy.
+        """
+        from ANNarchy.core.cython_ext import CSRConnectivity
+        if not isinstance(synapses, CSRConnectivity):
+            return
+
+        post_ranks, row_ptr, col_idx, values, delays = synapses.to_arrays()
+        data = {
+            'post_ranks': post_ranks,
+            'row_ptr': row_ptr,
+            'col_idx': col_idx,
+            'w': values,
+            'delay': delays,
+            'max_delay': synapses.max_delay,
+            'uniform_delay': synapses.uniform_delay,
+            'dt': Global.config['dt']
+        }
+
+        entry = self._entry_path(key)
+        tmp_paths = []
+        try:
+            os.makedirs(self._entry_dir, exist_ok=True)
+
+            # the state is renamed first, an entry is only complete with its .ann file
+            fd, tmp_path = tempfile.mkstemp(dir=self._entry_dir, suffix='.tmp')
+            tmp_paths.append(tmp_path)
+            with os.fdopen(fd, 'wb') as wfile:
+                pickle.dump(np.random.get_state(), wfile)
+
+            fd, tmp_path = tempfile.mkstemp(dir=self._entry_dir, suffix='.tmp')
+            tmp_paths.append(tmp_path)
+            os.close(fd)
+            _save_connectivity_binary(tmp_path, data)
+
+            # rename is atomic on POSIX systems
+            os.replace(tmp_paths[0], entry + '.rng')
+            os.replace(tmp_paths[1], entry + '.ann')
+            tmp_paths = []
+        except OSError as e:
+            Global._debug('ConnectivityCache.store():', e)
+            return
+        finally:
+            for tmp_path in tmp_paths:
+                self._remove(tmp_path)
+
+        self.evict()
+
+    def evict(self):
+        """
+        Removes the least recently used entries until the cache is smaller than *max_size*.
+        """
+        with open(self.path + '/.connectivity.lock', 'w') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+            try:
+                now = time.time()
+                entries = {}
+                for fname in os.listdir(self._entry_dir):
+                    path = self._entry_dir + '/' + fname
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+
+                    # left-overs of crashed insertions
+                    if fname.endswith('.tmp'):
+                        if now - stat.st_mtime > 3600:
+                            self._remove(path)
+                        continue
+
+                    key, extension = os.path.splitext(fname)
+                    mtime, size = entries.get(key, (0.0, 0))
+                    if extension == '.ann':
+                        mtime = stat.st_mtime
+                    entries[key] = (mtime, size + stat.st_size)
+
+                total_size = sum([size for _, size in entries.values()])
+                for mtime, size, key in sorted([(mtime, size, key) for key, (mtime, size) in entries.items()]):
+                    if total_size <= self.max_size:
+                        break
+                    self._remove(self._entry_path(key) + '.ann')
+                    self._remove(self._entry_path(key) + '.rng')
+                    total_size -= size
+
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def size_in_bytes(self):
+        "Returns the current size of all cached entries."
+        size = 0
+        if not os.path.isdir(self._entry_dir):
+            return size
+        for fname in os.listdir(self._entry_dir):
+            try:
+                size += os.stat(self._entry_dir + '/' + fname).st_size
+            except OSError:
+                continue
+        return size
+
+    def clear(self):
+        "Removes all entries."
+        if not os.path.isdir(self._entry_dir):
+            return
+        for fname in os.listdir(self._entry_dir):
+            self._remove(self._entry_dir + '/' + fname)
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+def _argument_key(arg):
+    "Representation of a connector argument which does not depend on the object identity."
+    if isinstance(arg, RandomDistribution):
+        return (type(arg).__name__, sorted((name, repr(value)) for name, value in vars(arg).items() if isinstance(value, (int, float, str, bool, type(None)))))
+    elif isinstance(arg, (list, tuple)):
+        return tuple(_argument_key(a) for a in arg)
+    elif isinstance(arg, np.ndarray):
+        return (str(arg.dtype), arg.shape, hashlib.sha256(np.ascontiguousarray(arg).tobytes()).hexdigest())
+    return repr(arg)
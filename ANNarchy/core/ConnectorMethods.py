@@ -26,13 +26,32 @@ import numpy as np
 from ANNarchy.core import Global
 from ANNarchy.core.Random import RandomDistribution, DiscreteUniform
 from ANNarchy.core.PopulationView import PopulationView
-from ANNarchy.parser.report.LatexParser import _process_random
 
 try:
     from ANNarchy.core.cython_ext import *
 except Exception as e:
     Global._print(e)
 
+def _validation_message(report):
+    "Summary of the report returned by LILConnectivity.validate()."
+    errors = []
+    if report['duplicate_synapses'] > 0:
+        errors.append(str(report['duplicate_synapses']) + ' synapses declared multiple times')
+    if report['invalid_pre_ranks'] > 0:
+        errors.append(str(report['invalid_pre_ranks']) + ' pre-synaptic ranks outside of the population')
+    if report['invalid_post_ranks'] > 0:
+        errors.append(str(report['invalid_post_ranks']) + ' post-synaptic ranks outside of the population')
+    if report['duplicate_rows'] > 0 and len(errors) == 0:
+        errors.append(str(report['duplicate_rows']) + ' post-synaptic neurons added several times')
+    return ', '.join(errors) + ' (post-synaptic neurons ' + str(report['faulty_rows'])[1:-1] + ('...' if len(report['faulty_rows']) == 10 else '') + ').'
+
+def _process_random(val):
+    "Transforms a connector attribute (weights, delays) into a string representation"
+    if isinstance(val, RandomDistribution):
+        return val.latex()
+    else:
+        return str(val)
+
 ################################
 ## Connector methods
 ################################
@@ -43,7 +62,7 @@ def connect_one_to_one(self, weights=1.0, delays=0.0, force_multiple_weights=Fal
     :param weights: initial synaptic values, either a single value (float) or a random distribution object.
     :param delays: synaptic delays, either a single value or a random distribution object (default=dt).
     :param force_multiple_weights: if a single value is provided for ``weights`` and there is no learning, a single weight value will be used for the whole projection instead of one per synapse. Setting ``force_multiple_weights`` to True ensures that a value per synapse will be used.
-    :param storage_format: for some of the default connection patterns, ANNarchy provide different storage formats. For one-to-one we support list-of-list ("lil") or compressed sparse row ("csr"), by default lil is chosen.
+    :param storage_format: for some of the default connection patterns, ANNarchy provide different storage formats. For one-to-one we support list-of-list ("lil"), compressed sparse row ("csr") or a dense matrix ("dense"), by default lil is chosen.
     :param storage_order: for some of the available storage formats, ANNarchy provides different storage orderings. For one-to-one we support *pre_to_post* and *post_to_pre*, by default *post_to_pre* is chosen.
     """
     if self.pre.size != self.post.size:
@@ -56,9 +75,6 @@ def connect_one_to_one(self, weights=1.0, delays=0.0, force_multiple_weights=Fal
     if isinstance(weights, (int, float)) and not force_multiple_weights:
         self._single_constant_weight = True
 
-    if storage_format == "dense":
-        Global._error("The usage of 'dense' storage format on one-to-one pattern is not allowed.")
-
     # if weights or delays are from random distribution I need to know this in code generator
     self.connector_weight_dist = weights if isinstance(weights, RandomDistribution) else None
     self.connector_delay_dist = delays if isinstance(delays, RandomDistribution) else None
@@ -259,7 +275,9 @@ def connect_with_func(self, method, storage_format=None, storage_order=None, **a
     """
     # Invoke the method directly, we need the delays already....
     synapses = method(self.pre, self.post, **args)
-    synapses.validate()
+    report = synapses.validate(self.pre.ranks, self.post.ranks)
+    if not report['valid']:
+        Global._error('connect_with_func(): the connectivity returned by', method.__name__, 'is not valid:', _validation_message(report))
 
     # Treat delays
     if synapses.uniform_delay != -1: # uniform delay
@@ -276,36 +294,107 @@ def connect_with_func(self, method, storage_format=None, storage_order=None, **a
     self.connector_description = "Created by the method " + method.__name__
     return self
 
+def connect_from_chunks(self, chunks, delays=0.0, nb_synapses=None, storage_format=None, storage_order=None):
+    """
+    Builds the connectivity from blocks of synapses, e. g. produced by a generator reading a file piece by piece or computing the synapses of a subset of the post-synaptic neurons.
+
+    The blocks are appended to contiguous arrays, contrary to ``connect_with_func()`` or ``connect_from_matrix()`` no intermediate structure holding the whole projection is created on the Python side. The memory required during the construction is the size of the final connectivity plus the size of the largest block.
+
+    Each block is a tuple ``(post_ranks, pre_ranks, weights)`` or ``(post_ranks, pre_ranks, weights, delays)`` of 1D arrays with one entry per synapse (delays in ms). ``weights`` can also be a single value. All synapses of a post-synaptic neuron must be contained in the same block, the order of the synapses inside a block does not matter.
+
+    Example:
+
+    ```python
+    def blocks(pre, post, nb_rows):
+        for start in range(0, post.size, nb_rows):
+            post_ranks = np.repeat(np.arange(start, min(start + nb_rows, post.size)), 10)
+            pre_ranks = np.random.randint(0, pre.size, post_ranks.size)
+            ...
+            yield post_ranks, pre_ranks, np.random.uniform(0.0, 1.0, post_ranks.size)
+
+    proj.connect_from_chunks(blocks(pop1, pop2, 1000))
+    ```
+
+    :param chunks: iterable (e. g. a generator) providing the blocks.
+    :param delays: delay of the synapses (in ms) if the blocks contain no delays.
+    :param nb_synapses: expected total number of synapses (optional), the arrays are then allocated only once.
+    """
+    if isinstance(delays, RandomDistribution):
+        Global._error('connect_from_chunks(): random delays must be provided by the blocks.')
+
+    synapses = CSRConnectivity()
+    if nb_synapses is not None:
+        synapses.reserve(nb_synapses)
+
+    # Post-synaptic neurons already contained in a previous block
+    stored = np.zeros(self.post.size, dtype=bool)
+
+    for idx, chunk in enumerate(chunks):
+        if len(chunk) not in [3, 4]:
+            Global._error('connect_from_chunks(): each block must be a tuple (post_ranks, pre_ranks, weights[, delays]).')
+
+        post_ranks = np.asarray(chunk[0], dtype=np.int64).ravel()
+        pre_ranks = np.asarray(chunk[1], dtype=np.int64).ravel()
+        weights = np.broadcast_to(np.asarray(chunk[2], dtype=np.float64), post_ranks.shape) if np.ndim(chunk[2]) == 0 else np.asarray(chunk[2], dtype=np.float64).ravel()
+        chunk_delays = np.asarray(chunk[3], dtype=np.float64).ravel() if len(chunk) == 4 else float(delays)
+
+        if pre_ranks.size != post_ranks.size or weights.size != post_ranks.size or (len(chunk) == 4 and chunk_delays.size != post_ranks.size):
+            Global._error('connect_from_chunks(): the arrays of block', idx, 'have different sizes.')
+        if post_ranks.size == 0:
+            continue
+        if post_ranks.min() < 0 or post_ranks.max() >= self.post.size or pre_ranks.min() < 0 or pre_ranks.max() >= self.pre.size:
+            Global._error('connect_from_chunks(): block', idx, 'contains ranks outside of the populations.')
+
+        # Sort the synapses by post- then pre-synaptic rank
+        order = np.lexsort((pre_ranks, post_ranks))
+        post_ranks = post_ranks[order]
+        pre_ranks = pre_ranks[order]
+        if np.any((post_ranks[1:] == post_ranks[:-1]) & (pre_ranks[1:] == pre_ranks[:-1])):
+            Global._error('connect_from_chunks(): the same synapse has been declared multiple times in block', idx, '.')
+        rows, row_lengths = np.unique(post_ranks, return_counts=True)
+        if np.any(stored[rows]):
+            Global._error('connect_from_chunks(): the synapses of a post-synaptic neuron are spread over several blocks (block', idx, ').')
+        stored[rows] = True
+
+        row_ptr = np.zeros(rows.size + 1, dtype=np.uint64)
+        np.cumsum(row_lengths, out=row_ptr[1:])
+        if len(chunk) == 4:
+            chunk_delays = chunk_delays[order]
+
+        synapses.append_arrays(rows, row_ptr, pre_ranks, weights[order], chunk_delays)
+
+    self.connector_name = "From Chunks"
+    self.connector_description = "From Chunks"
+
+    dt = Global.config['dt']
+    connection_delay = synapses.uniform_delay * dt if synapses.uniform_delay != -1 else [[synapses.max_delay * dt]]
+    self._store_connectivity(self._load_from_lil, (synapses,), connection_delay, storage_format=storage_format, storage_order=storage_order)
+
+    return self
+
 def connect_from_matrix_market(self, filename, storage_format=None, storage_order=None):
     """
     Read in a weight matrix encoded in the Matrix Market format. This connector is intended for benchmarking purposes.
 
-    TODO: check if the routine works for empty rows!
+    The rows of the matrix correspond to the post-synaptic neurons, the columns to the pre-synaptic ones. Sparse matrices (coordinate format) are parsed in parallel by ``connectivity_threads`` threads (all available cores if not set), see ``load_matrix_market()`` in cython_ext.Connector.
     """
-    from scipy.io import mmread
-    from scipy.sparse import coo_matrix
-    import tarfile
-
-    from ANNarchy.core.cython_ext import LILConnectivity
     if not filename.endswith(".mtx"):
         raise ValueError("connect_from_matrix_market(): expected .mtx file.")
 
-    # read with SciPy
-    tmp = mmread(filename)
+    self.connector_name = "MatrixMarket"
+    self.connector_description = "A weight matrix load from .mtx file"
 
-    # scipy should return a coo_matrix in case of sparse matrices
-    if isinstance(tmp, coo_matrix):
-        # transform into LIL (in place)
-        tmp = tmp.tolil(copy=True)
+    synapses = load_matrix_market(filename, self.pre.ranks, self.post.ranks)
+    if synapses is not None:
+        self._store_connectivity(self._load_from_lil, (synapses, ), 0, storage_format=storage_format, storage_order=storage_order)
+        return self
 
-        # build up ANNarchy LIL
-        synapses = LILConnectivity()
-        row_idx = 0
-        for col_idx, val in zip(tmp.rows, tmp.data):
-            synapses.push_back(row_idx, col_idx, val, [0])
-            row_idx+=1
+    # Dense matrices (array format) are read with SciPy
+    from scipy.io import mmread
+
+    tmp = mmread(filename)
 
-    elif isinstance(tmp, np.ndarray):
+    if isinstance(tmp, np.ndarray):
         # build up ANNarchy LIL
         synapses = LILConnectivity()
 
@@ -323,8 +412,40 @@ def connect_from_matrix_market(self, filename, storage_format=None, storage_orde
 
     self._store_connectivity(self._load_from_lil, (synapses, ), delays, storage_format=storage_format, storage_order=storage_order)
 
-    self.connector_name = "MatrixMarket"
-    self.connector_description = "A weight matrix load from .mtx file"
+    return self
+
+def _connect_from_binary(self, filename, data, storage_format, storage_order):
+    """
+    Stores the memory-mapped arrays of the binary connectivity format (see
+    IO._load_connectivity_binary()) in a CSRConnectivity.
+    """
+    dt = Global.config['dt']
+    csr = CSRConnectivity()
+    try:
+        # The delays are stored in steps, they are converted if dt changed
+        in_steps = data['dt'] == dt
+        delay = data['delay'] if data['nb_delays'] > 0 else max(data['uniform_delay'], 0)
+        if not in_steps:
+            delay = delay * data['dt']
+
+        # Single weight
+        w = data['w']
+        if data['nb_weights'] == 1:
+            self._single_constant_weight = True
+            w = np.full(data['nb_synapses'], w[0])
+
+        csr.from_arrays(data['post_ranks'], data['row_ptr'], data['col_idx'], w, delay, in_steps)
+
+    except Exception as e:
+        Global._print(e)
+        Global._error('Unable to load the data', filename, 'into the projection.')
+
+    # Store the synapses
+    self.connector_name = "From File"
+    self.connector_description = "From File"
+    connection_delay = csr.uniform_delay * dt if csr.uniform_delay != -1 else [[csr.max_delay * dt]]
+    self._store_connectivity(self._load_from_lil, (csr,), connection_delay, storage_format=storage_format, storage_order=storage_order)
+
     return self
 
 def _load_from_lil(self, pre, post, synapses):
@@ -431,7 +552,7 @@ def connect_from_sparse(self, weights, delays=0.0, storage_format=None, storage_
     Warning: a sparse matrix has pre-synaptic ranks as first dimension.
 
     :param weights: a sparse lil_matrix object created from scipy.
-    :param delays: the value of the constant delay (default: dt).
+    :param delays: the value of the constant delay (default: dt) or a sparse matrix with the same non-zero entries as *weights* containing the delay of each synapse.
     """
     try:
         from scipy.sparse import lil_matrix, csr_matrix, csc_matrix
@@ -441,10 +562,20 @@ def connect_from_sparse(self, weights, delays=0.0, storage_format=None, storage_
     if not isinstance(weights, (lil_matrix, csr_matrix, csc_matrix)):
         Global._error("connect_from_sparse(): only lil, csr and csc matrices are allowed for now.")
 
-    if not isinstance(delays, (int, float)):
-        Global._error("connect_from_sparse(): only constant delays are allowed for sparse matrices.")
-
+    # The columns of the matrix are the rows (post-synaptic neurons) of the projection
     weights = csc_matrix(weights)
+    weights.sort_indices()
+
+    if isinstance(delays, (lil_matrix, csr_matrix, csc_matrix)):
+        delays = csc_matrix(delays)
+        delays.sort_indices()
+        if delays.shape != weights.shape or not np.array_equal(delays.indptr, weights.indptr) or not np.array_equal(delays.indices, weights.indices):
+            Global._error("connect_from_sparse(): the delays must have the same non-zero entries as the weights.")
+        connection_delay = [delays.data] if delays.nnz > 0 else []
+    elif isinstance(delays, (int, float)):
+        connection_delay = delays
+    else:
+        Global._error("connect_from_sparse(): only constant delays or sparse matrices are allowed.")
 
     # if weights[weights.nonzero()].max() == weights[weights.nonzero()].min() :
     #     self._single_constant_weight = True
@@ -452,27 +583,26 @@ def connect_from_sparse(self, weights, delays=0.0, storage_format=None, storage_
     # Store the synapses
     self.connector_name = "Sparse connectivity matrix"
     self.connector_description = "Sparse connectivity matrix"
-    self._store_connectivity(self._load_from_sparse, (weights, delays), delays, storage_format, storage_order)
+    self._store_connectivity(self._load_from_sparse, (weights, delays), connection_delay, storage_format, storage_order)
 
     return self
 
 def _load_from_sparse(self, pre, post, weights, delays):
-    # Create an empty LIL object
-    lil = LILConnectivity()
+    # Create an empty CSR object
+    csr = CSRConnectivity()
 
     # Find offsets
     if isinstance(self.pre, PopulationView):
-        pre_ranks = self.pre.ranks
+        pre_ranks = np.array(self.pre.ranks, dtype=np.int32)
     else:
-        pre_ranks = [i for i in range(self.pre.size)]
+        pre_ranks = np.arange(self.pre.size, dtype=np.int32)
 
     if isinstance(self.post, PopulationView):
-        post_ranks = self.post.ranks
+        post_ranks = np.array(self.post.ranks, dtype=np.int32)
     else:
-        post_ranks = [i for i in range(self.post.size)]
+        post_ranks = np.arange(self.post.size, dtype=np.int32)
 
-    # Process the sparse matrix and fill the lil
-    weights.sort_indices()
+    # Process the sparse matrix (CSC, sorted indices)
     (pre, post) = weights.shape
 
     if (pre, post) != (len(pre_ranks), len(post_ranks)):
@@ -481,20 +611,32 @@ def _load_from_sparse(self, pre, post, weights, delays):
         Global._print('Received:', (pre, post))
         Global._error('Quitting...')
 
+    # The rows need to be sorted by post-synaptic rank
+    if np.any(np.diff(post_ranks) < 0):
+        order = np.argsort(post_ranks, kind='stable')
+        post_ranks = post_ranks[order]
+        weights = weights[:, order]
+        weights.sort_indices()
+        if not isinstance(delays, (int, float)):
+            delays = delays[:, order]
+            delays.sort_indices()
 
-    for idx_post in range(post):
-        idx_pre = weights.getcol(idx_post).indices
-        w = weights.getcol(idx_post).data
-        pr = [pre_ranks[i] for i in idx_pre]
-        lil.add(post_ranks[idx_post], pr, w, [float(delays)])
+    # Empty columns are skipped, the pre-synaptic ranks are obtained by indexing
+    non_empty = np.diff(weights.indptr) > 0
+    row_ptr = np.concatenate(([0], weights.indptr[1:][non_empty]))
+    delays = delays if isinstance(delays, (int, float)) else delays.data
 
-    return lil
+    csr.from_arrays(post_ranks[non_empty], row_ptr, pre_ranks[weights.indices], weights.data, delays)
+
+    return csr
 
 def connect_from_file(self, filename, storage_format=None, storage_order=None):
     """
     Builds the connectivity matrix using data saved using the Projection.save_connectivity() method (not save()!).
 
-    Admissible file formats are compressed Numpy files (.npz), gunzipped binary text files (.gz) or binary text files.
+    Admissible file formats are compressed Numpy files (.npz), gunzipped binary text files (.gz), the binary connectivity format (.ann) or binary text files.
+
+    Files in the binary format are mapped into memory and passed to the projection without conversion into lists.
 
     :param filename: file where the connections were saved.
 
@@ -513,6 +655,9 @@ def connect_from_file(self, filename, storage_format=None, storage_order=None):
         Global._print(e)
         Global._error('connect_from_file(): Unable to load the data', filename, 'into the projection.')
 
+    if data is not None and 'row_ptr' in data:
+        return self._connect_from_binary(filename, data, storage_format, storage_order)
+
     # Load the LIL object
     try:
         # Size
@@ -134,7 +134,7 @@ class Dendrite(object):
                     return self.proj.max_delay * Global.config['dt']
             
             elif name == "w" and self.proj._has_single_weight():
-                return self.proj.cyInstance.get_global_attribute(name, Global.config["precision"])
+                return self.proj.cyInstance.get_global_attribute(name, self.proj._get_attribute_cpp_type(name))
             
             elif name in self.proj.attributes:
                 # Determine C++ data type
@@ -50,11 +50,13 @@ config = dict(
     'suppress_warnings': False,
     'num_threads': 1,
     'visible_cores': [],
+    'step_scheduling': "phases",
     'paradigm': "openmp",
     'method': "explicit",
     'sparse_matrix_format': "default",
     'precision': "double",
-    'only_int_idx_type': True,
+    'only_int_idx_type': False,
+    'only_int_delay_type': False,
     'seed': -1,
     'structural_plasticity': False,
     'profiling': False,
@@ -65,14 +67,22 @@ config = dict(
     'disable_split_matrix': True,
     'disable_SIMD_SpMV': False,
     'disable_SIMD_Eq': False,
-    'disable_shared_library_time_offset': False
+    'disable_shared_library_time_offset': False,
+    'build_cache': False,
+    'build_jobs': None,
+    'parser_cache': False,
+    'precompiled_headers': True,
+    'autotune_storage_format': False,
+    'connectivity_threads': None,
+    'connectivity_cache': False
    }
 )
 
 # This flags can not be configured through setup()
 _performance_related_config_keys = [
-    'disable_parallel_rng', 'use_seed_seq', 'use_cpp_connectors',
-    'disable_split_matrix', 'disable_SIMD_SpMV', 'disable_SIMD_Eq', 'only_int_idx_type'
+    'disable_parallel_rng', 'use_seed_seq',
+    'disable_split_matrix', 'disable_SIMD_SpMV', 'disable_SIMD_Eq', 'only_int_idx_type',
+    'only_int_delay_type'
 ]
 
 # Profiling instance
@@ -124,8 +134,38 @@ def setup(**keyValueArgs):
     * num_threads: number of treads used by openMP (overrides the environment variable ``OMP_NUM_THREADS`` when set, default = None).
     * visible_cores: allows a fine-grained control which cores are useable for the created threads (default = [] for no limitation).
                      It can be used to limit created openMP threads to a physical socket.
+    * step_scheduling: synchronization of the openMP threads within a simulation step. With "phases", the threads wait for each other after
+                       every phase of the step (computation of the inputs, neural update, synaptic update, ...). With "dependencies", the synchronization
+                       points are derived from the dependencies between populations and projections, so independent objects do not wait for each
+                       other, e. g. the rate-coded populations are updated without synchronization in between (default: "phases").
     * structural_plasticity: allows synapses to be dynamically added/removed during the simulation (default: False).
     * seed: the seed (integer) to be used in the random number generators (default = -1 is equivalent to time(NULL)).
+    * build_cache: if True, compiled networks are stored in a user-level cache (default: ~/.cache/ANNarchy) and re-used if the generated code and
+                   compiler configuration are identical, even from other working directories (default: False). The location and the size/age limits
+                   can be changed in the "cache" section of annarchy.json.
+    * build_jobs: number of parallel jobs used to compile the generated code (default = None, i. e. the "build_jobs" entry of annarchy.json or all available cores).
+    * precompiled_headers: if True, the standard library and ANNarchy headers included by the generated code are precompiled once per compiler
+                           configuration and stored in the user-level cache directory (default: True, only used by gcc and clang for the openMP/sequential paradigm).
+    * parser_cache: if True, the translated equations are additionally stored in the user-level cache directory (default: ~/.cache/ANNarchy) and re-used
+                    by later scripts. Identical equations are always analysed only once per session (default: False).
+    * autotune_storage_format: if True, projections connected with ``storage_format="auto"`` select the format by compiling and simulating each
+                               candidate format with the configured number of threads, instead of using heuristics (default: False). The result is
+                               stored in the user-level cache directory (default: ~/.cache/ANNarchy) and re-used by later scripts.
+    * connectivity_threads: number of threads generating the patterns of connect_all_to_all(), connect_fixed_probability(), connect_fixed_number_pre()
+                            and connect_fixed_number_post() (default: None, i. e. sequential generation with numpy). If set, each post-synaptic neuron
+                            uses its own random stream derived from the seed, so the connectivity is identical for any number of threads. Also number of
+                            threads parsing the files of connect_from_matrix_market() (all cores if None).
+    * connectivity_cache: if True, the connectivity generated by the pre-defined patterns is stored in the user-level cache directory (default:
+                          ~/.cache/ANNarchy/connectivity) and re-used by later scripts with the same connector, arguments, populations and seed
+                          (default: False, only used if a seed is set). The size of the cache is limited by "connectivity_max_size" (in MB,
+                          "cache" section of annarchy.json, default: 1024), the least recently used entries are removed first.
+    * use_cpp_connectors: if True, connect_fixed_probability(), connect_fixed_number_pre(), connect_fixed_number_post(), connect_all_to_all(),
+                          connect_one_to_one(), connect_gaussian() and connect_dog() construct the pattern in the compiled library instead of Python,
+                          which reduces the initialization time (default: False). This is only available for a single thread and the LIL, CSR and dense
+                          formats (connect_fixed_number_pre() not for dense), the other projections are constructed in Python. The random patterns are
+                          drawn from the C++ generators, so the connectivity differs from the one created in Python with the same seed, the
+                          distance-based patterns are the same. The weights and delays can be constants or drawn from a Uniform distribution (the
+                          weights also from Normal or LogNormal).
 
     The following parameters are mainly for debugging and profiling, and should be ignored by most users:
 
@@ -168,8 +208,12 @@ def _optimization_flags(**keyValueArgs):
     In particular the ANNarchy 4.7.x releases added various optional arguments to control the code generation. Please take in mind, that these
     flags might not being tested thoroughly on all features available in ANNarchy. They are intended for experimental features or performance analysis.
 
-    * only_int_idx_type: if set to True (default) only signed integers are used to store pre-/post-synaptic ranks which was default until 4.7.
-                         If set to False, the index type used in a single projection is selected based on the size of the corresponding populations.
+    * only_int_idx_type: if set to True only signed integers are used to store pre-/post-synaptic ranks which was default until 4.7.
+                         If set to False (default), the index type used in a single projection is selected based on the size of the corresponding populations.
+                         Spiking projections and, with more than one openMP thread, all formats except LIL still use signed integers.
+    * only_int_delay_type: if set to False (default) the non-uniform delays of a projection are stored in the smallest unsigned type which can represent
+                           the maximal delay (in steps) known at compile(), e. g. one byte if it is below 256 steps. The delays can then not be increased
+                           beyond this range after compile(). If set to True, signed integers are used as until 4.7.
     * disable_parallel_rng: determines if random numbers drawn from distributions are generated from a single source (default: True). 
                             If this flag is set to true only one RNG source is used und the values are drawn by one thread which 
                             reduces parallel performance (this is the behavior of all ANNarchy versions prior to 4.7). 
@@ -178,9 +222,6 @@ def _optimization_flags(**keyValueArgs):
     * use_seed_seq: If parallel RNGs are used the single generators need to be initialized. By default (use_seed_seq == True) we use
                     the STL seed sequence to generate a list of seeds from the given master seed (*seed* argument). If set to False,
                     we use an improved version of the sequence generator proposed by M.E. O'Neill (https://www.pcg-random.org/posts/simple-portable-cpp-seed-entropy.html)
-    * use_cpp_connectors:   For some of the default connectivity methods of ANNarchy we offer a CPP-side construction of the pattern to improve the
-                            initialization time (default=False). For maximum performance the disable_parallel_rng should be set to False to allow
-                            a parallel construction of the pattern.
     * disable_split_matrix: determines if projections can use thread-local allocation. If set to *True* (default) no thread local allocation is allowed.
                             This equals the behavior of ANNarchy until 4.7. If set to *False* the code generator can use sliced versions if they
                             are available.
@@ -213,10 +254,6 @@ def _optimization_flags(**keyValueArgs):
         if key in config.keys():
             config[key] = keyValueArgs[key]
 
-            if key == "use_cpp_connectors":
-                _warning("use_cpp_connectors=True is currently disabled, will be enabled soon.")
-                config["use_cpp_connectors"] = False
-
         else:
             _warning('_optimization_flags(): unknown key:', key)
 
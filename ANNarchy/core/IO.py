@@ -445,6 +445,103 @@ def _load_data(filename):
             Global._print(e)
             return None
 
+# Binary connectivity format (Projection.save_connectivity() with the extension .ann).
+# All values are little-endian, the header is followed by the arrays:
+#
+#   post_ranks  int32   [nb_rows]
+#   row_ptr     uint64  [nb_rows + 1]
+#   col_idx     int32   [nb_synapses]
+#   w           float64 [nb_weights]   (1 for a single weight, nb_synapses otherwise)
+#   delay       int32   [nb_delays]    (0 for uniform delays, nb_synapses otherwise)
+#
+# The pre-synaptic ranks of post_ranks[i] are col_idx[row_ptr[i]:row_ptr[i+1]], delays
+# are given in steps of dt. Each array begins at a multiple of 8 bytes (zero padding).
+_connectivity_magic = b'ANNCONN\x00'
+_connectivity_version = 1
+_connectivity_header = np.dtype([
+    ('magic', 'S8'),
+    ('version', '<u4'),
+    ('header_size', '<u4'),
+    ('nb_rows', '<u8'),
+    ('nb_synapses', '<u8'),
+    ('max_delay', '<i4'),
+    ('uniform_delay', '<i4'),
+    ('nb_weights', '<u8'),
+    ('nb_delays', '<u8'),
+    ('dt', '<f8'),
+])
+_connectivity_arrays = [
+    ('post_ranks', '<i4', 'nb_rows'),
+    ('row_ptr', '<u8', None),
+    ('col_idx', '<i4', 'nb_synapses'),
+    ('w', '<f8', 'nb_weights'),
+    ('delay', '<i4', 'nb_delays'),
+]
+
+def _connectivity_array_offsets(header):
+    "Returns the offset, dtype and number of elements of each array in the binary format."
+    offsets = {}
+    offset = int(header['header_size'])
+    for name, dtype, size in _connectivity_arrays:
+        count = int(header['nb_rows']) + 1 if size is None else int(header[size])
+        offsets[name] = (offset, np.dtype(dtype), count)
+        offset += count * np.dtype(dtype).itemsize
+        offset += (-offset) % 8
+    return offsets
+
+def _save_connectivity_binary(filename, data):
+    """
+    Writes the connectivity in the binary format.
+
+    :param data: dictionary with the arrays (see _connectivity_arrays) and the header fields max_delay, uniform_delay and dt.
+    """
+    header = np.zeros(1, dtype=_connectivity_header)[0]
+    header['magic'] = _connectivity_magic
+    header['version'] = _connectivity_version
+    header['header_size'] = _connectivity_header.itemsize
+    header['nb_rows'] = len(data['post_ranks'])
+    header['nb_synapses'] = len(data['col_idx'])
+    header['max_delay'] = data['max_delay']
+    header['uniform_delay'] = data['uniform_delay']
+    header['nb_weights'] = len(data['w'])
+    header['nb_delays'] = len(data['delay'])
+    header['dt'] = data['dt']
+
+    offsets = _connectivity_array_offsets(header)
+    with open(filename, mode='wb') as w_file:
+        w_file.write(header.tobytes())
+        for name, _, _ in _connectivity_arrays:
+            offset, dtype, count = offsets[name]
+            w_file.write(b'\x00' * (offset - w_file.tell()))
+            w_file.write(np.ascontiguousarray(data[name], dtype=dtype).tobytes())
+
+def _is_connectivity_binary(filename):
+    "True if the file starts with the magic number of the binary format."
+    try:
+        with open(filename, mode='rb') as r_file:
+            return r_file.read(len(_connectivity_magic)) == _connectivity_magic
+    except OSError:
+        return False
+
+def _load_connectivity_binary(filename):
+    """
+    Maps the arrays of a file in the binary format into memory (np.memmap), the data
+    is only read when accessed.
+
+    :return: dictionary with the header fields and the arrays.
+    """
+    header = np.fromfile(filename, dtype=_connectivity_header, count=1)[0]
+    if header['version'] != _connectivity_version:
+        raise ValueError('Unsupported version ' + str(header['version']) + ' of the binary connectivity format.')
+
+    desc = {name: header[name].item() for name in _connectivity_header.names if name != 'magic'}
+    for name, (offset, dtype, count) in _connectivity_array_offsets(header).items():
+        if count == 0:
+            desc[name] = np.empty(0, dtype=dtype)
+        else:
+            desc[name] = np.memmap(filename, dtype=dtype, mode='r', offset=offset, shape=(count,))
+    return desc
+
 def _load_connectivity_data(filename):
     """
     Internally loads data contained in a given file.
@@ -455,6 +552,9 @@ def _load_connectivity_data(filename):
     (_, fname) = os.path.split(filename)
     extension = os.path.splitext(fname)[1]
 
+    if _is_connectivity_binary(filename):
+        return _load_connectivity_binary(filename)
+
     if extension == '.mat':
         Global._error('Unable to load Matlab format.')
         return None
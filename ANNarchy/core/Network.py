@@ -31,6 +31,7 @@ import ANNarchy.core.Global as Global
 import ANNarchy.core.Simulate as Simulate
 import ANNarchy.core.IO as IO
 import ANNarchy.core.SpecificPopulation as SpecificPopulation
+import ANNarchy.core.Timings as Timings
 import ANNarchy.generator.Compiler as Compiler
 import numpy as np
 import os
@@ -357,7 +358,8 @@ class Network(object):
                 annarchy_json="",
                 silent=False,
                 debug_build=False,
-                profile_enabled=False):
+                profile_enabled=False,
+                pgo=False):
         """
         Compiles the network.
 
@@ -368,9 +370,18 @@ class Network(object):
         :param cuda_config: dictionary defining the CUDA configuration for each population and projection.
         :param annarchy_json: compiler flags etc are stored in a .json file normally placed in the home directory. With this flag one can directly assign a file location.
         :param silent: defines if the "Compiling... OK" should be printed.
+        :param pgo: enables profile-guided optimization, either True or the duration of the warm-up simulation in ms (see ``ANNarchy.compile()``).
 
         """
-        Compiler.compile(directory=directory, clean=clean, silent=silent, debug_build=debug_build, add_sources=add_sources, extra_libs=extra_libs, compiler=compiler, compiler_flags=compiler_flags, cuda_config=cuda_config, annarchy_json=annarchy_json, profile_enabled=profile_enabled, net_id=self.id)
+        Compiler.compile(directory=directory, clean=clean, silent=silent, debug_build=debug_build, add_sources=add_sources, extra_libs=extra_libs, compiler=compiler, compiler_flags=compiler_flags, cuda_config=cuda_config, annarchy_json=annarchy_json, profile_enabled=profile_enabled, pgo=pgo, net_id=self.id)
+
+    def compile_timings(self, filename=None):
+        """
+        Returns the time spent in the different stages of ``compile()``, see ``ANNarchy.compile_timings()``.
+
+        :param filename: if set, the timings are additionally stored in this file in JSON format.
+        """
+        return Timings.compile_timings(self.id, filename)
 
     def simulate(self, duration, measure_time = False):
         """
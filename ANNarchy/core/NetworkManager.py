@@ -53,7 +53,8 @@ class NetworkManager(object):
                 'extensions': [],
                 'instance': None,
                 'compiled': False,
-                'directory': None
+                'directory': None,
+                'timings': {}
             },
         ]
         self._py_instances = [None]
@@ -125,7 +126,8 @@ class NetworkManager(object):
             'extensions': [],
             'instance': None,
             'compiled': False,
-            'directory': None
+            'directory': None,
+            'timings': {}
         }
 
         found = -1
@@ -26,9 +26,10 @@ import ANNarchy.core.Global as Global
 from .PopulationView import PopulationView
 from .Random import RandomDistribution
 from .Neuron import IndividualNeuron
+from .Utils import _numpy_types
 
 import numpy as np
-import copy, inspect
+import copy, inspect, time
 
 
 class Population(object):
@@ -94,7 +95,9 @@ class Population(object):
             self.neuron_type = neuron()
         else:
             self.neuron_type = copy.deepcopy(neuron)
+        t0 = time.time()
         self.neuron_type._analyse()
+        self._analysis_time = time.time() - t0
 
         # Store the stop condition
         self.stop_condition = stop_condition
@@ -198,8 +201,12 @@ class Population(object):
         # Initialize the population
         self.initialized = True
 
-        # Transfer the initial values of all attributes
+        # Transfer the initial values of all attributes, the local ones
+        # with a single call per data type if possible
+        transferred = self._init_local_attributes()
         for name, value in self.init.items():
+            if name in transferred:
+                continue
             if isinstance(value, Global.Constant):
                 self.__setattr__(name, value.value)
             else:
@@ -221,6 +228,42 @@ class Population(object):
         if self.neuron_type.type == 'spike':
             getattr(self.cyInstance, 'compute_firing_rate')(self._compute_mean_fr)
 
+    def _init_local_attributes(self):
+        """
+        Transfers the initial values of the local attributes as one contiguous
+        buffer per data type instead of one call per attribute.
+
+        :return: names of the transferred attributes, the others are set individually.
+        """
+        if not hasattr(self.cyInstance, 'set_local_attributes'):
+            return []
+
+        # Group the attributes by C++ type
+        buffers = {}
+        for name, value in self.init.items():
+            if not name in self.neuron_type.description['local']:
+                continue
+            ctype = self._get_attribute_cpp_type(name)
+            if not ctype in _numpy_types.keys():
+                continue
+            if isinstance(value, Global.Constant):
+                value = value.value
+            try:
+                value = np.broadcast_to(np.asarray(value, dtype=_numpy_types[ctype]).reshape(-1), (self.size,))
+            except (ValueError, TypeError):
+                # wrong size, the error is reported by the individual setter
+                continue
+            buffers.setdefault(ctype, ([], []))
+            buffers[ctype][0].append(name)
+            buffers[ctype][1].append(value)
+
+        transferred = []
+        for ctype, (names, values) in buffers.items():
+            if self.cyInstance.set_local_attributes(names, np.ascontiguousarray(values).reshape(-1), ctype):
+                transferred += names
+
+        return transferred
+
     def size_in_bytes(self):
         """
         Returns the size of allocated memory on the C++ side. Please note that this does not contain monitored data and works only if compile() was invoked.
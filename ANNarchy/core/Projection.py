@@ -25,19 +25,21 @@ import numpy as np
 import math, os
 import copy, inspect
 import pickle
+import time
 
 from ANNarchy.core import Global
 from ANNarchy.core.Random import RandomDistribution
 from ANNarchy.core.Dendrite import Dendrite
 from ANNarchy.core.PopulationView import PopulationView
 from ANNarchy.core import ConnectorMethods
+from ANNarchy.core.Utils import _numpy_types
 
 class Projection(object):
     """
     Container for all the synapses of the same type between two populations.
     """
 
-    def __init__(self, pre, post, target, synapse=None, name=None, disable_omp=True, copied=False):
+    def __init__(self, pre, post, target, synapse=None, name=None, disable_omp=True, storage_precision=None, copied=False):
         """
         By default, the synapse only ensures linear synaptic transmission:
 
@@ -52,6 +54,7 @@ class Projection(object):
         :param synapse: a ``Synapse`` instance.
         :param name: unique name of the projection (optional, it defaults to ``proj0``, ``proj1``, etc).
         :param disable_omp: especially for small- and mid-scale sparse spiking networks the parallelization of spike propagation is not scalable. But it can be enabled by setting this parameter to `False`.
+        :param storage_precision: floating point type used to store the weights and the other local synaptic attributes, either 'float32' or 'float64'. By default, the precision of the network (``setup(precision=...)``) is used. A reduced storage precision halves the memory footprint and bandwidth of the synaptic matrices, the weighted sums are still accumulated in the network precision.
         """
         # Check if the network has already been compiled
         if Global._network[0]['compiled'] and not copied:
@@ -111,7 +114,12 @@ class Projection(object):
         self.disable_omp = disable_omp
 
         # Analyse the parameters and variables
+        t0 = time.time()
         self.synapse_type._analyse()
+        self._analysis_time = time.time() - t0
+
+        # Storage precision of the local attributes
+        self._storage_precision = self._set_storage_precision(storage_precision)
 
         # Create a default name
         self.id = len(Global._network[0]['projections'])
@@ -236,6 +244,7 @@ class Projection(object):
     connect_fixed_number_pre = ConnectorMethods.connect_fixed_number_pre
     connect_fixed_number_post = ConnectorMethods.connect_fixed_number_post
     connect_with_func = ConnectorMethods.connect_with_func
+    connect_from_chunks = ConnectorMethods.connect_from_chunks
     connect_from_matrix = ConnectorMethods.connect_from_matrix
     connect_from_matrix_market = ConnectorMethods.connect_from_matrix_market
     _load_from_matrix = ConnectorMethods._load_from_matrix
@@ -243,10 +252,43 @@ class Projection(object):
     _load_from_sparse = ConnectorMethods._load_from_sparse
     connect_from_file = ConnectorMethods.connect_from_file
     _load_from_lil = ConnectorMethods._load_from_lil
+    _connect_from_binary = ConnectorMethods._connect_from_binary
+
+    def _set_storage_precision(self, storage_precision):
+        """
+        Changes the C++ type of the local floating point attributes if a storage precision different
+        from the network precision is requested. Returns the C++ type or None if nothing changed.
+        """
+        if storage_precision is None:
+            return None
+
+        _storage_types = {
+            'float32': 'float', 'float': 'float',
+            'float64': 'double', 'double': 'double',
+        }
+        if storage_precision not in _storage_types.keys():
+            if storage_precision in ['float16', 'half']:
+                Global._error('Projection: storage_precision="'+storage_precision+'" is not supported, as there is no portable half-precision type in C++. Use "float32" instead.')
+            Global._error('Projection: storage_precision must be either "float32" or "float64", not', storage_precision)
+
+        ctype = _storage_types[storage_precision]
+        if ctype == Global.config['precision']:
+            return None
+
+        if Global._check_paradigm("cuda"):
+            Global._error('Projection: a storage_precision different from the network precision is only available for single-threaded and openMP code.')
+
+        # Only the floating point attributes stored per synapse are affected,
+        # the accumulation of the weighted sums remains in the network precision.
+        for attr in self.synapse_type.description['parameters'] + self.synapse_type.description['variables']:
+            if attr['locality'] == 'local' and attr['ctype'] == Global.config['precision']:
+                attr['ctype'] = ctype
+
+        return ctype
 
     def _copy(self, pre, post):
         "Returns a copy of the projection when creating networks.  Internal use only."
-        copied_proj = Projection(pre=pre, post=post, target=self.target, synapse=self.synapse_type, name=self.name, disable_omp=self.disable_omp, copied=True)
+        copied_proj = Projection(pre=pre, post=post, target=self.target, synapse=self.synapse_type, name=self.name, disable_omp=self.disable_omp, storage_precision=self._storage_precision, copied=True)
 
         # these flags are modified during connect_XXX called before Network()
         copied_proj._single_constant_weight = self._single_constant_weight
@@ -279,14 +321,15 @@ class Projection(object):
 
         :param:     module  cython module (ANNarchyCore instance)
         """
-        if Global.config["profiling"]:
-            import time
-            t1 = time.time()
+        t1 = time.time()
 
         self.initialized = self._connect(module)
 
+        # Reported by compile_timings()
+        t2 = time.time()
+        self._connect_time = t2 - t1
+
         if Global.config["profiling"]:
-            t2 = time.time()
             Global._profiler.add_entry(t1, t2, "proj"+str(self.id), "instantiate")
 
     def _init_attributes(self):
@@ -294,11 +337,70 @@ class Projection(object):
         Method used after compilation to initialize the attributes. The function
         should be called by Compiler._instantiate
         """
+        # Local attributes with a single value or a random distribution are
+        # transferred with a single call per data type if possible
+        transferred = self._init_local_attributes()
+
         for name, val in self.init.items():
             # the weights ('w') are already inited by the _connect() method.
-            if not name in ['w']:
+            if not name in ['w'] and not name in transferred:
                 self.__setattr__(name, val)
 
+    def _init_local_attributes(self):
+        """
+        Transfers the initial values of the local attributes as one contiguous
+        buffer per data type, instead of one call per attribute and dendrite.
+
+        :return: names of the transferred attributes, the others are set individually.
+        """
+        if not hasattr(self.cyInstance, 'set_local_attributes'):
+            return []
+
+        nb_synapses = None
+        buffers = {}
+        for name, value in self.init.items():
+            if name == 'w' or not name in self.synapse_type.description['local']:
+                continue
+            ctype = self._get_attribute_cpp_type(attribute=name)
+            if not ctype in _numpy_types.keys():
+                continue
+
+            if nb_synapses is None:
+                nb_synapses = self.cyInstance.nb_synapses()
+
+            if isinstance(value, Global.Constant):
+                value = value.value
+            if isinstance(value, RandomDistribution):
+                value = np.asarray(value.get_values(nb_synapses), dtype=_numpy_types[ctype])
+            elif isinstance(value, (int, float, bool, np.number, np.bool_)):
+                value = np.full(nb_synapses, value, dtype=_numpy_types[ctype])
+            else:
+                # lists per dendrite are checked by the individual setter
+                continue
+
+            buffers.setdefault(ctype, ([], []))
+            buffers[ctype][0].append(name)
+            buffers[ctype][1].append(value)
+
+        transferred = []
+        for ctype, (names, values) in buffers.items():
+            if self.cyInstance.set_local_attributes(names, np.concatenate(values), ctype):
+                transferred += names
+
+        return transferred
+
+    def _generate_connectivity(self):
+        """
+        Calls the connector method, the result is taken from the connectivity
+        cache if enabled by ``setup(connectivity_cache=True)``.
+        """
+        if Global.config['connectivity_cache']:
+            # Local import to prevent circular import
+            from ANNarchy.core.ConnectivityCache import ConnectivityCache
+            return ConnectivityCache().generate(self)
+
+        return self._connection_method(*((self.pre, self.post,) + self._connection_args))
+
     def _connect(self, module):
         """
         Builds up dendrites either from list or dictionary. Called by instantiate().
@@ -310,6 +412,7 @@ class Projection(object):
         """
         # Local import to prevent circular import (HD: 28th June 2021)
         from ANNarchy.generator.Utils import cpp_connector_available
+        from ANNarchy.core.cython_ext import CSRConnectivity
 
         # Sanity check
         if not self._connection_method:
@@ -328,54 +431,93 @@ class Projection(object):
         if not cpp_connector_available(self.connector_name, self._storage_format, self._storage_order):
             # No default connector -> initialize from LIL
             if self._lil_connectivity:
-                return self.cyInstance.init_from_lil_connectivity(self._lil_connectivity)
+                synapses = self._lil_connectivity
             else:
-                return self.cyInstance.init_from_lil_connectivity(self._connection_method(*((self.pre, self.post,) + self._connection_args)))
+                synapses = self._generate_connectivity()
+
+            # The pre-defined patterns are stored as CSR, which is passed without conversion if
+            # the wrapper supports it (specific projections only implement init_from_lil_connectivity)
+            if isinstance(synapses, CSRConnectivity):
+                if hasattr(self.cyInstance, 'init_from_csr_connectivity'):
+                    return self.cyInstance.init_from_csr_connectivity(synapses)
+                synapses = synapses.to_lil()
+
+            return self.cyInstance.init_from_lil_connectivity(synapses)
 
         else:
+            def dist_args(value):
+                "Arguments of the weight/delay distribution, constants are passed twice."
+                if isinstance(value, RandomDistribution):
+                    return value.get_cpp_args()
+                return value, value
+
+            def delay_args(value):
+                "Arguments of the delay distribution, in steps."
+                return tuple(round(arg/Global.config['dt']) for arg in dist_args(value))
+
+            def geometries():
+                "Geometries of the populations for the distance-based patterns."
+                if len(self.post.geometry) < len(self.pre.geometry):
+                    Global._error('Distance-based connectors: the post-synaptic population needs at least as many dimensions as the pre-synaptic one.')
+                return list(self.pre.geometry), list(self.post.geometry)
+
             # fixed probability pattern
             if self.connector_name == "Random":
                 p = self._connection_args[0]
                 allow_self_connections = self._connection_args[3]
-                if isinstance(self._connection_args[1], RandomDistribution):
-                    #some kind of distribution
-                    w_dist_arg1, w_dist_arg2 = self._connection_args[1].get_cpp_args()
-                else:
-                    # constant
-                    w_dist_arg1 = self._connection_args[1]
-                    w_dist_arg2 = self._connection_args[1]
-
-                if isinstance(self._connection_args[2], RandomDistribution):
-                    #some kind of distribution
-                    d_dist_arg1, d_dist_arg2 = self._connection_args[2].get_cpp_args()
-                else:
-                    # constant
-                    d_dist_arg1 = self._connection_args[2]
-                    d_dist_arg2 = self._connection_args[2]
+                w_dist_arg1, w_dist_arg2 = dist_args(self._connection_args[1])
+                d_dist_arg1, d_dist_arg2 = delay_args(self._connection_args[2])
 
                 return self.cyInstance.fixed_probability(self.post.ranks, self.pre.ranks, p, w_dist_arg1, w_dist_arg2, d_dist_arg1, d_dist_arg2, allow_self_connections)
-        
+
             # fixed number pre prattern
             elif self.connector_name== "Random Convergent":
                 number_nonzero = self._connection_args[0]
-                if isinstance(self._connection_args[1], RandomDistribution):
-                    #some kind of distribution
-                    w_dist_arg1, w_dist_arg2 = self._connection_args[1].get_cpp_args()
-                else:
-                    # constant
-                    w_dist_arg1 = self._connection_args[1]
-                    w_dist_arg2 = self._connection_args[1]
-
-                if isinstance(self._connection_args[2], RandomDistribution):
-                    #some kind of distribution
-                    d_dist_arg1, d_dist_arg2 = self._connection_args[2].get_cpp_args()
-                else:
-                    # constant
-                    d_dist_arg1 = self._connection_args[2]
-                    d_dist_arg2 = self._connection_args[2]
+                w_dist_arg1, w_dist_arg2 = dist_args(self._connection_args[1])
+                d_dist_arg1, d_dist_arg2 = delay_args(self._connection_args[2])
 
                 return self.cyInstance.fixed_number_pre(self.post.ranks, self.pre.ranks, number_nonzero, w_dist_arg1, w_dist_arg2, d_dist_arg1, d_dist_arg2)
 
+            # fixed number post pattern
+            elif self.connector_name == "Random Divergent":
+                number_nonzero = self._connection_args[0]
+                allow_self_connections = self._connection_args[3]
+                w_dist_arg1, w_dist_arg2 = dist_args(self._connection_args[1])
+                d_dist_arg1, d_dist_arg2 = delay_args(self._connection_args[2])
+
+                return self.cyInstance.fixed_number_post(self.post.ranks, self.pre.ranks, number_nonzero, w_dist_arg1, w_dist_arg2, d_dist_arg1, d_dist_arg2, allow_self_connections)
+
+            # all-to-all pattern
+            elif self.connector_name == "All-to-All":
+                allow_self_connections = self._connection_args[2]
+                w_dist_arg1, w_dist_arg2 = dist_args(self._connection_args[0])
+                d_dist_arg1, d_dist_arg2 = delay_args(self._connection_args[1])
+
+                return self.cyInstance.all_to_all(self.post.ranks, self.pre.ranks, w_dist_arg1, w_dist_arg2, d_dist_arg1, d_dist_arg2, allow_self_connections)
+
+            # one-to-one pattern
+            elif self.connector_name == "One-to-One":
+                w_dist_arg1, w_dist_arg2 = dist_args(self._connection_args[0])
+                d_dist_arg1, d_dist_arg2 = delay_args(self._connection_args[1])
+
+                return self.cyInstance.one_to_one(self.post.ranks, self.pre.ranks, w_dist_arg1, w_dist_arg2, d_dist_arg1, d_dist_arg2)
+
+            # gaussian pattern, the weights are computed by the pattern
+            elif self.connector_name == "Gaussian":
+                amp, sigma, delays, limit, allow_self_connections = self._connection_args[:5]
+                d_dist_arg1, d_dist_arg2 = delay_args(delays)
+                pre_geometry, post_geometry = geometries()
+
+                return self.cyInstance.gaussian(pre_geometry, post_geometry, amp, sigma, limit, allow_self_connections, d_dist_arg1, d_dist_arg2)
+
+            # difference-of-gaussians pattern
+            elif self.connector_name == "Difference-of-Gaussian":
+                amp_pos, sigma_pos, amp_neg, sigma_neg, delays, limit, allow_self_connections = self._connection_args[:7]
+                d_dist_arg1, d_dist_arg2 = delay_args(delays)
+                pre_geometry, post_geometry = geometries()
+
+                return self.cyInstance.dog(pre_geometry, post_geometry, amp_pos, sigma_pos, amp_neg, sigma_neg, limit, allow_self_connections, d_dist_arg1, d_dist_arg2)
+
             else:
                 # This should never happen ...
                 Global._error("No initialization for CPP-connector defined ...")
@@ -420,9 +562,19 @@ class Projection(object):
             else:
                 self._storage_order = "post_to_pre"
 
-        # The user selected automatic format selection using heuristics
+        # The user selected automatic format selection using measurements or heuristics
         if storage_format == "auto":
-            self._storage_format = self._automatic_format_selection()
+            selection = None
+            if Global.config['autotune_storage_format'] and not Global.config['structural_plasticity']:
+                # Local import, the autotuner compiles benchmark networks
+                from ANNarchy.generator.FormatAutotuner import FormatAutotuner
+                selection = FormatAutotuner().select(self, storage_order)
+
+            if selection is not None:
+                self._storage_format, self._storage_order = selection
+                storage_order = self._storage_order
+            else:
+                self._storage_format = self._automatic_format_selection()
         if storage_order == "auto":
             self._storage_order = self._automatic_order_selection()
 
@@ -486,12 +638,10 @@ class Projection(object):
                 storage_format = "lil"
 
         else:
-            if self.synapse_type.type == "spike":
-                # we need to build up the matrix to analyze
-                self._lil_connectivity = self._connection_method(*((self.pre, self.post,) + self._connection_args))
+            # get the decision parameters, the matrix is only built if they can not be estimated
+            density, avg_nnz_per_row = self._connectivity_statistics()
 
-                # get the decision parameter
-                density = float(self._lil_connectivity.nb_synapses) / float(self.pre.size * self.post.size)
+            if self.synapse_type.type == "spike":
                 if density >= 0.6:
                     if Global._check_paradigm("cuda"):
                         storage_format = "csr"  # HD (11th Nov. 2022): there is no Dense_T for spiking and CUDA yet
@@ -501,13 +651,6 @@ class Projection(object):
                     storage_format = "csr"
 
             else:
-                # we need to build up the matrix to analyze
-                self._lil_connectivity = self._connection_method(*((self.pre, self.post,) + self._connection_args))
-
-                # get the decision parameter
-                density = float(self._lil_connectivity.nb_synapses) / float(self.pre.size * self.post.size)
-                avg_nnz_per_row, _ = self._lil_connectivity.compute_average_row_length()
-
                 # heuristic decision tree
                 if density >= 0.6:
                     storage_format = "dense"
@@ -523,6 +666,76 @@ class Projection(object):
         Global._info("Automatic format selection for", self.name, ":", storage_format)
         return storage_format
 
+    def _connectivity_statistics(self):
+        """
+        Returns the density and the average number of synapses per (non-empty) row
+        used by _automatic_format_selection().
+
+        The values are computed analytically for the random patterns, from a
+        sample of rows for the distance-based ones and directly from the data
+        for loaded connectivity. Otherwise, the connectivity is generated and
+        kept in ``self._lil_connectivity``, so it is built only once.
+        """
+        # Local import to prevent circular import
+        from ANNarchy.core.cython_ext import Connector
+
+        method = self._connection_method
+        args = self._connection_args
+        nb_pre, nb_post = self.pre.size, self.post.size
+
+        def random_rows(probability, nb_candidates):
+            # expected length of the rows, the empty rows are not stored
+            if probability <= 0.0 or nb_candidates <= 0:
+                return 0.0, 0.0
+            probability = min(probability, 1.0)
+            nnz = probability * nb_candidates
+            return nnz * nb_post / float(nb_pre * nb_post), nnz / (1.0 - (1.0 - probability) ** nb_candidates)
+
+        if method is Connector.fixed_probability:
+            probability, allow_self_connections = args[0], args[3]
+            nb_candidates = nb_pre
+            if not allow_self_connections:
+                # the neurons with the same rank are not connected
+                nb_candidates -= np.intersect1d(self.pre.ranks, self.post.ranks).size / float(nb_post)
+            return random_rows(probability, nb_candidates)
+
+        elif method is Connector.fixed_number_pre:
+            number = min(args[0], nb_pre)
+            return number / float(nb_pre), float(number)
+
+        elif method is Connector.fixed_number_post:
+            return random_rows(min(args[0], nb_post) / float(nb_post), nb_pre)
+
+        elif method in [Connector.gaussian, Connector.dog]:
+            # evenly spaced sample of post-synaptic neurons, no random numbers are drawn
+            posts = np.unique(np.linspace(0, nb_post - 1, min(nb_post, 100)).astype(int)).tolist()
+            if method is Connector.gaussian:
+                amp, sigma, _, limit, allow_self_connections = args[:5]
+                lengths = Connector.gaussian_row_lengths(self.pre, self.post, amp, sigma, limit, allow_self_connections, posts)
+            else:
+                amp_pos, sigma_pos, amp_neg, sigma_neg, _, limit, allow_self_connections = args[:7]
+                lengths = Connector.dog_row_lengths(self.pre, self.post, amp_pos, sigma_pos, amp_neg, sigma_neg, limit, allow_self_connections, posts)
+            return np.mean(lengths) / float(nb_pre), np.mean(lengths)
+
+        elif getattr(method, '__name__', None) == '_load_from_lil':
+            synapses = args[0]
+            avg_nnz_per_row, _ = synapses.compute_average_row_length() if synapses.size > 0 else (0.0, 0.0)
+            return synapses.nb_synapses / float(nb_pre * nb_post), avg_nnz_per_row
+
+        elif getattr(method, '__name__', None) == '_load_from_sparse':
+            # the columns of the matrix are the post-synaptic neurons
+            row_lengths = np.diff(args[0].indptr)
+            row_lengths = row_lengths[row_lengths > 0]
+            return args[0].nnz / float(nb_pre * nb_post), np.mean(row_lengths) if row_lengths.size > 0 else 0.0
+
+        # we need to build up the matrix to analyze
+        if not self._lil_connectivity:
+            self._lil_connectivity = self._generate_connectivity()
+
+        density = float(self._lil_connectivity.nb_synapses) / float(nb_pre * nb_post)
+        avg_nnz_per_row, _ = self._lil_connectivity.compute_average_row_length()
+        return density, avg_nnz_per_row
+
     def _automatic_order_selection(self):
         """
         Contrary to the matrix format, the decision for the matrix order is majorly dependent on
@@ -932,6 +1145,13 @@ class Projection(object):
                 else:
                     delays = [[max(1, round(v/Global.config['dt'])) for v in c] for c in value]
 
+                # Send the new values to the projection, the type of the delays
+                # is chosen at compile() based on the maximal delay
+                try:
+                    self.cyInstance.set_delay(delays)
+                except OverflowError:
+                    Global._error("set_delay with variable delays: the new delays exceed the data type chosen at compile() for the maximal delay of the projection. Set Global.config['only_int_delay_type'] = True before compile() to store the delays as integers.")
+
                 # Max delay
                 max_delay = max([max(l) for l in delays])
 
@@ -946,9 +1166,6 @@ class Projection(object):
                         self.pre.max_delay = max(self.max_delay, self.pre.max_delay)
                         self.pre.cyInstance.update_max_delay(self.pre.max_delay)
 
-                # Send the new values to the projection
-                self.cyInstance.set_delay(delays)
-
                 # Update ring buffers (if there exist)
                 self.cyInstance.update_max_delay(self.max_delay)
 
@@ -1054,6 +1271,8 @@ class Projection(object):
 
         * If the file name is '.mat', the data will be saved as a Matlab 7.2 file. Scipy must be installed.
 
+        * If the file name ends with '.ann', the data will be stored as flat arrays in a binary format, which ``connect_from_file()`` maps into memory instead of unpickling it (recommended for large projections). The file contains a 64 bytes header followed by the arrays post_ranks (int32), row_ptr (uint64), col_idx (int32), w (float64, a single value for constant weights) and delay (int32, in steps, empty for uniform delays), see ``ANNarchy/core/IO.py``.
+
         * Otherwise, the data will be pickled into a simple binary text file using pickle.
 
         :param filename: file name, may contain relative or absolute path.
@@ -1074,6 +1293,11 @@ class Projection(object):
 
         extension = os.path.splitext(fname)[1]
 
+        if extension == '.ann':
+            Global._print("Saving connectivity in binary format...")
+            self._save_connectivity_binary(filename)
+            return
+
         # Gathering the data
         data = {
             'name': self.name,
@@ -1131,6 +1355,38 @@ class Projection(object):
                     return
             return
 
+    def _save_connectivity_binary(self, filename):
+        "Collects the rows as flat arrays and writes them with IO._save_connectivity_binary()."
+        from ANNarchy.core.IO import _save_connectivity_binary
+        from itertools import chain
+
+        pre_ranks = self.cyInstance.pre_rank_all()
+        row_ptr = np.zeros(len(pre_ranks) + 1, dtype=np.uint64)
+        row_ptr[1:] = np.cumsum([len(row) for row in pre_ranks])
+        nb_synapses = int(row_ptr[-1])
+
+        w = self.w
+        if isinstance(w, (int, float)):
+            w = [w]
+        else:
+            w = np.fromiter(chain.from_iterable(w), dtype=np.float64, count=nb_synapses)
+
+        if self.uniform_delay == -1 and hasattr(self.cyInstance, 'get_delay'):
+            delay = np.fromiter(chain.from_iterable(self.cyInstance.get_delay()), dtype=np.int32, count=nb_synapses)
+        else:
+            delay = []
+
+        _save_connectivity_binary(filename, {
+            'post_ranks': self.post_ranks,
+            'row_ptr': row_ptr,
+            'col_idx': np.fromiter(chain.from_iterable(pre_ranks), dtype=np.int32, count=nb_synapses),
+            'w': w,
+            'delay': delay,
+            'max_delay': self.max_delay,
+            'uniform_delay': self.uniform_delay,
+            'dt': Global.config['dt']
+        })
+
     def receptive_fields(self, variable = 'w', in_post_geometry = True):
         """
         Gathers all receptive fields within this projection.
@@ -1151,7 +1407,7 @@ class Projection(object):
             for n in range(len(self.post_ranks)):
                 if self.post_ranks[n] == n:
                     pre_ranks = self.cyInstance.pre_rank(n)
-                    data = self.cyInstance.get_local_attribute_row(variable, rank, Global.config["precision"])
+                    data = self.cyInstance.get_local_attribute_row(variable, rank, self._get_attribute_cpp_type(variable))
                     for j in range(len(pre_ranks)):
                         res[pre_ranks[j]] = data[j]
             return res.reshape(self.pre.geometry)
@@ -1199,12 +1455,13 @@ class Projection(object):
             # pre-ranks
             preranks = self.cyInstance.pre_rank(idx)
             # get the values
+            w_type = self._get_attribute_cpp_type("w")
             if "w" in self.synapse_type.description['local'] and (not self._has_single_weight()):
-                w = self.cyInstance.get_local_attribute_row("w", idx, Global.config["precision"])
+                w = self.cyInstance.get_local_attribute_row("w", idx, w_type)
             elif "w" in self.synapse_type.description['semiglobal']:
-                w = self.cyInstance.get_semiglobal_attribute("w", idx, Global.config["precision"])*np.ones(self.cyInstance.dendrite_size(idx))
+                w = self.cyInstance.get_semiglobal_attribute("w", idx, w_type)*np.ones(self.cyInstance.dendrite_size(idx))
             else:
-                w = self.cyInstance.get_global_attribute("w", Global.config["precision"])*np.ones(self.cyInstance.dendrite_size(idx))
+                w = self.cyInstance.get_global_attribute("w", w_type)*np.ones(self.cyInstance.dendrite_size(idx))
             res[rank, preranks] = w
         return res
 
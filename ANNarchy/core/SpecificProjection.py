@@ -144,12 +144,11 @@ class DecodingProjection(SpecificProjection):
 
         self._specific_template['psp_code'] = """
         if (pop%(id_post)s._active) {
-            std::vector< std::pair<int, int> > inv_post;
             std::vector< %(float_prec)s > rates = std::vector< %(float_prec)s >(%(post_size)s, 0.0);
             // Iterate over all incoming spikes
             for(int _idx_j = 0; _idx_j < pop%(id_pre)s.spiked.size(); _idx_j++){
                 rk_j = pop%(id_pre)s.spiked[_idx_j];
-                inv_post = inv_pre_rank[rk_j];
+                auto& inv_post = inv_pre_rank[rk_j];
                 nb_post = inv_post.size();
                 // Iterate over connected post neurons
                 for(int _idx_i = 0; _idx_i < nb_post; _idx_i++){
@@ -197,12 +196,11 @@ class DecodingProjection(SpecificProjection):
         #pragma omp single
         {
             if (pop%(id_post)s._active) {
-                std::vector< std::pair<int, int> > inv_post;
                 std::vector< %(float_prec)s > rates = std::vector< %(float_prec)s >(%(post_size)s, 0.0);
                 // Iterate over all incoming spikes
                 for(int _idx_j = 0; _idx_j < pop%(id_pre)s.spiked.size(); _idx_j++){
                     rk_j = pop%(id_pre)s.spiked[_idx_j];
-                    inv_post = inv_pre_rank[rk_j];
+                    auto& inv_post = inv_pre_rank[rk_j];
                     nb_post = inv_post.size();
                     // Iterate over connected post neurons
                     for(int _idx_i = 0; _idx_i < nb_post; _idx_i++){
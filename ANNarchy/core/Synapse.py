@@ -22,7 +22,6 @@
 #
 #===============================================================================
 import ANNarchy.core.Global as Global
-from ANNarchy.parser.AnalyseSynapse import analyse_synapse
 
 class Synapse(object):
     """
@@ -102,6 +101,8 @@ class Synapse(object):
     def _analyse(self):
         # Analyse the synapse type
         if not self.description:
+            # the parser (and sympy) is only loaded when the first model is analysed
+            from ANNarchy.parser.AnalyseSynapse import analyse_synapse
             self.description = analyse_synapse(self)
 
     def __add__(self, synapse):
@@ -0,0 +1,79 @@
+#===============================================================================
+#
+#     Timings.py
+#
+#     This file is part of ANNarchy.
+#
+#     Copyright (C) 2013-2022  Julien Vitay <julien.vitay@gmail.com>,
+#     Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     ANNarchy is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#===============================================================================
+import json
+import time
+from copy import deepcopy
+from contextlib import contextmanager
+
+import ANNarchy.core.Global as Global
+
+def _record(net_id, duration, *keys):
+    """
+    Adds *duration* (in seconds) to the entry addressed by *keys* in the
+    timings of the network, intermediate dictionaries are created if needed.
+    """
+    entry = Global._network[net_id]['timings']
+    for key in keys[:-1]:
+        entry = entry.setdefault(key, {})
+    entry[keys[-1]] = entry.get(keys[-1], 0.0) + duration
+
+@contextmanager
+def _measure(net_id, *keys):
+    "Records the wall-clock time spent in the with-block, see _record()."
+    t0 = time.time()
+    try:
+        yield
+    finally:
+        _record(net_id, time.time() - t0, *keys)
+
+def compile_timings(net_id=0, filename=None):
+    """
+    Returns the time (in seconds) spent in the different stages of ``compile()`` as a dictionary:
+
+    * **analysis**: parsing of the equations for each population and projection (performed when the object is created).
+    * **generate**: code generation (``CodeGenerator``, ``PyxGenerator``), creation of the Makefile and copy of the changed files into the build directory.
+    * **compilation**: Cython translation, compilation of each object file and linking. Only the stages which were actually executed by ``make`` are contained (e. g. unchanged object files are not rebuilt), ``"build_cache"`` is True if the library was taken from the build cache.
+    * **instantiate**: loading of the library, creation of the populations and projections (``_instantiate()``, ``_connect()``) and transfer of the initial values (``_init_attributes()``).
+    * **pgo**: simulation of the instrumented library, only if profile-guided optimization was used (the compilation times then contain both builds).
+    * **total**: overall time of ``compile()``.
+
+    :param net_id: id of the network.
+    :param filename: if set, the timings are additionally stored in this file in JSON format.
+    """
+    timings = deepcopy(Global._network[net_id]['timings'])
+
+    # The equations are analysed when the objects are created, i. e. before compile()
+    analysis = {'populations': {}, 'projections': {}}
+    for pop in Global._network[net_id]['populations']:
+        analysis['populations'][pop.name] = getattr(pop, '_analysis_time', 0.0)
+    for proj in Global._network[net_id]['projections']:
+        analysis['projections'][proj.name] = getattr(proj, '_analysis_time', 0.0)
+    analysis['total'] = sum(analysis['populations'].values()) + sum(analysis['projections'].values())
+    timings['analysis'] = analysis
+
+    if filename is not None:
+        with open(filename, 'w') as wfile:
+            json.dump(timings, wfile, indent=2, sort_keys=True)
+
+    return timings
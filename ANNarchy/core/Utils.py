@@ -46,6 +46,19 @@ def sparse_random_matrix(pre, post, p, weight, delay=0):
 
     return W
 
+################################
+## Data transfer
+################################
+
+# NumPy types corresponding to the C++ types of parameters/variables, used to
+# transfer the initial values as contiguous buffers (set_local_attributes())
+_numpy_types = {
+    'double': np.float64,
+    'float': np.float32,
+    'int': np.int32,
+    'bool': np.bool_,
+}
+
 ################################
 ## Performance Measurment
 ################################
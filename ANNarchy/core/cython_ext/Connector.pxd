@@ -32,7 +32,8 @@ cdef class LILConnectivity:
     cpdef compute_average_row_length(self)
 
     # Method to validate a LIL object
-    cpdef validate(self)
+    cpdef validate(self, pre_ranks=*, post_ranks=*)
+    cdef _merge_rows(self, post)
 
     # pre-defined pattern
     cpdef all_to_all(self, pre, post, weights, delays, allow_self_connections)
@@ -42,3 +43,25 @@ cdef class LILConnectivity:
     cpdef fixed_number_post(self, pre, post, int number, weights, delays, allow_self_connections)
     cpdef gaussian(self, pre_pop, post_pop, float amp, float sigma, delays, limit, allow_self_connections)
     cpdef dog(self, pre_pop, post_pop, float amp_pos, float sigma_pos, float amp_neg, float sigma_neg, delays, limit, allow_self_connections)
+
+cdef class CSRConnectivity(LILConnectivity):
+    """
+    Container for the ranks, weights and delays of a projection stored as
+    contiguous arrays (compressed rows).
+    """
+    # Data
+    cdef public vector[size_t] row_ptr
+    cdef public vector[int] col_idx
+    cdef public vector[double] values
+    cdef public vector[int] delays
+
+    # Memory management
+    cpdef reserve(self, size_t nb_synapses)
+
+    # Insert all rows at once
+    cpdef from_arrays(self, post_ranks, row_ptr, col_idx, values, delays, bint in_steps=*)
+    cpdef append_arrays(self, post_ranks, row_ptr, col_idx, values, delays, bint in_steps=*)
+    cpdef to_arrays(self)
+
+    # Conversion for projections without init_from_csr()
+    cpdef to_lil(self)
@@ -1,28 +1,101 @@
 # distutils: language = c++
 
 from libcpp.vector cimport vector
+from libcpp.unordered_set cimport unordered_set
+from libcpp.algorithm cimport sort
 from libcpp cimport bool
+from cython.parallel cimport prange
+from cython.operator cimport dereference as deref, preincrement as inc
 
+import os
+import mmap
+import multiprocessing
 import numpy as np
 cimport numpy as np
 
-from libc.math cimport exp, fabs, ceil
+from libc.string cimport memcpy
+from libc.math cimport exp, fabs, ceil, floor, sqrt, log, log1p, fmax, INFINITY
 
 import ANNarchy
 from ANNarchy.core import Global
 from ANNarchy.core.Random import RandomDistribution
 from ANNarchy.core.Population import Population
 
-cimport ANNarchy.core.cython_ext.Coordinates as Coordinates
+cdef extern from *:
+    """
+    #include <cstdint>
+
+    /*
+     * Random stream of a single post-synaptic neuron (or pre-synaptic neuron for
+     * fixed_number_post): xoshiro256** generator whose state is derived with
+     * splitmix64 from the key of the connector call and the index of the neuron.
+     * The drawn numbers therefore do not depend on the thread processing the row.
+     */
+    struct ConnectorRowStream {
+        uint64_t s[4];
+
+        void seed(uint64_t key, uint64_t stream) {
+            uint64_t x = key ^ (0x9E3779B97F4A7C15ULL * (stream + 1));
+            for (int i = 0; i < 4; i++) {
+                uint64_t z = (x += 0x9E3779B97F4A7C15ULL);
+                z = (z ^ (z >> 30)) * 0xBF58476D1CE4E5B9ULL;
+                z = (z ^ (z >> 27)) * 0x94D049BB133111EBULL;
+                s[i] = z ^ (z >> 31);
+            }
+        }
+
+        static inline uint64_t rotl(const uint64_t x, int k) {
+            return (x << k) | (x >> (64 - k));
+        }
+
+        uint64_t next() {
+            const uint64_t result = rotl(s[1] * 5, 7) * 9;
+            const uint64_t t = s[1] << 17;
+            s[2] ^= s[0];
+            s[3] ^= s[1];
+            s[1] ^= s[2];
+            s[0] ^= s[3];
+            s[2] ^= t;
+            s[3] = rotl(s[3], 45);
+            return result;
+        }
+
+        // uniform double in (0, 1]
+        double uniform() {
+            return static_cast<double>((next() >> 11) + 1) * (1.0 / 9007199254740992.0);
+        }
+
+        // uniform integer in [0, n), unbiased (Lemire, 2019)
+        uint64_t bounded(uint64_t n) {
+            __uint128_t m = static_cast<__uint128_t>(next()) * n;
+            uint64_t l = static_cast<uint64_t>(m);
+            if (l < n) {
+                uint64_t t = -n % n;
+                while (l < t) {
+                    m = static_cast<__uint128_t>(next()) * n;
+                    l = static_cast<uint64_t>(m);
+                }
+            }
+            return static_cast<uint64_t>(m >> 64);
+        }
+    };
+    """
+    cdef cppclass ConnectorRowStream nogil:
+        void seed(unsigned long long key, unsigned long long stream)
+        double uniform()
+        unsigned long long bounded(unsigned long long n)
 
 ##################################################
 ### Connector methods, these functions are    ####
 ### exported towards ConnectorMethods         ####
 ##################################################
+# The patterns are stored as CSRConnectivity, which is passed to the
+# generated projections without intermediate list-of-lists.
 def all_to_all(pre, post, weights, delays, allow_self_connections, storage_format, storage_order):
     """ Cython implementation of the all-to-all pattern."""
     # instantiate pattern
-    projection = LILConnectivity()
+    projection = CSRConnectivity()
+    projection.reserve(pre.size * post.size)
     projection.all_to_all(pre, post, weights, delays, allow_self_connections)
 
     return projection
@@ -30,7 +103,8 @@ def all_to_all(pre, post, weights, delays, allow_self_connections, storage_forma
 def one_to_one(pre, post, weights, delays, storage_format, storage_order):
     """ Cython implementation of the one-to-one pattern."""
     # instantiate pattern
-    projection = LILConnectivity()
+    projection = CSRConnectivity()
+    projection.reserve(post.size)
     projection.one_to_one(pre, post, weights, delays)
 
     return projection
@@ -38,7 +112,8 @@ def one_to_one(pre, post, weights, delays, storage_format, storage_order):
 def fixed_probability(pre, post, probability, weights, delays, allow_self_connections, storage_format, storage_order):
     """ Cython implementation of the fixed_probability pattern."""
     # instantiate pattern
-    projection = LILConnectivity()
+    projection = CSRConnectivity()
+    projection.reserve(int(probability * pre.size * post.size))
     projection.fixed_probability(pre, post, probability, weights, delays, allow_self_connections)
 
     return projection
@@ -46,7 +121,8 @@ def fixed_probability(pre, post, probability, weights, delays, allow_self_connec
 def fixed_number_pre(pre, post, int number, weights, delays, allow_self_connections, storage_format, storage_order):
     """ Cython implementation of the fixed_number_pre pattern."""
     # instantiate pattern
-    projection = LILConnectivity()
+    projection = CSRConnectivity()
+    projection.reserve(number * post.size)
     projection.fixed_number_pre(pre, post, number, weights, delays, allow_self_connections)
 
     return projection
@@ -54,7 +130,8 @@ def fixed_number_pre(pre, post, int number, weights, delays, allow_self_connecti
 def fixed_number_post(pre, post, int number, weights, delays, allow_self_connections, storage_format, storage_order):
     """ Cython implementation of the fixed_number_post pattern."""
     # instantiate pattern
-    projection = LILConnectivity()
+    projection = CSRConnectivity()
+    projection.reserve(number * pre.size)
     projection.fixed_number_post(pre, post, number, weights, delays, allow_self_connections)
 
     return projection
@@ -62,7 +139,7 @@ def fixed_number_post(pre, post, int number, weights, delays, allow_self_connect
 def gaussian(pre_pop, post_pop, float amp, float sigma, delays, limit, allow_self_connections, storage_format, storage_order):
     """ Cython implementation of the gaussian pattern."""
     # instantiate pattern
-    projection = LILConnectivity()
+    projection = CSRConnectivity()
     projection.gaussian(pre_pop, post_pop, amp, sigma, delays, limit, allow_self_connections)
 
     return projection
@@ -70,11 +147,174 @@ def gaussian(pre_pop, post_pop, float amp, float sigma, delays, limit, allow_sel
 def dog(pre_pop, post_pop, float amp_pos, float sigma_pos, float amp_neg, float sigma_neg, delays, limit, allow_self_connections, storage_format, storage_order):
     """ Cython implementation of the difference-of-gaussian (dog) pattern."""
     # instantiate pattern
-    projection = LILConnectivity()
+    projection = CSRConnectivity()
     projection.dog(pre_pop, post_pop, amp_pos, sigma_pos, amp_neg, sigma_neg, delays, limit, allow_self_connections)
 
     return projection
 
+def gaussian_row_lengths(pre_pop, post_pop, float amp, float sigma, limit, allow_self_connections, posts):
+    """
+    Number of synapses which gaussian() creates for each post-synaptic neuron
+    in *posts*, used to estimate the statistics of the pattern from a sample
+    of rows (no weights or delays are drawn).
+    """
+    cdef _GridWindow window = _GridWindow(pre_pop.geometry, post_pop.geometry)
+    cdef double max_distance = _gaussian_max_distance(amp, sigma, limit)
+    cdef vector[int] candidates
+    cdef vector[float] distances
+    cdef float value
+    cdef int post, idx, nb_synapses
+    cdef list lengths = []
+
+    for post in posts:
+        nb_synapses = 0
+        window.candidates(post, max_distance, 2.0*sigma**2, candidates, distances)
+        for idx in range(candidates.size()):
+            if not allow_self_connections and candidates[idx]==post:
+                continue
+            value = amp * exp(-distances[idx]/(2.0*sigma**2))
+            if value > limit * amp:
+                nb_synapses += 1
+        lengths.append(nb_synapses)
+
+    return lengths
+
+def dog_row_lengths(pre_pop, post_pop, float amp_pos, float sigma_pos, float amp_neg, float sigma_neg, limit, allow_self_connections, posts):
+    """
+    Number of synapses which dog() creates for each post-synaptic neuron in
+    *posts*, see gaussian_row_lengths().
+    """
+    cdef _GridWindow window = _GridWindow(pre_pop.geometry, post_pop.geometry)
+    cdef double max_distance = _dog_max_distance(amp_pos, sigma_pos, amp_neg, sigma_neg, limit)
+    cdef vector[int] candidates
+    cdef vector[float] distances
+    cdef float value
+    cdef int post, idx, nb_synapses
+    cdef list lengths = []
+
+    for post in posts:
+        nb_synapses = 0
+        window.candidates(post, max_distance, fmax(2.0*sigma_pos**2, 2.0*sigma_neg**2), candidates, distances)
+        for idx in range(candidates.size()):
+            if not allow_self_connections and candidates[idx]==post:
+                continue
+            value = amp_pos * exp(-distances[idx]/(2.0*sigma_pos**2)) - amp_neg * exp(-distances[idx]/(2.0*sigma_neg**2))
+            if fabs(value) > limit * fabs(amp_pos - amp_neg):
+                nb_synapses += 1
+        lengths.append(nb_synapses)
+
+    return lengths
+
+cdef double _gaussian_max_distance(float amp, float sigma, double limit):
+    "Only the pre-synaptic neurons closer than the returned (scaled) distance can pass the limit."
+    if amp > 0.0 and limit > 0.0:
+        return -2.0 * sigma**2 * log(limit) if limit < 1.0 else -1.0
+    return INFINITY
+
+cdef double _dog_max_distance(float amp_pos, float sigma_pos, float amp_neg, float sigma_neg, double limit):
+    "|value| is bounded by the larger of both Gaussians, see _gaussian_max_distance()."
+    cdef double max_distance
+    cdef double threshold = limit * fabs(amp_pos - amp_neg)
+    if amp_pos >= 0.0 and amp_neg >= 0.0 and threshold > 0.0:
+        max_distance = -1.0
+        if amp_pos > threshold:
+            max_distance = fmax(max_distance, 2.0 * sigma_pos**2 * log(amp_pos / threshold))
+        if amp_neg > threshold:
+            max_distance = fmax(max_distance, 2.0 * sigma_neg**2 * log(amp_neg / threshold))
+        return max_distance
+    return INFINITY
+
+cdef extern from *:
+    """
+    #include <vector>
+    #include <algorithm>
+
+    /*
+     * Sorts the synapses of a row by pre-synaptic rank, the weights and delays
+     * are permuted accordingly (if not NULL). Already sorted rows are only
+     * scanned. Returns the number of ranks contained several times.
+     */
+    static long long sort_synapses(int* ranks, double* weights, int* delays, long long size) {
+        bool sorted = true;
+        for (long long i = 1; i < size; i++) {
+            if (ranks[i] <= ranks[i-1]) {
+                sorted = false;
+                break;
+            }
+        }
+        if (sorted)
+            return 0;
+
+        std::vector<long long> order(size);
+        for (long long i = 0; i < size; i++)
+            order[i] = i;
+        std::stable_sort(order.begin(), order.end(), [ranks](long long a, long long b) { return ranks[a] < ranks[b]; });
+
+        std::vector<int> int_buffer(size);
+        for (long long i = 0; i < size; i++)
+            int_buffer[i] = ranks[order[i]];
+        std::copy(int_buffer.begin(), int_buffer.end(), ranks);
+        if (delays != NULL) {
+            for (long long i = 0; i < size; i++)
+                int_buffer[i] = delays[order[i]];
+            std::copy(int_buffer.begin(), int_buffer.end(), delays);
+        }
+        if (weights != NULL) {
+            std::vector<double> buffer(size);
+            for (long long i = 0; i < size; i++)
+                buffer[i] = weights[order[i]];
+            std::copy(buffer.begin(), buffer.end(), weights);
+        }
+
+        long long duplicates = 0;
+        for (long long i = 1; i < size; i++) {
+            if (ranks[i] == ranks[i-1])
+                duplicates++;
+        }
+        return duplicates;
+    }
+
+    /*
+     * Number of ranks which do not belong to the population, i. e. outside of
+     * [0, mask_size) or with mask[rank] == 0.
+     */
+    static long long count_invalid_ranks(const int* ranks, long long size, const unsigned char* mask, long long mask_size) {
+        long long invalid = 0;
+        for (long long i = 0; i < size; i++) {
+            if (ranks[i] < 0 || ranks[i] >= mask_size || mask[ranks[i]] == 0)
+                invalid++;
+        }
+        return invalid;
+    }
+    """
+    long long sort_synapses(int* ranks, double* weights, int* delays, long long size) nogil
+    long long count_invalid_ranks(const int* ranks, long long size, const unsigned char* mask, long long mask_size) nogil
+
+def _default_num_threads():
+    "Threads validating user-defined connectivity or parsing files: connectivity_threads, all cores if not set."
+    if Global.config['connectivity_threads'] is not None:
+        return Global.config['connectivity_threads']
+    return multiprocessing.cpu_count()
+
+cdef _rank_mask(ranks):
+    "Array of size max(ranks)+1 which is 1 for the given ranks, None if ranks is None."
+    if ranks is None:
+        return None
+    ranks = np.asarray(ranks, dtype=np.int64)
+    mask = np.zeros(ranks.max() + 1 if ranks.size > 0 else 0, dtype=np.uint8)
+    mask[ranks] = 1
+    return mask
+
+cdef dict _validation_report(long long duplicate_rows, bint rows_merged, long long duplicate_synapses, long long invalid_pre, long long invalid_post, faulty_rows):
+    return {
+        'valid': (rows_merged or duplicate_rows == 0) and duplicate_synapses == 0 and invalid_pre == 0 and invalid_post == 0,
+        'duplicate_rows': duplicate_rows,
+        'duplicate_synapses': duplicate_synapses,
+        'invalid_pre_ranks': invalid_pre,
+        'invalid_post_ranks': invalid_post,
+        'faulty_rows': [int(rk) for rk in faulty_rows[:10]],
+    }
+
 ###################################################
 ########## LIL object to hold synapses ############
 ###################################################
@@ -141,6 +381,19 @@ cdef class LILConnectivity:
         self.size += 1
         self.nb_synapses += r.size()
 
+    def __reduce__(self):
+        """
+        Support of pickle (e. g. to transfer the connectivity to a child process),
+        the default implementation of Cython is not available because of __cinit__.
+        """
+        return (self.__class__, (), self.__getstate__())
+
+    def __getstate__(self):
+        return (self.post_rank, self.pre_rank, self.w, self.delay, self.max_delay, self.uniform_delay, self.size, self.nb_synapses, self.dt)
+
+    def __setstate__(self, state):
+        self.post_rank, self.pre_rank, self.w, self.delay, self.max_delay, self.uniform_delay, self.size, self.nb_synapses, self.dt = state
+
     cpdef int get_max_delay(self):
         return self.max_delay
 
@@ -153,59 +406,116 @@ cdef class LILConnectivity:
             rl.push_back(self.pre_rank[i].size())
         return np.mean(rl), np.std(rl)
 
-    cpdef validate(self):
-        cdef int idx, single, rk
-        cdef vector[int] ranks
-        cdef vector[double] weights
-        cdef vector[int] delays
-        cdef dict doubletons = {}
-        cdef list postranks = list(self.post_rank)
-        cdef list set_postranks = list(set(postranks))
-        cdef list preranks, set_preranks, indices
-
-        if len(postranks) != len(set_postranks):
-            ANNarchy.core.Global._warning('You have added several times the same post-synaptic neuron to the LIL data in your connector method.')
-            ANNarchy.core.Global._print('ANNarchy will try to sort the entries if possible, it may take some time...')
-        else:
-            return
+    cpdef validate(self, pre_ranks=None, post_ranks=None):
+        """
+        Checks the connectivity (e. g. returned by the method of connect_with_func())
+        and returns a report instead of stopping at the first error:
+
+        * the rows of a post-synaptic neuron added several times are merged.
+        * the synapses of each row are sorted by pre-synaptic rank (weights and delays accordingly), ranks contained several times are counted.
+        * if *pre_ranks* or *post_ranks* are given, the ranks which do not belong to these neurons are counted.
+
+        The rows are processed in parallel by connectivity_threads threads (all cores if not set).
+
+        :return: dictionary with the entries 'valid' (bool), 'duplicate_rows', 'duplicate_synapses', 'invalid_pre_ranks', 'invalid_post_ranks' and 'faulty_rows' (up to 10 post-synaptic ranks of rows with errors).
+        """
+        cdef long row, nb_rows
+        cdef long long row_duplicates, row_invalid
+        cdef long long duplicate_rows = 0, duplicates = 0, invalid_pre = 0, invalid_post = 0
+        cdef int num_threads = _default_num_threads()
+        cdef const unsigned char[::1] pre_mask
+        cdef const unsigned char* pre_mask_ptr = NULL
+        cdef long long pre_mask_size = 0
+        cdef bint check_pre = pre_ranks is not None
+        cdef np.uint8_t[::1] faulty
+        cdef np.ndarray[np.int32_t, ndim=1] post = np.empty(self.post_rank.size(), dtype=np.int32)
+
+        if not self.post_rank.empty():
+            memcpy(&post[0], self.post_rank.data(), self.post_rank.size() * sizeof(int))
+
+        # Rows of the same post-synaptic neuron
+        ranks, counts = np.unique(post, return_counts=True)
+        duplicate_rows = np.sum(counts - 1)
+        if duplicate_rows > 0:
+            Global._warning('You have added several times the same post-synaptic neuron to the LIL data in your connector method, the rows are merged.')
+            self._merge_rows(post)
+            post = ranks.astype(np.int32)
+
+        # Sort the rows, count the duplicated and invalid pre-synaptic ranks
+        nb_rows = self.post_rank.size()
+        faulty = np.zeros(nb_rows, dtype=np.uint8)
+
+        if post_ranks is not None:
+            invalid = ~np.isin(post, np.asarray(post_ranks))
+            invalid_post = np.count_nonzero(invalid)
+            np.asarray(faulty)[invalid] = 1
+
+        if check_pre:
+            pre_mask = _rank_mask(pre_ranks)
+            pre_mask_size = pre_mask.shape[0]
+            if pre_mask_size > 0:
+                pre_mask_ptr = &pre_mask[0]
+
+        with nogil:
+            for row in prange(nb_rows, num_threads=num_threads, schedule='dynamic', chunksize=64):
+                row_duplicates = sort_synapses(self.pre_rank[row].data(),
+                    self.w[row].data() if self.w[row].size() == self.pre_rank[row].size() else NULL,
+                    self.delay[row].data() if self.delay[row].size() == self.pre_rank[row].size() else NULL,
+                    self.pre_rank[row].size())
+                row_invalid = 0
+                if check_pre:
+                    row_invalid = count_invalid_ranks(self.pre_rank[row].data(), self.pre_rank[row].size(), pre_mask_ptr, pre_mask_size)
+                duplicates += row_duplicates
+                invalid_pre += row_invalid
+                if row_duplicates > 0 or row_invalid > 0:
+                    faulty[row] = 1
+
+        return _validation_report(duplicate_rows, True, duplicates, invalid_pre, invalid_post, post[np.flatnonzero(faulty)])
+
+    cdef _merge_rows(self, post):
+        """
+        Merges the rows of post-synaptic neurons added several times, the rows
+        are sorted by post-synaptic rank afterwards. Uniform weights or delays
+        of a row (a single value) are repeated for each synapse.
+        """
+        cdef long g, j, idx
+        cdef vector[int] post_rank
+        cdef vector[vector[int]] pre_rank, delay
+        cdef vector[vector[double]] w
+        cdef long[::1] order = np.argsort(post, kind='stable').astype(np.int64)
+        cdef long[::1] starts
+
+        sorted_post = post[np.asarray(order)]
+        starts = np.append(np.flatnonzero(np.r_[True, sorted_post[1:] != sorted_post[:-1]]), post.size).astype(np.int64)
+
+        pre_rank.resize(starts.shape[0] - 1)
+        w.resize(starts.shape[0] - 1)
+        delay.resize(starts.shape[0] - 1)
+        for g in range(starts.shape[0] - 1):
+            post_rank.push_back(self.post_rank[order[starts[g]]])
+            if starts[g+1] - starts[g] == 1:
+                idx = order[starts[g]]
+                pre_rank[g].swap(self.pre_rank[idx])
+                w[g].swap(self.w[idx])
+                delay[g].swap(self.delay[idx])
+                continue
+            for j in range(starts[g], starts[g+1]):
+                idx = order[j]
+                pre_rank[g].insert(pre_rank[g].end(), self.pre_rank[idx].begin(), self.pre_rank[idx].end())
+                if self.w[idx].size() == self.pre_rank[idx].size():
+                    w[g].insert(w[g].end(), self.w[idx].begin(), self.w[idx].end())
+                else:
+                    w[g].insert(w[g].end(), self.pre_rank[idx].size(), self.w[idx][0])
+                if self.delay[idx].size() == self.pre_rank[idx].size():
+                    delay[g].insert(delay[g].end(), self.delay[idx].begin(), self.delay[idx].end())
+                else:
+                    delay[g].insert(delay[g].end(), self.pre_rank[idx].size(), self.delay[idx][0])
 
-        # Find out which post neurons are doubled.
-        for single in set_postranks:
-            doubletons[single] = []
-            for idx, possible_double in enumerate(postranks):
-                if possible_double == single:
-                    doubletons[single].append(idx)
-            if len(doubletons[single]) == 1 : # Only one occurence
-                doubletons.pop(single)
-
-        # Gather the info
-        for rk, indices in doubletons.items():
-            # Store the different infos
-            ranks.clear()
-            weights.clear()
-            delays.clear()
-            for idx in reversed(indices): # Start from below, otherwise deletion crashes
-                # Gather data
-                ranks.insert(ranks.end(), self.pre_rank[idx].begin(), self.pre_rank[idx].end())
-                weights.insert(weights.end(), self.w[idx].begin(), self.w[idx].end())
-                delays.insert(delays.end(), self.delay[idx].begin(), self.delay[idx].end())
-                # Delete the old vectors
-                self.post_rank.erase(self.post_rank.begin()+idx)
-                self.pre_rank.erase(self.pre_rank.begin()+idx)
-                self.w.erase(self.w.begin()+idx)
-                self.delay.erase(self.delay.begin()+idx)
-
-            # Check if no synapse is doubled
-            preranks = list(ranks)
-            set_preranks = list(set(preranks))
-            if len(preranks) != len(set_preranks):
-                ANNarchy.core.Global._error('The same synapse has been declared multiple times! Check your code.', exit=True)
-
-            # Add the new data
-            self.post_rank.push_back(rk)
-            self.pre_rank.push_back(ranks)
-            self.w.push_back(weights)
-            self.delay.push_back(delays)
+        self.post_rank.swap(post_rank)
+        self.pre_rank.swap(pre_rank)
+        self.w.swap(w)
+        self.delay.swap(delay)
+        self.size = self.post_rank.size()
 
     #####################################################
     # Connector method implementations for list-of-list #
@@ -218,6 +528,10 @@ cdef class LILConnectivity:
         cdef vector[int] r
         cdef vector[double] w, d
 
+        if Global.config['connectivity_threads'] is not None:
+            _parallel_pattern(self, _ALL_TO_ALL, pre, post, 0.0, 0, weights, delays, allow_self_connections, Global.config['connectivity_threads'])
+            return
+
         # Retríeve ranks
         post_ranks = post.ranks.tolist()
         pre_ranks = pre.ranks.tolist()
@@ -276,6 +590,10 @@ cdef class LILConnectivity:
         cdef vector[double] w, d
         cdef np.ndarray random_values, tmp, pre_ranks
 
+        if Global.config['connectivity_threads'] is not None:
+            _parallel_pattern(self, _FIXED_PROBABILITY, pre, post, probability, 0, weights, delays, allow_self_connections, Global.config['connectivity_threads'])
+            return
+
         # Retríeve ranks
         post_ranks = post.ranks.tolist()
         pre_ranks = pre.ranks
@@ -315,6 +633,10 @@ cdef class LILConnectivity:
         cdef vector[int] r
         cdef vector[double] w, d
 
+        if Global.config['connectivity_threads'] is not None:
+            _parallel_pattern(self, _FIXED_NUMBER_PRE, pre, post, 0.0, number, weights, delays, allow_self_connections, Global.config['connectivity_threads'])
+            return
+
         # Retríeve ranks
         post_ranks = post.ranks.tolist()
         pre_ranks = pre.ranks.tolist()
@@ -355,10 +677,20 @@ cdef class LILConnectivity:
         cdef vector[int] tmp
         cdef vector[double] w, d
 
+        if Global.config['connectivity_threads'] is not None:
+            _parallel_pattern(self, _FIXED_NUMBER_POST, pre, post, 0.0, number, weights, delays, allow_self_connections, Global.config['connectivity_threads'])
+            return
+
         # Retrieve ranks
         post_ranks = post.ranks.tolist()
         pre_ranks = pre.ranks.tolist()
 
+        # Same check as in _parallel_pattern(), the self-connection is excluded
+        post_set = set(post_ranks)
+        for r_pre in pre_ranks:
+            if number > len(post_ranks) - (1 if not allow_self_connections and r_pre in post_set else 0):
+                Global._error('connect_fixed_number_post(): the post-synaptic population has not enough neurons for', number, 'synapses per pre-synaptic neuron.')
+
         # Build the backward matrix
         rk_mat = {i: [] for i in post_ranks}
         for r_pre in pre_ranks:
@@ -396,71 +728,36 @@ cdef class LILConnectivity:
 
     cpdef gaussian(self, pre_pop, post_pop, float amp, float sigma, delays, limit, allow_self_connections):
         cdef float distance, value
-        cdef int post, pre, pre_size, post_size, c, nb_synapses, pre_dim, post_dim
-        cdef tuple pre_coord, post_coord
-        cdef tuple pre_geometry, post_geometry
-        cdef list ranks, values
+        cdef double max_distance
+        cdef int post, pre, idx, post_size, nb_synapses
+        cdef _GridWindow window
+        cdef vector[int] candidates
+        cdef vector[float] distances
 
         cdef vector[int] r
         cdef vector[double] w, d
 
-        # Retrieve simulation time step
-        dt = Global.config['dt']
+        # Only the pre-synaptic neurons closer than max_distance can pass the limit
+        max_distance = _gaussian_max_distance(amp, sigma, limit)
 
-        # Population sizes
-        pre_geometry = pre_pop.geometry
-        post_geometry = post_pop.geometry
-        if isinstance(pre_geometry, int):
-            pre_size = pre_geometry
-            pre_dim = 1
-        else:
-            pre_dim = len(pre_geometry)
-            pre_size = 1
-            for c in pre_geometry:
-                pre_size  = pre_size * c
-        if isinstance(post_geometry, int):
-            post_size = post_geometry
-            post_dim = 1
-        else:
-            post_dim = len(post_geometry)
-            post_size = 1
-            for c in post_geometry:
-                post_size  = post_size * c
+        window = _GridWindow(pre_pop.geometry, post_pop.geometry)
+        post_size = window.post_size
 
         # Create the projection data
-        for post in list(range(post_size)):
-            ranks = []
-            values = []
-            if post_dim == 1:
-                post_coord = (post/float(post_size-1), )
-            elif post_dim == 2:
-                post_coord = Coordinates.get_normalized_2d_coord(post, post_geometry)
-            elif post_dim == 3:
-                post_coord = Coordinates.get_normalized_3d_coord(post, post_geometry)
-            else:
-                post_coord = Coordinates.get_normalized_coord(post, post_geometry)
-            for pre in list(range(pre_size)):
+        for post in range(post_size):
+            r.clear()
+            w.clear()
+            window.candidates(post, max_distance, 2.0*sigma**2, candidates, distances)
+            for idx in range(candidates.size()):
+                pre = candidates[idx]
                 if not allow_self_connections and pre==post:
                     continue
-                if pre_dim == 1:
-                    pre_coord = (pre/float(pre_size-1), )
-                    distance = Coordinates.comp_dist1D(pre_coord, post_coord)
-                elif pre_dim == 2:
-                    pre_coord = Coordinates.get_normalized_2d_coord(pre, pre_geometry)
-                    distance = Coordinates.comp_dist2D(pre_coord, post_coord)
-                elif pre_dim == 3:
-                    pre_coord = Coordinates.get_normalized_3d_coord(pre, pre_geometry)
-                    distance = Coordinates.comp_dist3D(pre_coord, post_coord)
-                else:
-                    pre_coord = Coordinates.get_normalized_coord(pre, pre_geometry)
-                    distance = Coordinates.comp_distND(pre_coord, post_coord)
+                distance = distances[idx]
                 value = amp * exp(-distance/(2.0*sigma**2))
                 if value > limit * amp:
-                    ranks.append(pre)
-                    values.append(value)
-            nb_synapses = len(ranks)
-            r = ranks
-            w = values
+                    r.push_back(pre)
+                    w.push_back(value)
+            nb_synapses = r.size()
             if isinstance(delays, (float, int)):
                 d = vector[double](1, delays)
             elif isinstance(delays, RandomDistribution):
@@ -470,68 +767,36 @@ cdef class LILConnectivity:
 
     cpdef dog(self, pre_pop, post_pop, float amp_pos, float sigma_pos, float amp_neg, float sigma_neg, delays, limit, allow_self_connections):
         cdef float distance, value
-        cdef int post, pre, pre_size, post_size, c, nb_synapses, pre_dim, post_dim
-        cdef tuple pre_coord, post_coord
-        cdef tuple pre_geometry, post_geometry
-        cdef list ranks, values
+        cdef double max_distance
+        cdef int post, pre, idx, post_size, nb_synapses
+        cdef _GridWindow window
+        cdef vector[int] candidates
+        cdef vector[float] distances
 
         cdef vector[int] r
         cdef vector[double] w, d
 
-        # Population sizes
-        pre_geometry = pre_pop.geometry
-        post_geometry = post_pop.geometry
-        if isinstance(pre_geometry, int):
-            pre_size = pre_geometry
-            pre_dim = 1
-        else:
-            pre_dim = len(pre_geometry)
-            pre_size = 1
-            for c in pre_geometry:
-                pre_size  = pre_size * c
-        if isinstance(post_geometry, int):
-            post_size = post_geometry
-            post_dim = 1
-        else:
-            post_dim = len(post_geometry)
-            post_size = 1
-            for c in post_geometry:
-                post_size  = post_size * c
+        # Only the pre-synaptic neurons closer than max_distance can pass the limit
+        max_distance = _dog_max_distance(amp_pos, sigma_pos, amp_neg, sigma_neg, limit)
+
+        window = _GridWindow(pre_pop.geometry, post_pop.geometry)
+        post_size = window.post_size
 
         # Create the projection data as LIL
-        for post in list(range(post_size)):
-            ranks = []
-            values = []
-            if post_dim == 1:
-                post_coord = (post/float(post_size-1), )
-            elif post_dim == 2:
-                post_coord = Coordinates.get_normalized_2d_coord(post, post_geometry)
-            elif post_dim == 3:
-                post_coord = Coordinates.get_normalized_3d_coord(post, post_geometry)
-            else:
-                post_coord = Coordinates.get_normalized_coord(post, post_geometry)
-            for pre in list(range(pre_size)):
+        for post in range(post_size):
+            r.clear()
+            w.clear()
+            window.candidates(post, max_distance, fmax(2.0*sigma_pos**2, 2.0*sigma_neg**2), candidates, distances)
+            for idx in range(candidates.size()):
+                pre = candidates[idx]
                 if not allow_self_connections and pre==post:
                     continue
-                if pre_dim == 1:
-                    pre_coord = (pre/float(pre_size-1), )
-                    distance = Coordinates.comp_dist1D(pre_coord, post_coord)
-                elif pre_dim == 2:
-                    pre_coord = Coordinates.get_normalized_2d_coord(pre, pre_geometry)
-                    distance = Coordinates.comp_dist2D(pre_coord, post_coord)
-                elif pre_dim == 3:
-                    pre_coord = Coordinates.get_normalized_3d_coord(pre, pre_geometry)
-                    distance = Coordinates.comp_dist3D(pre_coord, post_coord)
-                else:
-                    pre_coord = Coordinates.get_normalized_coord(pre, pre_geometry)
-                    distance = Coordinates.comp_distND(pre_coord, post_coord)
+                distance = distances[idx]
                 value = amp_pos * exp(-distance/(2.0*sigma_pos**2)) - amp_neg * exp(-distance/(2.0*sigma_neg**2))
                 if fabs(value) > limit * fabs(amp_pos - amp_neg):
-                    ranks.append(pre)
-                    values.append(value)
-            nb_synapses = len(ranks)
-            r = ranks
-            w = values
+                    r.push_back(pre)
+                    w.push_back(value)
+            nb_synapses = r.size()
             if isinstance(delays, (float, int)):
                 d = vector[double](1, delays)
             elif isinstance(delays, RandomDistribution):
@@ -540,6 +805,647 @@ cdef class LILConnectivity:
             # Create the dendrite
             self.push_back(post, r, w, d)
 
+###################################################
+########## CSR object to hold synapses ############
+###################################################
+cdef class CSRConnectivity(LILConnectivity):
+    """
+    Same interface as LILConnectivity, but the rows are appended to contiguous
+    arrays: the pre-synaptic ranks of the i-th post-synaptic neuron (post_rank[i])
+    are col_idx[row_ptr[i]:row_ptr[i+1]], the weights are stored in values at the
+    same positions. The delays (in steps) are only stored if they are not uniform,
+    otherwise the array is empty and uniform_delay is used.
+
+    The pre-defined patterns fill these arrays through push_back(), the generated
+    projections initialize the target format directly from them (init_from_csr()),
+    so no nested vectors are created on the Python side.
+    """
+    def __cinit__(self):
+        # begin of the first row
+        self.row_ptr.push_back(0)
+
+    def __dealloc__(self):
+        self.row_ptr.clear()
+        self.row_ptr.shrink_to_fit()
+        self.col_idx.clear()
+        self.col_idx.shrink_to_fit()
+        self.values.clear()
+        self.values.shrink_to_fit()
+        self.delays.clear()
+        self.delays.shrink_to_fit()
+
+    def __getstate__(self):
+        return (LILConnectivity.__getstate__(self), self.row_ptr, self.col_idx, self.values, self.delays)
+
+    def __setstate__(self, state):
+        LILConnectivity.__setstate__(self, state[0])
+        self.row_ptr, self.col_idx, self.values, self.delays = state[1:]
+
+    cpdef reserve(self, size_t nb_synapses):
+        "Allocates the arrays for the expected number of synapses."
+        self.col_idx.reserve(nb_synapses)
+        self.values.reserve(nb_synapses)
+
+    cpdef push_back(self, int rk, vector[int] r, vector[double] w, vector[double] d):
+        cdef unsigned int i
+        cdef size_t offset = self.col_idx.size()
+        cdef int max_d, unif_d
+        cdef int previous_delay = self.uniform_delay
+
+        # Do not add empty arrays
+        if r.size() == 0:
+            return
+
+        # Store the connectivity
+        self.post_rank.push_back(rk)
+        self.col_idx.insert(self.col_idx.end(), r.begin(), r.end())
+        self.row_ptr.push_back(self.col_idx.size())
+
+        # Are the weights uniform?
+        if w.size() > 1 or r.size() == 1:
+            self.values.insert(self.values.end(), w.begin(), w.end())
+        else:
+            self.values.insert(self.values.end(), r.size(), w[0])
+
+        # Update the max delay
+        max_d = round(np.max(d)/self.dt)
+        if max_d > self.max_delay:
+            self.max_delay = max_d
+
+        # Are the delays uniform?
+        if d.size() > 1 :
+            self.uniform_delay = -1
+        else:
+            unif_d = round(d[0]/self.dt)
+            if self.uniform_delay != unif_d and self.size > 0:
+                self.uniform_delay = -1
+            else:
+                self.uniform_delay = unif_d
+
+        # Store the delays once they are not uniform anymore
+        if self.uniform_delay == -1:
+            if self.delays.size() < offset:
+                self.delays.insert(self.delays.end(), offset - self.delays.size(), previous_delay)
+            if d.size() == 1:
+                self.delays.insert(self.delays.end(), r.size(), <int>round(d[0]/self.dt))
+            else:
+                for i in range(d.size()):
+                    self.delays.push_back(round(d[i]/self.dt))
+
+        # Increase the size
+        self.size += 1
+        self.nb_synapses += r.size()
+
+    cpdef from_arrays(self, post_ranks, row_ptr, col_idx, values, delays, bint in_steps=False):
+        """
+        Replaces the content with the given arrays (e. g. the index arrays of a
+        scipy sparse matrix), which are copied as contiguous blocks.
+
+        :param post_ranks: ranks of the post-synaptic neurons, only non-empty rows.
+        :param row_ptr: begin of each row in col_idx and values (len(post_ranks)+1 entries).
+        :param col_idx: ranks of the pre-synaptic neurons.
+        :param values: weight of each synapse.
+        :param delays: delay of each synapse (array, in ms) or a constant delay.
+        :param in_steps: if True, the delays are given as number of steps instead of ms.
+        """
+        cdef const int[::1] ranks = np.ascontiguousarray(post_ranks, dtype=np.int32)
+        cdef const np.uint64_t[::1] pointers = np.ascontiguousarray(row_ptr, dtype=np.uint64)
+        cdef const int[::1] indices = np.ascontiguousarray(col_idx, dtype=np.int32)
+        cdef const double[::1] weights = np.ascontiguousarray(values, dtype=np.float64)
+        cdef const int[::1] steps
+
+        if pointers.shape[0] != ranks.shape[0] + 1 or pointers[0] != 0 or indices.shape[0] != weights.shape[0] or <size_t>pointers[pointers.shape[0]-1] != <size_t>indices.shape[0]:
+            Global._error('CSRConnectivity.from_arrays(): the arrays have inconsistent sizes.')
+
+        self.post_rank.clear()
+        self.row_ptr.clear()
+        self.col_idx.clear()
+        self.values.clear()
+        self.delays.clear()
+        self.row_ptr.assign(&pointers[0], &pointers[0] + pointers.shape[0])
+        if ranks.shape[0] > 0:
+            self.post_rank.assign(&ranks[0], &ranks[0] + ranks.shape[0])
+            self.col_idx.assign(&indices[0], &indices[0] + indices.shape[0])
+            self.values.assign(&weights[0], &weights[0] + weights.shape[0])
+
+        if isinstance(delays, (int, float)):
+            self.uniform_delay = int(delays) if in_steps else round(delays/self.dt)
+            self.max_delay = self.uniform_delay
+        else:
+            if in_steps:
+                steps = np.ascontiguousarray(delays, dtype=np.int32)
+            else:
+                steps = np.ascontiguousarray(np.round(np.asarray(delays, dtype=np.float64)/self.dt), dtype=np.int32)
+            if steps.shape[0] != indices.shape[0]:
+                Global._error('CSRConnectivity.from_arrays(): one delay per synapse is required.')
+            self.uniform_delay = -1
+            self.max_delay = max(np.max(steps), 0) if steps.shape[0] > 0 else 0
+            if steps.shape[0] > 0:
+                self.delays.assign(&steps[0], &steps[0] + steps.shape[0])
+
+        self.size = ranks.shape[0]
+        self.nb_synapses = indices.shape[0]
+
+    cpdef append_arrays(self, post_ranks, row_ptr, col_idx, values, delays, bint in_steps=False):
+        """
+        Appends a block of rows given in the same form as for from_arrays()
+        (row_ptr starts at 0 for each block). The rows must not be contained in
+        previous blocks. Used for the construction of large projections in
+        chunks (Projection.connect_from_chunks()), the arrays only grow by the
+        size of the block.
+
+        :param post_ranks: ranks of the post-synaptic neurons, only non-empty rows.
+        :param row_ptr: begin of each row in col_idx and values (len(post_ranks)+1 entries).
+        :param col_idx: ranks of the pre-synaptic neurons.
+        :param values: weight of each synapse.
+        :param delays: delay of each synapse (array, in ms) or a constant delay.
+        :param in_steps: if True, the delays are given as number of steps instead of ms.
+        """
+        cdef const int[::1] ranks = np.ascontiguousarray(post_ranks, dtype=np.int32)
+        cdef const np.uint64_t[::1] pointers = np.ascontiguousarray(row_ptr, dtype=np.uint64)
+        cdef const int[::1] indices = np.ascontiguousarray(col_idx, dtype=np.int32)
+        cdef const double[::1] weights = np.ascontiguousarray(values, dtype=np.float64)
+        cdef const int[::1] steps
+        cdef size_t offset = self.col_idx.size()
+        cdef size_t i
+        cdef int unif_d
+        cdef int previous_delay = self.uniform_delay
+
+        if pointers.shape[0] != ranks.shape[0] + 1 or pointers[0] != 0 or indices.shape[0] != weights.shape[0] or <size_t>pointers[pointers.shape[0]-1] != <size_t>indices.shape[0]:
+            Global._error('CSRConnectivity.append_arrays(): the arrays have inconsistent sizes.')
+
+        # Do not add empty blocks
+        if indices.shape[0] == 0:
+            return
+
+        # Store the connectivity
+        self.post_rank.insert(self.post_rank.end(), &ranks[0], &ranks[0] + ranks.shape[0])
+        self.col_idx.insert(self.col_idx.end(), &indices[0], &indices[0] + indices.shape[0])
+        self.values.insert(self.values.end(), &weights[0], &weights[0] + weights.shape[0])
+        self.row_ptr.reserve(self.row_ptr.size() + ranks.shape[0])
+        for i in range(1, pointers.shape[0]):
+            self.row_ptr.push_back(offset + pointers[i])
+
+        # Are the delays uniform? Same logic as in push_back()
+        if isinstance(delays, (int, float)):
+            unif_d = int(delays) if in_steps else round(delays/self.dt)
+            if unif_d > self.max_delay:
+                self.max_delay = unif_d
+            if self.uniform_delay != unif_d and self.size > 0:
+                self.uniform_delay = -1
+            else:
+                self.uniform_delay = unif_d
+
+            if self.uniform_delay == -1:
+                if self.delays.size() < offset:
+                    self.delays.insert(self.delays.end(), offset - self.delays.size(), previous_delay)
+                self.delays.insert(self.delays.end(), <size_t>indices.shape[0], unif_d)
+        else:
+            if in_steps:
+                steps = np.ascontiguousarray(delays, dtype=np.int32)
+            else:
+                steps = np.ascontiguousarray(np.round(np.asarray(delays, dtype=np.float64)/self.dt), dtype=np.int32)
+            if steps.shape[0] != indices.shape[0]:
+                Global._error('CSRConnectivity.append_arrays(): one delay per synapse is required.')
+            if steps.shape[0] > 0 and np.max(steps) > self.max_delay:
+                self.max_delay = np.max(steps)
+
+            self.uniform_delay = -1
+            if self.delays.size() < offset:
+                self.delays.insert(self.delays.end(), offset - self.delays.size(), previous_delay)
+            self.delays.insert(self.delays.end(), &steps[0], &steps[0] + steps.shape[0])
+
+        # Increase the size
+        self.size += ranks.shape[0]
+        self.nb_synapses += indices.shape[0]
+
+    cpdef to_arrays(self):
+        """
+        Returns copies of the content as numpy arrays (inverse of from_arrays()):
+        post_ranks, row_ptr, col_idx, values and delays (in steps, empty if the delays are uniform).
+        """
+        cdef np.ndarray[np.int32_t, ndim=1] post_ranks = np.empty(self.post_rank.size(), dtype=np.int32)
+        cdef np.ndarray[np.uint64_t, ndim=1] row_ptr = np.empty(self.row_ptr.size(), dtype=np.uint64)
+        cdef np.ndarray[np.int32_t, ndim=1] col_idx = np.empty(self.col_idx.size(), dtype=np.int32)
+        cdef np.ndarray[np.float64_t, ndim=1] values = np.empty(self.values.size(), dtype=np.float64)
+        cdef np.ndarray[np.int32_t, ndim=1] delays = np.empty(self.delays.size(), dtype=np.int32)
+
+        if not self.post_rank.empty():
+            memcpy(&post_ranks[0], self.post_rank.data(), self.post_rank.size() * sizeof(int))
+        if not self.row_ptr.empty():
+            memcpy(&row_ptr[0], self.row_ptr.data(), self.row_ptr.size() * sizeof(size_t))
+        if not self.col_idx.empty():
+            memcpy(&col_idx[0], self.col_idx.data(), self.col_idx.size() * sizeof(int))
+        if not self.values.empty():
+            memcpy(&values[0], self.values.data(), self.values.size() * sizeof(double))
+        if not self.delays.empty():
+            memcpy(&delays[0], self.delays.data(), self.delays.size() * sizeof(int))
+
+        return post_ranks, row_ptr, col_idx, values, delays
+
+    cpdef compute_average_row_length(self):
+        cdef vector[int] rl
+        for i in range(self.post_rank.size()):
+            rl.push_back(self.row_ptr[i+1] - self.row_ptr[i])
+        return np.mean(rl), np.std(rl)
+
+    cpdef validate(self, pre_ranks=None, post_ranks=None):
+        """
+        Same checks as LILConnectivity.validate(), but the rows of post-synaptic
+        neurons added several times are not merged, they make the connectivity
+        invalid.
+        """
+        cdef long row, nb_rows = self.post_rank.size()
+        cdef long long row_duplicates, row_invalid
+        cdef long long duplicates = 0, invalid_pre = 0, invalid_post = 0
+        cdef int num_threads = _default_num_threads()
+        cdef const unsigned char[::1] pre_mask
+        cdef const unsigned char* pre_mask_ptr = NULL
+        cdef long long pre_mask_size = 0
+        cdef bint check_pre = pre_ranks is not None
+        cdef bint has_delays = not self.delays.empty()
+        cdef np.uint8_t[::1] faulty = np.zeros(nb_rows, dtype=np.uint8)
+        cdef np.ndarray[np.int32_t, ndim=1] post = np.empty(nb_rows, dtype=np.int32)
+
+        if nb_rows > 0:
+            memcpy(&post[0], self.post_rank.data(), nb_rows * sizeof(int))
+
+        # Rows of the same post-synaptic neuron
+        ranks, counts = np.unique(post, return_counts=True)
+        np.asarray(faulty)[np.isin(post, ranks[counts > 1])] = 1
+
+        if post_ranks is not None:
+            invalid = ~np.isin(post, np.asarray(post_ranks))
+            invalid_post = np.count_nonzero(invalid)
+            np.asarray(faulty)[invalid] = 1
+
+        if check_pre:
+            pre_mask = _rank_mask(pre_ranks)
+            pre_mask_size = pre_mask.shape[0]
+            if pre_mask_size > 0:
+                pre_mask_ptr = &pre_mask[0]
+
+        # Sort the rows, count the duplicated and invalid pre-synaptic ranks
+        with nogil:
+            for row in prange(nb_rows, num_threads=num_threads, schedule='dynamic', chunksize=64):
+                row_duplicates = sort_synapses(self.col_idx.data() + self.row_ptr[row],
+                    self.values.data() + self.row_ptr[row],
+                    self.delays.data() + self.row_ptr[row] if has_delays else NULL,
+                    self.row_ptr[row+1] - self.row_ptr[row])
+                row_invalid = 0
+                if check_pre:
+                    row_invalid = count_invalid_ranks(self.col_idx.data() + self.row_ptr[row], self.row_ptr[row+1] - self.row_ptr[row], pre_mask_ptr, pre_mask_size)
+                duplicates += row_duplicates
+                invalid_pre += row_invalid
+                if row_duplicates > 0 or row_invalid > 0:
+                    faulty[row] = 1
+
+        return _validation_report(np.sum(counts - 1), False, duplicates, invalid_pre, invalid_post, post[np.flatnonzero(faulty)])
+
+    cpdef to_lil(self):
+        "Returns the connectivity as LILConnectivity."
+        cdef LILConnectivity lil = LILConnectivity()
+        cdef vector[int] ranks, delays
+        cdef vector[double] weights
+        cdef size_t i
+
+        for i in range(self.post_rank.size()):
+            ranks.assign(self.col_idx.data() + self.row_ptr[i], self.col_idx.data() + self.row_ptr[i+1])
+            weights.assign(self.values.data() + self.row_ptr[i], self.values.data() + self.row_ptr[i+1])
+            if self.delays.empty():
+                delays = vector[int](1, self.uniform_delay)
+            else:
+                delays.assign(self.delays.data() + self.row_ptr[i], self.delays.data() + self.row_ptr[i+1])
+
+            lil.post_rank.push_back(self.post_rank[i])
+            lil.pre_rank.push_back(ranks)
+            lil.w.push_back(weights)
+            lil.delay.push_back(delays)
+
+        lil.max_delay = self.max_delay
+        lil.uniform_delay = self.uniform_delay
+        lil.size = self.size
+        lil.nb_synapses = self.nb_synapses
+        lil.dt = self.dt
+
+        return lil
+
+cdef class _GridWindow:
+    """
+    Normalized coordinates of the pre- and post-synaptic neurons, used by the
+    distance-based connectors (gaussian, dog).
+
+    The neurons of a population form a regular grid, so the pre-synaptic neurons
+    within a given distance of a post-synaptic neuron are found by iterating
+    over a bounding box of grid indices instead of the whole population.
+
+    The coordinates and distances are rounded like in the Coordinates module
+    (single precision for 2D and 3D geometries), the selected synapses are
+    the same as when testing every pair.
+    """
+    cdef public int pre_size, post_size
+    cdef int pre_dim, post_dim
+    cdef vector[int] pre_shape, pre_strides, post_shape, post_strides
+    cdef vector[vector[double]] pre_coords, post_coords
+
+    def __cinit__(self, pre_geometry, post_geometry):
+        if isinstance(pre_geometry, int):
+            pre_geometry = (pre_geometry, )
+        if isinstance(post_geometry, int):
+            post_geometry = (post_geometry, )
+
+        self.pre_dim = len(pre_geometry)
+        self.post_dim = len(post_geometry)
+        if self.post_dim < self.pre_dim:
+            Global._error('Distance-based connectors: the post-synaptic population needs at least as many dimensions as the pre-synaptic one.')
+
+        self.pre_size = _grid_setup(pre_geometry, self.pre_shape, self.pre_strides, self.pre_coords)
+        self.post_size = _grid_setup(post_geometry, self.post_shape, self.post_strides, self.post_coords)
+
+    cdef void candidates(self, int post, double max_distance, double scale, vector[int]& ranks, vector[float]& distances):
+        """
+        Fills *ranks* (in ascending order) and *distances* (squared) with the
+        pre-synaptic neurons in the bounding box around the post-synaptic
+        neuron, all neurons if max_distance is infinite and none if it is negative.
+
+        The box is slightly enlarged (relative to *scale*, the squared width
+        of the profile) to be robust against rounding.
+        """
+        cdef int k, rank
+        cdef double radius, diff
+        cdef vector[int] lower, upper, idx
+        cdef vector[double] center
+        cdef vector[float] partial
+
+        ranks.clear()
+        distances.clear()
+        if max_distance < 0.0:
+            return
+
+        radius = sqrt(max_distance * (1.0 + 1e-5) + 1e-5 * scale) + 1e-6 if max_distance < INFINITY else INFINITY
+
+        lower.resize(self.pre_dim)
+        upper.resize(self.pre_dim)
+        center.resize(self.pre_dim)
+        for k in range(self.pre_dim):
+            center[k] = self.post_coords[k][(post // self.post_strides[k]) % self.post_shape[k]]
+            if self.pre_shape[k] == 1 or radius == INFINITY:
+                lower[k] = 0
+                upper[k] = self.pre_shape[k] - 1
+                continue
+            lower[k] = <int> max(ceil((center[k] - radius) * (self.pre_shape[k] - 1)), 0.0)
+            upper[k] = <int> min(floor((center[k] + radius) * (self.pre_shape[k] - 1)), <double>(self.pre_shape[k] - 1))
+            if lower[k] > upper[k]:
+                return
+
+        # Iterate over the box in row-major order, the squared distance is
+        # accumulated over the dimensions in the same order as comp_distND()
+        idx = lower
+        partial.resize(self.pre_dim + 1)
+        partial[0] = 0.0
+        k = 0
+        while True:
+            # descend to the last dimension
+            while k < self.pre_dim:
+                diff = self.pre_coords[k][idx[k]] - center[k]
+                partial[k+1] = partial[k] + diff * diff
+                k += 1
+
+            rank = 0
+            for k in range(self.pre_dim):
+                rank += idx[k] * self.pre_strides[k]
+            ranks.push_back(rank)
+            distances.push_back(partial[self.pre_dim])
+
+            # next index (odometer), the last dimension varies fastest
+            k = self.pre_dim - 1
+            while k >= 0 and idx[k] == upper[k]:
+                idx[k] = lower[k]
+                k -= 1
+            if k < 0:
+                return
+            idx[k] += 1
+
+cdef int _grid_setup(tuple geometry, vector[int]& shape, vector[int]& strides, vector[vector[double]]& coords):
+    "Shape, row-major strides and normalized coordinates along each dimension, returns the number of neurons."
+    cdef int k, i, size, dim
+    cdef double coord
+    cdef vector[double] values
+
+    dim = len(geometry)
+    shape.resize(dim)
+    strides.resize(dim)
+    coords.resize(dim)
+
+    size = 1
+    for k in range(dim - 1, -1, -1):
+        shape[k] = geometry[k]
+        strides[k] = size
+        size *= shape[k]
+
+        values.clear()
+        for i in range(shape[k]):
+            coord = i / <double>(shape[k] - 1) if shape[k] > 1 else 0.0
+            if dim == 2 or dim == 3:
+                coord = <float> coord
+            values.push_back(coord)
+        coords[k] = values
+
+    return size
+
+###################################################
+####### Parallel generation of the patterns #######
+###################################################
+cdef enum:
+    _ALL_TO_ALL = 0
+    _FIXED_PROBABILITY = 1
+    _FIXED_NUMBER_PRE = 2
+    _FIXED_NUMBER_POST = 3
+
+cdef _parallel_pattern(LILConnectivity lil, int pattern, pre, post, double probability, int number, weights, delays, bint allow_self_connections, int num_threads):
+    """
+    Generates the pattern with *num_threads* threads. The
+    rows (columns for fixed_number_post) are distributed over the threads and
+    each one draws from its own stream (see ConnectorRowStream), the key of the
+    streams is taken from numpy's generator. The connectivity only depends on
+    the seed, not on the number of threads.
+
+    The weights and delays drawn from random distributions are generated
+    afterwards with a single call to numpy, in the order of the rows.
+    """
+    cdef vector[int] pre_ranks = pre.ranks
+    cdef vector[int] post_ranks = post.ranks
+    cdef vector[int] post_indices, pre_position, post_position
+    cdef vector[vector[int]] rows, columns
+    cdef unsigned long long key
+    cdef long idx, k, nb_rows, nb_columns, total, offset, size, max_rank
+    cdef double weight
+    cdef vector[double] w, d
+    cdef double[::1] w_values, d_values
+
+    if num_threads < 1:
+        Global._error('connectivity_threads must be a positive integer or None.')
+
+    nb_rows = post_ranks.size()
+    nb_columns = pre_ranks.size()
+
+    # Position of each rank in pre_ranks and post_ranks (-1 if not contained), to exclude self-connections
+    max_rank = max(max(pre_ranks) if nb_columns > 0 else 0, max(post_ranks) if nb_rows > 0 else 0) + 1
+    pre_position = vector[int](max_rank, -1)
+    post_position = vector[int](max_rank, -1)
+    if not allow_self_connections:
+        for idx in range(nb_columns):
+            pre_position[pre_ranks[idx]] = idx
+        for idx in range(nb_rows):
+            post_position[post_ranks[idx]] = idx
+
+    if pattern == _FIXED_NUMBER_PRE:
+        for idx in range(nb_rows):
+            if number > nb_columns - (1 if pre_position[post_ranks[idx]] >= 0 else 0):
+                Global._error('connect_fixed_number_pre(): the pre-synaptic population has not enough neurons for', number, 'synapses per post-synaptic neuron.')
+    elif pattern == _FIXED_NUMBER_POST:
+        for idx in range(nb_columns):
+            if number > nb_rows - (1 if post_position[pre_ranks[idx]] >= 0 else 0):
+                Global._error('connect_fixed_number_post(): the post-synaptic population has not enough neurons for', number, 'synapses per pre-synaptic neuron.')
+
+    key = np.random.randint(np.iinfo(np.int64).max, dtype=np.int64)
+
+    rows = vector[vector[int]](nb_rows)
+    with nogil:
+        if pattern == _FIXED_NUMBER_POST:
+            # Select the post-synaptic neurons of each pre-synaptic neuron, then transpose
+            for idx in range(nb_rows):
+                post_indices.push_back(idx)
+            columns = vector[vector[int]](nb_columns)
+            for idx in prange(nb_columns, num_threads=num_threads, schedule='dynamic', chunksize=16):
+                _sample_row(post_indices, post_position[pre_ranks[idx]], number, key, idx, columns[idx])
+            for idx in range(nb_columns):
+                for k in range(<long> columns[idx].size()):
+                    rows[columns[idx][k]].push_back(pre_ranks[idx])
+                columns[idx].clear()
+                columns[idx].shrink_to_fit()
+        else:
+            for idx in prange(nb_rows, num_threads=num_threads, schedule='dynamic', chunksize=16):
+                if pattern == _ALL_TO_ALL:
+                    _all_row(pre_ranks, pre_position[post_ranks[idx]], rows[idx])
+                elif pattern == _FIXED_PROBABILITY:
+                    _bernoulli_row(pre_ranks, pre_position[post_ranks[idx]], probability, key, idx, rows[idx])
+                else:
+                    _sample_row(pre_ranks, pre_position[post_ranks[idx]], number, key, idx, rows[idx])
+
+    # Weights and delays
+    total = 0
+    for idx in range(nb_rows):
+        total += rows[idx].size()
+    if isinstance(weights, RandomDistribution):
+        w_values = np.ascontiguousarray(weights.get_values(total), dtype=np.float64).reshape(-1)
+    else:
+        weight = weights
+        w = vector[double](1, weight)
+    if isinstance(delays, RandomDistribution):
+        d_values = np.ascontiguousarray(delays.get_values(total), dtype=np.float64).reshape(-1)
+    else:
+        d = vector[double](1, delays)
+
+    # Create the dendrites
+    offset = 0
+    for idx in range(nb_rows):
+        size = rows[idx].size()
+        if size == 0:
+            continue
+        if isinstance(weights, RandomDistribution):
+            w.assign(&w_values[offset], &w_values[offset] + size)
+        if isinstance(delays, RandomDistribution):
+            d.assign(&d_values[offset], &d_values[offset] + size)
+        offset += size
+
+        lil.push_back(post_ranks[idx], rows[idx], w, d)
+        rows[idx].clear()
+        rows[idx].shrink_to_fit()
+
+cdef void _all_row(const vector[int]& candidates, int excluded, vector[int]& row) nogil:
+    "All candidates except the one at position *excluded* (-1 for none)."
+    cdef long i
+    row.reserve(candidates.size())
+    for i in range(<long> candidates.size()):
+        if i != excluded:
+            row.push_back(candidates[i])
+
+cdef void _bernoulli_row(const vector[int]& candidates, int excluded, double p, unsigned long long key, long stream, vector[int]& row) nogil:
+    """
+    Selects each candidate with probability *p*. The gaps between two selected
+    candidates are drawn from a geometric distribution, so the cost only
+    depends on the number of created synapses.
+    """
+    cdef ConnectorRowStream rng
+    cdef long n = candidates.size()
+    cdef long i = -1
+    cdef double skip, log_q
+
+    if p <= 0.0:
+        return
+    if p >= 1.0:
+        _all_row(candidates, excluded, row)
+        return
+
+    rng.seed(key, stream)
+    log_q = log1p(-p)
+    while True:
+        skip = floor(log(rng.uniform()) / log_q)
+        if skip >= n - i - 1:
+            break
+        i += 1 + <long> skip
+        if i != excluded:
+            row.push_back(candidates[i])
+
+    # sort the indices to prevent irregular accesses
+    sort(row.begin(), row.end())
+
+cdef void _sample_row(const vector[int]& candidates, int excluded, int number, unsigned long long key, long stream, vector[int]& row) nogil:
+    """
+    Selects *number* different candidates (all if there are not enough), the
+    candidate at position *excluded* (-1 for none) is never selected. Small
+    samples use Floyd's algorithm, large ones a mask over the candidates.
+    """
+    cdef ConnectorRowStream rng
+    cdef long n = candidates.size() - (1 if excluded >= 0 else 0)
+    cdef long i, j, t
+    cdef unordered_set[long] selected
+    cdef unordered_set[long].iterator it
+    cdef vector[char] mask
+
+    if number >= n:
+        _all_row(candidates, excluded, row)
+        return
+
+    rng.seed(key, stream)
+    row.reserve(number)
+    if 8 * <long> number < n:
+        for j in range(n - number, n):
+            t = rng.bounded(j + 1)
+            if selected.count(t) > 0:
+                t = j
+            selected.insert(t)
+        it = selected.begin()
+        while it != selected.end():
+            t = deref(it)
+            if excluded >= 0 and t >= excluded:
+                t += 1
+            row.push_back(candidates[t])
+            inc(it)
+        sort(row.begin(), row.end())
+    else:
+        mask = vector[char](n, 0)
+        for j in range(n - number, n):
+            t = rng.bounded(j + 1)
+            if mask[t]:
+                t = j
+            mask[t] = 1
+        for i in range(n):
+            if mask[i]:
+                row.push_back(candidates[i + 1 if excluded >= 0 and i >= excluded else i])
+        sort(row.begin(), row.end())
+
 cdef _get_weights_delays(int size, weights, delays):
 
     cdef vector[double] w, d
@@ -557,4 +1463,295 @@ cdef _get_weights_delays(int size, weights, delays):
     elif isinstance(delays, RandomDistribution):
         d = delays.get_list_values(size)
 
-    return w, d
\ No newline at end of file
+    return w, d
+##################################################
+### Matrix Market files                       ####
+##################################################
+cdef extern from *:
+    """
+    #include <cstdlib>
+    #include <algorithm>
+    #if __cplusplus >= 201703L && defined(__has_include)
+    #if __has_include(<charconv>)
+    #include <charconv>
+    #endif
+    #endif
+
+    /*
+     * Parsing of the entries of a Matrix Market file (coordinate format) in the
+     * byte range [begin, end), which starts at the beginning of a line. The
+     * numbers are read in place with std::from_chars() (copied to a buffer on
+     * the stack for strtod() if not available).
+     */
+    static inline const char* mm_skip_blanks(const char* p, const char* end) {
+        while (p < end && (*p == ' ' || *p == '\\t' || *p == '\\r'))
+            p++;
+        return p;
+    }
+
+    static inline const char* mm_next_line(const char* p, const char* end) {
+        while (p < end && *p != '\\n')
+            p++;
+        return p < end ? p + 1 : end;
+    }
+
+    static inline bool mm_parse_index(const char*& p, const char* end, long long& index) {
+        p = mm_skip_blanks(p, end);
+        if (p == end || *p < '0' || *p > '9')
+            return false;
+        index = 0;
+        while (p < end && *p >= '0' && *p <= '9')
+            index = 10 * index + (*p++ - '0');
+        return true;
+    }
+
+    static inline bool mm_parse_value(const char*& p, const char* end, double& value) {
+        p = mm_skip_blanks(p, end);
+        if (p < end && *p == '+')
+            p++;
+        const char* begin = p;
+        while (p < end && *p != ' ' && *p != '\\t' && *p != '\\r' && *p != '\\n')
+            p++;
+        if (p == begin)
+            return false;
+    #if defined(__cpp_lib_to_chars) && __cpp_lib_to_chars >= 201611L
+        auto result = std::from_chars(begin, p, value);
+        return result.ec == std::errc() && result.ptr == p;
+    #else
+        char buffer[64];
+        if (p - begin > 63)
+            return false;
+        std::copy(begin, p, buffer);
+        buffer[p - begin] = '\\0';
+        char* stop;
+        value = std::strtod(buffer, &stop);
+        return stop == buffer + (p - begin);
+    #endif
+    }
+
+    /*
+     * Parses the line starting at p and moves p to the next line. Returns 1 for
+     * an entry (converted to 0-based indices), 0 for an empty or comment line
+     * and -1 for a malformed line or indices out of range. The value (1.0 for
+     * the pattern format) is only parsed and the rest of the line checked if
+     * parse_value is true.
+     */
+    static inline int mm_parse_line(const char*& p, const char* end, bool parse_value, bool has_value, long long nb_rows, long long nb_columns, long long& row, long long& column, double& value) {
+        const char* q = mm_skip_blanks(p, end);
+        if (q == end || *q == '\\n' || *q == '%') {
+            p = mm_next_line(q, end);
+            return 0;
+        }
+        value = 1.0;
+        bool valid = mm_parse_index(q, end, row) && mm_parse_index(q, end, column) && row >= 1 && row <= nb_rows && column >= 1 && column <= nb_columns;
+        if (valid && parse_value) {
+            if (has_value)
+                valid = mm_parse_value(q, end, value);
+            q = mm_skip_blanks(q, end);
+            valid = valid && (q == end || *q == '\\n');
+        }
+        p = mm_next_line(q, end);
+        row--;
+        column--;
+        return valid ? 1 : -1;
+    }
+
+    /*
+     * First pass: number of entries of each row in the range. The symmetric
+     * formats (symmetry 1: symmetric, 2: skew-symmetric) store only the lower
+     * triangle, the mirrored entries are counted as well. Only the indices are
+     * parsed, returns false if they are malformed or out of range.
+     */
+    static bool mm_count_range(const char* begin, const char* end, bool has_value, int symmetry, long long nb_rows, long long nb_columns, long long* counts) {
+        long long row, column;
+        double value;
+        const char* p = begin;
+        while (p < end) {
+            int status = mm_parse_line(p, end, false, false, nb_rows, nb_columns, row, column, value);
+            if (status < 0)
+                return false;
+            if (status == 0)
+                continue;
+            counts[row]++;
+            if (symmetry > 0 && row != column)
+                counts[column]++;
+        }
+        return true;
+    }
+
+    /*
+     * Second pass: writes each entry to the next free position of its row
+     * (positions are the offsets computed from the counts of all ranges).
+     * Returns false if a value is malformed.
+     */
+    static bool mm_fill_range(const char* begin, const char* end, bool has_value, int symmetry, long long nb_rows, long long nb_columns, long long* positions, int* col_idx, double* values) {
+        long long row, column;
+        double value;
+        const char* p = begin;
+        while (p < end) {
+            int status = mm_parse_line(p, end, true, has_value, nb_rows, nb_columns, row, column, value);
+            if (status < 0)
+                return false;
+            if (status == 0)
+                continue;
+            long long k = positions[row]++;
+            col_idx[k] = static_cast<int>(column);
+            values[k] = value;
+            if (symmetry > 0 && row != column) {
+                k = positions[column]++;
+                col_idx[k] = static_cast<int>(row);
+                values[k] = symmetry == 2 ? -value : value;
+            }
+        }
+        return true;
+    }
+    """
+    bool mm_count_range(const char* begin, const char* end, bool has_value, int symmetry, long long nb_rows, long long nb_columns, long long* counts) nogil
+    bool mm_fill_range(const char* begin, const char* end, bool has_value, int symmetry, long long nb_rows, long long nb_columns, long long* positions, int* col_idx, double* values) nogil
+
+def load_matrix_market(filename, pre_ranks, post_ranks, num_threads=None):
+    """
+    Reads a Matrix Market file in coordinate format into a CSRConnectivity, the
+    rows of the matrix are the post-synaptic neurons, the columns the
+    pre-synaptic ones (the i-th row/column corresponds to post_ranks[i] and
+    pre_ranks[i]).
+
+    The file is memory-mapped and split into *num_threads* byte ranges (default:
+    connectivity_threads, all cores if not set), which
+    are parsed in parallel twice: the first pass counts the entries of each row
+    per range, the prefix sums over rows and ranges then give the final position
+    of every entry, so that the second pass writes the parsed entries directly
+    into the arrays of the CSRConnectivity. The result does not depend on the
+    number of threads.
+
+    :return: the CSRConnectivity (zero delays), None if the file contains a dense matrix (array format).
+    """
+    cdef CSRConnectivity csr
+    cdef const unsigned char[::1] data
+    cdef const char* base
+    cdef long long nb_rows, nb_columns, nb_entries, nb_synapses, t, r, k, size, start, stop
+    cdef long long duplicates = 0
+    cdef bint has_value
+    cdef int symmetry, nb_threads
+    cdef long long[:, ::1] counts
+    cdef long long[::1] bounds
+    cdef np.uint8_t[::1] valid
+    cdef const long long[::1] row_ptr
+    cdef const int[::1] pre_map, ranks
+    cdef const np.uint64_t[::1] pointers
+    cdef int* col_idx
+    cdef double* values
+
+    if num_threads is None:
+        num_threads = _default_num_threads()
+    if num_threads < 1:
+        Global._error('connectivity_threads must be a positive integer or None.')
+    nb_threads = num_threads
+
+    with open(filename, 'rb') as rfile:
+        # Banner: %%MatrixMarket matrix coordinate real general
+        banner = rfile.readline().decode('ascii', 'replace').lower().split()
+        if len(banner) != 5 or banner[0] != '%%matrixmarket' or banner[1] != 'matrix':
+            Global._error('load_matrix_market():', filename, 'is not a Matrix Market file.')
+        if banner[2] == 'array':
+            return None
+        if banner[2] != 'coordinate' or banner[3] not in ['real', 'double', 'integer', 'pattern'] or banner[4] not in ['general', 'symmetric', 'skew-symmetric']:
+            Global._error('load_matrix_market(): the format', ' '.join(banner[2:]), 'is not supported.')
+        has_value = banner[3] != 'pattern'
+        symmetry = ['general', 'symmetric', 'skew-symmetric'].index(banner[4])
+
+        # Comments, then the size line
+        line = rfile.readline()
+        while line and (line.startswith(b'%') or not line.strip()):
+            line = rfile.readline()
+        try:
+            nb_rows, nb_columns, nb_entries = [int(v) for v in line.split()]
+        except ValueError:
+            Global._error('load_matrix_market(): the size line of', filename, 'is malformed.')
+        start = rfile.tell()
+
+        if nb_rows > len(post_ranks) or nb_columns > len(pre_ranks):
+            Global._error('load_matrix_market(): the matrix (' + str(nb_rows) + 'x' + str(nb_columns) + ') is larger than the populations.')
+        if symmetry > 0 and nb_rows != nb_columns:
+            Global._error('load_matrix_market(): symmetric matrices must be square.')
+
+        size = os.fstat(rfile.fileno()).st_size
+        counts = np.zeros((nb_threads, nb_rows), dtype=np.int64)
+        valid = np.ones(nb_threads, dtype=np.uint8)
+        mapping = None
+        if size > start:
+            mapping = mmap.mmap(rfile.fileno(), 0, access=mmap.ACCESS_READ)
+
+    csr = CSRConnectivity()
+    if mapping is None:
+        return csr
+
+    try:
+        data = mapping
+        base = <const char*> &data[0]
+
+        # Ranges of each thread, starting at the beginning of a line
+        bounds = np.empty(nb_threads + 1, dtype=np.int64)
+        bounds[0] = start
+        bounds[nb_threads] = size
+        for t in range(1, nb_threads):
+            stop = max(start + (size - start) * t // nb_threads, bounds[t-1])
+            while stop < size and stop > start and base[stop-1] != b'\n':
+                stop += 1
+            bounds[t] = stop
+
+        # First pass: entries per row and range
+        with nogil:
+            for t in prange(nb_threads, num_threads=nb_threads, schedule='static', chunksize=1):
+                valid[t] = mm_count_range(base + bounds[t], base + bounds[t+1], has_value, symmetry, nb_rows, nb_columns, &counts[t, 0])
+        if not np.all(valid):
+            Global._error('load_matrix_market():', filename, 'contains malformed entries or indices outside of the matrix.')
+
+        # Offset of each row, then position of the first entry of each range in the row
+        row_lengths = np.asarray(counts).sum(axis=0)
+        offsets = np.zeros(nb_rows + 1, dtype=np.int64)
+        np.cumsum(row_lengths, out=offsets[1:])
+        positions = np.cumsum(counts, axis=0)
+        positions -= counts
+        positions += offsets[:-1]
+        counts = positions
+        nb_synapses = offsets[nb_rows]
+
+        # Second pass: the entries are written in place
+        csr.col_idx.resize(nb_synapses)
+        csr.values.resize(nb_synapses)
+        col_idx = csr.col_idx.data()
+        values = csr.values.data()
+        with nogil:
+            for t in prange(nb_threads, num_threads=nb_threads, schedule='static', chunksize=1):
+                valid[t] = mm_fill_range(base + bounds[t], base + bounds[t+1], has_value, symmetry, nb_rows, nb_columns, &counts[t, 0], col_idx, values)
+    finally:
+        data = None
+        mapping.close()
+    if not np.all(valid):
+        Global._error('load_matrix_market():', filename, 'contains malformed values.')
+
+    # Pre-synaptic ranks (PopulationViews), then sort the rows
+    pre_map = np.ascontiguousarray(pre_ranks, dtype=np.int32)
+    row_ptr = offsets
+    with nogil:
+        for k in prange(nb_synapses, num_threads=nb_threads, schedule='static'):
+            col_idx[k] = pre_map[col_idx[k]]
+        for r in prange(nb_rows, num_threads=nb_threads, schedule='dynamic', chunksize=64):
+            duplicates += sort_synapses(col_idx + row_ptr[r], values + row_ptr[r], NULL, row_ptr[r+1] - row_ptr[r])
+    if duplicates > 0:
+        Global._error('load_matrix_market():', filename, 'contains the same entry several times.')
+
+    # Only the non-empty rows are stored
+    rows = np.flatnonzero(row_lengths)
+    ranks = np.ascontiguousarray(np.asarray(post_ranks, dtype=np.int32)[rows])
+    pointers = np.ascontiguousarray(offsets[np.append(rows, nb_rows)], dtype=np.uint64)
+    if ranks.shape[0] > 0:
+        csr.post_rank.assign(&ranks[0], &ranks[0] + ranks.shape[0])
+    csr.row_ptr.assign(&pointers[0], &pointers[0] + pointers.shape[0])
+    csr.size = rows.size
+    csr.nb_synapses = nb_synapses
+    csr.uniform_delay = 0
+    csr.max_delay = 0
+
+    return csr
@@ -1,6 +1,7 @@
 # export connector functions
 from .Connector import one_to_one, all_to_all, gaussian, dog, fixed_probability, fixed_number_pre, fixed_number_post
-from .Connector import LILConnectivity
+from .Connector import load_matrix_market
+from .Connector import LILConnectivity, CSRConnectivity
 
 __all__ = [
     # Methods
@@ -11,7 +12,9 @@ __all__ = [
     'fixed_probability',
     'fixed_number_pre',
     'fixed_number_post',
+    'load_matrix_market',
     # Classes
     'LILConnectivity',
+    'CSRConnectivity',
     'Coordinates'
 ]
\ No newline at end of file
@@ -129,7 +129,7 @@ class NormProjection(SpecificProjection):
                 auto inv_post_ptr = inv_pre_rank.find(rk_j);
                 if (inv_post_ptr == inv_pre_rank.end())
                     continue;
-                std::vector< std::pair<int, int> >& inv_post = inv_post_ptr->second;
+                auto& inv_post = inv_post_ptr->second;
                 int nb_post = inv_post.size();
 
                 // Iterate over connected post neurons
@@ -160,7 +160,7 @@ class NormProjection(SpecificProjection):
                 auto inv_post_ptr = inv_pre_rank.find(rk_j);
                 if (inv_post_ptr == inv_pre_rank.end())
                     continue;
-                std::vector< std::pair<int, int> >& inv_post = inv_post_ptr->second;
+                auto& inv_post = inv_post_ptr->second;
                 int nb_post = inv_post.size();
 
                 // Iterate over connected post neurons
@@ -246,7 +246,7 @@ class NormProjection(SpecificProjection):
                 auto inv_post_ptr = inv_pre_rank.find(rk_j);
                 if (inv_post_ptr == inv_pre_rank.end())
                     continue;
-                std::vector< std::pair<int, int> >& inv_post = inv_post_ptr->second;
+                auto& inv_post = inv_post_ptr->second;
                 int nb_post = inv_post.size();
 
                 // Iterate over connected post neurons
@@ -279,7 +279,7 @@ class NormProjection(SpecificProjection):
                     auto inv_post_ptr = inv_pre_rank.find(rk_j);
                     if (inv_post_ptr == inv_pre_rank.end())
                         continue;
-                    std::vector< std::pair<int, int> >& inv_post = inv_post_ptr->second;
+                    auto& inv_post = inv_post_ptr->second;
                     int nb_post = inv_post.size();
 
                     // Iterate over connected post neurons
@@ -121,6 +121,7 @@ class Transpose(Projection):
         #
         # C++ definition and PYX wrapper
         self._specific_template['struct_additional'] = """
+#include "proj%(fwd_id_proj)s.hpp"
 extern ProjStruct%(fwd_id_proj)s proj%(fwd_id_proj)s;    // Forward projection
 """ % { 'fwd_id_proj': self.fwd_proj.id }
 
@@ -250,6 +251,7 @@ extern ProjStruct%(fwd_id_proj)s proj%(fwd_id_proj)s;    // Forward projection
 
         # Which projection is transposed
         self._specific_template['struct_additional'] = """
+#include "proj%(fwd_id_proj)s.hpp"
 extern ProjStruct%(fwd_id_proj)s proj%(fwd_id_proj)s;    // Forward projection
 """ % { 'fwd_id_proj': self.fwd_proj.id }
 
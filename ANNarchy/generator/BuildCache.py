@@ -0,0 +1,237 @@
+#===============================================================================
+#
+#     BuildCache.py
+#
+#     This file is part of ANNarchy.
+#
+#     Copyright (C) 2013-2022  Julien Vitay <julien.vitay@gmail.com>,
+#     Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     ANNarchy is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#===============================================================================
+import os, sys
+import time
+import shutil
+import hashlib
+import tempfile
+
+import numpy as np
+
+import ANNarchy
+import ANNarchy.core.Global as Global
+
+try:
+    import Cython
+    _cython_version = Cython.__version__
+except ImportError:
+    # the cython executable is found independently (see python_environment())
+    _cython_version = "unknown"
+
+try:
+    import fcntl
+except ImportError:
+    # e. g. Windows, concurrent eviction is then not synchronized
+    fcntl = None
+
+# Default settings, can be overwritten by a "cache" section in annarchy.json
+_default_cache_config = {
+    'path': "~/.cache/ANNarchy",
+    'max_size': 2048,   # in MB
+    'max_age': 30       # in days
+}
+
+class BuildCache(object):
+    """
+    User-level cache for compiled networks (ANNarchyCore*.so), shared across
+    working directories and processes.
+
+    An entry is addressed by a hash over the generated sources (file names and
+    content), the ANNarchy headers, the additional sources and libraries linked
+    into the network and the build configuration (compiler, flags, precision,
+    paradigm, ANNarchy release, Python, Cython and Numpy versions). If an entry exists,
+    the Cython translation and the C++ compilation can be skipped completely.
+
+    Entries are inserted atomically (write to a temporary file, then rename), so
+    concurrent readers never see partially written libraries. Eviction by age and
+    total size (least recently used first) is serialized by a lock file.
+    """
+    def __init__(self, user_config=None):
+        """
+        :param user_config: content of annarchy.json, an optional "cache" section can define 'path', 'max_size' (in MB) and 'max_age' (in days).
+        """
+        config = dict(_default_cache_config)
+        if user_config is not None and 'cache' in user_config.keys():
+            config.update(user_config['cache'])
+
+        self.path = os.path.expanduser(config['path'])
+        self.max_size = float(config['max_size']) * 1024 * 1024
+        self.max_age = float(config['max_age']) * 24 * 3600
+
+        self._entry_dir = self.path + '/builds'
+        if not os.path.exists(self._entry_dir):
+            os.makedirs(self._entry_dir, exist_ok=True)
+
+    @staticmethod
+    def compute_key(source_dir, build_config, exclude=[], dependencies=[]):
+        """
+        Computes the content hash for the generated sources in *source_dir* and the
+        provided *build_config* dictionary (compiler, flags, etc.). Files listed in
+        *exclude* are ignored. The content of the files listed in *dependencies*
+        (e. g. the add_sources and extra_libs of compile()) is added to the hash.
+        """
+        key = hashlib.sha256()
+
+        # build configuration
+        for name in sorted(build_config.keys()):
+            key.update((name + '=' + str(build_config[name]) + ';').encode('utf-8'))
+        key.update(('release=' + ANNarchy.__release__ + ';').encode('utf-8'))
+        key.update(('python=' + sys.version + ';').encode('utf-8'))
+        key.update(('cython=' + _cython_version + ';').encode('utf-8'))
+        key.update(('numpy=' + np.__version__ + ';').encode('utf-8'))
+        key.update(('platform=' + sys.platform + ';').encode('utf-8'))
+
+        # generated sources, the log files do not influence the build
+        for fname in sorted(os.listdir(source_dir)):
+            if fname.endswith('.log') or fname in exclude:
+                continue
+            BuildCache._update_with_file(key, source_dir + '/' + fname, fname)
+
+        # ANNarchy headers used by the generated code
+        include_dir = ANNarchy.__path__[0] + '/include'
+        for fname in sorted(os.listdir(include_dir)):
+            BuildCache._update_with_file(key, include_dir + '/' + fname, fname)
+
+        # user-provided sources and libraries, a missing file is recorded by its name
+        for path in dependencies:
+            if os.path.isfile(path):
+                BuildCache._update_with_file(key, path, path)
+            else:
+                key.update(('missing=' + path + ';').encode('utf-8'))
+
+        return key.hexdigest()
+
+    @staticmethod
+    def _update_with_file(key, path, fname):
+        "Add name and content of a file to the hash."
+        if not os.path.isfile(path):
+            return
+        key.update(fname.encode('utf-8'))
+        with open(path, 'rb') as rfile:
+            key.update(rfile.read())
+
+    def _entry_path(self, key):
+        return self._entry_dir + '/' + key + '.so'
+
+    def lookup(self, key, target):
+        """
+        Copies the cached library to *target* if it exists.
+
+        :return: True if the entry was found and copied, False otherwise.
+        """
+        entry = self._entry_path(key)
+        if not os.path.isfile(entry):
+            return False
+
+        try:
+            shutil.copy(entry, target)
+            # mark the entry as recently used
+            os.utime(entry, None)
+        except OSError:
+            # the entry was evicted by another process in the meantime
+            return False
+
+        return True
+
+    def store(self, key, source):
+        """
+        Inserts the library *source* into the cache and applies the eviction policy.
+        """
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self._entry_dir, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as wfile, open(source, 'rb') as rfile:
+                shutil.copyfileobj(rfile, wfile)
+            # rename is atomic on POSIX systems
+            os.replace(tmp_path, self._entry_path(key))
+        except OSError as e:
+            Global._debug('BuildCache.store():', e)
+            if tmp_path is not None:
+                self._remove(tmp_path)
+            return
+
+        self.evict()
+
+    def evict(self):
+        """
+        Removes entries older than *max_age* and afterwards the least recently used
+        entries until the cache is smaller than *max_size*.
+        """
+        with open(self.path + '/.lock', 'w') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+            try:
+                now = time.time()
+                entries = []
+                for fname in os.listdir(self._entry_dir):
+                    path = self._entry_dir + '/' + fname
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+
+                    # left-overs of crashed insertions
+                    if fname.endswith('.tmp'):
+                        if now - stat.st_mtime > 3600:
+                            self._remove(path)
+                        continue
+
+                    if now - stat.st_mtime > self.max_age:
+                        self._remove(path)
+                    else:
+                        entries.append((stat.st_mtime, stat.st_size, path))
+
+                total_size = sum([size for _, size, _ in entries])
+                for _, size, path in sorted(entries):
+                    if total_size <= self.max_size:
+                        break
+                    self._remove(path)
+                    total_size -= size
+
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def size_in_bytes(self):
+        "Returns the current size of all cached entries."
+        size = 0
+        for fname in os.listdir(self._entry_dir):
+            try:
+                size += os.stat(self._entry_dir + '/' + fname).st_size
+            except OSError:
+                continue
+        return size
+
+    def clear(self):
+        "Removes all entries."
+        shutil.rmtree(self._entry_dir, True)
+        os.makedirs(self._entry_dir, exist_ok=True)
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,144 @@
+#===============================================================================
+#
+#     ChildProcess.py
+#
+#     This file is part of ANNarchy.
+#
+#     Copyright (C) 2013-2022  Julien Vitay <julien.vitay@gmail.com>,
+#     Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     ANNarchy is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#===============================================================================
+"""
+Execution of a function in a new Python interpreter (used by the format autotuner
+and the profile-guided optimization).
+
+os.fork() can not be used for this purpose: once the current process executed an
+openMP parallel region (a previous simulation, the parallel loader, ...), the
+openMP runtime of the forked child deadlocks. multiprocessing with the "spawn"
+start method is not used either, as it executes the main script of the user again
+in the child process (ANNarchy scripts are usually not protected by
+``if __name__ == "__main__"``).
+
+The function and its arguments are transferred with pickle, together with the
+configuration, the constants and the functions declared with add_function().
+"""
+import os, sys
+import pickle
+import shutil
+import signal
+import tempfile
+import traceback
+import subprocess
+
+import ANNarchy
+import ANNarchy.core.Global as Global
+
+def run(function, args=(), timeout=None):
+    """
+    Calls ``function(*args)`` in a new Python interpreter and returns the result.
+
+    :param function: module-level function or method of a picklable object.
+    :param args: arguments of the function, which need to be picklable.
+    :param timeout: time in seconds after which the child process (and the processes it started, e. g. make) is killed.
+    :raises ChildProcessError: if the arguments can not be transferred, the function raised an exception or the process did not finish in time.
+    """
+    work_dir = tempfile.mkdtemp(prefix='annarchy_child_')
+    input_file = os.path.join(work_dir, 'input.pickle')
+    output_file = os.path.join(work_dir, 'output.pickle')
+
+    try:
+        # Configuration first, so that it is set before the arguments are unpickled
+        state = {
+            'config': dict(Global.config),
+            'constants': [(obj.name, float(obj.value)) for obj in Global._objects['constants']],
+            'functions': list(Global._objects['functions']),
+            'sys_path': list(sys.path),
+            'cwd': os.getcwd(),
+        }
+        try:
+            with open(input_file, 'wb') as wfile:
+                pickle.dump(state, wfile)
+                pickle.dump((function, tuple(args)), wfile)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            raise ChildProcessError("the arguments could not be transferred to the child process: " + str(e))
+
+        # The child imports the same ANNarchy package
+        env = dict(os.environ)
+        package_dir = os.path.dirname(os.path.dirname(os.path.abspath(ANNarchy.__file__)))
+        env['PYTHONPATH'] = package_dir + (os.pathsep + env['PYTHONPATH'] if 'PYTHONPATH' in env.keys() else "")
+
+        output = None if Global.config['debug'] else subprocess.DEVNULL
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+        process = subprocess.Popen(
+            [sys.executable, '-m', 'ANNarchy.generator.ChildProcess', work_dir],
+            env=env, stdout=output, stderr=output,
+            start_new_session=True  # own process group, killed as a whole after the timeout
+        )
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            _kill(process)
+            raise ChildProcessError("the child process did not finish within " + str(timeout) + " seconds.")
+        except BaseException:
+            _kill(process)
+            raise
+
+        try:
+            with open(output_file, 'rb') as rfile:
+                success, result = pickle.load(rfile)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            raise ChildProcessError("the child process terminated with exit code " + str(process.returncode) + ".")
+
+        if not success:
+            raise ChildProcessError(result)
+        return result
+
+    finally:
+        shutil.rmtree(work_dir, True)
+
+def _kill(process):
+    "Kills the child process and its own children."
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except (OSError, AttributeError):
+        process.kill()
+    process.wait()
+
+def _main(work_dir):
+    "Entry point of the child process."
+    with open(os.path.join(work_dir, 'input.pickle'), 'rb') as rfile:
+        state = pickle.load(rfile)
+
+        sys.path = state['sys_path']
+        os.chdir(state['cwd'])
+        Global.config.update(state['config'])
+        for name, value in state['constants']:
+            Global.Constant(name, value)
+        Global._objects['functions'] = state['functions']
+
+        try:
+            function, args = pickle.load(rfile)
+            result = (True, function(*args))
+        except BaseException:
+            result = (False, traceback.format_exc())
+
+    with open(os.path.join(work_dir, 'output.pickle'), 'wb') as wfile:
+        pickle.dump(result, wfile)
+
+if __name__ == "__main__":
+    _main(sys.argv[1])
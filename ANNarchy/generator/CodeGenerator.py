@@ -23,8 +23,8 @@
 #==============================================================================
 import time
 import ANNarchy.core.Global as Global
+from ANNarchy.core.Timings import _measure
 from ANNarchy.core.PopulationView import PopulationView
-from ANNarchy.parser.Extraction import extract_functions
 
 from ANNarchy.generator.PyxGenerator import PyxGenerator
 from ANNarchy.generator.MonitorGenerator import MonitorGenerator
@@ -158,6 +158,9 @@ class CodeGenerator(object):
         source_dest = self._annarchy_dir+'/generate/net'+str(self._net_id)+'/'
 
         # Generate header code for the analysed pops and projs
+        if Global.config['paradigm'] == "openmp":
+            with open(source_dest+'ANNarchyCommon.h', 'w') as ofile:
+                ofile.write(self._generate_common_header())
         with open(source_dest+'ANNarchy.h', 'w') as ofile:
             ofile.write(self._generate_header())
 
@@ -180,8 +183,10 @@ class CodeGenerator(object):
             raise NotImplementedError
 
         # Generate cython code for the analysed pops and projs
+        with _measure(self._net_id, 'generate', 'PyxGenerator'):
+            pyx_code = self._pyxgen.generate()
         with open(source_dest+'ANNarchyCore'+str(self._net_id)+'.pyx', 'w') as ofile:
-            ofile.write(self._pyxgen.generate())
+            ofile.write(pyx_code)
 
         self._generate_file_overview(source_dest)
 
@@ -291,24 +296,16 @@ class CodeGenerator(object):
             proj_struct += proj['include']
             proj_ptr += proj['extern']
 
-        # Custom functions
-        custom_func = self._header_custom_functions()
-
-        # Custom constants
-        custom_constant = self._header_custom_constants()
-
         # Final code
         header_code = ""
         if Global.config['paradigm'] == "openmp":
+            # functions and constants are declared in ANNarchyCommon.h
             header_code = BaseTemplate.omp_header_template % {
                 'float_prec': Global.config['precision'],
                 'pop_struct': pop_struct,
                 'proj_struct': proj_struct,
                 'pop_ptr': pop_ptr,
                 'proj_ptr': proj_ptr,
-                'custom_func': custom_func,
-                'custom_constant': custom_constant,
-                'built_in': BaseTemplate.built_in_functions + BaseTemplate.integer_power_cpu % {'float_prec': Global.config['precision']},
             }
         elif Global.config['paradigm'] == "cuda":
             header_code = BaseTemplate.cuda_header_template % {
@@ -317,15 +314,28 @@ class CodeGenerator(object):
                 'proj_struct': proj_struct,
                 'pop_ptr': pop_ptr,
                 'proj_ptr': proj_ptr,
-                'custom_func': custom_func,
+                'custom_func': self._header_custom_functions(),
                 'built_in': BaseTemplate.built_in_functions,
-                'custom_constant': custom_constant
+                'custom_constant': self._header_custom_constants()
             }
         else:
             raise NotImplementedError
 
         return header_code
 
+    def _generate_common_header(self):
+        """
+        Generate the ANNarchyCommon.h code (openMP only), which contains the
+        declarations needed by all translation units. It is included by the
+        population and projection headers instead of ANNarchy.h, so that the
+        object files only depend on the headers of the objects they use.
+        """
+        return BaseTemplate.omp_common_header_template % {
+            'custom_func': self._header_custom_functions(),
+            'custom_constant': self._header_custom_constants(),
+            'built_in': BaseTemplate.built_in_functions + BaseTemplate.integer_power_cpu % {'float_prec': Global.config['precision']},
+        }
+
     def _header_custom_functions(self):
         """
         Generate code for custom functions defined globally and are usable
@@ -335,6 +345,8 @@ class CodeGenerator(object):
         if len(Global._objects['functions']) == 0:
             return ""
 
+        from ANNarchy.parser.Extraction import extract_functions
+
         # Attention CUDA: this definition will work only on host side.
         code = ""
         for _, func in Global._objects['functions']:
@@ -521,6 +533,10 @@ void set_%(name)s(%(float_prec)s value){
             # custom constants
             custom_constant, _ = self._body_custom_constants()
 
+            # thread synchronization within a simulation step
+            sync_dict = self._body_synchronization(reset_sums, compute_sums, delay_code, update_globalops, update_synapse, post_event, structural_plasticity)
+            reset_sums += sync_dict.pop('sync_reset')
+
             # code fields for openMP/single thread template
             base_dict = {
                 'float_prec': Global.config['precision'],
@@ -541,7 +557,8 @@ void set_%(name)s(%(float_prec)s value){
                 'custom_constant': custom_constant,
             }
 
-            # profiling
+            # synchronization and profiling
+            base_dict.update(sync_dict)
             base_dict.update(prof_dict)
 
             # complete code template
@@ -583,6 +600,7 @@ void set_%(name)s(%(float_prec)s value){
                 custom_func += pop['custom_func']
             for proj in self._proj_desc:
                 custom_func += proj['custom_func']
+            from ANNarchy.parser.Extraction import extract_functions
             for _, func in Global._objects['functions']:
                 custom_func += extract_functions(func, local_global=True)[0]['cpp'].replace("inline", "__device__") + '\n'
 
@@ -763,6 +781,79 @@ void set_%(name)s(%(float_prec)s value){
 
         return code
 
+    def _body_synchronization(self, reset_sums, compute_sums, delay_code, update_globalops, update_synapse, post_event, structural_plasticity):
+        """
+        Thread synchronization between the phases of singleStep() for the openMP paradigm.
+
+        With step_scheduling="phases" the threads wait for each other after each phase. With
+        step_scheduling="dependencies" a barrier is only placed, if a later phase reads data
+        written by an earlier one. As the populations and projections rely on openMP work-sharing
+        constructs, which are not allowed within explicit tasks, the threads still process all
+        objects, but the objects without dependencies skip the implicit barriers (see the
+        PopulationGenerator).
+        """
+        if Global.config['step_scheduling'] not in ["phases", "dependencies"]:
+            Global._error('setup(): step_scheduling must be either "phases" or "dependencies", not', Global.config['step_scheduling'])
+
+        barrier = "\n    #pragma omp barrier\n"
+
+        if Global.config['step_scheduling'] == "phases":
+            return {
+                'sync_reset': "",
+                'sync_psp': barrier,
+                'sync_record_targets': barrier,
+                'sync_neuron': barrier,
+                'sync_delay': "",
+                'sync_synapse': barrier,
+                'sync_record': barrier
+            }
+
+        def _has_code(*codes):
+            return any(code.strip() != "" for code in codes)
+
+        # The accumulation of inputs requires zeroed arrays (the populations
+        # reset their sums without synchronization in between)
+        sync_reset = barrier if _has_code(reset_sums) and _has_code(compute_sums) else ""
+
+        # The neural update reads the accumulated inputs
+        sync_psp = barrier if _has_code(reset_sums, compute_sums) else ""
+
+        # The recorded inputs are modified during the neural update only by spiking
+        # populations (reset of conductances) or populations with specific code.
+        sync_record_targets = ""
+        for pop in self._populations:
+            if pop.neuron_type.type == "spike" or pop._specific_template != {}:
+                sync_record_targets = barrier
+                break
+
+        # Delayed variables, global operations and synapses read the neural variables.
+        # Otherwise, the barrier before the recording is sufficient.
+        sync_neuron = barrier if _has_code(delay_code, update_globalops, update_synapse, post_event, structural_plasticity) else ""
+
+        # The delay queues are updated without synchronization, but the synaptic
+        # update may access delayed pre-synaptic variables.
+        sync_delay = barrier if _has_code(delay_code) and _has_code(update_synapse, post_event, structural_plasticity) else ""
+
+        # The post-synaptic events and structural plasticity modify the synapses
+        sync_synapse = barrier if _has_code(post_event, structural_plasticity) else ""
+
+        # The monitors must finish before the time is increased. The number of
+        # recorders is equal for all threads.
+        sync_record = """
+    if (!recorders.empty()) {
+        #pragma omp barrier
+    }
+"""
+        return {
+            'sync_reset': sync_reset,
+            'sync_psp': sync_psp,
+            'sync_record_targets': sync_record_targets,
+            'sync_neuron': sync_neuron,
+            'sync_delay': sync_delay,
+            'sync_synapse': sync_synapse,
+            'sync_record': sync_record
+        }
+
     def _body_structural_plasticity(self):
         """
         Call of pruning or creating methods if necessary.
@@ -33,12 +33,15 @@ import numpy as np
 # ANNarchy core informations
 import ANNarchy
 import ANNarchy.core.Global as Global
+from ANNarchy.core.Timings import _record, _measure
 
 from ANNarchy.extensions.bold.NormProjection import _update_num_aff_connections
 from ANNarchy.generator.Template.MakefileTemplate import *
-from ANNarchy.generator.CodeGenerator import CodeGenerator
+from ANNarchy.generator.BuildCache import BuildCache
+from ANNarchy.generator.PrecompiledHeader import PrecompiledHeader
 from ANNarchy.generator.Sanity import check_structure, check_experimental_features
-from ANNarchy.generator.Utils import check_cuda_version
+from ANNarchy.generator.Utils import check_cuda_version, compiler_family
+from ANNarchy.parser.ParserCache import _parser_cache
 
 # String containing the extra libs which can be added by extensions
 # e.g. extra_libs = ['-lopencv_core', '-lopencv_video']
@@ -82,6 +85,50 @@ def _folder_management(annarchy_dir, profile_enabled, clean, net_id):
 
     sys.path.append(annarchy_dir)
 
+def _clean_build_required(annarchy_dir):
+    """
+    Returns True if the compilation folder *annarchy_dir* can not be re-used, i. e. it was
+    created by an older ANNarchy release or for another paradigm, or the last compilation
+    failed.
+    """
+    clean = False
+
+    # Test if the current ANNarchy version is newer than what was used to create the subfolder
+    from pkg_resources import parse_version
+    if os.path.isfile(annarchy_dir+'/release'):
+        with open(annarchy_dir+'/release', 'r') as rfile:
+            prev_release = rfile.read().strip()
+            prev_paradigm = ''
+
+            # HD (03.08.2016):
+            # in ANNarchy 4.5.7b I added also the paradigm to the release tag.
+            # This if clause can be removed in later releases (TODO)
+            if prev_release.find(',') != -1:
+                prev_paradigm, prev_release = prev_release.split(', ')
+            else:
+                # old release tag
+                clean = True
+
+            if parse_version(prev_release) < parse_version(ANNarchy.__release__):
+                clean = True
+
+            elif prev_paradigm != Global.config['paradigm']:
+                clean = True
+
+    else:
+        clean = True # for very old versions
+
+    # Check if the last compilation was successful
+    if os.path.isfile(annarchy_dir+'/compilation'):
+        with open(annarchy_dir + '/compilation', 'r') as rfile:
+            res = rfile.read()
+            if res.strip() == "0": # the last compilation failed
+                clean = True
+    else:
+        clean = True
+
+    return clean
+
 def setup_parser():
     """
     ANNarchy scripts can be run by several command line arguments. These are
@@ -124,6 +171,7 @@ def compile(
         silent=False,
         debug_build=False,
         profile_enabled=False,
+        pgo=False,
         net_id=0
     ):
     """
@@ -145,6 +193,7 @@ def compile(
     :param cuda_config: dictionary defining the CUDA configuration for each population and projection.
     :param annarchy_json: compiler flags etc can be stored in a .json file normally placed in the home directory (see comment below). With this flag one can directly assign a file location.
     :param silent: defines if status message like "Compiling... OK" should be printed.
+    :param pgo: enables profile-guided optimization (gcc and clang, openMP/sequential paradigm only). The library is first compiled with instrumentation and the network is simulated in a separate process to record the profile, before the library is compiled again using the profile. Either True (warm-up of 1000 ms or the "duration" of the "pgo" section in annarchy.json) or the warm-up duration in ms. The profile is kept in *directory* and re-used as long as the generated code does not change. Setting ``"pgo": {"enabled": true}`` in annarchy.json has the same effect as True, the warm-up is aborted after the "timeout" (in seconds, default: 600) of this section.
     """
     # Check if the network has already been compiled
     if Global._network[net_id]['compiled']:
@@ -152,6 +201,10 @@ def compile(
     If you are re-running a Jupyter notebook, you should call `clear()` right after importing ANNarchy in order to reset everything.""")
         return
 
+    # Timings of the different stages, see compile_timings()
+    t_compile = time.time()
+    Global._network[net_id]['timings'] = {}
+
     # Get the command-line arguments
     parser = setup_parser()
     options, unknown = parser.parse_known_args()
@@ -227,38 +280,8 @@ def compile(
     #    Global._warning("OpenMP is still not supported by the default clang on Mac OS... Running single-threaded.")
     #    Global.config['num_threads'] = 1
 
-    # Test if the current ANNarchy version is newer than what was used to create the subfolder
-    from pkg_resources import parse_version
-    if os.path.isfile(annarchy_dir+'/release'):
-        with open(annarchy_dir+'/release', 'r') as rfile:
-            prev_release = rfile.read().strip()
-            prev_paradigm = ''
-
-            # HD (03.08.2016):
-            # in ANNarchy 4.5.7b I added also the paradigm to the release tag.
-            # This if clause can be removed in later releases (TODO)
-            if prev_release.find(',') != -1:
-                prev_paradigm, prev_release = prev_release.split(', ')
-            else:
-                # old release tag
-                clean = True
-
-            if parse_version(prev_release) < parse_version(ANNarchy.__release__):
-                clean = True
-
-            elif prev_paradigm != Global.config['paradigm']:
-                clean = True
-
-    else:
-        clean = True # for very old versions
-
-    # Check if the last compilation was successful
-    if os.path.isfile(annarchy_dir+'/compilation'):
-        with open(annarchy_dir + '/compilation', 'r') as rfile:
-            res = rfile.read()
-            if res.strip() == "0": # the last compilation failed
-                clean = True
-    else:
+    # Test if the compilation folder can be re-used
+    if _clean_build_required(annarchy_dir):
         clean = True
 
     # Manage the compilation subfolder
@@ -283,7 +306,11 @@ def compile(
     )
 
     # Code Generation
-    compiler.generate()
+    pgo_duration = compiler.pgo_duration(pgo)
+    if pgo_duration is None:
+        compiler.generate()
+    else:
+        compiler.generate_with_pgo(pgo_duration)
 
     if Global.config['verbose']:
         net_str = "" if compiler.net_id == 0 else str(compiler.net_id)+" "
@@ -295,9 +322,95 @@ def compile(
     # NormProjections require an update of afferent projections
     _update_num_aff_connections(compiler.net_id)
 
+    _record(net_id, time.time() - t_compile, 'total')
+
     if Global.config['verbose']:
         Global._print('OK')
 
+def check_rebuild(
+        directory='annarchy',
+        populations=None,
+        projections=None,
+        compiler="default",
+        compiler_flags="default",
+        add_sources="",
+        extra_libs="",
+        annarchy_json="",
+        silent=False,
+        net_id=0
+    ):
+    """
+    Checks if a call to ``compile()`` with the same arguments would recompile the C++ library, e. g. after the model definitions were edited.
+
+    The code for the current network is generated and compared to the code of the last compilation in *directory*, but it is neither compiled nor loaded.
+    Values of parameters, initial values of variables and ``Constant`` values are set at runtime and do not require a recompilation, while changes
+    to the equations (including numerical values inside them and in bounds like ``min=0.0``), flags or the population sizes do.
+
+    ```python
+    if check_rebuild():
+        print('The network will be recompiled.')
+    compile()
+    ```
+
+    :param directory: name of the subdirectory where the code was generated and compiled (default: "annarchy/").
+    :param silent: if False (default), the modified files and the differing lines of code are printed.
+    :return: list of the modified source files. An empty list means that the existing library will be re-used.
+    """
+    # Populations and projections to compile
+    if populations is None:
+        populations = Global._network[net_id]['populations']
+    if projections is None:
+        projections = Global._network[net_id]['projections']
+
+    # Compiling directory
+    annarchy_dir = os.getcwd() + '/' + directory
+    if not annarchy_dir.endswith('/'):
+        annarchy_dir += '/'
+
+    # A complete build is required
+    if _clean_build_required(annarchy_dir) or \
+        not os.path.isdir(annarchy_dir + 'build/net' + str(net_id)) or \
+        not os.path.isfile(annarchy_dir + 'ANNarchyCore' + str(net_id) + '.so'):
+        if not silent:
+            Global._print('check_rebuild(): no re-usable library in', annarchy_dir + ', the network will be compiled entirely.')
+        return ['ANNarchyCore' + str(net_id) + '.so']
+
+    if not os.path.exists(annarchy_dir + 'generate/net' + str(net_id)):
+        os.makedirs(annarchy_dir + 'generate/net' + str(net_id))
+
+    compiler = Compiler(
+        annarchy_dir=annarchy_dir,
+        clean=False,
+        compiler=compiler,
+        compiler_flags=compiler_flags,
+        add_sources=add_sources,
+        extra_libs=extra_libs,
+        path_to_json=annarchy_json,
+        silent=True,
+        cuda_config={'device': 0},
+        debug_build=Global.config["debug"],
+        profile_enabled=Global.config["profiling"],
+        populations=populations,
+        projections=projections,
+        net_id=net_id
+    )
+
+    # Generate the code and the Makefile without compiling it
+    check_structure(populations, projections)
+    compiler.code_generation()
+    compiler.generate_makefile()
+
+    modified, removed = compiler.modified_files()
+
+    if not silent:
+        if len(modified + removed) == 0:
+            Global._print('check_rebuild(): the generated code is unchanged, the library will be re-used.')
+        else:
+            Global._print('check_rebuild(): the network will be recompiled, as the following files have changed:')
+            Global._print(compiler.describe_changes(modified + removed).rstrip())
+
+    return modified + removed
+
 def python_environment():
     """
     Python environment configuration, required by Compiler.generate_makefile. Contains among others the python version, library path and cython version.
@@ -385,6 +498,9 @@ class Compiler(object):
         self.projections = projections
         self.net_id = net_id
 
+        # Additional flags for profile-guided optimization (see generate_with_pgo())
+        self.pgo_flags = ""
+
         # Get user-defined config
         self.user_config = {
             'openmp': {
@@ -417,10 +533,27 @@ class Compiler(object):
 
     def generate(self):
         "Perform the code generation for the C++ code and create the Makefile."
+        changed = self._generate_sources()
+
+        # Perform compilation if something has changed
+        if changed or not os.path.isfile(self.annarchy_dir + '/ANNarchyCore' + str(self.net_id) + '.so'):
+            self.compilation()
+
+        self._register_library()
+
+    def _generate_sources(self):
+        """
+        Generates the C++ code and the Makefile, the files are copied into the
+        build directory if they changed.
+
+        :return: True if the sources in the build directory changed.
+        """
+        t_sources = time.time()
         if Global._profiler or Global.config["show_time"]:
             t0 = time.time()
             if Global._profiler:
                 Global._profiler.add_entry(t0, t0, "overall", "compile")
+                self._t_generate = t0
 
         if Global.config['verbose']:
             net_str = "" if self.net_id == 0 else str(self.net_id)+" "
@@ -433,13 +566,20 @@ class Compiler(object):
         check_experimental_features(self.populations, self.projections)
 
         # Generate the code
-        self.code_generation()
+        with _measure(self.net_id, 'generate', 'CodeGenerator'):
+            self.code_generation()
 
         # Generate the Makefile
-        self.generate_makefile()
+        with _measure(self.net_id, 'generate', 'makefile'):
+            self.generate_makefile()
 
         # Copy the files if needed
-        changed = self.copy_files()
+        with _measure(self.net_id, 'generate', 'copy_files'):
+            changed = self.copy_files()
+
+        # Keep the translated equations for later scripts
+        if Global.config['parser_cache']:
+            _parser_cache.save()
 
         # Code generation done
         if Global.config['verbose']:
@@ -448,11 +588,14 @@ class Compiler(object):
                 Global._print("OK", flush=True)
             else:
                 Global._print("OK (took "+str(t1-t0)+" seconds)", flush=True)
+            _parser_cache.report()
 
-        # Perform compilation if something has changed
-        if changed or not os.path.isfile(self.annarchy_dir + '/ANNarchyCore' + str(self.net_id) + '.so'):
-            self.compilation()
+        _record(self.net_id, time.time() - t_sources, 'generate', 'total')
+
+        return changed
 
+    def _register_library(self):
+        "Prepares the loading of the compiled library and marks the network as compiled."
         if Global.config["debug"] or Global.config["disable_shared_library_time_offset"]:
             # In case of debugging or high-throughput simulations we want to
             # disable the below trick
@@ -468,7 +611,7 @@ class Compiler(object):
         Global._network[self.net_id]['compiled'] = True
         if Global._profiler:
             t1 = time.time()
-            Global._profiler.update_entry(t0, t1, "overall", "compile")
+            Global._profiler.update_entry(self._t_generate, t1, "overall", "compile")
 
     def copy_files(self):
         " Copy the generated files in the build/ folder if needed."
@@ -484,50 +627,297 @@ class Compiler(object):
             changed = True
 
         else: # only the ones which have changed
-            import filecmp
-            for file in os.listdir(self.annarchy_dir+'/generate/net'+ str(self.net_id)):
-                if file.endswith(".log"):
-                    continue
+            modified, removed = self.modified_files()
 
-                if not os.path.isfile(self.annarchy_dir+'/build/net'+ str(self.net_id) + '/' + file) or \
-                    not file == "codegen.log" and \
-                    not filecmp.cmp(self.annarchy_dir+'/generate/net' + str(self.net_id) + '/' + file,
-                                    self.annarchy_dir+'/build/net'+ str(self.net_id) + '/' + file):
+            for file in modified:
+                shutil.copy(self.annarchy_dir+'/generate/net'+ str(self.net_id) + '/' + file, # src
+                            self.annarchy_dir+'/build/net'+ str(self.net_id) + '/' +file # dest
+                           )
+                changed = True
 
+            # Remove files which existed before in build/net but not in generate anymore
+            for file in removed:
+                basename, _ = os.path.splitext(file)
+                os.remove(self.annarchy_dir+'/build/net'+ str(self.net_id) + '/' + file)
+                for ext in ['.o', '.d']: # object file and its header dependencies
+                    if os.path.isfile(self.annarchy_dir+'/build/net'+ str(self.net_id) + '/' + basename + ext):
+                        os.remove(self.annarchy_dir+'/build/net'+ str(self.net_id) + '/' + basename + ext)
+                changed = True
 
-                    shutil.copy(self.annarchy_dir+'/generate//net'+ str(self.net_id) + '/' + file, # src
-                                self.annarchy_dir+'/build/net'+ str(self.net_id) + '/' +file # dest
-                               )
-                    changed = True
+            if Global.config["verbose"] and changed:
+                Global._print(self.describe_changes(modified + removed).rstrip())
 
-                    if Global.config["verbose"]:
-                        print(file, 'has changed')
-                        # For debugging
-                        # with open(self.annarchy_dir+'/generate/net'+ str(self.net_id) + '/' + file, 'r') as rfile:
-                        #     text = rfile.read()
-                        #     print(text)
+        return changed
 
-            # Needs to check now if a file existed before in build/net but not in generate anymore
-            for file in os.listdir(self.annarchy_dir+'/build/net'+ str(self.net_id)):
-                if file == 'Makefile':
-                    continue
-                if file.endswith(".log"):
-                    continue
-                basename, extension = os.path.splitext(file)
-                if not extension in ['h', 'hpp', 'cpp', 'cu']: # ex: .o
-                    continue
-                if not os.path.isfile(self.annarchy_dir+'/generate/net'+ str(self.net_id) + '/' + file):
-                    if file.startswith('ANNarchyCore'):
-                        continue
-                    os.remove(self.annarchy_dir+'/build/net'+ str(self.net_id) + '/' + file)
-                    if os.path.isfile(self.annarchy_dir+'/build/net'+ str(self.net_id) + '/' + basename + '.o'):
-                        os.remove(self.annarchy_dir+'/build/net'+ str(self.net_id) + '/' + basename + '.o')
-                    changed = True
+    def modified_files(self):
+        """
+        Compares the generated files (generate/ folder) with the files used for the last
+        compilation (build/ folder).
 
-        return changed
+        :return: two lists: the files which are new or have changed and the source files which do not exist anymore.
+        """
+        import filecmp
+        generate_dir = self.annarchy_dir+'/generate/net'+ str(self.net_id) + '/'
+        build_dir = self.annarchy_dir+'/build/net'+ str(self.net_id) + '/'
+
+        modified = []
+        for file in sorted(os.listdir(generate_dir)):
+            if file.endswith(".log"):
+                continue
+
+            if not os.path.isfile(build_dir + file) or \
+                not filecmp.cmp(generate_dir + file, build_dir + file, shallow=False):
+                modified.append(file)
+
+        removed = []
+        for file in sorted(os.listdir(build_dir)):
+            if file == 'Makefile':
+                continue
+            if file.endswith(".log"):
+                continue
+            _, extension = os.path.splitext(file)
+            if not extension in ['.h', '.hpp', '.cpp', '.cu']: # ex: .o
+                continue
+            if file.startswith('ANNarchyCore'):
+                continue
+            if not os.path.isfile(generate_dir + file):
+                removed.append(file)
+
+        return modified, removed
+
+    def describe_changes(self, files, max_lines=5):
+        """
+        Human-readable summary which objects are affected by the modified *files* and
+        which lines of the generated code differ.
+        """
+        import difflib
+
+        generate_dir = self.annarchy_dir+'/generate/net'+ str(self.net_id) + '/'
+        build_dir = self.annarchy_dir+'/build/net'+ str(self.net_id) + '/'
+
+        # Map the generated files to the objects
+        objects = {}
+        for pop in self.populations:
+            objects['pop'+str(pop.id)] = 'population ' + pop.name
+        for proj in self.projections:
+            objects['proj'+str(proj.id)] = 'projection ' + proj.name
+
+        report = ""
+        for file in files:
+            basename, _ = os.path.splitext(file)
+            report += file
+            if basename in objects.keys():
+                report += ' (' + objects[basename] + ')'
+
+            if not os.path.isfile(build_dir + file):
+                report += ': new file\n'
+                continue
+            if not os.path.isfile(generate_dir + file):
+                report += ': removed\n'
+                continue
+            report += ':\n'
+
+            with open(build_dir + file, 'r') as rfile:
+                old_code = rfile.readlines()
+            with open(generate_dir + file, 'r') as rfile:
+                new_code = rfile.readlines()
+
+            diff = [line.rstrip() for line in difflib.unified_diff(old_code, new_code, n=0)
+                        if line[0] in ['-', '+'] and not line.startswith('---') and not line.startswith('+++')]
+            for line in diff[:max_lines]:
+                report += '    ' + line + '\n'
+            if len(diff) > max_lines:
+                report += '    ... (' + str(len(diff)-max_lines) + ' more lines)\n'
+
+        return report
+
+    def pgo_duration(self, pgo):
+        """
+        Returns the warm-up duration (in ms) used for profile-guided optimization
+        or None if it is disabled.
+
+        :param pgo: argument of compile(), False, True or a duration.
+        """
+        pgo_config = self.user_config['pgo'] if 'pgo' in self.user_config.keys() else {}
+
+        if pgo is False or pgo is None:
+            if not pgo_config.get('enabled', False):
+                return None
+            pgo = True
+
+        if pgo is True:
+            duration = pgo_config.get('duration', 1000.0)
+        else:
+            duration = pgo
+
+        if not isinstance(duration, (int, float)) or duration <= 0.0:
+            Global._error('compile(): the warm-up duration for profile-guided optimization must be a positive number (got ' + str(duration) + ').')
+
+        return float(duration)
+
+    def generate_with_pgo(self, duration):
+        """
+        Profile-guided optimization: an instrumented library is compiled and the
+        network is simulated for *duration* ms in a child process to record the
+        execution profile (see _pgo_warm_up()). The library is then compiled again
+        using the profile.
+
+        The profile is stored in annarchy_dir/pgo/netX together with a hash of the
+        generated code and re-used as long as the code does not change.
+        """
+        if self.compiler == "default":
+            self.compiler = self.user_config['openmp']['compiler']
+        family = compiler_family(self.compiler)
+
+        if not Global._check_paradigm("openmp") or family is None:
+            Global._warning('compile(): profile-guided optimization is only available for gcc and clang (openMP/sequential paradigm), compiling without.')
+            self.generate()
+            return
+
+        pgo_dir = self.annarchy_dir + '/pgo/net' + str(self.net_id)
+        build_dir = self.annarchy_dir + '/build/net' + str(self.net_id)
+        library = self.annarchy_dir + '/ANNarchyCore' + str(self.net_id) + '.so'
+
+        # Generate the code assuming that a valid profile exists
+        self.pgo_flags = self._pgo_flags(family, pgo_dir, instrument=False)
+        changed = self._generate_sources()
+
+        # Re-use the recorded profile if the code did not change
+        profile_key = self._pgo_key(duration)
+        if self._pgo_profile_valid(pgo_dir, profile_key):
+            if changed or not os.path.isfile(library):
+                self.compilation()
+            self._register_library()
+            return
+
+        # The build cache can not distinguish between different profiles
+        build_cache = Global.config['build_cache']
+        Global.config['build_cache'] = False
+
+        try:
+            # Instrumented build
+            shutil.rmtree(pgo_dir, True)
+            os.makedirs(pgo_dir)
+            self.pgo_flags = self._pgo_flags(family, pgo_dir, instrument=True)
+            self._rebuild_with_flags(build_dir)
+
+            if not self.silent:
+                Global._print('Recording the profile (' + str(duration) + ' ms) ...', end=" ", flush=True)
+            with _measure(self.net_id, 'pgo', 'warm_up'):
+                success = self._pgo_warm_up(duration)
+                if success and family == "clang":
+                    success = self._pgo_merge_profile(pgo_dir)
+            if not self.silent:
+                Global._print('OK' if success else 'failed')
+
+            # Optimized build, without profile if the warm-up failed
+            if success:
+                self.pgo_flags = self._pgo_flags(family, pgo_dir, instrument=False)
+            else:
+                Global._warning('compile(): the profile could not be recorded, compiling without profile-guided optimization.')
+                self.pgo_flags = ""
+            self._rebuild_with_flags(build_dir)
+
+            if success:
+                with open(pgo_dir + '/key', 'w') as wfile:
+                    wfile.write(profile_key)
+        finally:
+            Global.config['build_cache'] = build_cache
+
+        self._register_library()
+
+    @staticmethod
+    def _pgo_flags(family, pgo_dir, instrument):
+        "Compiler flags to record (instrument=True) or to apply the profile."
+        if family == "gcc":
+            if instrument:
+                # the counters are updated by several openMP threads
+                return "-fprofile-generate=" + pgo_dir + " -fprofile-update=prefer-atomic"
+            return "-fprofile-use=" + pgo_dir + " -fprofile-correction -Wno-missing-profile"
+        else:
+            if instrument:
+                return "-fprofile-generate=" + pgo_dir
+            return "-fprofile-use=" + pgo_dir + "/annarchy.profdata -Wno-profile-instr-unprofiled -Wno-profile-instr-out-of-date"
+
+    def _pgo_key(self, duration):
+        "Hash over the generated sources (without the Makefile), the compiler and the warm-up duration."
+        return BuildCache.compute_key(
+            self.annarchy_dir + '/generate/net' + str(self.net_id),
+            {
+                'compiler': self.compiler,
+                'compiler_flags': self.compiler_flags,
+                'duration': duration
+            },
+            exclude=['Makefile']
+        )
+
+    @staticmethod
+    def _pgo_profile_valid(pgo_dir, profile_key):
+        "Checks if a profile was recorded for the current code."
+        try:
+            with open(pgo_dir + '/key', 'r') as rfile:
+                return rfile.read().strip() == profile_key
+        except OSError:
+            return False
+
+    def _rebuild_with_flags(self, build_dir):
+        "Writes the Makefile for the current flags and recompiles all objects."
+        self.generate_makefile()
+        for file in ['Makefile', 'compile_flags']:
+            shutil.copy(self.annarchy_dir + '/generate/net' + str(self.net_id) + '/' + file, build_dir + '/' + file)
+        self.compilation()
+
+    def _pgo_warm_up(self, duration):
+        """
+        Simulates the instrumented library in a new Python interpreter (see
+        ChildProcess, a forked process deadlocks if an openMP parallel region
+        was already executed), which writes the profile when it quits. The
+        populations, projections and monitors are transferred to the child.
+
+        :return: True if the simulation succeeded.
+        """
+        from ANNarchy.generator import ChildProcess
+
+        pgo_config = self.user_config['pgo'] if 'pgo' in self.user_config.keys() else {}
+        network = {key: Global._network[self.net_id][key] for key in ['populations', 'projections', 'monitors', 'extensions']}
+
+        try:
+            ChildProcess.run(
+                _pgo_simulate,
+                (self.net_id, network, self.annarchy_dir, duration, self.cuda_config, self.user_config),
+                timeout=pgo_config.get('timeout', 600.0)
+            )
+        except ChildProcessError as e:
+            Global._debug('compile(): the warm-up simulation failed:', e)
+            return False
+        return True
+
+    def _pgo_merge_profile(self, pgo_dir):
+        "clang writes raw profiles, which need to be merged with llvm-profdata."
+        profdata = self.user_config['pgo'].get('profdata', 'llvm-profdata') if 'pgo' in self.user_config.keys() else 'llvm-profdata'
+        raw_profiles = [pgo_dir + '/' + f for f in os.listdir(pgo_dir) if f.endswith('.profraw')]
+        if len(raw_profiles) == 0:
+            return False
+        try:
+            subprocess.check_call([profdata, 'merge', '-output=' + pgo_dir + '/annarchy.profdata'] + raw_profiles)
+        except (OSError, subprocess.CalledProcessError) as e:
+            Global._debug('llvm-profdata:', e)
+            return False
+        return True
 
     def compilation(self):
         """ Create ANNarchyCore.so and py extensions if something has changed. """
+        t_compilation = time.time()
+
+        # Re-use a previously compiled library if available
+        build_cache = None
+        if Global.config['build_cache']:
+            build_cache, cache_key = self._lookup_build_cache()
+            if build_cache is None:
+                Global._network[self.net_id]['timings'].setdefault('compilation', {})['build_cache'] = True
+                _record(self.net_id, time.time() - t_compilation, 'compilation', 'total')
+                return
+
         # STDOUT
         if not self.silent:
             if Global.config["verbose"]:
@@ -548,8 +938,12 @@ class Compiler(object):
         # Start the compilation
         verbose = "> compile_stdout.log 2> compile_stderr.log" if not Global.config["verbose"] else ""
 
+        # The Makefile appends the start and end of each step to this file
+        if os.path.isfile(_build_timings_file):
+            os.remove(_build_timings_file)
+
         # Start the compilation process
-        make_process = subprocess.Popen("make all -j4" + verbose, shell=True)
+        make_process = subprocess.Popen("make all -j" + str(self._number_of_build_jobs()) + " " + verbose, shell=True)
 
         # Check for errors
         if make_process.wait() != 0:
@@ -567,9 +961,24 @@ class Compiler(object):
             with open(self.annarchy_dir + '/compilation', 'w') as wfile:
                 wfile.write("1")
 
+        build_timings = _read_build_timings(_build_timings_file)
+
         # Return to the current directory
         os.chdir(cwd)
 
+        for stage, duration in build_timings.items():
+            if stage == 'objects':
+                for obj, obj_duration in duration.items():
+                    _record(self.net_id, obj_duration, 'compilation', 'objects', obj)
+            else:
+                _record(self.net_id, duration, 'compilation', stage)
+        Global._network[self.net_id]['timings'].setdefault('compilation', {})['build_cache'] = False
+        _record(self.net_id, time.time() - t_compilation, 'compilation', 'total')
+
+        # Store the library for later re-use
+        if build_cache is not None:
+            build_cache.store(cache_key, self.annarchy_dir + '/ANNarchyCore' + str(self.net_id) + '.so')
+
         if not self.silent:
             t1 = time.time()
 
@@ -581,6 +990,85 @@ class Compiler(object):
             if Global._profiler:
                 Global._profiler.add_entry(t0, t1, "compilation", "compile")
 
+    def _number_of_build_jobs(self):
+        """
+        Number of parallel jobs used by make. The value set by setup(build_jobs=...)
+        has priority over the "build_jobs" entry in annarchy.json. By default, all
+        available cores are used.
+        """
+        num_jobs = Global.config['build_jobs']
+        if num_jobs is None and 'build_jobs' in self.user_config.keys():
+            num_jobs = self.user_config['build_jobs']
+        if num_jobs is None:
+            num_jobs = multiprocessing.cpu_count()
+
+        if not isinstance(num_jobs, int) or num_jobs < 1:
+            Global._error('The number of build jobs must be a positive integer (got ' + str(num_jobs) + ').')
+
+        return num_jobs
+
+    def _build_dependencies(self):
+        """
+        Files of the *add_sources* and *extra_libs* arguments (and the module-level
+        extra_libs list), which are compiled or linked into the library. Relative
+        paths are resolved from the build directory, where make is called. Libraries
+        given as -l<name> are searched in the directories provided with -L.
+        """
+        build_dir = self.annarchy_dir + '/build/net' + str(self.net_id)
+
+        def resolve(path):
+            return os.path.normpath(path if os.path.isabs(path) else os.path.join(build_dir, path))
+
+        libs = self.extra_libs.split() + [str(lib) for lib in extra_libs]
+        lib_dirs = [resolve(lib[2:]) for lib in libs if lib.startswith('-L')]
+
+        dependencies = [resolve(src) for src in self.add_sources.split()]
+        for lib in libs:
+            if lib.startswith('-l'):
+                for lib_dir in lib_dirs:
+                    for suffix in ['.so', '.a']:
+                        if os.path.isfile(lib_dir + '/lib' + lib[2:] + suffix):
+                            dependencies.append(lib_dir + '/lib' + lib[2:] + suffix)
+            elif not lib.startswith('-'):
+                dependencies.append(resolve(lib))
+
+        return dependencies
+
+    def _lookup_build_cache(self):
+        """
+        Checks if the user-level build cache contains a library for the current
+        generated code and compiler configuration. If yes, the library is copied
+        to the annarchy directory.
+
+        :return: (None, None) if the library was found, otherwise the cache instance and the key to store the new library.
+        """
+        build_cache = BuildCache(self.user_config)
+        cache_key = BuildCache.compute_key(
+            self.annarchy_dir + '/generate/net' + str(self.net_id),
+            {
+                'compiler': self.compiler,
+                'compiler_flags': self.compiler_flags,
+                'precision': Global.config['precision'],
+                'paradigm': Global.config['paradigm'],
+            },
+            dependencies=self._build_dependencies()
+        )
+
+        if not build_cache.lookup(cache_key, self.annarchy_dir + '/ANNarchyCore' + str(self.net_id) + '.so'):
+            return build_cache, cache_key
+
+        with open(self.annarchy_dir + '/compilation', 'w') as wfile:
+            wfile.write("1")
+
+        if not self.silent:
+            msg = 'Compiling '
+            if self.net_id > 0:
+                msg += 'network ' + str(self.net_id)
+            msg += '... OK (from build cache)'
+            Global._print(msg)
+
+        return None, None
+
     def generate_makefile(self):
         """
         Generate the Makefile.
@@ -605,6 +1093,10 @@ class Compiler(object):
             cpu_flags += " -g"
             #extra_libs.append("-lpapi")
 
+        # Instrumentation or usage of the recorded profile
+        if self.pgo_flags != "" and Global._check_paradigm("openmp"):
+            cpu_flags += " " + self.pgo_flags
+
         # OpenMP flag
         omp_flag = ""
         if Global.config['paradigm'] == "openmp" :
@@ -683,6 +1175,32 @@ class Compiler(object):
         else: # Windows: to test....
             Global._warning("Compilation on windows is not supported yet.")
 
+        # Object files, each population and projection forms its own translation unit
+        objects = "ANNarchy.o ANNarchyCore" + str(self.net_id) + ".o"
+        if Global._check_paradigm("openmp"):
+            for pop in self.populations:
+                objects += " pop" + str(pop.id) + ".o"
+            for proj in self.projections:
+                objects += " proj" + str(proj.id) + ".o"
+
+        # Precompiled header for the standard library and ANNarchy/include,
+        # shared by all networks with the same compiler configuration
+        pch = ""
+        pch_header = ""
+        pch_rule = ""
+        # (not with PGO, as the flags of each project directory differ)
+        if Global.config['precompiled_headers'] and Global._check_paradigm("openmp") and self.pgo_flags == "":
+            pch_header, pch_ext = PrecompiledHeader(self.user_config).prepare(self.compiler, {
+                'cpu_flags': cpu_flags,
+                'openmp': omp_flag,
+                'template': makefile_template
+            })
+            if pch_header is not None:
+                pch = pch_header + pch_ext
+                pch_rule = pch_rule_template % {'pch_header': pch_header}
+            else:
+                pch_header = ""
+
         # Gather all Makefile flags
         makefile_flags = {
             'compiler': self.compiler,
@@ -704,22 +1222,78 @@ class Compiler(object):
             'annarchy_include': annarchy_include,
             'thirdparty_include': thirdparty_include,
             'net_id': self.net_id,
-            'cython_ext': path_to_cython_ext
+            'cython_ext': path_to_cython_ext,
+            'objects': objects,
+            'pch': pch,
+            'pch_header': pch_header,
+            'pch_rule': pch_rule,
+            'python': sys.executable,
+            'timings': _build_timings_file
         }
 
         # Write the Makefile to the disk
         with open(self.annarchy_dir + '/generate/net'+ str(self.net_id) + '/Makefile', 'w') as wfile:
             wfile.write(makefile_template % makefile_flags)
 
+        # The object files depend on this file, so that they are rebuilt if the flags change
+        with open(self.annarchy_dir + '/generate/net'+ str(self.net_id) + '/compile_flags', 'w') as wfile:
+            wfile.write(self.compiler + ' ' + cpu_flags + ' ' + omp_flag + ' ' + pch + '\n')
+
 
     def code_generation(self):
         """
         Code generation dependent on paradigm
         """
+        # The code generators (templates for all paradigms) are only loaded if
+        # a network is actually generated.
+        from ANNarchy.generator.CodeGenerator import CodeGenerator
+
         generator = CodeGenerator(self.annarchy_dir, self.populations, self.projections, self.net_id, self.cuda_config)
         generator.generate()
 
 
+# Written by the generated Makefile, one line for the start and the end of each step
+_build_timings_file = 'compile_times.log'
+
+def _read_build_timings(filename):
+    """
+    Parses the file written by the Makefile (lines "<target> start|end <timestamp>").
+
+    :return: dictionary with the duration (in seconds) of the Cython translation ("cython"), of each object file ("objects"), of the precompiled header ("precompiled_header") and of the linking ("link"). Steps which were not executed by make are missing.
+    """
+    timings = {}
+    try:
+        with open(filename, 'r') as rfile:
+            lines = rfile.readlines()
+    except OSError:
+        return timings
+
+    starts = {}
+    for line in lines:
+        try:
+            target, event, stamp = line.strip().rsplit(' ', 2)
+            stamp = float(stamp)
+        except ValueError:
+            continue
+
+        if event == 'start':
+            starts[target] = stamp
+            continue
+        if event != 'end' or target not in starts:
+            continue
+
+        duration = stamp - starts.pop(target)
+        if target.endswith('.so'):
+            timings['link'] = duration
+        elif target.endswith('.o'):
+            timings.setdefault('objects', {})[target[:-2]] = duration
+        elif target.endswith('.cpp'):
+            timings['cython'] = duration
+        else:
+            timings['precompiled_header'] = duration
+
+    return timings
+
 def load_cython_lib(libname, libpath):
     """
     Load the shared library created by Cython using importlib. Follows the example
@@ -749,11 +1323,28 @@ def load_cython_lib(libname, libpath):
 
     return module
 
+def _pgo_simulate(net_id, network, annarchy_dir, duration, cuda_config, user_config):
+    """
+    Executed in the child process of the profile-guided optimization: loads the
+    instrumented library for the transferred network and simulates it.
+    """
+    from ANNarchy.core.Simulate import simulate
+
+    while len(Global._network) <= net_id:
+        Global._network.add_network(None)
+    Global._network[net_id].update(network)
+    Global._network[net_id]['directory'] = annarchy_dir
+    Global._network[net_id]['compiled'] = True
+
+    _instantiate(net_id, cuda_config=cuda_config, user_config=user_config)
+    _update_num_aff_connections(net_id)
+    simulate(duration, callbacks=False, net_id=net_id)  # the callbacks are not transferred
+
 def _instantiate(net_id, import_id=-1, cuda_config=None, user_config=None, core_list=None):
     """ After every is compiled, actually create the Cython objects and
         bind them to the Python ones."""
+    t0 = time.time()
     if Global._profiler:
-        t0 = time.time()
         Global._profiler.add_entry(t0, t0, "overall", "instantiate") # placeholder, to have the correct ordering
 
     # parallel_run(number=x) defines multiple networks (net_id) but only network0 is compiled
@@ -765,7 +1356,8 @@ def _instantiate(net_id, import_id=-1, cuda_config=None, user_config=None, core_
     libname = 'ANNarchyCore' + str(import_id)
     libpath = annarchy_dir + '/' + libname + '.so'
 
-    cython_module = load_cython_lib(libname, libpath)
+    with _measure(net_id, 'instantiate', 'load_library'):
+        cython_module = load_cython_lib(libname, libpath)
     Global._network[net_id]['instance'] = cython_module
 
     # Set the CUDA device
@@ -853,27 +1445,30 @@ def _instantiate(net_id, import_id=-1, cuda_config=None, user_config=None, core_
     for pop in Global._network[net_id]['populations']:
         if Global.config['verbose']:
             Global._print('Creating population', pop.name)
-        if Global.config['show_time']:
-            t0 = time.time()
+        t_obj = time.time()
 
         # Instantiate the population
         pop._instantiate(cython_module)
 
+        duration = time.time() - t_obj
+        _record(net_id, duration, 'instantiate', 'populations', pop.name, 'instantiate')
         if Global.config['show_time']:
-            Global._print('Creating', pop.name, 'took', (time.time()-t0)*1000, 'milliseconds')
+            Global._print('Creating', pop.name, 'took', duration*1000, 'milliseconds')
 
     # Instantiate projections
     for proj in Global._network[net_id]['projections']:
         if Global.config['verbose']:
             Global._print('Creating projection from', proj.pre.name, 'to', proj.post.name, 'with target="', proj.target, '"')
-        if Global.config['show_time']:
-            t0 = time.time()
+        t_obj = time.time()
 
         # Create the projection
         proj._instantiate(cython_module)
 
+        duration = time.time() - t_obj
+        _record(net_id, duration, 'instantiate', 'projections', proj.name, 'instantiate')
+        _record(net_id, proj._connect_time, 'instantiate', 'projections', proj.name, 'connect')
         if Global.config['show_time']:
-            Global._print('Creating the projection took', (time.time()-t0)*1000, 'milliseconds')
+            Global._print('Creating the projection took', duration*1000, 'milliseconds')
 
     # Finish to initialize the network
     cython_module.pyx_create(Global.config['dt'])
@@ -886,18 +1481,21 @@ def _instantiate(net_id, import_id=-1, cuda_config=None, user_config=None, core_
     for pop in Global._network[net_id]['populations']:
         if Global.config['verbose']:
             Global._print('Initializing population', pop.name)
-        pop._init_attributes()
+        with _measure(net_id, 'instantiate', 'populations', pop.name, 'init_attributes'):
+            pop._init_attributes()
     for proj in Global._network[net_id]['projections']:
         if Global.config['verbose']:
             Global._print('Initializing projection', proj.name, 'from', proj.pre.name, 'to', proj.post.name, 'with target="', proj.target, '"')
-        proj._init_attributes()
+        with _measure(net_id, 'instantiate', 'projections', proj.name, 'init_attributes'):
+            proj._init_attributes()
 
     # Start the monitors
     for monitor in Global._network[net_id]['monitors']:
         monitor._init_monitoring()
 
+    t1 = time.time()
+    _record(net_id, t1 - t0, 'instantiate', 'total')
     if Global._profiler:
-        t1 = time.time()
         Global._profiler.update_entry(t0, t1, "overall", "instantiate")
 
         # register the CPP profiling instance
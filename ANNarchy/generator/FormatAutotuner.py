@@ -0,0 +1,270 @@
+#===============================================================================
+#
+#     FormatAutotuner.py
+#
+#     This file is part of ANNarchy.
+#
+#     Copyright (C) 2013-2022  Julien Vitay <julien.vitay@gmail.com>,
+#     Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     ANNarchy is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#===============================================================================
+import os
+import math
+import json
+import time
+import shutil
+import hashlib
+import platform
+import tempfile
+import multiprocessing
+
+import ANNarchy
+import ANNarchy.core.Global as Global
+
+# Storage formats (and orders) compared by the autotuner. The formats need
+# to support the synapse type and the paradigm, candidates which fail to
+# compile are skipped.
+_candidates = {
+    'openmp': {
+        'rate': [("lil", "post_to_pre"), ("csr", "post_to_pre"), ("ellr", "post_to_pre"), ("dense", "post_to_pre")],
+        'spike': [("lil", "post_to_pre"), ("csr", "post_to_pre"), ("csr", "pre_to_post"), ("dense", "post_to_pre"), ("dense", "pre_to_post")],
+    },
+    'cuda': {
+        'rate': [("csr", "post_to_pre"), ("ellr", "post_to_pre"), ("dense", "post_to_pre")],
+        'spike': [("csr", "post_to_pre")],
+    }
+}
+
+class FormatAutotuner(object):
+    """
+    Selection of the storage format for ``storage_format="auto"`` by measurement
+    (enabled by ``setup(autotune_storage_format=True)``).
+
+    For each candidate format, a network consisting of the pre- and post-synaptic
+    populations and the projection (connected with the generated connectivity) is
+    compiled and simulated in a new Python interpreter, using the configured number of
+    threads. The format with the lowest time per step is kept.
+
+    The result is stored in the user-level cache directory (default:
+    ~/.cache/ANNarchy/storage_formats.json) for the population sizes, the density,
+    the synapse type, the number of threads and the machine, so that later runs
+    skip the measurement.
+    """
+    # Number of simulated steps for each candidate, the fastest of *repeats* measurements is used
+    warm_up_steps = 10
+    steps = 100
+    repeats = 3
+
+    # Maximal time in seconds for the compilation and simulation of one candidate
+    timeout = 300.0
+
+    # Firing rate of the pre-synaptic neurons for spiking projections (if the synapse does not access pre-synaptic variables)
+    pre_rate = 20.0
+
+    def __init__(self, path=None):
+        """
+        :param path: file storing the selected formats, by default storage_formats.json in the cache directory configured in annarchy.json.
+        """
+        self.path = path if path is not None else self._file_path()
+
+    @staticmethod
+    def _file_path():
+        "Location of the results, the directory can be set in annarchy.json."
+        path = "~/.cache/ANNarchy"
+        json_path = os.path.expanduser('~/.config/ANNarchy/annarchy.json')
+        if os.path.exists(json_path):
+            try:
+                with open(json_path, 'r') as rfile:
+                    user_config = json.load(rfile)
+                path = user_config['cache']['path']
+            except (ValueError, KeyError, TypeError, OSError):
+                pass
+        return os.path.expanduser(path) + '/storage_formats.json'
+
+    @staticmethod
+    def candidates(proj, storage_order=None):
+        """
+        Returns the list of (storage_format, storage_order) tuples compared for
+        the projection. If *storage_order* is set by the user (i. e. not None or
+        "auto"), only the formats with this order are considered.
+        """
+        candidates = _candidates[Global.config['paradigm']][proj.synapse_type.type]
+        if storage_order not in [None, "auto"]:
+            candidates = [c for c in candidates if c[1] == storage_order]
+        return list(candidates)
+
+    @staticmethod
+    def compute_key(proj, lil):
+        """
+        Key of the measurement: population sizes, density, synapse type, paradigm,
+        precision, number of threads and machine. The density is rounded to
+        quarter powers of two, so that random connectivity with slightly
+        different numbers of synapses shares the same entry.
+        """
+        synapse = proj.synapse_type
+        definition = hashlib.sha256()
+        for item in [synapse.type, synapse.parameters, synapse.equations, synapse.psp, synapse.operation,
+                     synapse.pre_spike, synapse.post_spike, synapse.pre_axon_spike, proj._single_constant_weight]:
+            definition.update((str(item) + ';').encode('utf-8'))
+
+        density = float(lil.nb_synapses) / float(proj.pre.size * proj.post.size)
+        density = 2.0 ** (round(4.0 * math.log2(density)) / 4.0) if density > 0.0 else 0.0
+
+        return '|'.join([
+            str(proj.pre.size) + 'x' + str(proj.post.size),
+            '%.3g' % density,
+            definition.hexdigest()[:16],
+            Global.config['paradigm'],
+            Global.config['precision'],
+            str(Global.config['num_threads']),
+            platform.node(),
+            platform.machine(),
+            platform.processor(),
+            str(multiprocessing.cpu_count()),
+            ANNarchy.__release__
+        ])
+
+    def load(self):
+        "Returns the stored results, an empty dictionary if the file does not exist or is corrupted."
+        try:
+            with open(self.path, 'r') as rfile:
+                results = json.load(rfile)
+        except (OSError, ValueError):
+            return {}
+        return results if isinstance(results, dict) else {}
+
+    def store(self, key, storage_format, storage_order, timings):
+        "Adds the result of a measurement, the file is replaced atomically."
+        results = self.load()
+        results[key] = {'storage_format': storage_format, 'storage_order': storage_order, 'timings': timings}
+
+        tmp_path = None
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.path), suffix='.tmp')
+            with os.fdopen(fd, 'w') as wfile:
+                json.dump(results, wfile, indent=2)
+            os.replace(tmp_path, self.path)
+            tmp_path = None
+        except OSError as e:
+            Global._debug('FormatAutotuner.store():', e)
+        finally:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def select(self, proj, storage_order=None, candidates=None):
+        """
+        Selects the fastest storage format for the projection, the connectivity is
+        generated once and kept in ``proj._lil_connectivity``.
+
+        :param proj: projection whose connectivity was stored with storage_format="auto".
+        :param storage_order: storage order requested by the user (None or "auto" to select it as well).
+        :param candidates: list of (format, order) tuples, by default ``candidates(proj, storage_order)``.
+        :return: tuple (storage_format, storage_order), None if no candidate could be measured.
+        """
+        if candidates is None:
+            candidates = self.candidates(proj, storage_order)
+        if len(candidates) == 0:
+            return None
+        if len(candidates) == 1:
+            return candidates[0]
+
+        # Generate the connectivity, re-used by _connect() for formats without C++ connector
+        if not proj._lil_connectivity:
+            proj._lil_connectivity = proj._generate_connectivity()
+        lil = proj._lil_connectivity
+
+        key = self.compute_key(proj, lil)
+        result = self.load().get(key)
+        if result is not None and (result['storage_format'], result['storage_order']) in candidates:
+            Global._info("Autotuned format selection for", proj.name, ":", result['storage_format'], "(" + result['storage_order'] + ", cached)")
+            return result['storage_format'], result['storage_order']
+
+        Global._print("Autotuning the storage format for", proj.name, "...", end=" ", flush=True)
+        timings = {}
+        for storage_format, order in candidates:
+            duration = self._benchmark(proj, lil, storage_format, order)
+            if duration is not None:
+                timings[storage_format + ',' + order] = duration
+
+        if len(timings) == 0:
+            Global._print("failed")
+            return None
+
+        storage_format, order = min(timings, key=timings.get).split(',')
+        Global._print(storage_format, "(" + order + ")")
+        self.store(key, storage_format, order, timings)
+
+        return storage_format, order
+
+    def _benchmark(self, proj, lil, storage_format, storage_order):
+        """
+        Compiles and simulates the projection with the given format in a new
+        Python interpreter (see ChildProcess). Candidates which fail to compile
+        or do not finish within *timeout* seconds are skipped.
+
+        :return: time per simulation step in seconds, None if the candidate failed.
+        """
+        from ANNarchy.generator import ChildProcess
+
+        work_dir = tempfile.mkdtemp(prefix='annarchy_autotune_')
+        try:
+            return ChildProcess.run(self._run_candidate, (proj, lil, storage_format, storage_order, work_dir), timeout=self.timeout)
+        except ChildProcessError as e:
+            Global._debug('FormatAutotuner: candidate', storage_format, storage_order, 'failed:', e)
+            return None
+        finally:
+            shutil.rmtree(work_dir, True)
+
+    def _run_candidate(self, proj, lil, storage_format, storage_order, work_dir):
+        "Executed in the child process, builds and simulates the benchmark network."
+        from ANNarchy.core.Population import Population
+        from ANNarchy.core.Projection import Projection
+        from ANNarchy.core.SpecificPopulation import PoissonPopulation
+        from ANNarchy.core.Simulate import simulate
+        from ANNarchy.generator.Compiler import compile
+
+        # Only the benchmark network is compiled
+        os.chdir(work_dir)
+        Global._network._create_initial_state()
+        Global.config['verbose'] = False
+        Global.config['suppress_warnings'] = True
+
+        # Spiking synapses are driven by Poisson neurons, unless pre-synaptic variables are accessed
+        description = proj.synapse_type.description
+        if proj.synapse_type.type == "spike" and len(description['dependencies']['pre']) == 0 and len(description['pre_global_operations']) == 0:
+            pre = PoissonPopulation(proj.pre.size, rates=self.pre_rate)
+        else:
+            pre = Population(proj.pre.size, proj.pre.neuron_type)
+        post = Population(proj.post.size, proj.post.neuron_type)
+
+        bench = Projection(pre, post, proj.target, synapse=proj.synapse_type)
+        bench.connector_name = "Autotuning"
+        bench.connector_description = "Autotuning"
+        bench._single_constant_weight = proj._single_constant_weight
+        bench._store_connectivity(bench._load_from_lil, (lil,), proj._connection_delay, storage_format=storage_format, storage_order=storage_order)
+
+        compile(directory='annarchy', silent=True)
+
+        dt = Global.config['dt']
+        simulate(self.warm_up_steps * dt)
+        durations = []
+        for _ in range(self.repeats):
+            t0 = time.time()
+            simulate(self.steps * dt)
+            durations.append((time.time() - t0) / self.steps)
+
+        return min(durations)
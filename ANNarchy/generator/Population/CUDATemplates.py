@@ -282,6 +282,17 @@ attribute_template = {
         // should not happen
         std::cerr << "PopStruct%(id)s::set_local_attribute_%(ctype_name)s: " << name << " not found" << std::endl;
     }
+
+    bool set_local_attributes_%(ctype_name)s(std::vector<std::string> names, %(ctype)s* values, std::size_t num_values) {
+        // all values of an attribute are stored contiguously, one attribute after another
+        if ( num_values != names.size() * size )
+            return false;
+
+        for (std::size_t i = 0; i < names.size(); i++) {
+            set_local_attribute_all_%(ctype_name)s(names[i], std::vector<%(ctype)s>(values + i * size, values + (i + 1) * size));
+        }
+        return true;
+    }
 """,
     'global': """
     %(ctype)s get_global_attribute_%(ctype_name)s(std::string name) {
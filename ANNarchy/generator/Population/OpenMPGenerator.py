@@ -190,8 +190,8 @@ class OpenMPGenerator(PopulationGenerator):
         if 'update_global_ops' in pop._specific_template.keys():
             update_global_ops = pop._specific_template['update_global_ops']
 
-        # Fill the template
-        code = self._templates['population_header'] % {
+        # Fill the templates
+        template_dict = {
             # version tag
             'annarchy_version': ANNarchy.__release__,
             #'time_stamp': '{:%Y-%b-%d %H:%M:%S}'.format(datetime.datetime.now()),
@@ -231,14 +231,21 @@ class OpenMPGenerator(PopulationGenerator):
             'determine_size': determine_size_in_bytes,
             'clear_container': clear_container
         }
+        code = self._templates['population_header'] % template_dict
+        body_code = self._templates['population_body'] % template_dict
 
         # remove right-trailing spaces
         code = remove_trailing_spaces(code)
+        body_code = remove_trailing_spaces(body_code)
 
         # Store the complete header definition in a single file
         with open(annarchy_dir+'/generate/net'+str(self._net_id)+'/pop'+str(pop.id)+'.hpp', 'w') as ofile:
             ofile.write(code)
 
+        # The methods called in the simulation loop form a separate translation unit
+        with open(annarchy_dir+'/generate/net'+str(self._net_id)+'/pop'+str(pop.id)+'.cpp', 'w') as ofile:
+            ofile.write(body_code)
+
         # Basic informations common to all populations
         pop_desc = {
             'include': """#include "pop%(id)s.hpp"\n""" % {'id': pop.id},
@@ -328,8 +335,9 @@ _spike_history.shrink_to_fit();
                 'float_prec': Global.config['precision']
             }
 
-        # we need to sync the memsets
-        if len(code) > 1:
+        # we need to sync the memsets, with step_scheduling="dependencies"
+        # a single barrier follows the reset of all populations (CodeGenerator)
+        if len(code) > 1 and Global.config['step_scheduling'] == "phases":
             code += tabify("#pragma omp barrier\n", 1)
 
         return code
@@ -365,7 +373,7 @@ _spike_history.shrink_to_fit();
 
                 if attr['locality'] == "local":
                     declare_code += """
-    std::deque< std::vector< %(type)s > > _delayed_%(name)s; """ % attr_dict
+    RingBuffer< %(type)s > _delayed_%(name)s; """ % attr_dict
                 else:
                     declare_code += """
     std::deque< %(type)s > _delayed_%(name)s; """ % attr_dict
@@ -381,7 +389,7 @@ _spike_history.shrink_to_fit();
 
                 if attr['locality'] == "local":
                     declare_code += """
-    std::deque< std::vector< %(type)s > > _delayed_%(name)s; """ % attr_dict
+    RingBuffer< %(type)s > _delayed_%(name)s; """ % attr_dict
                 else:
                     declare_code += """
     std::deque< %(type)s > _delayed_%(name)s; """ % attr_dict
@@ -397,10 +405,14 @@ _spike_history.shrink_to_fit();
         }
         max_delay = value;
         """
+        # The queues of different populations are independent, with step_scheduling="dependencies"
+        # the synchronization follows the delay update of all populations (CodeGenerator)
+        nowait = " nowait" if Global.config['step_scheduling'] == "dependencies" else ""
+
         for var in pop.delayed_variables:
             attr = self._get_attr(pop, var)
             init_code += delay_tpl[attr['locality']]['init'] % {'name': attr['name'], 'type': attr['ctype']}
-            update_code += delay_tpl[attr['locality']]['update'] % {'name' : var}
+            update_code += delay_tpl[attr['locality']]['update'] % {'name' : var, 'nowait': nowait}
             reset_code += delay_tpl[attr['locality']]['reset'] % {'id': pop.id, 'name' : var}
             resize_code += delay_tpl[attr['locality']]['resize'] % {'id': pop.id, 'name' : var, 'type': attr['ctype']}
 
@@ -410,12 +422,12 @@ _spike_history.shrink_to_fit();
         _delayed_spike = std::deque< std::vector<int> >(max_delay, std::vector<int>());"""
 
             update_code += """
-            #pragma omp single
+            #pragma omp single%(nowait)s
             {
                 _delayed_spike.push_front(spiked);
                 _delayed_spike.pop_back();
             }
-"""
+""" % {'nowait': nowait}
             reset_code += """
         _delayed_spike.clear();
         _delayed_spike = std::deque< std::vector<int> >(max_delay, std::vector<int>());"""
@@ -755,14 +767,19 @@ _spike_history.shrink_to_fit();
         eqs = generate_equation_code(
             pop.id, pop.neuron_type.description, 'local', padding=4)
         eqs = eqs % id_dict
+
+        # Rate-coded populations are independent of each other, with step_scheduling="dependencies"
+        # the threads synchronize after the update of all populations (CodeGenerator)
+        nowait = " nowait" if Global.config['step_scheduling'] == "dependencies" else ""
+
         if eqs.strip() != "":
             code += """
             // Updating the local variables
-            #pragma omp for simd
+            #pragma omp for simd%(nowait)s
             for (int i = 0; i < size; i++) {
 %(eqs)s
             }
-""" % {'eqs': eqs}
+""" % {'eqs': eqs, 'nowait': nowait}
 
         # finish code
         final_code = """
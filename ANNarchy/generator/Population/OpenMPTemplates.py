@@ -35,7 +35,8 @@ population_header = """/*
  *  ANNarchy-version: %(annarchy_version)s
  */
 #pragma once
-#include "ANNarchy.h"
+#include "ANNarchyCommon.h"
+#include "RingBuffer.hpp"
 #include <random>
 #include "randutils.hpp"
 %(include_additional)s
@@ -92,56 +93,18 @@ struct PopStruct%(id)s{
 %(reset_additional)s
     }
 
-    // Method to draw new random numbers
-    void update_rng(int tid) {
-    #ifdef _TRACE_SIMULATION_STEPS
-        #pragma omp critical
-        {
-            std::cout << "    PopStruct%(id)s::update_rng() - tid " << tid << std::endl;
-            std::cout << std::flush;
-        }
-    #endif
-%(update_rng)s
-    }
-
-    // Method to update global operations on the population (min/max/mean...)
-    void update_global_ops(int tid, int nt) {
-%(update_global_ops)s
-    }
-
-    // Method to enqueue output variables in case outgoing projections have non-zero delay
-    void update_delay() {
-%(update_delay)s
-    }
+    // Methods called by the simulation loop, defined in pop%(id)s.cpp
+    void update_rng(int tid);
+    void update_global_ops(int tid, int nt);
+    void update_delay();
+    void update(int tid);
+    void spike_gather(int tid);
 
     // Method to dynamically change the size of the queue for delayed variables
     void update_max_delay(int value) {
 %(update_max_delay)s
     }
 
-    // Main method to update neural variables
-    void update(int tid) {
-    #ifdef _TRACE_SIMULATION_STEPS
-        #pragma omp critical
-        {
-            std::cout << "    PopStruct%(id)s::update() - tid " << tid << std::endl;
-            std::cout << std::flush;
-        }
-    #endif
-%(update_variables)s
-    }
-
-    void spike_gather(int tid) {
-    #ifdef _TRACE_SIMULATION_STEPS
-        #pragma omp critical
-        {
-            std::cout << "    PopStruct%(id)s::spike_gather() - tid " << tid << std::endl;
-            std::cout << std::flush;
-        }
-    #endif
-%(test_spike_cond)s
-    }
-
     %(stop_condition)s
 
     // Memory management: track the memory consumption
@@ -158,6 +121,62 @@ struct PopStruct%(id)s{
 };
 """
 
+# Definition of the methods called in the simulation loop (see population_header).
+# They are stored in a separate translation unit (pop<id>.cpp) so that the
+# populations can be compiled in parallel and only modified objects are rebuilt.
+#
+# Parameters: see population_header
+population_body = """/*
+ *  ANNarchy-version: %(annarchy_version)s
+ */
+#include "pop%(id)s.hpp"
+
+// Method to draw new random numbers
+void PopStruct%(id)s::update_rng(int tid) {
+#ifdef _TRACE_SIMULATION_STEPS
+    #pragma omp critical
+    {
+        std::cout << "    PopStruct%(id)s::update_rng() - tid " << tid << std::endl;
+        std::cout << std::flush;
+    }
+#endif
+%(update_rng)s
+}
+
+// Method to update global operations on the population (min/max/mean...)
+void PopStruct%(id)s::update_global_ops(int tid, int nt) {
+%(update_global_ops)s
+}
+
+// Method to enqueue output variables in case outgoing projections have non-zero delay
+void PopStruct%(id)s::update_delay() {
+%(update_delay)s
+}
+
+// Main method to update neural variables
+void PopStruct%(id)s::update(int tid) {
+#ifdef _TRACE_SIMULATION_STEPS
+    #pragma omp critical
+    {
+        std::cout << "    PopStruct%(id)s::update() - tid " << tid << std::endl;
+        std::cout << std::flush;
+    }
+#endif
+%(update_variables)s
+}
+
+void PopStruct%(id)s::spike_gather(int tid) {
+#ifdef _TRACE_SIMULATION_STEPS
+    #pragma omp critical
+    {
+        std::cout << "    PopStruct%(id)s::spike_gather() - tid " << tid << std::endl;
+        std::cout << std::flush;
+    }
+#endif
+%(test_spike_cond)s
+}
+"""
+
 # c like definition of neuron attributes, whereas 'local' is used if values can vary across
 # neurons, consequently 'global' is used if values are common to all neurons.Currently two
 # types of sets are defined: openmp and cuda. In cuda case additional 'dirty' flags are
@@ -277,6 +296,17 @@ attribute_template = {
         // should not happen
         std::cerr << "PopStruct%(id)s::set_local_attribute_%(ctype_name)s: " << name << " not found" << std::endl;
     }
+
+    bool set_local_attributes_%(ctype_name)s(std::vector<std::string> names, %(ctype)s* values, std::size_t num_values) {
+        // all values of an attribute are stored contiguously, one attribute after another
+        if ( num_values != names.size() * size )
+            return false;
+
+        for (std::size_t i = 0; i < names.size(); i++) {
+            set_local_attribute_all_%(ctype_name)s(names[i], std::vector<%(ctype)s>(values + i * size, values + (i + 1) * size));
+        }
+        return true;
+    }
 """,
     'global': """
     %(ctype)s get_global_attribute_%(ctype_name)s(std::string name) {
@@ -317,29 +347,26 @@ attribute_cpp_init = {
 attribute_delayed = {
     'local': {
         'init': """
-        _delayed_%(name)s = std::deque< std::vector< %(type)s > >(max_delay, std::vector< %(type)s >(size, 0.0));""",
+        _delayed_%(name)s = RingBuffer< %(type)s >(max_delay, size, 0.0);""",
 
         'update': """
-        #pragma omp single
+        #pragma omp single%(nowait)s
         {
             _delayed_%(name)s.push_front(%(name)s);
-            _delayed_%(name)s.pop_back();
         }
 """,
         'reset' : """
-        for ( int i = 0; i < _delayed_%(name)s.size(); i++ ) {
-            _delayed_%(name)s[i] = %(name)s;
-        }
+        _delayed_%(name)s.fill(%(name)s);
 """,
         'resize' : """
-    _delayed_%(name)s.resize(max_delay, std::vector< %(type)s >(size, 0.0));
+    _delayed_%(name)s.resize(max_delay, 0.0);
 """
     },
     'global':{
         'init': """
         _delayed_%(name)s = std::deque< %(type)s >(max_delay, 0.0);""",
         'update': """
-        #pragma omp single
+        #pragma omp single%(nowait)s
         {
             _delayed_%(name)s.push_front(%(name)s);
             _delayed_%(name)s.pop_back();
@@ -500,6 +527,7 @@ spike_specific = {
 # Final dictionary
 openmp_templates = {
     'population_header': population_header,
+    'population_body': population_body,
     'attr_decl': attribute_decl,
     'attr_acc': attribute_acc,
     'accessor_template': attribute_template,
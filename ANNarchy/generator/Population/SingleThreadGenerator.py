@@ -190,8 +190,8 @@ class SingleThreadGenerator(PopulationGenerator):
         if 'update_global_ops' in pop._specific_template.keys():
             update_global_ops = pop._specific_template['update_global_ops']
 
-        # Fill the template
-        code = self._templates['population_header'] % {
+        # Fill the templates
+        template_dict = {
             # version tag
             'annarchy_version': ANNarchy.__release__,
             # fill code templates
@@ -230,14 +230,21 @@ class SingleThreadGenerator(PopulationGenerator):
             'determine_size': determine_size_in_bytes,
             'clear_container': clear_container
         }
+        code = self._templates['population_header'] % template_dict
+        body_code = self._templates['population_body'] % template_dict
 
         # remove right-trailing spaces
         code = remove_trailing_spaces(code)
+        body_code = remove_trailing_spaces(body_code)
 
         # Store the complete header definition in a single file
         with open(annarchy_dir+'/generate/net'+str(self._net_id)+'/pop'+str(pop.id)+'.hpp', 'w') as ofile:
             ofile.write(code)
 
+        # The methods called in the simulation loop form a separate translation unit
+        with open(annarchy_dir+'/generate/net'+str(self._net_id)+'/pop'+str(pop.id)+'.cpp', 'w') as ofile:
+            ofile.write(body_code)
+
         # Basic informations common to all populations
         pop_desc = {
             'include': """#include "pop%(id)s.hpp"\n""" % {'id': pop.id},
@@ -356,7 +363,7 @@ _spike_history.shrink_to_fit();
 
                 if attr['locality'] == "local":
                     declare_code += """
-    std::deque< std::vector< %(type)s > > _delayed_%(name)s; """ % attr_dict
+    RingBuffer< %(type)s > _delayed_%(name)s; """ % attr_dict
                 else:
                     declare_code += """
     std::deque< %(type)s > _delayed_%(name)s; """ % attr_dict
@@ -372,7 +379,7 @@ _spike_history.shrink_to_fit();
 
                 if attr['locality'] == "local":
                     declare_code += """
-    std::deque< std::vector< %(type)s > > _delayed_%(name)s; """ % attr_dict
+    RingBuffer< %(type)s > _delayed_%(name)s; """ % attr_dict
                 else:
                     declare_code += """
     std::deque< %(type)s > _delayed_%(name)s; """ % attr_dict
@@ -36,7 +36,8 @@ population_header = """/*
  */
 #pragma once
 
-#include "ANNarchy.h"
+#include "ANNarchyCommon.h"
+#include "RingBuffer.hpp"
 #include <random>
 
 %(include_additional)s
@@ -96,38 +97,18 @@ struct PopStruct%(id)s{
 %(reset_additional)s
     }
 
-    // Method to draw new random numbers
-    void update_rng() {
-#ifdef _TRACE_SIMULATION_STEPS
-    std::cout << "    PopStruct%(id)s::update_rng()" << std::endl;
-#endif
-%(update_rng)s
-    }
-
-    // Method to update global operations on the population (min/max/mean...)
-    void update_global_ops() {
-%(update_global_ops)s
-    }
-
-    // Method to enqueue output variables in case outgoing projections have non-zero delay
-    void update_delay() {
-%(update_delay)s
-    }
+    // Methods called by the simulation loop, defined in pop%(id)s.cpp
+    void update_rng();
+    void update_global_ops();
+    void update_delay();
+    void update();
+    void spike_gather();
 
     // Method to dynamically change the size of the queue for delayed variables
     void update_max_delay(int value) {
 %(update_max_delay)s
     }
 
-    // Main method to update neural variables
-    void update() {
-%(update_variables)s
-    }
-
-    void spike_gather() {
-%(test_spike_cond)s
-    }
-
     %(stop_condition)s
 
     // Memory management: track the memory consumption
@@ -147,6 +128,44 @@ struct PopStruct%(id)s{
 };
 """
 
+# Definition of the methods called in the simulation loop (see population_header).
+# They are stored in a separate translation unit (pop<id>.cpp) so that the
+# populations can be compiled in parallel and only modified objects are rebuilt.
+#
+# Parameters: see population_header
+population_body = """/*
+ *  ANNarchy-version: %(annarchy_version)s
+ */
+#include "pop%(id)s.hpp"
+
+// Method to draw new random numbers
+void PopStruct%(id)s::update_rng() {
+#ifdef _TRACE_SIMULATION_STEPS
+    std::cout << "    PopStruct%(id)s::update_rng()" << std::endl;
+#endif
+%(update_rng)s
+}
+
+// Method to update global operations on the population (min/max/mean...)
+void PopStruct%(id)s::update_global_ops() {
+%(update_global_ops)s
+}
+
+// Method to enqueue output variables in case outgoing projections have non-zero delay
+void PopStruct%(id)s::update_delay() {
+%(update_delay)s
+}
+
+// Main method to update neural variables
+void PopStruct%(id)s::update() {
+%(update_variables)s
+}
+
+void PopStruct%(id)s::spike_gather() {
+%(test_spike_cond)s
+}
+"""
+
 # c like definition of neuron attributes, whereas 'local' is used if values can vary across
 # neurons, consequently 'global' is used if values are common to all neurons.Currently two
 # types of sets are defined: openmp and cuda. In cuda case additional 'dirty' flags are
@@ -264,6 +283,17 @@ attribute_template = {
         // should not happen
         std::cerr << "PopStruct%(id)s::set_local_attribute_%(ctype_name)s: " << name << " not found" << std::endl;
     }
+
+    bool set_local_attributes_%(ctype_name)s(std::vector<std::string> names, %(ctype)s* values, std::size_t num_values) {
+        // all values of an attribute are stored contiguously, one attribute after another
+        if ( num_values != names.size() * size )
+            return false;
+
+        for (std::size_t i = 0; i < names.size(); i++) {
+            set_local_attribute_all_%(ctype_name)s(names[i], std::vector<%(ctype)s>(values + i * size, values + (i + 1) * size));
+        }
+        return true;
+    }
 """,
     'global': """
     %(ctype)s get_global_attribute_%(ctype_name)s(std::string name) {
@@ -304,19 +334,16 @@ attribute_cpp_init = {
 attribute_delayed = {
     'local': {
         'init': """
-        _delayed_%(name)s = std::deque< std::vector< %(type)s > >(max_delay, std::vector< %(type)s >(size, 0.0));""",
+        _delayed_%(name)s = RingBuffer< %(type)s >(max_delay, size, 0.0);""",
 
         'update': """
         _delayed_%(name)s.push_front(%(name)s);
-        _delayed_%(name)s.pop_back();
 """,
         'reset' : """
-        for ( int i = 0; i < _delayed_%(name)s.size(); i++ ) {
-            _delayed_%(name)s[i] = %(name)s;
-        }
+        _delayed_%(name)s.fill(%(name)s);
 """,
         'resize' : """
-    _delayed_%(name)s.resize(max_delay, std::vector< %(type)s >(size, 0.0));
+    _delayed_%(name)s.resize(max_delay, 0.0);
 """
     },
     'global':{
@@ -465,6 +492,7 @@ spike_specific = {
 # Final dictionary
 single_thread_templates = {
     'population_header': population_header,
+    'population_body': population_body,
     'attr_decl': attribute_decl,
     'attr_acc': attribute_acc,
     'accessor_template': attribute_template,
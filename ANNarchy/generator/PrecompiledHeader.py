@@ -0,0 +1,131 @@
+#===============================================================================
+#
+#     PrecompiledHeader.py
+#
+#     This file is part of ANNarchy.
+#
+#     Copyright (C) 2013-2022  Julien Vitay <julien.vitay@gmail.com>,
+#     Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     ANNarchy is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#===============================================================================
+import os
+import hashlib
+import tempfile
+import subprocess
+
+import ANNarchy
+import ANNarchy.core.Global as Global
+from ANNarchy.generator.BuildCache import _default_cache_config
+from ANNarchy.generator.Template.BaseTemplate import precompiled_header
+
+# Name of the header, the precompiled version is stored next to it
+_header_name = 'ANNarchyPCH.hpp'
+
+class PrecompiledHeader(object):
+    """
+    Precompiled version of the standard library and ANNarchy/include headers,
+    which are parsed by every translation unit of the generated code.
+
+    The header is shared by all networks compiled with the same compiler (and
+    compiler version), the same flags and the same ANNarchy headers. Each
+    configuration is stored in its own directory below the user-level cache
+    (default: ~/.cache/ANNarchy/pch).
+
+    The header itself is compiled by the generated Makefile. The rule writes to a
+    temporary file which is renamed afterwards, so concurrent builds never see
+    a partially written file. If the compilation fails, the translation units
+    are simply compiled without precompiled header.
+    """
+    def __init__(self, user_config=None):
+        """
+        :param user_config: content of annarchy.json, the "path" entry of the "cache" section is used as root directory.
+        """
+        path = _default_cache_config['path']
+        if user_config is not None and 'cache' in user_config.keys() and 'path' in user_config['cache'].keys():
+            path = user_config['cache']['path']
+
+        self.path = os.path.expanduser(path) + '/pch'
+
+    @staticmethod
+    def extension(version):
+        """
+        Returns the file extension of precompiled headers for the compiler with
+        the given version string (".gch" for gcc, ".pch" for clang) or None if
+        the compiler is not supported.
+        """
+        if 'clang' in version:
+            return '.pch'
+        elif 'Free Software Foundation' in version:
+            return '.gch'
+        return None
+
+    @staticmethod
+    def compute_key(compiler, version, build_config):
+        """
+        Hash over the compiler (version), the build configuration (flags,
+        Makefile template) and the included ANNarchy headers.
+        """
+        key = hashlib.sha256()
+        key.update(('compiler=' + compiler + ';').encode('utf-8'))
+        key.update(('version=' + version + ';').encode('utf-8'))
+        for name in sorted(build_config.keys()):
+            key.update((name + '=' + str(build_config[name]) + ';').encode('utf-8'))
+        key.update(('release=' + ANNarchy.__release__ + ';').encode('utf-8'))
+        key.update(precompiled_header.encode('utf-8'))
+
+        include_dir = ANNarchy.__path__[0] + '/include'
+        for fname in sorted(os.listdir(include_dir)):
+            with open(include_dir + '/' + fname, 'rb') as rfile:
+                key.update(fname.encode('utf-8'))
+                key.update(rfile.read())
+
+        return key.hexdigest()
+
+    def prepare(self, compiler, build_config):
+        """
+        Creates the directory for the given configuration and writes the header,
+        which is compiled by the Makefile if not already done.
+
+        :return: tuple of the path to the header and the extension of the precompiled file, (None, None) if the compiler is not supported.
+        """
+        try:
+            version = subprocess.check_output([compiler, '--version'], stderr=subprocess.STDOUT).decode()
+        except (OSError, subprocess.CalledProcessError):
+            return None, None
+
+        extension = self.extension(version)
+        if extension is None:
+            return None, None
+
+        directory = self.path + '/' + self.compute_key(compiler, version, build_config)
+        header = directory + '/' + _header_name
+        if os.path.isfile(header):
+            return header, extension
+
+        tmp_path = None
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            with os.fdopen(fd, 'w') as wfile:
+                wfile.write(precompiled_header)
+            os.replace(tmp_path, header)
+        except OSError as e:
+            Global._debug('PrecompiledHeader.prepare():', e)
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return None, None
+
+        return header, extension
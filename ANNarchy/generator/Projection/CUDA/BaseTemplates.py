@@ -181,6 +181,24 @@ attribute_template = {
     void set_local_attribute_%(ctype_name)s(std::string name, int rk_post, int rk_pre, %(ctype)s value) {
 %(local_set3)s
     }
+
+    bool set_local_attributes_%(ctype_name)s(std::vector<std::string> names, %(ctype)s* values, std::size_t num_values) {
+        // all values of an attribute are stored contiguously (dendrite after dendrite), one attribute after another
+        std::size_t offset = 0;
+        for (auto it = names.begin(); it != names.end(); it++) {
+            auto value = std::vector<std::vector<%(ctype)s>>(nb_dendrites(), std::vector<%(ctype)s>());
+            for (int lil_idx = 0; lil_idx < nb_dendrites(); lil_idx++) {
+                std::size_t row_size = dendrite_size(lil_idx);
+                if ( offset + row_size > num_values )
+                    return false;
+
+                value[lil_idx] = std::vector<%(ctype)s>(values + offset, values + offset + row_size);
+                offset += row_size;
+            }
+            set_local_attribute_all_%(ctype_name)s(*it, value);
+        }
+        return offset == num_values;
+    }
 """,
     "semiglobal": """
     std::vector<%(ctype)s> get_semiglobal_attribute_all_%(ctype_name)s(std::string name) {
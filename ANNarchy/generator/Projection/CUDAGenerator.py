@@ -109,7 +109,8 @@ class CUDAGenerator(ProjectionGenerator):
                 'add_args': "",
                 'num_threads': "",
                 'float_prec': Global.config["precision"],
-                'idx_type': determine_idx_type_for_projection(proj)[0]
+                'idx_type': determine_idx_type_for_projection(proj)[0],
+                'col_idx_type': determine_idx_type_for_projection(proj)[0]
             }
             declare_connectivity_matrix = ""
             access_connectivity_matrix = ""
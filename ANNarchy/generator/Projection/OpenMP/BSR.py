@@ -97,7 +97,7 @@ continuous_transmission = {
         for (%(idx_type)s blk_col_idx = block_ptr[blk_row]; blk_col_idx < block_ptr[blk_row+1]; blk_col_idx++) {
             %(idx_type)s bcol_idx = block_col_idx[blk_col_idx];     // which column in row
 
-            %(float_prec)s* __restrict__ values = w.data() + blk_col_idx * tile_size2;       // find the correct dense tile
+            const auto* __restrict__ values = w.data() + blk_col_idx * tile_size2;       // find the correct dense tile (in the storage precision of w)
             %(float_prec)s* __restrict__ loc_pr = pre_r + bcol_idx * tile_size;              // select the correct part in pre vector
 
             // process the dense matrix row by row
@@ -144,7 +144,7 @@ continuous_transmission_unroll_2x2 = {
             for (%(idx_type)s blk_col_idx = block_ptr[blk_row]; blk_col_idx < block_ptr[blk_row+1]; blk_col_idx++) {
                 %(idx_type)s bcol_idx = block_col_idx[blk_col_idx];     // which column in row
 
-                %(float_prec)s* __restrict__ values = w.data() + blk_col_idx * tile_size2;       // find the correct dense tile
+                const auto* __restrict__ values = w.data() + blk_col_idx * tile_size2;       // find the correct dense tile (in the storage precision of w)
                 %(float_prec)s* __restrict__ loc_pr = pre_r + bcol_idx * tile_size;              // select the correct part in pre vector
 
                 sum1 += values[0] * loc_pr[0];
@@ -185,7 +185,7 @@ continuous_transmission_unroll_3x3 = {
             for (%(idx_type)s blk_col_idx = block_ptr[blk_row]; blk_col_idx < block_ptr[blk_row+1]; blk_col_idx++) {
                 %(idx_type)s bcol_idx = block_col_idx[blk_col_idx];     // which column in row
 
-                %(float_prec)s* __restrict__ values = w.data() + blk_col_idx * tile_size2;       // find the correct dense tile
+                const auto* __restrict__ values = w.data() + blk_col_idx * tile_size2;       // find the correct dense tile (in the storage precision of w)
                 %(float_prec)s* __restrict__ loc_pr = pre_r + bcol_idx * tile_size;              // select the correct part in pre vector
 
                 %(float_prec)s sum1_1, sum1_2, sum1_3, sum2_1, sum2_2, sum2_3, sum3_1, sum3_2, sum3_3;
@@ -26,7 +26,9 @@ projection_header = """/*
  */
 #pragma once
 
-#include "ANNarchy.h"
+#include "ANNarchyCommon.h"
+#include "pop%(id_pre)s.hpp"
+#include "pop%(id_post)s.hpp"
 %(sparse_matrix_include)s
 %(include_additional)s
 %(include_profile)s
@@ -99,42 +101,11 @@ struct ProjStruct%(id_proj)s : %(sparse_format)s {
 %(update_max_delay)s
     }
 
-    // Computes the weighted sum of inputs or updates the conductances
-    void compute_psp(const int tid, const int nt) {
-    #ifdef _TRACE_SIMULATION_STEPS
-        #pragma omp critical
-        {
-            std::cout << "    ProjStruct%(id_proj)s::compute_psp() - tid = " << tid << ", nt = " << nt << std::endl;
-            std::cout << std::flush;
-        }
-    #endif
-%(psp_prefix)s
-%(psp_code)s
-    }
-
-    // Draws random numbers
-    void update_rng() {
-%(update_rng)s
-    }
-
-    // Updates synaptic variables
-    void update_synapse(const int tid) {
-    #ifdef _TRACE_SIMULATION_STEPS
-        #pragma omp critical
-        {
-            std::cout << "    ProjStruct%(id_proj)s::update_synapse() - tid " << tid << std::endl;
-            std::cout << std::flush;
-        }
-    #endif
-%(update_prefix)s
-%(update_variables)s
-    }
-
-    // Post-synaptic events
-    void post_event(const int tid) {
-%(post_event_prefix)s
-%(post_event)s
-    }
+    // Methods called by the simulation loop, defined in proj%(id_proj)s.cpp
+    void compute_psp(const int tid, const int nt);
+    void update_rng();
+    void update_synapse(const int tid);
+    void post_event(const int tid);
 
     // Variable/Parameter access methods
 %(access_parameters_variables)s
@@ -162,6 +133,54 @@ struct ProjStruct%(id_proj)s : %(sparse_format)s {
 };
 """
 
+# Definition of the methods called in the simulation loop (see projection_header).
+# They are stored in a separate translation unit (proj<id>.cpp) so that the
+# projections can be compiled in parallel and only modified objects are rebuilt.
+#
+# Parameters: see projection_header
+projection_body = """/*
+ *  ANNarchy-version: %(annarchy_version)s
+ */
+#include "proj%(id_proj)s.hpp"
+
+// Computes the weighted sum of inputs or updates the conductances
+void ProjStruct%(id_proj)s::compute_psp(const int tid, const int nt) {
+#ifdef _TRACE_SIMULATION_STEPS
+    #pragma omp critical
+    {
+        std::cout << "    ProjStruct%(id_proj)s::compute_psp() - tid = " << tid << ", nt = " << nt << std::endl;
+        std::cout << std::flush;
+    }
+#endif
+%(psp_prefix)s
+%(psp_code)s
+}
+
+// Draws random numbers
+void ProjStruct%(id_proj)s::update_rng() {
+%(update_rng)s
+}
+
+// Updates synaptic variables
+void ProjStruct%(id_proj)s::update_synapse(const int tid) {
+#ifdef _TRACE_SIMULATION_STEPS
+    #pragma omp critical
+    {
+        std::cout << "    ProjStruct%(id_proj)s::update_synapse() - tid " << tid << std::endl;
+        std::cout << std::flush;
+    }
+#endif
+%(update_prefix)s
+%(update_variables)s
+}
+
+// Post-synaptic events
+void ProjStruct%(id_proj)s::post_event(const int tid) {
+%(post_event_prefix)s
+%(post_event)s
+}
+"""
+
 attribute_template = {
     "local": """
     std::vector<std::vector<%(ctype)s>> get_local_attribute_all_%(ctype_name)s(std::string name) {
@@ -208,6 +227,24 @@ attribute_template = {
     void set_local_attribute_%(ctype_name)s(std::string name, int rk_post, int rk_pre, %(ctype)s value) {
 %(local_set3)s
     }
+
+    bool set_local_attributes_%(ctype_name)s(std::vector<std::string> names, %(ctype)s* values, std::size_t num_values) {
+        // all values of an attribute are stored contiguously (dendrite after dendrite), one attribute after another
+        std::size_t offset = 0;
+        for (auto it = names.begin(); it != names.end(); it++) {
+            auto value = std::vector<std::vector<%(ctype)s>>(nb_dendrites(), std::vector<%(ctype)s>());
+            for (int lil_idx = 0; lil_idx < nb_dendrites(); lil_idx++) {
+                std::size_t row_size = dendrite_size(lil_idx);
+                if ( offset + row_size > num_values )
+                    return false;
+
+                value[lil_idx] = std::vector<%(ctype)s>(values + offset, values + offset + row_size);
+                offset += row_size;
+            }
+            set_local_attribute_all_%(ctype_name)s(*it, value);
+        }
+        return offset == num_values;
+    }
 """,
     "semiglobal": """
     std::vector<%(ctype)s> get_semiglobal_attribute_all_%(ctype_name)s(std::string name) {
@@ -484,6 +521,7 @@ if(_transmission && _update && pop%(id_post)s._active && ( (t - _update_offset)%
 
 openmp_templates = {
     'projection_header': projection_header,
+    'projection_body': projection_body,
     'attr_acc': attribute_acc,
     'accessor_template': attribute_template,
     'rng': cpp_11_rng
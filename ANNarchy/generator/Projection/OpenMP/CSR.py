@@ -43,7 +43,7 @@ attribute_cpp_init = {
     'local':
 """
         // Local %(attr_type)s %(name)s
-        %(name)s = init_matrix_variable(static_cast<%(float_prec)s>(%(init)s));
+        %(name)s = init_matrix_variable<%(type)s>(static_cast<%(type)s>(%(init)s));
 """,
     'semiglobal':
 """
@@ -116,24 +116,24 @@ delay = {
 """},
     'nonuniform_rate_coded': {
         'declare': """
-    std::vector<int> delay;
+    std::vector<%(delay_type)s> delay;
     int max_delay;
 
-    std::vector<std::vector<int>> get_delay() { return get_matrix_variable_all<int>(delay); }
-    void set_delay(std::vector<std::vector<int>> value) { update_matrix_variable_all<int>(delay, value); }
-    std::vector<int> get_dendrite_delay(int lil_idx) { return get_matrix_variable_row<int>(delay, lil_idx); }
+    std::vector<std::vector<%(delay_type)s>> get_delay() { return get_matrix_variable_all<%(delay_type)s>(delay); }
+    void set_delay(std::vector<std::vector<%(delay_type)s>> value) { update_matrix_variable_all<%(delay_type)s>(delay, value); }
+    std::vector<%(delay_type)s> get_dendrite_delay(int lil_idx) { return get_matrix_variable_row<%(delay_type)s>(delay, lil_idx); }
 """,
         'init': """
-    delay = init_matrix_variable<int>(1);
-    update_matrix_variable_all<int>(delay, delays);
+    delay = init_matrix_variable<%(delay_type)s>(1);
+    update_matrix_variable_all<%(delay_type)s>(delay, convert_lil<%(delay_type)s>(delays));
 """,
         'reset': "",
         'pyx_struct':
 """
         # Non-uniform delay
-        vector[vector[int]] get_delay()
-        void set_delay(vector[vector[int]])
-        vector[int] get_dendrite_delay(int)
+        vector[vector[%(delay_type)s]] get_delay()
+        void set_delay(vector[vector[%(delay_type)s]])
+        vector[%(delay_type)s] get_dendrite_delay(int)
         int max_delay
         void update_max_delay(int)
         void reset_ring_buffer()
@@ -160,14 +160,14 @@ delay = {
     },
     'nonuniform_spiking': {
         'declare': """
-    std::vector<int> delay;
+    std::vector<%(delay_type)s> delay;
     int max_delay;
     int idx_delay;
     std::vector< std::vector< std::vector< int > > > _delayed_spikes;
 """,
         'init': """
-    delay = init_matrix_variable<int>(1);
-    update_variable_all<int>(delay, delays);
+    delay = init_matrix_variable<%(delay_type)s>(1);
+    update_variable_all<%(delay_type)s>(delay, convert_lil<%(delay_type)s>(delays));
 
     idx_delay = 0;
     max_delay = %(pre_prefix)smax_delay;
@@ -186,7 +186,7 @@ delay = {
         'pyx_struct':
 """
         # Non-uniform delay
-        vector[vector[int]] delay
+        vector[vector[%(delay_type)s]] delay
         int max_delay
         void update_max_delay(int)
         void reset_ring_buffer()
@@ -234,7 +234,7 @@ csr_summation_operation = {
 
 // w as CSR
 const %(size_type)s* __restrict__ row_ptr = row_begin_.data();
-const %(idx_type)s* __restrict__ col_idx = col_idx_.data();
+const %(col_idx_type)s* __restrict__ col_idx = col_idx_.data();
 %(idx_type)s nb_post = static_cast<%(idx_type)s>(post_ranks_.size());
 %(float_prec)s* __restrict__ target_ptr = %(post_prefix)s_sum_%(target)s.data();
 
@@ -304,13 +304,15 @@ continuous_transmission_sse_single_weight = {
     #ifdef __SSE4_1__
         if (_transmission && pop%(id_post)s._active) {
             const %(size_type)s* __restrict__ row_ptr = row_begin_.data();
-            const %(idx_type)s* __restrict__ _idx = col_idx_.data();
+            const %(col_idx_type)s* __restrict__ _idx = col_idx_.data();
 
             double _tmp_sum[2];
             double* __restrict__ _pre_r = %(get_r)s;
 
+            %(idx_type)s nb_post = static_cast<%(idx_type)s>(post_ranks_.size());
+
             #pragma omp for firstprivate(w)
-            for (%(idx_type)s i = 0; i < post_ranks_.size(); i++) {
+            for (%(idx_type)s i = 0; i < nb_post; i++) {
                 %(idx_type)s rk_post = post_ranks_[i];
                 %(size_type)s _s = row_ptr[rk_post];
                 %(size_type)s _stop = row_ptr[rk_post+1];
@@ -345,13 +347,15 @@ continuous_transmission_sse_single_weight = {
     #ifdef __SSE4_1__
         if (_transmission && pop%(id_post)s._active) {
             const %(size_type)s* __restrict__ row_ptr = row_begin_.data();
-            const %(idx_type)s* __restrict__ _idx = col_idx_.data();
+            const %(col_idx_type)s* __restrict__ _idx = col_idx_.data();
 
             float _tmp_sum[4];
             float* __restrict__ _pre_r = %(get_r)s;
 
+            %(idx_type)s nb_post = static_cast<%(idx_type)s>(post_ranks_.size());
+
             #pragma omp for firstprivate(w)
-            for (%(idx_type)s i = 0; i < post_ranks_.size(); i++) {
+            for (%(idx_type)s i = 0; i < nb_post; i++) {
                 %(idx_type)s rk_post = post_ranks_[i];
                 %(size_type)s _s = row_ptr[rk_post];
                 %(size_type)s _stop = row_ptr[rk_post+1];
@@ -393,12 +397,14 @@ continuous_transmission_avx_single_weight = {
     #ifdef __AVX__
         if (_transmission && %(post_prefix)s_active) {
             const %(size_type)s* __restrict__ row_ptr = row_begin_.data();
-            const %(idx_type)s* __restrict__ _idx = col_idx_.data();
+            const %(col_idx_type)s* __restrict__ _idx = col_idx_.data();
             double _tmp_sum[4];
             double* __restrict__ _pre_r = %(get_r)s;
 
+            %(idx_type)s nb_post = static_cast<%(idx_type)s>(post_ranks_.size());
+
             #pragma omp for firstprivate(w)
-            for (%(idx_type)s i = 0; i < post_ranks_.size(); i++) {
+            for (%(idx_type)s i = 0; i < nb_post; i++) {
                 %(idx_type)s rk_post = post_ranks_[i];
 
                 %(size_type)s _s = row_ptr[rk_post];
@@ -435,12 +441,14 @@ continuous_transmission_avx_single_weight = {
     #ifdef __AVX__
         if (_transmission && %(post_prefix)s_active) {
             const %(size_type)s* __restrict__ row_ptr = row_begin_.data();
-            const %(idx_type)s* __restrict__ _idx = col_idx_.data();
+            const %(col_idx_type)s* __restrict__ _idx = col_idx_.data();
             float _tmp_sum[8];
             float* __restrict__ _pre_r = %(get_r)s;
 
+            %(idx_type)s nb_post = static_cast<%(idx_type)s>(post_ranks_.size());
+
             #pragma omp for firstprivate(w)
-            for (%(idx_type)s i = 0; i < post_ranks_.size(); i++) {
+            for (%(idx_type)s i = 0; i < nb_post; i++) {
                 %(idx_type)s rk_post = post_ranks_[i];
 
                 %(size_type)s _s = row_ptr[rk_post];
@@ -483,14 +491,16 @@ continuous_transmission_avx512_single_weight = {
         'double': """
     #ifdef __AVX__
         const %(size_type)s* __restrict__ row_ptr = row_begin_.data();
-        const %(idx_type)s* __restrict__ _idx = col_idx_.data();
+        const %(col_idx_type)s* __restrict__ _idx = col_idx_.data();
 
         if (_transmission && %(post_prefix)s_active) {
             double _tmp_sum[8];
             double* __restrict__ _pre_r = %(get_r)s;
 
+            %(idx_type)s nb_post = static_cast<%(idx_type)s>(post_ranks_.size());
+
             #pragma omp for firstprivate(w)
-            for (%(idx_type)s i = 0; i < post_ranks_.size(); i++) {
+            for (%(idx_type)s i = 0; i < nb_post; i++) {
                 %(idx_type)s rk_post = post_ranks_[i];
                 %(size_type)s _s = row_ptr[rk_post];
                 %(size_type)s _stop = row_ptr[rk_post+1];
@@ -524,14 +534,16 @@ continuous_transmission_avx512_single_weight = {
         'float': """
     #ifdef __AVX__
         const %(size_type)s* __restrict__ row_ptr = row_begin_.data();
-        const %(idx_type)s* __restrict__ _idx = col_idx_.data();
+        const %(col_idx_type)s* __restrict__ _idx = col_idx_.data();
 
         if (_transmission && %(post_prefix)s_active) {
             float _tmp_sum[16];
             float* __restrict__ _pre_r = %(get_r)s;
 
+            %(idx_type)s nb_post = static_cast<%(idx_type)s>(post_ranks_.size());
+
             #pragma omp for firstprivate(w)
-            for (%(idx_type)s i = 0; i < post_ranks_.size(); i++) {
+            for (%(idx_type)s i = 0; i < nb_post; i++) {
                 %(idx_type)s rk_post = post_ranks_[i];
 
                 %(size_type)s _s = row_ptr[rk_post];
@@ -578,14 +590,16 @@ continuous_transmission_sse = {
 
         if (_transmission && %(post_prefix)s_active) {
             const %(size_type)s* __restrict__ row_ptr = row_begin_.data();
-            const %(idx_type)s* __restrict__ _idx = col_idx_.data();
+            const %(col_idx_type)s* __restrict__ _idx = col_idx_.data();
             const double* __restrict__ _w = w.data();
 
             double _tmp_sum[2];
             double* __restrict__ _pre_r = %(get_r)s;
 
+            %(idx_type)s nb_post = static_cast<%(idx_type)s>(post_ranks_.size());
+
             #pragma omp for
-            for (%(idx_type)s i = 0; i < post_ranks_.size(); i++) {
+            for (%(idx_type)s i = 0; i < nb_post; i++) {
                 %(idx_type)s rk_post = post_ranks_[i];
                 %(size_type)s _s = row_ptr[rk_post];
                 %(size_type)s _stop = row_ptr[rk_post+1];
@@ -628,14 +642,16 @@ continuous_transmission_sse = {
     #ifdef __SSE4_1__
         if (_transmission && %(post_prefix)s_active) {
             const %(size_type)s* __restrict__ row_ptr = row_begin_.data();
-            const %(idx_type)s* __restrict__ _idx = col_idx_.data();
+            const %(col_idx_type)s* __restrict__ _idx = col_idx_.data();
             const float* __restrict__ _w = w.data();
 
             float _tmp_sum[4];
             float* __restrict__ _pre_r = %(get_r)s;
 
+            %(idx_type)s nb_post = static_cast<%(idx_type)s>(post_ranks_.size());
+
             #pragma omp for
-            for (%(idx_type)s i = 0; i < post_ranks_.size(); i++) {
+            for (%(idx_type)s i = 0; i < nb_post; i++) {
                 %(idx_type)s rk_post = post_ranks_[i];
                 %(size_type)s _s = row_ptr[rk_post];
                 %(size_type)s _stop = row_ptr[rk_post+1];
@@ -675,6 +691,59 @@ continuous_transmission_sse = {
     #else
         std::cerr << "The code was not compiled with SSE4-1 support. Please check your compiler flags ..." << std::endl;
     #endif
+""",
+        'mixed': """
+    #ifdef __SSE4_1__
+
+        if (_transmission && %(post_prefix)s_active) {
+            const %(size_type)s* __restrict__ row_ptr = row_begin_.data();
+            const %(col_idx_type)s* __restrict__ _idx = col_idx_.data();
+            const float* __restrict__ _w = w.data();
+
+            double _tmp_sum[2];
+            double* __restrict__ _pre_r = %(get_r)s;
+
+            %(idx_type)s nb_post = static_cast<%(idx_type)s>(post_ranks_.size());
+
+            #pragma omp for
+            for (%(idx_type)s i = 0; i < nb_post; i++) {
+                %(idx_type)s rk_post = post_ranks_[i];
+                %(size_type)s _s = row_ptr[rk_post];
+                %(size_type)s _stop = row_ptr[rk_post+1];
+                __m128d _tmp_reg_sum = _mm_setzero_pd();
+
+                for (; _s+8 < _stop; _s+=8) {
+                    __m128d _tmp_r = _mm_set_pd(_pre_r[_idx[_s+1]], _pre_r[_idx[_s+0]]);
+                    __m128d _tmp_r2 = _mm_set_pd(_pre_r[_idx[_s+3]], _pre_r[_idx[_s+2]]);
+                    __m128d _tmp_r3 = _mm_set_pd(_pre_r[_idx[_s+5]], _pre_r[_idx[_s+4]]);
+                    __m128d _tmp_r4 = _mm_set_pd(_pre_r[_idx[_s+7]], _pre_r[_idx[_s+6]]);
+
+                    __m128d _tmp_w = _mm_cvtps_pd(_mm_castsi128_ps(_mm_loadl_epi64((__m128i const*) &_w[_s])));
+                    __m128d _tmp_w2 = _mm_cvtps_pd(_mm_castsi128_ps(_mm_loadl_epi64((__m128i const*) &_w[_s+2])));
+                    __m128d _tmp_w3 = _mm_cvtps_pd(_mm_castsi128_ps(_mm_loadl_epi64((__m128i const*) &_w[_s+4])));
+                    __m128d _tmp_w4 = _mm_cvtps_pd(_mm_castsi128_ps(_mm_loadl_epi64((__m128i const*) &_w[_s+6])));
+
+                    _tmp_reg_sum = _mm_add_pd(_tmp_reg_sum, _mm_mul_pd(_tmp_r, _tmp_w));
+                    _tmp_reg_sum = _mm_add_pd(_tmp_reg_sum, _mm_mul_pd(_tmp_r2, _tmp_w2));
+                    _tmp_reg_sum = _mm_add_pd(_tmp_reg_sum, _mm_mul_pd(_tmp_r3, _tmp_w3));
+                    _tmp_reg_sum = _mm_add_pd(_tmp_reg_sum, _mm_mul_pd(_tmp_r4, _tmp_w4));
+                }
+
+                _mm_storeu_pd(_tmp_sum, _tmp_reg_sum);
+
+                // partial sums
+                double lsum = _tmp_sum[0] + _tmp_sum[1];
+
+                // remainder loop
+                for (; _s < _stop; _s++)
+                    lsum += _pre_r[_idx[_s]] * _w[_s];
+
+                %(post_prefix)s_sum_%(target)s%(post_index)s += lsum;
+            }
+        } // active
+    #else
+        std::cerr << "The code was not compiled with AVX support. Please check your compiler flags ..." << std::endl;
+    #endif
 """
     }
 }
@@ -684,15 +753,17 @@ continuous_transmission_avx = {
         'double': """
     #ifdef __AVX__
         const %(size_type)s* __restrict__ row_ptr = row_begin_.data();
-        const %(idx_type)s* __restrict__ _idx = col_idx_.data();
+        const %(col_idx_type)s* __restrict__ _idx = col_idx_.data();
         const double* __restrict__ _w = w.data();
 
         if (_transmission && pop%(id_post)s._active) {
             double _tmp_sum[4];
             double* __restrict__ _pre_r = %(get_r)s;
 
+            %(idx_type)s nb_post = static_cast<%(idx_type)s>(post_ranks_.size());
+
             #pragma omp for
-            for (%(idx_type)s i = 0; i < post_ranks_.size(); i++) {
+            for (%(idx_type)s i = 0; i < nb_post; i++) {
                 %(idx_type)s rk_post = post_ranks_[i];
 
                 %(size_type)s _s = row_ptr[rk_post];
@@ -733,15 +804,17 @@ continuous_transmission_avx = {
         'float': """
     #ifdef __AVX__
         const %(size_type)s* __restrict__ row_ptr = row_begin_.data();
-        const %(idx_type)s* __restrict__ _idx = col_idx_.data();
+        const %(col_idx_type)s* __restrict__ _idx = col_idx_.data();
         const float* __restrict__ _w = w.data();
 
         if (_transmission && %(post_prefix)s_active) {
             float _tmp_sum[8];
             float* __restrict__ _pre_r = %(get_r)s;
 
+            %(idx_type)s nb_post = static_cast<%(idx_type)s>(post_ranks_.size());
+
             #pragma omp for
-            for (%(idx_type)s i = 0; i < post_ranks_.size(); i++) {
+            for (%(idx_type)s i = 0; i < nb_post; i++) {
                 %(idx_type)s rk_post = post_ranks_[i];
 
                 %(size_type)s _s = row_ptr[rk_post];
@@ -779,6 +852,57 @@ continuous_transmission_avx = {
     #else
         std::cerr << "The code was not compiled with AVX support. Please check your compiler flags ..." << std::endl;
     #endif
+""",
+        'mixed': """
+    #ifdef __AVX__
+        const %(size_type)s* __restrict__ row_ptr = row_begin_.data();
+        const %(col_idx_type)s* __restrict__ _idx = col_idx_.data();
+        const float* __restrict__ _w = w.data();
+
+        if (_transmission && pop%(id_post)s._active) {
+            double _tmp_sum[4];
+            double* __restrict__ _pre_r = %(get_r)s;
+
+            %(idx_type)s nb_post = static_cast<%(idx_type)s>(post_ranks_.size());
+
+            #pragma omp for
+            for (%(idx_type)s i = 0; i < nb_post; i++) {
+                %(idx_type)s rk_post = post_ranks_[i];
+
+                %(size_type)s _s = row_ptr[rk_post];
+                %(size_type)s _stop = row_ptr[rk_post+1];
+                __m256d _tmp_reg_sum = _mm256_setzero_pd();
+
+                for (; (_s+8) < _stop; _s+=8) {
+                    __m256d _tmp_r = _mm256_set_pd(
+                        _pre_r[_idx[_s+3]], _pre_r[_idx[_s+2]], _pre_r[_idx[_s+1]], _pre_r[_idx[_s]]
+                    );
+                    __m256d _tmp_r2 = _mm256_set_pd(
+                        _pre_r[_idx[_s+7]], _pre_r[_idx[_s+6]], _pre_r[_idx[_s+5]], _pre_r[_idx[_s+4]]
+                    );
+
+                    __m256d _tmp_w = _mm256_cvtps_pd(_mm_loadu_ps(&_w[_s]));
+                    __m256d _tmp_w2 = _mm256_cvtps_pd(_mm_loadu_ps(&_w[_s+4]));
+
+                    _tmp_reg_sum = _mm256_add_pd(_tmp_reg_sum, _mm256_mul_pd(_tmp_r, _tmp_w));
+                    _tmp_reg_sum = _mm256_add_pd(_tmp_reg_sum, _mm256_mul_pd(_tmp_r2, _tmp_w2));
+                }
+
+                _mm256_storeu_pd(_tmp_sum, _tmp_reg_sum);
+
+                // partial sums
+                double lsum = _tmp_sum[0] + _tmp_sum[1] + _tmp_sum[2] + _tmp_sum[3];
+
+                // remainder loop
+                for (; _s < _stop; _s++)
+                    lsum += _pre_r[_idx[_s]] * _w[_s];
+
+                %(post_prefix)s_sum_%(target)s%(post_index)s += lsum;
+            }
+        } // active
+    #else
+        std::cerr << "The code was not compiled with AVX support. Please check your compiler flags ..." << std::endl;
+    #endif
 """
     }
 }
@@ -788,15 +912,17 @@ continuous_transmission_avx512 = {
         'double': """
     #ifdef __AVX512F__
         const %(size_type)s* __restrict__ row_ptr = row_begin_.data();
-        const %(idx_type)s* __restrict__ _idx = col_idx_.data();
+        const %(col_idx_type)s* __restrict__ _idx = col_idx_.data();
         const double* __restrict__ _w = w.data();
 
         if (_transmission && %(post_prefix)s_active) {
             double _tmp_sum[8];
             double* __restrict__ _pre_r = %(get_r)s;
 
+            %(idx_type)s nb_post = static_cast<%(idx_type)s>(post_ranks_.size());
+
             #pragma omp for
-            for (%(idx_type)s i = 0; i < post_ranks_.size(); i++) {
+            for (%(idx_type)s i = 0; i < nb_post; i++) {
                 %(idx_type)s rk_post = post_ranks_[i];
                 %(size_type)s _s = row_ptr[rk_post];
                 %(size_type)s _stop = row_ptr[rk_post+1];
@@ -832,15 +958,17 @@ continuous_transmission_avx512 = {
         'float': """
     #ifdef __AVX512F__
         const %(size_type)s* __restrict__ row_ptr = row_begin_.data();
-        const %(idx_type)s* __restrict__ _idx = col_idx_.data();
+        const %(col_idx_type)s* __restrict__ _idx = col_idx_.data();
         const float* __restrict__ _w = w.data();
 
         if (_transmission && pop%(id_post)s._active) {
             float _tmp_sum[16];
             float* __restrict__ _pre_r = %(get_r)s;
 
+            %(idx_type)s nb_post = static_cast<%(idx_type)s>(post_ranks_.size());
+
             #pragma omp for
-            for (%(idx_type)s i = 0; i < post_ranks_.size(); i++) {
+            for (%(idx_type)s i = 0; i < nb_post; i++) {
                 %(idx_type)s rk_post = post_ranks_[i];
                 %(size_type)s _s = row_ptr[rk_post];
                 %(size_type)s _stop = row_ptr[rk_post+1];
@@ -873,6 +1001,52 @@ continuous_transmission_avx512 = {
     #else
         std::cerr << "The code was not compiled with AVX-512 support. Please check your compiler flags ..." << std::endl;
     #endif
+""",
+        'mixed': """
+    #ifdef __AVX512F__
+        const %(size_type)s* __restrict__ row_ptr = row_begin_.data();
+        const %(col_idx_type)s* __restrict__ _idx = col_idx_.data();
+        const float* __restrict__ _w = w.data();
+
+        if (_transmission && %(post_prefix)s_active) {
+            double _tmp_sum[8];
+            double* __restrict__ _pre_r = %(get_r)s;
+
+            %(idx_type)s nb_post = static_cast<%(idx_type)s>(post_ranks_.size());
+
+            #pragma omp for
+            for (%(idx_type)s i = 0; i < nb_post; i++) {
+                %(idx_type)s rk_post = post_ranks_[i];
+                %(size_type)s _s = row_ptr[rk_post];
+                %(size_type)s _stop = row_ptr[rk_post+1];
+                __m512d _tmp_reg_sum = _mm512_setzero_pd();
+
+                for (; (_s+8) < _stop; _s+=8) {
+                    __m512d _tmp_r = _mm512_set_pd(
+                        _pre_r[_idx[_s+7]], _pre_r[_idx[_s+6]], _pre_r[_idx[_s+5]], _pre_r[_idx[_s+4]],
+                        _pre_r[_idx[_s+3]], _pre_r[_idx[_s+2]], _pre_r[_idx[_s+1]], _pre_r[_idx[_s]]
+                    );
+
+                    __m512d _tmp_w = _mm512_cvtps_pd(_mm256_loadu_ps(&_w[_s]));
+
+                    _tmp_reg_sum = _mm512_add_pd(_tmp_reg_sum, _mm512_mul_pd(_tmp_r, _tmp_w));
+                }
+
+                _mm512_storeu_pd(_tmp_sum, _tmp_reg_sum);
+
+                // partial sums
+                double lsum = _tmp_sum[0] + _tmp_sum[1] + _tmp_sum[2] + _tmp_sum[3] + _tmp_sum[4] + _tmp_sum[5] + _tmp_sum[6] + _tmp_sum[7];
+
+                // remainder loop
+                for (; _s < _stop; _s++)
+                    lsum += _pre_r[_idx[_s]] * _w[_s];
+
+                pop%(id_post)s._sum_%(target)s%(post_index)s += lsum;
+            }
+        } // active
+    #else
+        std::cerr << "The code was not compiled with AVX-512 support. Please check your compiler flags ..." << std::endl;
+    #endif
 """
     }
 }
@@ -883,7 +1057,7 @@ if(_transmission && _update && %(post_prefix)s_active && ( (t - _update_offset)%
     %(global)s
 
     const %(size_type)s* __restrict__ row_ptr = row_begin_.data();
-    const %(idx_type)s* __restrict__ col_idx = col_idx_.data();
+    const %(col_idx_type)s* __restrict__ col_idx = col_idx_.data();
     %(idx_type)s nb_post = static_cast<%(idx_type)s>(post_ranks_.size());
 
     #pragma omp for
@@ -949,8 +1123,8 @@ if (_transmission && %(post_prefix)s_active) {
 
 spiking_post_event = """
 // w as CSR
-const int * __restrict__ row_ptr = row_begin_.data();
-const int * __restrict__ _col_idx = col_idx_.data();
+const %(size_type)s* __restrict__ row_ptr = row_begin_.data();
+const %(idx_type)s* __restrict__ _col_idx = col_idx_.data();
 
 if(_transmission && %(post_prefix)s_active){
     #pragma omp for
@@ -98,14 +98,14 @@ attribute_cpp_delete = {
 delay = {
     'nonuniform_spiking': {
         'declare': """
-    std::vector<int> delay;
+    std::vector<%(delay_type)s> delay;
     int max_delay;
     int idx_delay;
     std::vector< std::vector< std::vector< int > > > _delayed_spikes;
 """,
         'init': """
-    delay = init_matrix_variable<int>(1);
-    update_matrix_variable_all<int>(delay, delays);
+    delay = init_matrix_variable<%(delay_type)s>(1);
+    update_matrix_variable_all<%(delay_type)s>(delay, convert_lil<%(delay_type)s>(delays));
 
     idx_delay = 0;
     max_delay = %(pre_prefix)smax_delay;
@@ -124,7 +124,7 @@ delay = {
         'pyx_struct':
 """
         # Non-uniform delay
-        vector[vector[int]] delay
+        vector[vector[%(delay_type)s]] delay
         int max_delay
         void update_max_delay(int)
         void reset_ring_buffer()
@@ -145,12 +145,12 @@ delay = {
 """},
     'nonuniform_rate_coded': {
         'declare': """
-    std::vector<std::vector<int>> delay;
+    std::vector<std::vector<%(delay_type)s>> delay;
     int max_delay;
 """,
         'init': """
-    delay = init_matrix_variable<int>(1);
-    update_matrix_variable_all<int>(delay, delays);
+    delay = init_matrix_variable<%(delay_type)s>(1);
+    update_matrix_variable_all<%(delay_type)s>(delay, convert_lil<%(delay_type)s>(delays));
 
     max_delay = %(pre_prefix)smax_delay;
 """,
@@ -158,7 +158,7 @@ delay = {
         'pyx_struct':
 """
         # Non-uniform delay
-        vector[vector[int]] delay
+        vector[vector[%(delay_type)s]] delay
         int max_delay
         void update_max_delay(int)
         void reset_ring_buffer()
@@ -186,21 +186,21 @@ delay = {
     'nonuniform_spiking': {
         'declare': """
     // Nonuniform spiking delays
-    std::vector<std::vector<std::vector<int>>> delay;
+    std::vector<std::vector<std::vector<%(delay_type)s>>> delay;
     int max_delay;
     int idx_delay;
     std::vector< std::vector< std::vector< std::vector< int > > > > _delayed_spikes;
 
-    std::vector<std::vector<int>> get_delay() {
-        return get_matrix_variable_all<int, std::vector<std::vector<int>>>(delay);
+    std::vector<std::vector<%(delay_type)s>> get_delay() {
+        return get_matrix_variable_all<%(delay_type)s, std::vector<std::vector<%(delay_type)s>>>(delay);
     }
-    void set_delay(std::vector<std::vector<int>> value) {
-        update_matrix_variable_all<int, std::vector<std::vector<int>>>(delay, value);
+    void set_delay(std::vector<std::vector<%(delay_type)s>> value) {
+        update_matrix_variable_all<%(delay_type)s, std::vector<std::vector<%(delay_type)s>>>(delay, value);
     }
 """,
         'init': """
-        delay = init_matrix_variable<int, std::vector<std::vector<int>>>(1);
-        update_matrix_variable_all<int>(delay, delays);
+        delay = init_matrix_variable<%(delay_type)s, std::vector<std::vector<%(delay_type)s>>>(1);
+        update_matrix_variable_all<%(delay_type)s>(delay, convert_lil<%(delay_type)s>(delays));
 
         idx_delay = 0;
         max_delay = %(pre_prefix)smax_delay ;
@@ -236,8 +236,8 @@ delay = {
         int max_delay
         void update_max_delay(int)
         void reset_ring_buffer()
-        vector[vector[int]] get_delay()
-        void set_delay(vector[vector[int]])
+        vector[vector[%(delay_type)s]] get_delay()
+        void set_delay(vector[vector[%(delay_type)s]])
 """,
         'pyx_wrapper_init': "",
         'pyx_wrapper_accessor':
@@ -333,7 +333,7 @@ lil_summation_operation_avx_single_weight = {
             float* __restrict__ _pre_r = %(get_r)s;
 
             for (std::vector<%(idx_type)s>::size_type i = 0; i < nb_post; i++) {
-                int* __restrict__ _idx = sub_matrices_[tid]->pre_rank[i].data();
+                %(col_idx_type)s* __restrict__ _idx = sub_matrices_[tid]->pre_rank[i].data();
 
                 _stop = sub_matrices_[tid]->pre_rank[i].size();
                 __m256 _tmp_reg_sum = _mm256_set1_ps(0.0);
@@ -508,7 +508,7 @@ if (_transmission && %(post_prefix)s_active){
             continue;
 
         // List of postsynaptic neurons receiving spikes from that neuron
-        std::vector< std::pair<int, int> >& inv_post = inv_post_ptr->second;
+        auto& inv_post = inv_post_ptr->second;
         // Number of post neurons
         int nb_post = inv_post.size();
 
@@ -35,7 +35,7 @@ from ANNarchy.generator.Projection.OpenMP import *
 from ANNarchy.generator.Projection.SingleThread import LIL_SingleThread
 
 # Useful functions
-from ANNarchy.generator.Utils import generate_equation_code, tabify, remove_trailing_spaces, check_avx_instructions, determine_idx_type_for_projection
+from ANNarchy.generator.Utils import generate_equation_code, tabify, remove_trailing_spaces, check_avx_instructions, determine_idx_type_for_projection, determine_col_idx_type_for_projection, determine_delay_type_for_projection
 
 import re
 from copy import deepcopy
@@ -136,7 +136,8 @@ class OpenMPGenerator(ProjectionGenerator):
                 'add_args': "",
                 'num_threads': num_threads_acc,
                 'float_prec': Global.config["precision"],
-                'idx_type': self._template_ids['idx_type']
+                'idx_type': self._template_ids['idx_type'],
+                'col_idx_type': self._template_ids['col_idx_type']
             }
             declare_connectivity_matrix = ""
             access_connectivity_matrix = ""
@@ -253,14 +254,20 @@ class OpenMPGenerator(ProjectionGenerator):
         }
 
         final_code = self._templates['projection_header'] % final_code_dict
+        final_body_code = self._templates['projection_body'] % final_code_dict
 
         # remove right-trailing white spaces
         final_code = remove_trailing_spaces(final_code)
+        final_body_code = remove_trailing_spaces(final_body_code)
 
         # Store file
         with open(annarchy_dir+'/generate/net'+str(self._net_id)+'/proj'+str(proj.id)+'.hpp', 'w') as ofile:
             ofile.write(final_code)
 
+        # The methods called in the simulation loop form a separate translation unit
+        with open(annarchy_dir+'/generate/net'+str(self._net_id)+'/proj'+str(proj.id)+'.cpp', 'w') as ofile:
+            ofile.write(final_body_code)
+
         # Dictionary for inclusions in ANNarchy.cpp
         proj_desc = {
             'include': """#include "proj%(id)s.hpp"\n""" % {'id': proj.id},
@@ -286,6 +293,10 @@ class OpenMPGenerator(ProjectionGenerator):
         #                       spiking models. I want to adjust new codes already as I
         #                       hope to update the spike code generation soon ...
         idx_type, _, size_type, _ = determine_idx_type_for_projection(proj)
+        col_idx_type, _ = determine_col_idx_type_for_projection(proj)
+
+        # Non-uniform delays are stored in the smallest suitable type
+        delay_type, _ = determine_delay_type_for_projection(proj)
 
         self._template_ids.update({
             'id_proj' : proj.id,
@@ -296,7 +307,9 @@ class OpenMPGenerator(ProjectionGenerator):
             'pre_prefix': 'pop'+ str(proj.pre.id) + '.',
             'post_prefix': 'pop'+ str(proj.post.id) + '.',
             'idx_type': idx_type,
-            'size_type': size_type
+            'col_idx_type': col_idx_type,
+            'size_type': size_type,
+            'delay_type': delay_type
         })
 
         if proj._storage_format == "lil":
@@ -544,7 +557,8 @@ class OpenMPGenerator(ProjectionGenerator):
                 simd_type = "avx512"
 
             # Does our current system support AVX?
-            if simd_type is not None:
+            simd_precision = self._simd_precision(proj)
+            if simd_type is not None and simd_precision is not None:
 
                 try:
                     # The default weighted sum can be re-formulated for single weights
@@ -559,7 +573,7 @@ class OpenMPGenerator(ProjectionGenerator):
                         ids.update({
                             'get_r': ids['pre_prefix']+"r.data()"
                         })
-                        psp_code = template["sum"][Global.config["precision"]] % ids
+                        psp_code = template["sum"][simd_precision] % ids
 
                         if self._prof_gen:
                             psp_code = self._prof_gen.annotate_computesum_rate(proj, psp_code)
@@ -571,7 +585,7 @@ class OpenMPGenerator(ProjectionGenerator):
                         ids.update({
                             'get_r': ids['pre_prefix']+"_delayed_r[delay-1].data()",
                         })
-                        psp_code = template["sum"][Global.config["precision"]] % ids
+                        psp_code = template["sum"][simd_precision] % ids
 
                         if self._prof_gen:
                             psp_code = self._prof_gen.annotate_computesum_rate(proj, psp_code)
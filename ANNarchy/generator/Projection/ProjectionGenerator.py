@@ -27,7 +27,7 @@ from ANNarchy.core import Random as ANNRandom
 from ANNarchy.extensions.convolution import Transpose
 
 # Useful functions
-from ANNarchy.generator.Utils import tabify, determine_idx_type_for_projection, cpp_connector_available
+from ANNarchy.generator.Utils import tabify, determine_idx_type_for_projection, determine_col_idx_type_for_projection, determine_delay_type_for_projection, cpp_connector_available
 
 class ProjectionGenerator(object):
     """
@@ -84,6 +84,19 @@ class ProjectionGenerator(object):
         "Implemented by child class"
         raise NotImplementedError
 
+    @staticmethod
+    def _simd_precision(proj):
+        """
+        Returns the key of the SIMD kernels in the templates: the network precision, or "mixed" if the
+        weights are stored in single precision (storage_precision) and converted to double precision before
+        the accumulation. None if no kernel is available for the storage precision.
+        """
+        if proj._storage_precision is None or proj._has_single_weight():
+            return Global.config['precision']
+        if proj._storage_precision == "float" and Global.config['precision'] == "double":
+            return "mixed"
+        return None
+
     def _configure_template_ids(self, proj):
         """
         This function should be called before any other method of the
@@ -109,6 +122,9 @@ class ProjectionGenerator(object):
         # get preferred index type
         idx_type, _, size_type, _ = determine_idx_type_for_projection(proj)
 
+        # the column indices can be stored in a smaller type (only some formats)
+        col_idx_type, _ = determine_col_idx_type_for_projection(proj)
+
         # ANNarchy supports a list of different formats to encode projections.
         # The general structure of the decision tree is:
         #
@@ -128,12 +144,12 @@ class ProjectionGenerator(object):
             if proj._storage_format == "lil":
                 if Global._check_paradigm("openmp"):
                     if Global.config['num_threads'] == 1:
-                        sparse_matrix_format = "LILMatrix<"+idx_type+", "+size_type+">"
+                        sparse_matrix_format = "LILMatrix<"+idx_type+", "+size_type+", "+col_idx_type+">"
                         sparse_matrix_include = "#include \"LILMatrix.hpp\"\n"
                         single_matrix = True
                     else:
                         if proj._no_split_matrix:
-                            sparse_matrix_format = "LILMatrix<"+idx_type+", "+size_type+">"
+                            sparse_matrix_format = "LILMatrix<"+idx_type+", "+size_type+", "+col_idx_type+">"
                             sparse_matrix_include = "#include \"LILMatrix.hpp\"\n"
                             single_matrix = True
                         else:
@@ -173,7 +189,7 @@ class ProjectionGenerator(object):
 
             elif proj._storage_format in ["csr", "csr_scalar", "csr_vector"]:
                 if Global._check_paradigm("openmp"):
-                    sparse_matrix_format = "CSRMatrix<"+idx_type+", "+size_type+">"
+                    sparse_matrix_format = "CSRMatrix<"+idx_type+", "+size_type+", "+col_idx_type+">"
                     sparse_matrix_include = "#include \"CSRMatrix.hpp\"\n"
                     single_matrix = True
 
@@ -408,6 +424,13 @@ class ProjectionGenerator(object):
         #
         # Define the correct projection init code. Not all patterns have specialized
         # implementations.
+
+        # The distance-based patterns return the weights, which are set like in init_from_lil().
+        # The dense format needs the row indices for this.
+        distance_rows = ""
+        if proj._storage_format == "dense":
+            distance_rows = "        auto row_indices = static_cast<%(sparse_format)s*>(this)->get_post_rank();\n"
+
         if proj.connector_name == "Random" and cpp_connector_available("Random", proj._storage_format, proj._storage_order):
             connector_call = """
     bool fixed_probability_pattern(std::vector<%(idx_type)s> post_ranks, std::vector<%(idx_type)s> pre_ranks, %(float_prec)s p, %(float_prec)s w_dist_arg1, %(float_prec)s w_dist_arg2, %(float_prec)s d_dist_arg1, %(float_prec)s d_dist_arg2, bool allow_self_connections) {
@@ -424,6 +447,61 @@ class ProjectionGenerator(object):
     bool fixed_number_pre_pattern(std::vector<%(idx_type)s> post_ranks, std::vector<%(idx_type)s> pre_ranks, unsigned int nnz_per_row, %(float_prec)s w_dist_arg1, %(float_prec)s w_dist_arg2, %(float_prec)s d_dist_arg1, %(float_prec)s d_dist_arg2) {
         static_cast<%(sparse_format)s*>(this)->fixed_number_pre_pattern(post_ranks, pre_ranks, nnz_per_row, rng%(rng_idx)s%(num_threads)s);
 
+%(init_weights)s
+%(init_delays)s
+
+        return true;
+    }
+"""
+        elif proj.connector_name == "Random Divergent" and cpp_connector_available("Random Divergent", proj._storage_format, proj._storage_order):
+            connector_call = """
+    bool fixed_number_post_pattern(std::vector<%(idx_type)s> post_ranks, std::vector<%(idx_type)s> pre_ranks, unsigned int nnz_per_column, %(float_prec)s w_dist_arg1, %(float_prec)s w_dist_arg2, %(float_prec)s d_dist_arg1, %(float_prec)s d_dist_arg2, bool allow_self_connections) {
+        static_cast<%(sparse_format)s*>(this)->fixed_number_post_pattern(post_ranks, pre_ranks, nnz_per_column, allow_self_connections, rng%(rng_idx)s%(num_threads)s);
+
+%(init_weights)s
+%(init_delays)s
+
+        return true;
+    }
+"""
+        elif proj.connector_name == "All-to-All" and cpp_connector_available("All-to-All", proj._storage_format, proj._storage_order):
+            connector_call = """
+    bool all_to_all_pattern(std::vector<%(idx_type)s> post_ranks, std::vector<%(idx_type)s> pre_ranks, %(float_prec)s w_dist_arg1, %(float_prec)s w_dist_arg2, %(float_prec)s d_dist_arg1, %(float_prec)s d_dist_arg2, bool allow_self_connections) {
+        static_cast<%(sparse_format)s*>(this)->all_to_all_pattern(post_ranks, pre_ranks, allow_self_connections);
+
+%(init_weights)s
+%(init_delays)s
+
+        return true;
+    }
+"""
+        elif proj.connector_name == "One-to-One" and cpp_connector_available("One-to-One", proj._storage_format, proj._storage_order):
+            connector_call = """
+    bool one_to_one_pattern(std::vector<%(idx_type)s> post_ranks, std::vector<%(idx_type)s> pre_ranks, %(float_prec)s w_dist_arg1, %(float_prec)s w_dist_arg2, %(float_prec)s d_dist_arg1, %(float_prec)s d_dist_arg2) {
+        static_cast<%(sparse_format)s*>(this)->one_to_one_pattern(post_ranks, pre_ranks);
+
+%(init_weights)s
+%(init_delays)s
+
+        return true;
+    }
+"""
+        elif proj.connector_name == "Gaussian" and cpp_connector_available("Gaussian", proj._storage_format, proj._storage_order):
+            connector_call = """
+    bool gaussian_pattern(std::vector<int> pre_geometry, std::vector<int> post_geometry, float amp, float sigma, double limit, bool allow_self_connections, %(float_prec)s d_dist_arg1, %(float_prec)s d_dist_arg2) {
+        auto values = static_cast<%(sparse_format)s*>(this)->template gaussian_pattern<%(float_prec)s>(pre_geometry, post_geometry, amp, sigma, limit, allow_self_connections);
+""" + distance_rows + """
+%(init_weights)s
+%(init_delays)s
+
+        return true;
+    }
+"""
+        elif proj.connector_name == "Difference-of-Gaussian" and cpp_connector_available("Difference-of-Gaussian", proj._storage_format, proj._storage_order):
+            connector_call = """
+    bool dog_pattern(std::vector<int> pre_geometry, std::vector<int> post_geometry, float amp_pos, float sigma_pos, float amp_neg, float sigma_neg, double limit, bool allow_self_connections, %(float_prec)s d_dist_arg1, %(float_prec)s d_dist_arg2) {
+        auto values = static_cast<%(sparse_format)s*>(this)->template dog_pattern<%(float_prec)s>(pre_geometry, post_geometry, amp_pos, sigma_pos, amp_neg, sigma_neg, limit, allow_self_connections);
+""" + distance_rows + """
 %(init_weights)s
 %(init_delays)s
 
@@ -433,7 +511,7 @@ class ProjectionGenerator(object):
         else:
             connector_call = """
     bool init_from_lil( std::vector<%(idx_type)s> &row_indices,
-                        std::vector< std::vector<%(idx_type)s> > &column_indices,
+                        std::vector< std::vector<%(col_idx_type)s> > &column_indices,
                         std::vector< std::vector<%(float_prec)s> > &values,
                         std::vector< std::vector<int> > &delays) {
         bool success = static_cast<%(sparse_format)s*>(this)->init_matrix_from_lil(row_indices, column_indices%(add_args)s%(num_threads)s);
@@ -454,9 +532,48 @@ class ProjectionGenerator(object):
         return true;
     }
 """
+            connector_call += self._connectivity_init_from_csr()
 
         return connector_call
 
+    def _connectivity_init_from_csr(self):
+        """
+        Initialization from the flat arrays of a CSRConnectivity object (see
+        Connector.pyx). All formats are filled directly from the arrays by
+        init_matrix_from_csr().
+
+        The weights and delays are forwarded to the same initialization code
+        as init_from_lil(), the variables *values* and *delays* are therefore
+        CSRValues (see helper_functions.hpp) which provide the element access
+        of nested vectors on the flat arrays without copying them.
+        """
+        return """
+    bool init_from_csr( std::vector<int> &row_indices, std::size_t* row_ptr, int* col_idx,
+                        double* w_values, std::size_t nb_w, int* d_values, std::size_t nb_d, int uniform_delay) {
+        auto post_ranks = std::vector<%(idx_type)s>(row_indices.begin(), row_indices.end());
+
+        bool success = static_cast<%(sparse_format)s*>(this)->init_matrix_from_csr(post_ranks, row_ptr, col_idx%(add_args)s%(num_threads)s);
+        if (!success)
+            return false;
+
+        auto values = CSRValues<double, std::size_t>(row_ptr, w_values, nb_w, 0.0);
+        auto delays = CSRValues<int, std::size_t>(row_ptr, d_values, nb_d, uniform_delay);
+
+%(init_weights)s
+%(init_delays)s
+
+        // init other variables than 'w' or delay
+        if (!init_attributes()){
+            return false;
+        }
+
+    #ifdef _DEBUG_CONN
+        static_cast<%(sparse_format)s*>(this)->print_data_representation();
+    #endif
+        return true;
+    }
+"""
+
     def _declaration_accessors(self, proj, single_matrix):
         """
         Generate declaration and accessor code for variables/parameters of the projection.
@@ -485,7 +602,7 @@ class ProjectionGenerator(object):
                 else:
                     key_delay = "nonuniform_spiking"
 
-            declare_delay = self._templates['delay'][key_delay]['declare']
+            declare_delay = self._templates['delay'][key_delay]['declare'] % self._template_ids
             init_delay = self._templates['delay'][key_delay]['init']
         else:
             declare_delay = ""
@@ -751,6 +868,10 @@ class ProjectionGenerator(object):
 
         attributes = []
 
+        # The distance-based patterns return the weights like a LIL
+        cpp_weights = cpp_connector_available(proj.connector_name, proj._storage_format, proj._storage_order) and \
+            proj.connector_name not in ["Gaussian", "Difference-of-Gaussian"]
+
         # Initialize parameters
         for var in proj.synapse_type.description['parameters'] + proj.synapse_type.description['variables']:
             # Avoid doublons
@@ -764,13 +885,13 @@ class ProjectionGenerator(object):
             # The synaptic weight
             if var['name'] == 'w':
                 if var['locality'] == "global" or proj._has_single_weight():
-                    if cpp_connector_available(proj.connector_name, proj._storage_format, proj._storage_order):
+                    if cpp_weights:
                         weight_code = tabify("w = w_dist_arg1;", 2)
                     else:
                         weight_code = tabify("w = values[0][0];", 2)
                     
                 elif var['locality'] == "local":
-                    if cpp_connector_available(proj.connector_name, proj._storage_format, proj._storage_order):   # Init weights in CPP
+                    if cpp_weights:   # Init weights in CPP
                         if proj.connector_weight_dist == None:
                             init_code = self._templates['attribute_cpp_init']['local'] % {
                                 'init': 'w_dist_arg1',
@@ -811,7 +932,8 @@ class ProjectionGenerator(object):
                         if Global._check_paradigm("cuda"):
                             init_code += "\ngpu_w = init_matrix_variable_gpu<%(float_prec)s>(w);"
 
-                        weight_code = tabify(init_code % {'float_prec': Global.config['precision']}, 2)
+                        # the weights are drawn in their storage type, which might differ from the network precision
+                        weight_code = tabify(init_code % {'float_prec': var['ctype']}, 2)
 
                     # Init_from_lil
                     else:
@@ -825,10 +947,12 @@ class ProjectionGenerator(object):
                             'attr_type': attr_type,
                             'float_prec': Global.config['precision']
                         }
+                        # the values are provided in network precision, convert_lil() only copies
+                        # them if a different storage precision was chosen for this projection.
                         if proj._storage_format=="dense":
-                            weight_code += tabify("for (%(idx_type)s row_idx = 0; row_idx < row_indices.size(); row_idx++) {\n\tupdate_matrix_variable_row<%(float_prec)s>(w, row_indices[row_idx], values[row_idx]);\n}" % {'idx_type': 'int', 'float_prec': Global.config['precision']}, 2)
+                            weight_code += tabify("auto&& w_lil = convert_lil<%(type)s>(values);\nfor (%(idx_type)s row_idx = 0; row_idx < row_indices.size(); row_idx++) {\n\tupdate_matrix_variable_row<%(type)s>(w, row_indices[row_idx], w_lil[row_idx]);\n}" % {'idx_type': 'int', 'type': var['ctype']}, 2)
                         else:
-                            weight_code += tabify("update_matrix_variable_all<%(float_prec)s>(w, values);" % {'float_prec': Global.config['precision']}, 2)
+                            weight_code += tabify("update_matrix_variable_all<%(type)s>(w, convert_lil<%(type)s>(values));" % {'type': var['ctype']}, 2)
                         if Global._check_paradigm("cuda"):
                             weight_code += tabify("\nw_host_to_device = true;", 2)
 
@@ -877,10 +1001,13 @@ class ProjectionGenerator(object):
             # non-uniform delay drawn from distribution
             elif isinstance(proj.connector_delay_dist, ANNRandom.RandomDistribution):
                 if cpp_connector_available(proj.connector_name, proj._storage_format, proj._storage_order):
+                    if not isinstance(proj.connector_delay_dist, ANNRandom.Uniform):
+                        raise NotImplementedError( str(type(proj.connector_delay_dist)) + " is not available for CPP-side connection patterns.")
+
                     rng_init = "rng[0]" if single_spmv_matrix else "rng"
                     delay_code = tabify("""
-delay = init_matrix_variable_discrete_uniform<int>(d_dist_arg1, d_dist_arg2, %(rng_init)s);
-max_delay = -1;""" % {'id_pre': proj.pre.id, 'rng_init': rng_init}, 2)
+delay = init_matrix_variable_discrete_uniform<%(delay_type)s>(d_dist_arg1, d_dist_arg2, %(rng_init)s);
+max_delay = -1;""" % {'id_pre': proj.pre.id, 'rng_init': rng_init, 'delay_type': determine_delay_type_for_projection(proj)[0]}, 2)
 
                 else:
                     id_pre = proj.pre.id if not isinstance(proj.pre, PopulationView) else proj.pre.population.id
@@ -117,24 +117,24 @@ delay = {
 """},
     'nonuniform_rate_coded': {
         'declare': """
-    std::vector<int> delay;
+    std::vector<%(delay_type)s> delay;
     int max_delay;
 
-    std::vector<std::vector<int>> get_delay() { return get_matrix_variable_all<int>(delay); }
-    void set_delay(std::vector<std::vector<int>> value) { update_matrix_variable_all<int>(delay, value); }
-    std::vector<int> get_dendrite_delay(int lil_idx) { return get_matrix_variable_row<int>(delay, lil_idx); }
+    std::vector<std::vector<%(delay_type)s>> get_delay() { return get_matrix_variable_all<%(delay_type)s>(delay); }
+    void set_delay(std::vector<std::vector<%(delay_type)s>> value) { update_matrix_variable_all<%(delay_type)s>(delay, value); }
+    std::vector<%(delay_type)s> get_dendrite_delay(int lil_idx) { return get_matrix_variable_row<%(delay_type)s>(delay, lil_idx); }
 """,
         'init': """
-    delay = init_matrix_variable<int>(1);
-    update_matrix_variable_all<int>(delay, delays);
+    delay = init_matrix_variable<%(delay_type)s>(1);
+    update_matrix_variable_all<%(delay_type)s>(delay, convert_lil<%(delay_type)s>(delays));
 """,
         'reset': "",
         'pyx_struct':
 """
         # Non-uniform delay
-        vector[vector[int]] get_delay()
-        void set_delay(vector[vector[int]])
-        vector[int] get_dendrite_delay(int)
+        vector[vector[%(delay_type)s]] get_delay()
+        void set_delay(vector[vector[%(delay_type)s]])
+        vector[%(delay_type)s] get_dendrite_delay(int)
         int max_delay
         void update_max_delay(int)
         void reset_ring_buffer()
@@ -161,14 +161,14 @@ delay = {
     },
     'nonuniform_spiking': {
         'declare': """
-    std::vector<int> delay;
+    std::vector<%(delay_type)s> delay;
     int max_delay;
     int idx_delay;
     std::vector< std::vector< std::vector< int > > > _delayed_spikes;
 """,
         'init': """
-    delay = init_matrix_variable<int>(1);
-    update_matrix_variable_all<int>(delay, delays);
+    delay = init_matrix_variable<%(delay_type)s>(1);
+    update_matrix_variable_all<%(delay_type)s>(delay, convert_lil<%(delay_type)s>(delays));
 
     idx_delay = 0;
     max_delay = %(pre_prefix)smax_delay;
@@ -187,7 +187,7 @@ delay = {
         'pyx_struct':
 """
         # Non-uniform delay
-        vector[vector[int]] delay
+        vector[vector[%(delay_type)s]] delay
         int max_delay
         void update_max_delay(int)
         void reset_ring_buffer()
@@ -231,7 +231,7 @@ csr_summation_operation = {
 %(pre_copy)s
 
 const %(size_type)s * __restrict__ row_ptr = row_begin_.data();
-const %(idx_type)s * __restrict__ col_idx = col_idx_.data();
+const %(col_idx_type)s * __restrict__ col_idx = col_idx_.data();
 
 for(auto it = post_ranks_.cbegin(); it != post_ranks_.cend(); it++) {
     %(idx_type)s rk_post = *it;
@@ -247,7 +247,7 @@ for(auto it = post_ranks_.cbegin(); it != post_ranks_.cend(); it++) {
 %(pre_copy)s
 
 const %(size_type)s* __restrict__ row_ptr = row_begin_.data();
-const %(idx_type)s* __restrict__ col_idx = col_idx_.data();
+const %(col_idx_type)s* __restrict__ col_idx = col_idx_.data();
 
 for(auto it = post_ranks_.cbegin(); it != post_ranks_.cend(); it++) {
     %(idx_type)s rk_post = *it;
@@ -266,7 +266,7 @@ for(auto it = post_ranks_.cbegin(); it != post_ranks_.cend(); it++) {
 %(pre_copy)s
 
 const %(size_type)s* __restrict__ row_ptr = row_begin_.data();
-const %(idx_type)s* __restrict__ col_idx = col_idx_.data();
+const %(col_idx_type)s* __restrict__ col_idx = col_idx_.data();
 
 for(auto it = post_ranks_.cbegin(); it != post_ranks_.cend(); it++) {
     %(idx_type)s rk_post = *it;
@@ -285,7 +285,7 @@ for(auto it = post_ranks_.cbegin(); it != post_ranks_.cend(); it++) {
 %(pre_copy)s
 
 const %(size_type)s* __restrict__ row_ptr = row_begin_.data();
-const %(idx_type)s* __restrict__ col_idx = col_idx_.data();
+const %(col_idx_type)s* __restrict__ col_idx = col_idx_.data();
 
 for(auto it = post_ranks_.cbegin(); it != post_ranks_.cend(); it++) {
     %(idx_type)s rk_post = *it;
@@ -323,7 +323,7 @@ continuous_transmission_sse_single_weight = {
     #ifdef __SSE4_1__
         if (_transmission && %(post_prefix)s_active) {
             const %(size_type)s* __restrict__ row_ptr = row_begin_.data();
-            const %(idx_type)s* __restrict__ _idx = col_idx_.data();
+            const %(col_idx_type)s* __restrict__ _idx = col_idx_.data();
 
             double _tmp_sum[2];
             double* __restrict__ _pre_r = %(get_r)s;
@@ -363,7 +363,7 @@ continuous_transmission_sse_single_weight = {
     #ifdef __SSE4_1__
         if (_transmission && %(post_prefix)s_active) {
             const %(size_type)s* __restrict__ row_ptr = row_begin_.data();
-            const %(idx_type)s* __restrict__ _idx = col_idx_.data();
+            const %(col_idx_type)s* __restrict__ _idx = col_idx_.data();
 
             float _tmp_sum[4];
             float* __restrict__ _pre_r = %(get_r)s;
@@ -409,7 +409,7 @@ continuous_transmission_avx_single_weight = {
         'double': """
     #ifdef __AVX__
         const %(size_type)s* __restrict__ row_ptr = row_begin_.data();
-        const %(idx_type)s* __restrict__ _idx = col_idx_.data();
+        const %(col_idx_type)s* __restrict__ _idx = col_idx_.data();
 
         if (_transmission && %(post_prefix)s_active) {
             %(size_type)s _s, _stop;
@@ -453,7 +453,7 @@ continuous_transmission_avx_single_weight = {
         'float': """
     #ifdef __AVX__
         const %(size_type)s* __restrict__ row_ptr = row_begin_.data();
-        const %(idx_type)s* __restrict__ _idx = col_idx_.data();
+        const %(col_idx_type)s* __restrict__ _idx = col_idx_.data();
 
         if (_transmission && %(post_prefix)s_active) {
             %(size_type)s _s, _stop;
@@ -503,7 +503,7 @@ continuous_transmission_avx512_single_weight = {
         'double': """
     #ifdef __AVX__
         const %(size_type)s* __restrict__ row_ptr = row_begin_.data();
-        const %(idx_type)s* __restrict__ _idx = col_idx_.data();
+        const %(col_idx_type)s* __restrict__ _idx = col_idx_.data();
 
         if (_transmission && %(post_prefix)s_active) {
             %(size_type)s _s, _stop;
@@ -545,7 +545,7 @@ continuous_transmission_avx512_single_weight = {
         'float': """
     #ifdef __AVX__
         const %(size_type)s* __restrict__ row_ptr = row_begin_.data();
-        const %(idx_type)s* __restrict__ _idx = col_idx_.data();
+        const %(col_idx_type)s* __restrict__ _idx = col_idx_.data();
 
         if (_transmission && %(post_prefix)s_active) {
             %(size_type)s _s, _stop;
@@ -599,7 +599,7 @@ continuous_transmission_sse = {
 
         if (_transmission && %(post_prefix)s_active) {
             const %(size_type)s* __restrict__ row_ptr = row_begin_.data();
-            const %(idx_type)s* __restrict__ _idx = col_idx_.data();
+            const %(col_idx_type)s* __restrict__ _idx = col_idx_.data();
             const double* __restrict__ _w = w.data();
 
             double _tmp_sum[2];
@@ -648,7 +648,7 @@ continuous_transmission_sse = {
     #ifdef __SSE4_1__
         if (_transmission && %(post_prefix)s_active) {
             const %(size_type)s* __restrict__ row_ptr = row_begin_.data();
-            const %(idx_type)s* __restrict__ _idx = col_idx_.data();
+            const %(col_idx_type)s* __restrict__ _idx = col_idx_.data();
             const float* __restrict__ _w = w.data();
 
             float _tmp_sum[4];
@@ -694,6 +694,56 @@ continuous_transmission_sse = {
     #else
         std::cerr << "The code was not compiled with SSE4-1 support. Please check your compiler flags ..." << std::endl;
     #endif
+""",
+        'mixed': """
+    #ifdef __SSE4_1__
+
+        if (_transmission && %(post_prefix)s_active) {
+            const %(size_type)s* __restrict__ row_ptr = row_begin_.data();
+            const %(col_idx_type)s* __restrict__ _idx = col_idx_.data();
+            const float* __restrict__ _w = w.data();
+
+            double _tmp_sum[2];
+            double* __restrict__ _pre_r = %(get_r)s;
+
+            for (%(idx_type)s i = 0; i < post_ranks_.size(); i++) {
+                %(idx_type)s rk_post = post_ranks_[i];
+                %(size_type)s _s = row_ptr[rk_post];
+                %(size_type)s _stop = row_ptr[rk_post+1];
+                __m128d _tmp_reg_sum = _mm_setzero_pd();
+
+                for (; _s+8 < _stop; _s+=8) {
+                    __m128d _tmp_r = _mm_set_pd(_pre_r[_idx[_s+1]], _pre_r[_idx[_s+0]]);
+                    __m128d _tmp_r2 = _mm_set_pd(_pre_r[_idx[_s+3]], _pre_r[_idx[_s+2]]);
+                    __m128d _tmp_r3 = _mm_set_pd(_pre_r[_idx[_s+5]], _pre_r[_idx[_s+4]]);
+                    __m128d _tmp_r4 = _mm_set_pd(_pre_r[_idx[_s+7]], _pre_r[_idx[_s+6]]);
+
+                    __m128d _tmp_w = _mm_cvtps_pd(_mm_castsi128_ps(_mm_loadl_epi64((__m128i const*) &_w[_s])));
+                    __m128d _tmp_w2 = _mm_cvtps_pd(_mm_castsi128_ps(_mm_loadl_epi64((__m128i const*) &_w[_s+2])));
+                    __m128d _tmp_w3 = _mm_cvtps_pd(_mm_castsi128_ps(_mm_loadl_epi64((__m128i const*) &_w[_s+4])));
+                    __m128d _tmp_w4 = _mm_cvtps_pd(_mm_castsi128_ps(_mm_loadl_epi64((__m128i const*) &_w[_s+6])));
+
+                    _tmp_reg_sum = _mm_add_pd(_tmp_reg_sum, _mm_mul_pd(_tmp_r, _tmp_w));
+                    _tmp_reg_sum = _mm_add_pd(_tmp_reg_sum, _mm_mul_pd(_tmp_r2, _tmp_w2));
+                    _tmp_reg_sum = _mm_add_pd(_tmp_reg_sum, _mm_mul_pd(_tmp_r3, _tmp_w3));
+                    _tmp_reg_sum = _mm_add_pd(_tmp_reg_sum, _mm_mul_pd(_tmp_r4, _tmp_w4));
+                }
+
+                _mm_storeu_pd(_tmp_sum, _tmp_reg_sum);
+
+                // partial sums
+                double lsum = _tmp_sum[0] + _tmp_sum[1];
+
+                // remainder loop
+                for (; _s < _stop; _s++)
+                    lsum += _pre_r[_idx[_s]] * _w[_s];
+
+                %(post_prefix)s_sum_%(target)s%(post_index)s += lsum;
+            }
+        } // active
+    #else
+        std::cerr << "The code was not compiled with AVX support. Please check your compiler flags ..." << std::endl;
+    #endif
 """
     }
 }
@@ -703,7 +753,7 @@ continuous_transmission_avx = {
         'double': """
     #ifdef __AVX__
         const %(size_type)s* __restrict__ row_ptr = row_begin_.data();
-        const %(idx_type)s* __restrict__ _idx = col_idx_.data();
+        const %(col_idx_type)s* __restrict__ _idx = col_idx_.data();
         const double* __restrict__ _w = w.data();
 
         if (_transmission && %(post_prefix)s_active) {
@@ -752,7 +802,7 @@ continuous_transmission_avx = {
         'float': """
     #ifdef __AVX__
         const %(size_type)s* __restrict__ row_ptr = row_begin_.data();
-        const %(idx_type)s* __restrict__ _idx = col_idx_.data();
+        const %(col_idx_type)s* __restrict__ _idx = col_idx_.data();
         const float* __restrict__ _w = w.data();
 
         if (_transmission && %(post_prefix)s_active) {
@@ -798,6 +848,55 @@ continuous_transmission_avx = {
     #else
         std::cerr << "The code was not compiled with AVX support. Please check your compiler flags ..." << std::endl;
     #endif
+""",
+        'mixed': """
+    #ifdef __AVX__
+        const %(size_type)s* __restrict__ row_ptr = row_begin_.data();
+        const %(col_idx_type)s* __restrict__ _idx = col_idx_.data();
+        const float* __restrict__ _w = w.data();
+
+        if (_transmission && %(post_prefix)s_active) {
+            %(size_type)s _s, _stop;
+            double _tmp_sum[4];
+            double* __restrict__ _pre_r = %(get_r)s;
+
+            for (%(idx_type)s i = 0; i < post_ranks_.size(); i++) {
+                %(idx_type)s rk_post = post_ranks_[i];
+
+                _s = row_ptr[rk_post];
+                _stop = row_ptr[rk_post+1];
+                __m256d _tmp_reg_sum = _mm256_setzero_pd();
+
+                for (; _s+8 < _stop; _s+=8) {
+                    __m256d _tmp_r = _mm256_set_pd(
+                        _pre_r[_idx[_s+3]], _pre_r[_idx[_s+2]], _pre_r[_idx[_s+1]], _pre_r[_idx[_s]]
+                    );
+                    __m256d _tmp_r2 = _mm256_set_pd(
+                        _pre_r[_idx[_s+7]], _pre_r[_idx[_s+6]], _pre_r[_idx[_s+5]], _pre_r[_idx[_s+4]]
+                    );
+
+                    __m256d _tmp_w = _mm256_cvtps_pd(_mm_loadu_ps(&_w[_s]));
+                    __m256d _tmp_w2 = _mm256_cvtps_pd(_mm_loadu_ps(&_w[_s+4]));
+
+                    _tmp_reg_sum = _mm256_add_pd(_tmp_reg_sum, _mm256_mul_pd(_tmp_r, _tmp_w));
+                    _tmp_reg_sum = _mm256_add_pd(_tmp_reg_sum, _mm256_mul_pd(_tmp_r2, _tmp_w2));
+                }
+
+                _mm256_storeu_pd(_tmp_sum, _tmp_reg_sum);
+
+                // partial sums
+                double lsum = _tmp_sum[0] + _tmp_sum[1] + _tmp_sum[2] + _tmp_sum[3];
+
+                // remainder loop
+                for (; _s < _stop; _s++)
+                    lsum += _pre_r[_idx[_s]] * _w[_s];
+
+                %(post_prefix)s_sum_%(target)s%(post_index)s += lsum;
+            }
+        } // active
+    #else
+        std::cerr << "The code was not compiled with AVX support. Please check your compiler flags ..." << std::endl;
+    #endif
 """
     }
 }
@@ -807,7 +906,7 @@ continuous_transmission_avx512 = {
         'double': """
     #ifdef __AVX512F__
         const %(size_type)s* __restrict__ row_ptr = row_begin_.data();
-        const %(idx_type)s* __restrict__ _idx = col_idx_.data();
+        const %(col_idx_type)s* __restrict__ _idx = col_idx_.data();
         const double* __restrict__ _w = w.data();
 
         if (_transmission && %(post_prefix)s_active) {
@@ -852,7 +951,7 @@ continuous_transmission_avx512 = {
         'float': """
     #ifdef __AVX512F__
         const %(size_type)s* __restrict__ row_ptr = row_begin_.data();
-        const %(idx_type)s* __restrict__ _idx = col_idx_.data();
+        const %(col_idx_type)s* __restrict__ _idx = col_idx_.data();
         const float* __restrict__ _w = w.data();
 
         if (_transmission && %(post_prefix)s_active) {
@@ -894,6 +993,51 @@ continuous_transmission_avx512 = {
     #else
         std::cerr << "The code was not compiled with AVX-512 support. Please check your compiler flags ..." << std::endl;
     #endif
+""",
+        'mixed': """
+    #ifdef __AVX512F__
+        const %(size_type)s* __restrict__ row_ptr = row_begin_.data();
+        const %(col_idx_type)s* __restrict__ _idx = col_idx_.data();
+        const float* __restrict__ _w = w.data();
+
+        if (_transmission && %(post_prefix)s_active) {
+            %(size_type)s _s, _stop;
+            double _tmp_sum[8];
+            double* __restrict__ _pre_r = %(get_r)s;
+
+            for (%(idx_type)s i = 0; i < post_ranks_.size(); i++) {
+                %(idx_type)s rk_post = post_ranks_[i];
+
+                _s = row_ptr[rk_post];
+                _stop = row_ptr[rk_post+1];
+                __m512d _tmp_reg_sum = _mm512_setzero_pd();
+
+                for (; (_s+8) < _stop; _s+=8) {
+                    __m512d _tmp_r = _mm512_set_pd(
+                        _pre_r[_idx[_s+7]], _pre_r[_idx[_s+6]], _pre_r[_idx[_s+5]], _pre_r[_idx[_s+4]],
+                        _pre_r[_idx[_s+3]], _pre_r[_idx[_s+2]], _pre_r[_idx[_s+1]], _pre_r[_idx[_s]]
+                    );
+
+                    __m512d _tmp_w = _mm512_cvtps_pd(_mm256_loadu_ps(&_w[_s]));
+
+                    _tmp_reg_sum = _mm512_add_pd(_tmp_reg_sum, _mm512_mul_pd(_tmp_r, _tmp_w));
+                }
+
+                _mm512_storeu_pd(_tmp_sum, _tmp_reg_sum);
+
+                // partial sums
+                double lsum = _tmp_sum[0] + _tmp_sum[1] + _tmp_sum[2] + _tmp_sum[3] + _tmp_sum[4] + _tmp_sum[5] + _tmp_sum[6] + _tmp_sum[7];
+
+                // remainder loop
+                for (; _s < _stop; _s++)
+                    lsum += _pre_r[_idx[_s]] * _w[_s];
+
+                %(post_prefix)s_sum_%(target)s%(post_index)s += lsum;
+            }
+        } // active
+    #else
+        std::cerr << "The code was not compiled with AVX-512 support. Please check your compiler flags ..." << std::endl;
+    #endif
 """
     }
 }
@@ -908,7 +1052,7 @@ if(_transmission && _update && %(post_prefix)s_active && ( (t - _update_offset)%
     %(global)s
 
     const %(size_type)s* __restrict__ row_ptr = row_begin_.data();
-    const %(idx_type)s* __restrict__ col_idx = col_idx_.data();
+    const %(col_idx_type)s* __restrict__ col_idx = col_idx_.data();
 
     %(idx_type)s nb_post = static_cast<%(idx_type)s>(post_ranks_.size());
     for (%(idx_type)s i = 0; i < nb_post; i++) {
@@ -942,7 +1086,7 @@ if(_transmission && _update && %(post_prefix)s_active && ( (t - _update_offset)%
 spiking_summation_fixed_delay_csr = """// Event-based summation
 if (_transmission && %(post_prefix)s_active){
     // w as CSR
-    const int * __restrict__ col_ptr = _col_ptr.data();
+    const %(size_type)s* __restrict__ col_ptr = _col_ptr.data();
 
     // Iterate over all spiking neurons
     for (int _idx = 0; _idx < %(pre_array)s.size(); _idx++) {
@@ -964,8 +1108,8 @@ if (_transmission && %(post_prefix)s_active){
 
 spiking_post_event = """
 // w as CSR
-const int * __restrict__ row_ptr = row_begin_.data();
-const int * __restrict__ col_idx = col_idx_.data();
+const %(size_type)s* __restrict__ row_ptr = row_begin_.data();
+const %(idx_type)s* __restrict__ col_idx = col_idx_.data();
 
 if(_transmission && %(post_prefix)s_active){
     int rk_post, beg, end;
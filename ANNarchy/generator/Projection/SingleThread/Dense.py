@@ -265,6 +265,62 @@ continuous_transmission_sse = {
 #else
     std::cerr << "The code was not compiled with SSE4-1 support. Please check your compiler flags ..." << std::endl;
 #endif
+""",
+        'mixed': """
+#ifdef __SSE4_1__
+    if (_transmission && pop%(id_post)s._active) {
+        double _tmp_sum[2];
+
+        // matrix dimensions
+        %(idx_type)s rows = pop%(id_post)s.size;
+        %(idx_type)s columns = pop%(id_pre)s.size;
+
+        // running indices
+        %(idx_type)s i, j;
+        %(size_type)s _s;
+
+        // required pointer
+        double* __restrict__ _pre_r = %(get_r)s;
+        float* __restrict__ _w = w.data();
+
+        // Row-wise SpMV
+        for(i = 0; i < rows; i++) {
+            %(idx_type)s rk_post = i;
+            __m128d _tmp_reg_sum = _mm_setzero_pd();
+
+            _s=i*columns;
+            for (j = 0; (j+8) < columns; j+=8, _s+=8) {
+                __m128d _tmp_r = _mm_loadu_pd(&_pre_r[j]);
+                __m128d _tmp_r2 = _mm_loadu_pd(&_pre_r[j+2]);
+                __m128d _tmp_r3 = _mm_loadu_pd(&_pre_r[j+4]);
+                __m128d _tmp_r4 = _mm_loadu_pd(&_pre_r[j+6]);
+
+                __m128d _tmp_w = _mm_cvtps_pd(_mm_castsi128_ps(_mm_loadl_epi64((__m128i const*) &_w[_s])));
+                __m128d _tmp_w2 = _mm_cvtps_pd(_mm_castsi128_ps(_mm_loadl_epi64((__m128i const*) &_w[_s+2])));
+                __m128d _tmp_w3 = _mm_cvtps_pd(_mm_castsi128_ps(_mm_loadl_epi64((__m128i const*) &_w[_s+4])));
+                __m128d _tmp_w4 = _mm_cvtps_pd(_mm_castsi128_ps(_mm_loadl_epi64((__m128i const*) &_w[_s+6])));
+
+                _tmp_reg_sum = _mm_add_pd(_tmp_reg_sum, _mm_mul_pd(_tmp_r, _tmp_w));
+                _tmp_reg_sum = _mm_add_pd(_tmp_reg_sum, _mm_mul_pd(_tmp_r2, _tmp_w2));
+                _tmp_reg_sum = _mm_add_pd(_tmp_reg_sum, _mm_mul_pd(_tmp_r3, _tmp_w3));
+                _tmp_reg_sum = _mm_add_pd(_tmp_reg_sum, _mm_mul_pd(_tmp_r4, _tmp_w4));
+            }
+
+            _mm_storeu_pd(_tmp_sum, _tmp_reg_sum);
+
+            // partial sums
+            double lsum = _tmp_sum[0] + _tmp_sum[1];
+
+            // remainder loop
+            for (; j < columns; j++, _s++)
+                lsum += _pre_r[j] * _w[_s];
+
+            pop%(id_post)s._sum_%(target)s%(post_index)s += lsum;
+        }
+    } // active
+#else
+    std::cerr << "The code was not compiled with SSE4-1 support. Please check your compiler flags ..." << std::endl;
+#endif
 """
     }
 }
@@ -366,6 +422,54 @@ continuous_transmission_avx = {
 #else
     std::cerr << "The code was not compiled with AVX support. Please check your compiler flags ..." << std::endl;
 #endif
+""",
+    'mixed': """
+#ifdef __AVX__
+    if (_transmission && %(post_prefix)s_active) {
+        double _tmp_sum[4];
+
+        // matrix dimensions
+        %(idx_type)s rows = %(post_prefix)ssize;
+        %(idx_type)s columns = %(pre_prefix)ssize;
+        // running indices
+        %(idx_type)s i, j;
+        %(size_type)s _s;
+
+        // required pointer
+        double* __restrict__ _pre_r = %(get_r)s;
+        float* __restrict__ _w = w.data();
+
+        // Row-wise SpMV
+        for(i = 0; i < rows; i++) {
+            __m256d _tmp_reg_sum = _mm256_setzero_pd();
+
+            _s=i*columns;
+            for (j = 0; (j+8) < columns; j+=8, _s+=8) {
+                __m256d _tmp_r = _mm256_loadu_pd(&_pre_r[j]);
+                __m256d _tmp_r2 = _mm256_loadu_pd(&_pre_r[j+4]);
+
+                __m256d _tmp_w = _mm256_cvtps_pd(_mm_loadu_ps(&_w[_s]));
+                __m256d _tmp_w2 = _mm256_cvtps_pd(_mm_loadu_ps(&_w[_s+4]));
+
+                _tmp_reg_sum = _mm256_add_pd(_tmp_reg_sum, _mm256_mul_pd(_tmp_r, _tmp_w));
+                _tmp_reg_sum = _mm256_add_pd(_tmp_reg_sum, _mm256_mul_pd(_tmp_r2, _tmp_w2));
+            }
+
+            _mm256_storeu_pd(_tmp_sum, _tmp_reg_sum);
+
+            // partial sums
+            double lsum = _tmp_sum[0] + _tmp_sum[1] + _tmp_sum[2] + _tmp_sum[3];
+
+            // remainder loop
+            for (; j < columns; j++, _s++)
+                lsum += _pre_r[j] * _w[_s];
+
+            %(post_prefix)s_sum_%(target)s[i] += lsum;
+        }
+    } // active
+#else
+    std::cerr << "The code was not compiled with AVX support. Please check your compiler flags ..." << std::endl;
+#endif
 """
     }
 }
@@ -463,6 +567,52 @@ continuous_transmission_avx512 = {
 #else
     std::cerr << "The code was not compiled with AVX-512 support. Please check your compiler flags ..." << std::endl;
 #endif
+""",
+        'mixed': """
+#ifdef __AVX512F__
+    if (_transmission && pop%(id_post)s._active) {
+        double _tmp_sum[8];
+
+        // matrix dimensions
+        %(idx_type)s rows = pop%(id_post)s.size;
+        %(idx_type)s columns = pop%(id_pre)s.size;
+
+        // running indices
+        %(idx_type)s i, j;
+        %(size_type)s _s;
+
+        // required pointer
+        double* __restrict__ _pre_r = %(get_r)s;
+        float* __restrict__ _w = w.data();
+
+        // Row-wise SpMV
+        for(i = 0; i < rows; i++) {
+            %(idx_type)s rk_post = i;
+            __m512d _tmp_reg_sum = _mm512_setzero_pd();
+
+            _s=i*columns;
+            for (j = 0; (j+8) < columns; j+=8, _s+=8) {
+                __m512d _tmp_r = _mm512_loadu_pd(&_pre_r[j]);
+                __m512d _tmp_w = _mm512_cvtps_pd(_mm256_loadu_ps(&_w[_s]));
+
+                _tmp_reg_sum = _mm512_add_pd(_tmp_reg_sum, _mm512_mul_pd(_tmp_r, _tmp_w));
+            }
+
+            _mm512_storeu_pd(_tmp_sum, _tmp_reg_sum);
+
+            // partial sums
+            double lsum = _tmp_sum[0] + _tmp_sum[1] + _tmp_sum[2] + _tmp_sum[3] + _tmp_sum[4] + _tmp_sum[5] + _tmp_sum[6] + _tmp_sum[7];
+
+            // remainder loop
+            for (; j < columns; j++, _s++)
+                lsum += _pre_r[j] * _w[_s];
+
+            pop%(id_post)s._sum_%(target)s%(post_index)s += lsum;
+        }
+    } // active
+#else
+    std::cerr << "The code was not compiled with AVX-512 support. Please check your compiler flags ..." << std::endl;
+#endif
 """
     }
 }
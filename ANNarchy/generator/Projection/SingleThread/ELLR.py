@@ -118,24 +118,24 @@ delay = {
 """},
     'nonuniform_rate_coded': {
         'declare': """
-    std::vector<int> delay;
+    std::vector<%(delay_type)s> delay;
     int max_delay;
 
-    std::vector<std::vector<int>> get_delay() { return get_matrix_variable_all<int>(delay); }
-    void set_delay(std::vector<std::vector<int>> value) { update_matrix_variable_all<int>(delay, value); }
-    std::vector<int> get_dendrite_delay(int lil_idx) { return get_matrix_variable_row<int>(delay, lil_idx); }
+    std::vector<std::vector<%(delay_type)s>> get_delay() { return get_matrix_variable_all<%(delay_type)s>(delay); }
+    void set_delay(std::vector<std::vector<%(delay_type)s>> value) { update_matrix_variable_all<%(delay_type)s>(delay, value); }
+    std::vector<%(delay_type)s> get_dendrite_delay(int lil_idx) { return get_matrix_variable_row<%(delay_type)s>(delay, lil_idx); }
 """,
         'init': """
-    delay = init_variable<int>(1);
-    update_variable_all<int>(delay, delays);
+    delay = init_variable<%(delay_type)s>(1);
+    update_variable_all<%(delay_type)s>(delay, convert_lil<%(delay_type)s>(delays));
 """,
         'reset': "",
         'pyx_struct':
 """
         # Non-uniform delay
-        vector[vector[int]] get_delay()
-        void set_delay(vector[vector[int]])
-        vector[int] get_dendrite_delay(int)
+        vector[vector[%(delay_type)s]] get_delay()
+        void set_delay(vector[vector[%(delay_type)s]])
+        vector[%(delay_type)s] get_dendrite_delay(int)
         int max_delay
         void update_max_delay(int)
         void reset_ring_buffer()
@@ -162,14 +162,14 @@ delay = {
     },
     'nonuniform_spiking': {
         'declare': """
-    std::vector<int> delay;
+    std::vector<%(delay_type)s> delay;
     int max_delay;
     int idx_delay;
     std::vector< std::vector< std::vector< int > > > _delayed_spikes;
 """,
         'init': """
-    delay = init_variable<int>(1);
-    update_variable_all<int>(delay, delays);
+    delay = init_variable<%(delay_type)s>(1);
+    update_variable_all<%(delay_type)s>(delay, convert_lil<%(delay_type)s>(delays));
 
     idx_delay = 0;
     max_delay = %(pre_prefix)smax_delay;
@@ -188,7 +188,7 @@ delay = {
         'pyx_struct':
 """
         # Non-uniform delay
-        vector[vector[int]] delay
+        vector[vector[%(delay_type)s]] delay
         int max_delay
         void update_max_delay(int)
         void reset_ring_buffer()
@@ -143,12 +143,12 @@ delay = {
     },
     'nonuniform_rate_coded': {
         'declare': """
-    std::vector<std::vector<int>> delay;
+    std::vector<std::vector<%(delay_type)s>> delay;
     int max_delay;
 """,
         'init': """
-    delay = init_matrix_variable<int>(1);
-    update_matrix_variable_all<int>(delay, delays);
+    delay = init_matrix_variable<%(delay_type)s>(1);
+    update_matrix_variable_all<%(delay_type)s>(delay, convert_lil<%(delay_type)s>(delays));
 
     max_delay = %(pre_prefix)smax_delay;
 """,
@@ -156,7 +156,7 @@ delay = {
         'pyx_struct':
 """
         # Non-uniform delay
-        vector[vector[int]] delay
+        vector[vector[%(delay_type)s]] delay
         int max_delay
         void update_max_delay(int)
         void reset_ring_buffer()
@@ -183,14 +183,14 @@ delay = {
     },
     'nonuniform_spiking': {
         'declare': """
-    std::vector<std::vector<int>> delay;
+    std::vector<std::vector<%(delay_type)s>> delay;
     int max_delay;
     int idx_delay;
     std::vector< std::vector< std::vector< int > > > _delayed_spikes;
 """,
         'init': """
-    delay = init_matrix_variable<int>(1);
-    update_matrix_variable_all<int>(delay, delays);
+    delay = init_matrix_variable<%(delay_type)s>(1);
+    update_matrix_variable_all<%(delay_type)s>(delay, convert_lil<%(delay_type)s>(delays));
 
     idx_delay = 0;
     max_delay = %(pre_prefix)smax_delay ;
@@ -210,7 +210,7 @@ delay = {
         'pyx_struct':
 """
         # Non-uniform delay
-        vector[vector[int]] delay
+        vector[vector[%(delay_type)s]] delay
         int max_delay
         void update_max_delay(int)
         void reset_ring_buffer()
@@ -341,7 +341,7 @@ continuous_transmission_sse_single_weight = {
 
             for (%(idx_type)s i = 0; i < post_rank.size(); i++) {
                 %(idx_type)s rk_post = post_rank[i];
-                %(idx_type)s* __restrict__ _idx = pre_rank[i].data();
+                %(col_idx_type)s* __restrict__ _idx = pre_rank[i].data();
                 _stop = pre_rank[i].size();
 
                 __m128d _tmp_reg_sum = _mm_setzero_pd();
@@ -380,7 +380,7 @@ continuous_transmission_sse_single_weight = {
 
             for (%(idx_type)s i = 0; i < post_rank.size(); i++) {
                 %(idx_type)s rk_post = post_rank[i];
-                %(idx_type)s* __restrict__ _idx = pre_rank[i].data();
+                %(col_idx_type)s* __restrict__ _idx = pre_rank[i].data();
                 _stop = pre_rank[i].size();
 
                 __m128 _tmp_reg_sum = _mm_setzero_ps();
@@ -426,7 +426,7 @@ continuous_transmission_avx_single_weight = {
 
             for (%(idx_type)s i = 0; i < post_rank.size(); i++) {
                 %(idx_type)s rk_post = post_rank[i];
-                %(idx_type)s* __restrict__ _idx = pre_rank[i].data();
+                %(col_idx_type)s* __restrict__ _idx = pre_rank[i].data();
                 _stop = pre_rank[i].size();
 
                 __m256d _tmp_reg_sum = _mm256_setzero_pd();
@@ -467,7 +467,7 @@ continuous_transmission_avx_single_weight = {
 
             for (%(idx_type)s i = 0; i < post_rank.size(); i++) {
                 %(idx_type)s rk_post = post_rank[i];
-                %(idx_type)s* __restrict__ _idx = pre_rank[i].data();
+                %(col_idx_type)s* __restrict__ _idx = pre_rank[i].data();
                 _stop = pre_rank[i].size();
 
                 __m256 _tmp_reg_sum = _mm256_setzero_ps();
@@ -515,7 +515,7 @@ continuous_transmission_avx512_single_weight = {
 
             for (%(idx_type)s i = 0; i < post_rank.size(); i++) {
                 %(idx_type)s rk_post = post_rank[i];
-                %(idx_type)s* __restrict__ _idx = pre_rank[i].data();
+                %(col_idx_type)s* __restrict__ _idx = pre_rank[i].data();
                 _stop = pre_rank[i].size();
 
                 __m512d _tmp_reg_sum = _mm512_setzero_pd();
@@ -555,7 +555,7 @@ continuous_transmission_avx512_single_weight = {
 
             for (%(idx_type)s i = 0; i < post_rank.size(); i++) {
                 %(idx_type)s rk_post = post_rank[i];
-                %(idx_type)s* __restrict__ _idx = pre_rank[i].data();
+                %(col_idx_type)s* __restrict__ _idx = pre_rank[i].data();
                 _stop = pre_rank[i].size();
 
                 __m512 _tmp_reg_sum = _mm512_setzero_ps();
@@ -606,7 +606,7 @@ continuous_transmission_sse = {
 
             for (%(idx_type)s i = 0; i < post_rank.size(); i++) {
                 %(idx_type)s rk_post = post_rank[i];
-                %(idx_type)s* __restrict__ _idx = pre_rank[i].data();
+                %(col_idx_type)s* __restrict__ _idx = pre_rank[i].data();
                 double* __restrict__ _w = w[i].data();
 
                 _s = 0;
@@ -655,7 +655,7 @@ continuous_transmission_sse = {
 
             for (%(idx_type)s i = 0; i < post_rank.size(); i ++) {
                 %(idx_type)s rk_post = post_rank[i];
-                %(idx_type)s* __restrict__ _idx = pre_rank[i].data();
+                %(col_idx_type)s* __restrict__ _idx = pre_rank[i].data();
                 float* __restrict__ _w = w[i].data();
 
                 _stop = pre_rank[i].size();
@@ -693,6 +693,55 @@ continuous_transmission_sse = {
     #else
         std::cerr << "The code was not compiled with SSE4-1 support. Please check your compiler flags ..." << std::endl;
     #endif
+    """,
+        'mixed': """
+    #ifdef __SSE4_1__
+        if (_transmission && %(post_prefix)s_active) {
+            %(idx_type)s _s, _stop;
+            double _tmp_sum[2];
+            double* __restrict__ _pre_r = %(get_r)s;
+
+            for (%(idx_type)s i = 0; i < post_rank.size(); i++) {
+                %(idx_type)s rk_post = post_rank[i];
+                %(col_idx_type)s* __restrict__ _idx = pre_rank[i].data();
+                float* __restrict__ _w = w[i].data();
+
+                _s = 0;
+                _stop = pre_rank[i].size();
+                __m128d _tmp_reg_sum = _mm_setzero_pd();
+
+                for (; (_s+8) < _stop; _s+=8) {
+                    __m128d _tmp_r = _mm_set_pd(_pre_r[_idx[_s+1]], _pre_r[_idx[_s]]);
+                    __m128d _tmp_r2 = _mm_set_pd(_pre_r[_idx[_s+3]], _pre_r[_idx[_s+2]]);
+                    __m128d _tmp_r3 = _mm_set_pd(_pre_r[_idx[_s+5]], _pre_r[_idx[_s+4]]);
+                    __m128d _tmp_r4 = _mm_set_pd(_pre_r[_idx[_s+7]], _pre_r[_idx[_s+6]]);
+
+                    __m128d _tmp_w = _mm_cvtps_pd(_mm_castsi128_ps(_mm_loadl_epi64((__m128i const*) &_w[_s])));
+                    __m128d _tmp_w2 = _mm_cvtps_pd(_mm_castsi128_ps(_mm_loadl_epi64((__m128i const*) &_w[_s+2])));
+                    __m128d _tmp_w3 = _mm_cvtps_pd(_mm_castsi128_ps(_mm_loadl_epi64((__m128i const*) &_w[_s+4])));
+                    __m128d _tmp_w4 = _mm_cvtps_pd(_mm_castsi128_ps(_mm_loadl_epi64((__m128i const*) &_w[_s+6])));
+
+                    _tmp_reg_sum = _mm_add_pd(_tmp_reg_sum, _mm_mul_pd(_tmp_r, _tmp_w));
+                    _tmp_reg_sum = _mm_add_pd(_tmp_reg_sum, _mm_mul_pd(_tmp_r2, _tmp_w2));
+                    _tmp_reg_sum = _mm_add_pd(_tmp_reg_sum, _mm_mul_pd(_tmp_r3, _tmp_w3));
+                    _tmp_reg_sum = _mm_add_pd(_tmp_reg_sum, _mm_mul_pd(_tmp_r4, _tmp_w4));
+                }
+
+                _mm_storeu_pd(_tmp_sum, _tmp_reg_sum);
+
+                // partial sums
+                double lsum = _tmp_sum[0] + _tmp_sum[1];
+
+                // remainder loop
+                for (; _s < _stop; _s++)
+                    lsum += _pre_r[_idx[_s]] * _w[_s];
+
+                %(post_prefix)s_sum_%(target)s%(post_index)s += lsum;
+            }
+        } // active
+    #else
+        std::cerr << "The code was not compiled with SSE4-1 support. Please check your compiler flags ..." << std::endl;
+    #endif
     """
     }
 }
@@ -708,7 +757,7 @@ continuous_transmission_avx = {
 
             for (%(idx_type)s i = 0; i < post_rank.size(); i++) {
                 %(idx_type)s rk_post = post_rank[i];
-                %(idx_type)s* __restrict__ _idx = pre_rank[i].data();
+                %(col_idx_type)s* __restrict__ _idx = pre_rank[i].data();
                 double* __restrict__ _w = w[i].data();
 
                 _s = 0;
@@ -755,7 +804,7 @@ continuous_transmission_avx = {
 
             for (%(idx_type)s i = 0; i < post_rank.size(); i ++) {
                 %(idx_type)s rk_post = post_rank[i];
-                %(idx_type)s* __restrict__ _idx = pre_rank[i].data();
+                %(col_idx_type)s* __restrict__ _idx = pre_rank[i].data();
                 float* __restrict__ _w = w[i].data();
 
                 _stop = pre_rank[i].size();
@@ -793,6 +842,53 @@ continuous_transmission_avx = {
     #else
         std::cerr << "The code was not compiled with AVX support. Please check your compiler flags ..." << std::endl;
     #endif
+    """,
+        'mixed': """
+    #ifdef __AVX__
+        if (_transmission && %(post_prefix)s_active) {
+            %(idx_type)s _s, _stop;
+            double _tmp_sum[4];
+            double* __restrict__ _pre_r = %(get_r)s;
+
+            for (%(idx_type)s i = 0; i < post_rank.size(); i++) {
+                %(idx_type)s rk_post = post_rank[i];
+                %(col_idx_type)s* __restrict__ _idx = pre_rank[i].data();
+                float* __restrict__ _w = w[i].data();
+
+                _s = 0;
+                _stop = pre_rank[i].size();
+                __m256d _tmp_reg_sum = _mm256_setzero_pd();
+
+                for (; (_s+8) < _stop; _s+=8) {
+                    __m256d _tmp_r = _mm256_set_pd(
+                        _pre_r[_idx[_s+3]], _pre_r[_idx[_s+2]], _pre_r[_idx[_s+1]], _pre_r[_idx[_s]]
+                    );
+                    __m256d _tmp_r2 = _mm256_set_pd(
+                        _pre_r[_idx[_s+7]], _pre_r[_idx[_s+6]], _pre_r[_idx[_s+5]], _pre_r[_idx[_s+4]]
+                    );
+
+                    __m256d _tmp_w = _mm256_cvtps_pd(_mm_loadu_ps(&_w[_s]));
+                    __m256d _tmp_w2 = _mm256_cvtps_pd(_mm_loadu_ps(&_w[_s+4]));
+
+                    _tmp_reg_sum = _mm256_add_pd(_tmp_reg_sum, _mm256_mul_pd(_tmp_r, _tmp_w));
+                    _tmp_reg_sum = _mm256_add_pd(_tmp_reg_sum, _mm256_mul_pd(_tmp_r2, _tmp_w2));
+                }
+
+                _mm256_storeu_pd(_tmp_sum, _tmp_reg_sum);
+
+                // partial sums
+                double lsum = _tmp_sum[0] + _tmp_sum[1] + _tmp_sum[2] + _tmp_sum[3];
+
+                // remainder loop
+                for (; _s < _stop; _s++)
+                    lsum += _pre_r[_idx[_s]] * _w[_s];
+
+                %(post_prefix)s_sum_%(target)s%(post_index)s += lsum;
+            }
+        } // active
+    #else
+        std::cerr << "The code was not compiled with AVX support. Please check your compiler flags ..." << std::endl;
+    #endif
     """
     }
 }
@@ -808,7 +904,7 @@ continuous_transmission_avx512 = {
 
             for (%(idx_type)s i = 0; i < post_rank.size(); i++) {
                 %(idx_type)s rk_post = post_rank[i];
-                %(idx_type)s* __restrict__ _idx = pre_rank[i].data();
+                %(col_idx_type)s* __restrict__ _idx = pre_rank[i].data();
                 _stop = pre_rank[i].size();
                 double* __restrict__ _w = w[i].data();
 
@@ -849,7 +945,7 @@ continuous_transmission_avx512 = {
 
             for (%(idx_type)s i = 0; i < post_rank.size(); i++) {
                 %(idx_type)s rk_post = post_rank[i];
-                %(idx_type)s* __restrict__ _idx = pre_rank[i].data();
+                %(col_idx_type)s* __restrict__ _idx = pre_rank[i].data();
                 _stop = pre_rank[i].size();
                 float* __restrict__ _w = w[i].data();
 
@@ -882,6 +978,47 @@ continuous_transmission_avx512 = {
     #else
         std::cerr << "The code was not compiled with AVX-512 support. Please check your compiler flags ..." << std::endl;
     #endif
+    """,
+        'mixed': """
+    #ifdef __AVX512F__
+        if (_transmission && %(post_prefix)s_active) {
+            %(idx_type)s _s, _stop;
+            double _tmp_sum[8];
+            double* __restrict__ _pre_r = %(get_r)s;
+
+            for (%(idx_type)s i = 0; i < post_rank.size(); i++) {
+                %(idx_type)s rk_post = post_rank[i];
+                %(col_idx_type)s* __restrict__ _idx = pre_rank[i].data();
+                _stop = pre_rank[i].size();
+                float* __restrict__ _w = w[i].data();
+
+		        __m512d _tmp_reg_sum = _mm512_setzero_pd();
+                _s = 0;
+                for (; (_s+8) < _stop; _s+=8) {
+                    __m512d _tmp_r = _mm512_set_pd(
+                        _pre_r[_idx[_s+7]], _pre_r[_idx[_s+6]], _pre_r[_idx[_s+5]], _pre_r[_idx[_s+4]],
+                        _pre_r[_idx[_s+3]], _pre_r[_idx[_s+2]], _pre_r[_idx[_s+1]], _pre_r[_idx[_s]]
+                    );
+
+                    __m512d _tmp_w = _mm512_cvtps_pd(_mm256_loadu_ps(&_w[_s]));
+
+                    _tmp_reg_sum = _mm512_add_pd(_tmp_reg_sum, _mm512_mul_pd(_tmp_r, _tmp_w));
+                }
+                _mm512_storeu_pd(_tmp_sum, _tmp_reg_sum);
+
+                // partial sums
+                double lsum = _tmp_sum[0] + _tmp_sum[1] + _tmp_sum[2] + _tmp_sum[3] + _tmp_sum[4] + _tmp_sum[5] + _tmp_sum[6] + _tmp_sum[7];
+
+                // remainder loop
+                for (; _s < _stop; _s++)
+                    lsum += _pre_r[_idx[_s]] * _w[_s];
+
+                %(post_prefix)s_sum_%(target)s%(post_index)s +=  lsum;
+            }
+        } // active
+    #else
+        std::cerr << "The code was not compiled with AVX-512 support. Please check your compiler flags ..." << std::endl;
+    #endif
     """
     }
 }
@@ -943,7 +1080,7 @@ if (_transmission && %(post_prefix)s_active){
         if (inv_post_ptr == inv_pre_rank.end())
             continue;
         // List of postsynaptic neurons receiving spikes from that neuron
-        std::vector< std::pair<int, int> >& inv_post = inv_post_ptr->second;
+        auto& inv_post = inv_post_ptr->second;
         // Number of post neurons
         int nb_post = inv_post.size();
 
@@ -975,7 +1112,7 @@ if (_transmission && %(post_prefix)s_active){
         // Get the rank of the pre-synaptic neuron which spiked
         int rk_pre = %(pre_prefix)sspiked[idx_spike];
         // List of post neurons receiving connections
-        std::vector< std::pair<int, int> > rks_post = inv_pre_rank[rk_pre];
+        auto& rks_post = inv_pre_rank[rk_pre];
 
         // Iterate over the post neurons
         for(int x=0; x<rks_post.size(); x++){
@@ -34,7 +34,7 @@ from ANNarchy.generator.Projection.ProjectionGenerator import ProjectionGenerato
 from ANNarchy.generator.Projection.SingleThread import *
 
 # Useful functions
-from ANNarchy.generator.Utils import generate_equation_code, tabify, remove_trailing_spaces, check_avx_instructions, determine_idx_type_for_projection
+from ANNarchy.generator.Utils import generate_equation_code, tabify, remove_trailing_spaces, check_avx_instructions, determine_idx_type_for_projection, determine_col_idx_type_for_projection, determine_delay_type_for_projection
 
 import re
 from copy import deepcopy
@@ -130,7 +130,8 @@ class SingleThreadGenerator(ProjectionGenerator):
                 'add_args': add_args,
                 'num_threads': "",
                 'float_prec': Global.config["precision"],
-                'idx_type': determine_idx_type_for_projection(proj)[0]
+                'idx_type': determine_idx_type_for_projection(proj)[0],
+                'col_idx_type': determine_col_idx_type_for_projection(proj)[0]
             }
             declare_connectivity_matrix = ""
             access_connectivity_matrix = ""
@@ -235,14 +236,20 @@ class SingleThreadGenerator(ProjectionGenerator):
 
         # Generate the final code
         final_code = self._templates['projection_header'] % final_code_dict
+        final_body_code = self._templates['projection_body'] % final_code_dict
 
         # remove right-trailing white spaces
         final_code = remove_trailing_spaces(final_code)
+        final_body_code = remove_trailing_spaces(final_body_code)
 
         # Store file (default: $(cwd)/annarchy/)
         with open(annarchy_dir+'/generate/net'+str(self._net_id)+'/proj'+str(proj.id)+'.hpp', 'w') as ofile:
             ofile.write(final_code)
 
+        # The methods called in the simulation loop form a separate translation unit
+        with open(annarchy_dir+'/generate/net'+str(self._net_id)+'/proj'+str(proj.id)+'.cpp', 'w') as ofile:
+            ofile.write(final_body_code)
+
         # Dictionary for inclusions in ANNarchy.cpp
         proj_desc = {
             'include': """#include "proj%(id)s.hpp"\n""" % {'id': proj.id},
@@ -277,6 +284,10 @@ class SingleThreadGenerator(ProjectionGenerator):
         #                       spiking models. I want to adjust new codes already as I
         #                       hope to update the spike code generation soon ...
         idx_type, _, size_type, _ = determine_idx_type_for_projection(proj)
+        col_idx_type, _ = determine_col_idx_type_for_projection(proj)
+
+        # Non-uniform delays are stored in the smallest suitable type
+        delay_type, _ = determine_delay_type_for_projection(proj)
 
         # Some common ids
         self._template_ids.update({
@@ -285,7 +296,9 @@ class SingleThreadGenerator(ProjectionGenerator):
             'id_post': proj.post.id,
             'id_pre': proj.pre.id,
             'idx_type': idx_type,
+            'col_idx_type': col_idx_type,
             'size_type': size_type,
+            'delay_type': delay_type,
             'float_prec': Global.config["precision"],
             'pre_prefix': 'pop'+ str(proj.pre.id) + '.',
             'post_prefix': 'pop'+ str(proj.post.id) + '.',
@@ -494,7 +507,8 @@ class SingleThreadGenerator(ProjectionGenerator):
                 simd_type = "avx512"
 
             # Does our current system support SIMD and does the selected format offer an implementation?
-            if simd_type is not None and "vectorized_default_psp" in self._templates.keys():
+            simd_precision = self._simd_precision(proj)
+            if simd_type is not None and "vectorized_default_psp" in self._templates.keys() and simd_precision is not None:
                 try:
                     # The default weighted sum can be re-formulated for single weights
                     if proj._has_single_weight():
@@ -509,7 +523,7 @@ class SingleThreadGenerator(ProjectionGenerator):
                             'get_r': ids['pre_prefix']+"r.data()",
                         })
 
-                        psp_code = template["sum"][Global.config["precision"]] % ids
+                        psp_code = template["sum"][simd_precision] % ids
 
                         if self._prof_gen:
                             psp_code = self._prof_gen.annotate_computesum_rate(proj, psp_code)
@@ -522,7 +536,7 @@ class SingleThreadGenerator(ProjectionGenerator):
                             'get_r': ids['pre_prefix']+"_delayed_r[delay-1].data()",
                         })
 
-                        psp_code = template["sum"][Global.config["precision"]] % ids
+                        psp_code = template["sum"][simd_precision] % ids
 
                         if self._prof_gen:
                             psp_code = self._prof_gen.annotate_computesum_rate(proj, psp_code)
@@ -559,7 +573,7 @@ class SingleThreadGenerator(ProjectionGenerator):
 
                         # Check if we implemented a SIMD version
                         if simd_type in unrolled_template.keys():
-                            template = unrolled_template[simd_type]['multi_w']['sum'][Global.config["precision"]]
+                            template = unrolled_template[simd_type]['multi_w']['sum'][simd_precision]
                         else:
                             template = unrolled_template['none']['multi_w']["sum"]
 
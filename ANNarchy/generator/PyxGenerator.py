@@ -38,7 +38,7 @@ from ANNarchy.generator.Projection.OpenMP import BaseTemplates as proj_omp_templ
 from ANNarchy.generator.Projection.SingleThread import *
 from ANNarchy.generator.Projection.OpenMP import *
 from ANNarchy.generator.Projection.CUDA import *
-from ANNarchy.generator.Utils import tabify, determine_idx_type_for_projection, cpp_connector_available
+from ANNarchy.generator.Utils import tabify, determine_idx_type_for_projection, determine_col_idx_type_for_projection, determine_delay_type_for_projection, cpp_connector_available
 
 class PyxGenerator(object):
     """
@@ -507,6 +507,7 @@ def _set_%(name)s(%(float_prec)s value):
         set_local_all = ""
         get_local = ""
         set_local = ""
+        set_local_bulk = ""
         get_global = ""
         set_global = ""
 
@@ -537,6 +538,10 @@ def _set_%(name)s(%(float_prec)s value):
         if ctype == "%(ctype)s":
             pop%(id)s.set_local_attribute_%(ctype_name)s(cpp_string, rk, value)
 """ % ids
+            set_local_bulk += """
+        if ctype == "%(ctype)s":
+            return pop%(id)s.set_local_attributes_%(ctype_name)s(cpp_names, <%(ctype)s*> np.PyArray_DATA(values), values.size)
+""" % ids
 
         # Global parameters/variables
         for ctype in datatypes["global"]:
@@ -564,7 +569,8 @@ def _set_%(name)s(%(float_prec)s value):
                 'get_local_all': get_local_all,
                 'set_local_all': set_local_all,
                 'get_local': get_local,
-                'set_local': set_local
+                'set_local': set_local,
+                'set_local_bulk': set_local_bulk
             }
 
         if get_global != "":
@@ -601,7 +607,8 @@ def _set_%(name)s(%(float_prec)s value):
         # basic
         ids = {
             'id': proj.id,
-            'float_prec': Global.config['precision']
+            'float_prec': Global.config['precision'],
+            'delay_type': determine_delay_type_for_projection(proj)[1]
         }
 
         # Check if we need delay code
@@ -693,17 +700,29 @@ def _set_%(name)s(%(float_prec)s value):
         # Check if either a custom definition or a CPP side init
         # is available otherwise fall back to init from LIL
         if proj.connector_name == "Random" and cpp_connector_available("Random", proj._storage_format, proj._storage_order):
-            export_connector = tabify("void fixed_probability_pattern(vector[%(idx_type)s], vector[%(idx_type)s], %(float_prec)s, %(float_prec)s, %(float_prec)s, %(float_prec)s, %(float_prec)s, bool)", 2)
+            export_connector = tabify("bool fixed_probability_pattern(vector[%(idx_type)s], vector[%(idx_type)s], %(float_prec)s, %(float_prec)s, %(float_prec)s, %(float_prec)s, %(float_prec)s, bool)", 2)
         elif proj.connector_name == "Random Convergent" and cpp_connector_available("Random Convergent", proj._storage_format, proj._storage_order):
-            export_connector = tabify("void fixed_number_pre_pattern(vector[%(idx_type)s], vector[%(idx_type)s], %(idx_type)s, %(float_prec)s, %(float_prec)s, %(float_prec)s, %(float_prec)s)", 2)
+            export_connector = tabify("bool fixed_number_pre_pattern(vector[%(idx_type)s], vector[%(idx_type)s], %(idx_type)s, %(float_prec)s, %(float_prec)s, %(float_prec)s, %(float_prec)s)", 2)
+        elif proj.connector_name == "Random Divergent" and cpp_connector_available("Random Divergent", proj._storage_format, proj._storage_order):
+            export_connector = tabify("bool fixed_number_post_pattern(vector[%(idx_type)s], vector[%(idx_type)s], %(idx_type)s, %(float_prec)s, %(float_prec)s, %(float_prec)s, %(float_prec)s, bool)", 2)
+        elif proj.connector_name == "All-to-All" and cpp_connector_available("All-to-All", proj._storage_format, proj._storage_order):
+            export_connector = tabify("bool all_to_all_pattern(vector[%(idx_type)s], vector[%(idx_type)s], %(float_prec)s, %(float_prec)s, %(float_prec)s, %(float_prec)s, bool)", 2)
+        elif proj.connector_name == "One-to-One" and cpp_connector_available("One-to-One", proj._storage_format, proj._storage_order):
+            export_connector = tabify("bool one_to_one_pattern(vector[%(idx_type)s], vector[%(idx_type)s], %(float_prec)s, %(float_prec)s, %(float_prec)s, %(float_prec)s)", 2)
+        elif proj.connector_name == "Gaussian" and cpp_connector_available("Gaussian", proj._storage_format, proj._storage_order):
+            export_connector = tabify("bool gaussian_pattern(vector[int], vector[int], float, float, double, bool, %(float_prec)s, %(float_prec)s)", 2)
+        elif proj.connector_name == "Difference-of-Gaussian" and cpp_connector_available("Difference-of-Gaussian", proj._storage_format, proj._storage_order):
+            export_connector = tabify("bool dog_pattern(vector[int], vector[int], float, float, float, float, double, bool, %(float_prec)s, %(float_prec)s)", 2)
         else:
-            export_connector = tabify("bool init_from_lil(vector[%(idx_type)s], vector[vector[%(idx_type)s]], vector[vector[%(float_prec)s]], vector[vector[int]])", 2)
+            export_connector = tabify("bool init_from_lil(vector[%(idx_type)s], vector[vector[%(col_idx_type)s]], vector[vector[%(float_prec)s]], vector[vector[int]])", 2)
+            export_connector += "\n" + tabify("bool init_from_csr(vector[int]&, size_t*, int*, double*, size_t, int*, size_t, int)", 2)
 
         # Data types, only of interest if Global.config["only_int_idx_type"] is false
         idx_types = determine_idx_type_for_projection(proj)
         idx_type_dict = {
             'float_prec': Global.config["precision"],
             'idx_type': idx_types[1],
+            'col_idx_type': determine_col_idx_type_for_projection(proj)[1],
             'size_type': idx_types[3]
         }
 
@@ -840,12 +859,37 @@ def _set_%(name)s(%(float_prec)s value):
         if proj.connector_name == "Random" and cpp_connector_available("Random", proj._storage_format, proj._storage_order):
             wrapper_connector_call = """
     def fixed_probability(self, post_ranks, pre_ranks, p, w_dist_arg1, w_dist_arg2, d_dist_arg1, d_dist_arg2, allow_self_connections):
-        proj%(id_proj)s.fixed_probability_pattern(post_ranks, pre_ranks, p, w_dist_arg1, w_dist_arg2, d_dist_arg1, d_dist_arg2, allow_self_connections)
+        return proj%(id_proj)s.fixed_probability_pattern(post_ranks, pre_ranks, p, w_dist_arg1, w_dist_arg2, d_dist_arg1, d_dist_arg2, allow_self_connections)
 """ % {'id_proj': proj.id}
         elif proj.connector_name == "Random Convergent" and cpp_connector_available("Random Convergent", proj._storage_format, proj._storage_order):
             wrapper_connector_call = """
     def fixed_number_pre(self, post_ranks, pre_ranks, number_synapses_per_row, w_dist_arg1, w_dist_arg2, d_dist_arg1, d_dist_arg2):
-        proj%(id_proj)s.fixed_number_pre_pattern(post_ranks, pre_ranks, number_synapses_per_row, w_dist_arg1, w_dist_arg2, d_dist_arg1, d_dist_arg2)
+        return proj%(id_proj)s.fixed_number_pre_pattern(post_ranks, pre_ranks, number_synapses_per_row, w_dist_arg1, w_dist_arg2, d_dist_arg1, d_dist_arg2)
+""" % {'id_proj': proj.id}
+        elif proj.connector_name == "Random Divergent" and cpp_connector_available("Random Divergent", proj._storage_format, proj._storage_order):
+            wrapper_connector_call = """
+    def fixed_number_post(self, post_ranks, pre_ranks, number_synapses_per_column, w_dist_arg1, w_dist_arg2, d_dist_arg1, d_dist_arg2, allow_self_connections):
+        return proj%(id_proj)s.fixed_number_post_pattern(post_ranks, pre_ranks, number_synapses_per_column, w_dist_arg1, w_dist_arg2, d_dist_arg1, d_dist_arg2, allow_self_connections)
+""" % {'id_proj': proj.id}
+        elif proj.connector_name == "All-to-All" and cpp_connector_available("All-to-All", proj._storage_format, proj._storage_order):
+            wrapper_connector_call = """
+    def all_to_all(self, post_ranks, pre_ranks, w_dist_arg1, w_dist_arg2, d_dist_arg1, d_dist_arg2, allow_self_connections):
+        return proj%(id_proj)s.all_to_all_pattern(post_ranks, pre_ranks, w_dist_arg1, w_dist_arg2, d_dist_arg1, d_dist_arg2, allow_self_connections)
+""" % {'id_proj': proj.id}
+        elif proj.connector_name == "One-to-One" and cpp_connector_available("One-to-One", proj._storage_format, proj._storage_order):
+            wrapper_connector_call = """
+    def one_to_one(self, post_ranks, pre_ranks, w_dist_arg1, w_dist_arg2, d_dist_arg1, d_dist_arg2):
+        return proj%(id_proj)s.one_to_one_pattern(post_ranks, pre_ranks, w_dist_arg1, w_dist_arg2, d_dist_arg1, d_dist_arg2)
+""" % {'id_proj': proj.id}
+        elif proj.connector_name == "Gaussian" and cpp_connector_available("Gaussian", proj._storage_format, proj._storage_order):
+            wrapper_connector_call = """
+    def gaussian(self, pre_geometry, post_geometry, amp, sigma, limit, allow_self_connections, d_dist_arg1, d_dist_arg2):
+        return proj%(id_proj)s.gaussian_pattern(pre_geometry, post_geometry, amp, sigma, limit, allow_self_connections, d_dist_arg1, d_dist_arg2)
+""" % {'id_proj': proj.id}
+        elif proj.connector_name == "Difference-of-Gaussian" and cpp_connector_available("Difference-of-Gaussian", proj._storage_format, proj._storage_order):
+            wrapper_connector_call = """
+    def dog(self, pre_geometry, post_geometry, amp_pos, sigma_pos, amp_neg, sigma_neg, limit, allow_self_connections, d_dist_arg1, d_dist_arg2):
+        return proj%(id_proj)s.dog_pattern(pre_geometry, post_geometry, amp_pos, sigma_pos, amp_neg, sigma_neg, limit, allow_self_connections, d_dist_arg1, d_dist_arg2)
 """ % {'id_proj': proj.id}
         else:
             wrapper_connector_call = """
@@ -855,6 +899,10 @@ def _set_%(name)s(%(float_prec)s value):
 
     def init_from_lil(self, post_rank, pre_rank, w, delay):
         return proj%(id_proj)s.init_from_lil(post_rank, pre_rank, w, delay)
+
+    def init_from_csr_connectivity(self, CSR synapses):
+        " synapses is an instance of CSRConnectivity, the arrays are passed without conversion "
+        return proj%(id_proj)s.init_from_csr(synapses.post_rank, synapses.row_ptr.data(), synapses.col_idx.data(), synapses.values.data(), synapses.values.size(), synapses.delays.data(), synapses.delays.size(), synapses.uniform_delay)
 """ % {'id_proj': proj.id}
 
         wrapper_args = ""
@@ -926,6 +974,7 @@ def _set_%(name)s(%(float_prec)s value):
         set_local_row = ""
         get_local = ""
         set_local = ""
+        set_local_bulk = ""
         get_semiglobal_all = ""
         set_semiglobal_all = ""
         get_semiglobal = ""
@@ -965,6 +1014,10 @@ def _set_%(name)s(%(float_prec)s value):
         if ctype == "%(ctype)s":
             proj%(id_proj)s.set_local_attribute_%(ctype_name)s(cpp_string, rk_post, rk_pre, value)
 """ % ids
+            set_local_bulk += """
+        if ctype == "%(ctype)s":
+            return proj%(id_proj)s.set_local_attributes_%(ctype_name)s(cpp_names, <%(ctype)s*> np.PyArray_DATA(values), values.size)
+""" % ids
 
         for ctype in datatypes["semiglobal"]:
             ids = {
@@ -1017,6 +1070,7 @@ def _set_%(name)s(%(float_prec)s value):
                 'set_local_row': set_local_row,
                 'get_local': get_local,
                 'set_local': set_local,
+                'set_local_bulk': set_local_bulk,
                 'id_proj': proj.id
             }
 
@@ -1,4 +1,6 @@
-omp_header_template = """#pragma once
+# Declarations shared by all translation units of the generated code: standard
+# library, built-in and custom functions, custom constants (ANNarchyCommon.h).
+omp_common_header_template = """#pragma once
 
 #include <string>
 #include <vector>
@@ -42,6 +44,15 @@ omp_header_template = """#pragma once
  *
  */
 %(custom_func)s
+"""
+
+# Interface to the Python extension, includes all network objects (in contrast
+# to omp_common_header_template, which is included by the population and
+# projection headers, so that each translation unit only depends on the headers
+# of the objects it uses).
+omp_header_template = """#pragma once
+
+#include "ANNarchyCommon.h"
 
 /*
  * Structures for the populations
@@ -113,6 +124,54 @@ void setSeed(long int seed, int num_sources, bool use_seed_seq);
 
 """
 
+# Precompiled header, contains the includes of omp_common_header_template and the
+# sparse matrix formats of ANNarchy/include used on the CPU. It is passed with
+# -include to each translation unit of the generated code (see PrecompiledHeader.py).
+precompiled_header = """#pragma once
+
+#include <string>
+#include <vector>
+#include <algorithm>
+#include <map>
+#include <deque>
+#include <queue>
+#include <iostream>
+#include <sstream>
+#include <fstream>
+#include <cstdlib>
+#include <stdlib.h>
+#include <string.h>
+#include <cmath>
+#include <random>
+#include <cassert>
+// only included if compiled with -fopenmp
+#ifdef _OPENMP
+    #include <omp.h>
+#endif
+
+// Intrinsic operations (Intel/AMD)
+#ifdef __x86_64__
+    #include <immintrin.h>
+#endif
+
+#include "helper_functions.hpp"
+#include "RingBuffer.hpp"
+#include "LILMatrix.hpp"
+#include "LILInvMatrix.hpp"
+#include "CSRMatrix.hpp"
+#include "CSRCMatrix.hpp"
+#include "CSRCMatrixT.hpp"
+#include "COOMatrix.hpp"
+#include "BSRMatrix.hpp"
+#include "ELLMatrix.hpp"
+#include "ELLRMatrix.hpp"
+#include "SELLMatrix.hpp"
+#include "HYBMatrix.hpp"
+#include "DenseMatrix.hpp"
+#include "DenseMatrixOffsets.hpp"
+#include "PartitionedMatrix.hpp"
+"""
+
 st_body_template = """
 #include "ANNarchy.h"
 
@@ -465,8 +524,7 @@ void singleStep(const int tid, const int nt)
     }
 #endif
 %(compute_sums)s
-
-    #pragma omp barrier
+%(sync_psp)s
 %(prof_proj_psp_post)s
 
     ////////////////////////////////
@@ -483,8 +541,7 @@ void singleStep(const int tid, const int nt)
         if (recorders[i])
             recorders[i]->record_targets();
     }
-
-    #pragma omp barrier
+%(sync_record_targets)s
 
     ////////////////////////////////
     // Update random distributions
@@ -513,8 +570,7 @@ void singleStep(const int tid, const int nt)
 %(prof_neur_step_pre)s
 %(update_neuron)s
 %(prof_neur_step_post)s
-
-    #pragma omp barrier
+%(sync_neuron)s
 
     ////////////////////////////////
     // Delay outputs
@@ -527,6 +583,7 @@ void singleStep(const int tid, const int nt)
     }
 #endif
 %(delay_code)s
+%(sync_delay)s
 
     ////////////////////////////////
     // Global operations (min/max/mean)
@@ -555,8 +612,7 @@ void singleStep(const int tid, const int nt)
 %(prof_proj_step_pre)s
 %(update_synapse)s
 %(prof_proj_step_post)s
-
-    #pragma omp barrier
+%(sync_synapse)s
 
     ////////////////////////////////
     // Postsynaptic events
@@ -586,8 +642,7 @@ void singleStep(const int tid, const int nt)
             recorders[i]->record();
     }
 %(prof_record_post)s
-
-    #pragma omp barrier
+%(sync_record)s
 
     ////////////////////////////////
     // Increase internal time
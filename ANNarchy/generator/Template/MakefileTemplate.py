@@ -1,17 +1,69 @@
+# Precompiled header
+#
+# The generated translation units (not the Cython wrapper, which needs to
+# include Python.h first) use a precompiled header if available. The header
+# is shared across networks (see PrecompiledHeader.py), the rule writes to a
+# temporary file and renames it to be safe against concurrent builds. A
+# failure is ignored, the objects are then compiled without the header.
+pch_rule_template = """$(PCH): %(pch_header)s
+\t@echo "$@ start $$($(STAMP))" >> $(TIMINGS)
+\t-$(CXX) $(CXXFLAGS) -x c++-header $< -o $@.$$$$.tmp $(INCLUDES) && mv -f $@.$$$$.tmp $@
+\t@echo "$@ end $$($(STAMP))" >> $(TIMINGS)
+"""
+
 # Linux, Seq or OMP
+#
+# Each population/projection is stored in a separate translation unit, the
+# object files are compiled in parallel (make -j) and only rebuilt if the
+# corresponding source file, one of the headers it includes or the compiler
+# flags (stored in the file compile_flags by the Compiler) have changed. The
+# included headers are listed by the compiler (-MMD) in one .d file per object,
+# -MP adds an empty rule for each header so that a removed header does not
+# break the build.
+# Each step appends its start and end time to $(TIMINGS), which is read by
+# the Compiler afterwards (see compile_timings()).
 linux_omp_template = """# Makefile generated by ANNarchy
-all:
+CXX = %(compiler)s
+CXXFLAGS = %(cpu_flags)s -std=c++14 -fPIC %(openmp)s
+INCLUDES = %(python_include)s -I%(numpy_include)s -I%(annarchy_include)s -I%(thirdparty_include)s %(cython_ext)s
+OBJECTS = %(objects)s
+DEPFLAGS = -MMD -MP
+PCH = %(pch)s
+PCH_FLAGS = $(if $(wildcard $(PCH)),-include %(pch_header)s,)
+STAMP = %(python)s -S -c "import time; print(time.time())"
+TIMINGS = %(timings)s
+
+all: ANNarchyCore%(net_id)s.so
+\tmv ANNarchyCore%(net_id)s.so ../..
+
+ANNarchyCore%(net_id)s.cpp: ANNarchyCore%(net_id)s.pyx
+\t@echo "$@ start $$($(STAMP))" >> $(TIMINGS)
 \t%(cython)s -%(py_major)s --cplus %(cython_ext)s -D ANNarchyCore%(net_id)s.pyx
-\t%(compiler)s %(cpu_flags)s -std=c++14 -fPIC -shared %(openmp)s \\
-        *.cpp  %(add_sources)s -o ANNarchyCore%(net_id)s.so \\
-        %(python_include)s -I%(numpy_include)s -I%(annarchy_include)s -I%(thirdparty_include)s \\
-        %(cython_ext)s \\
+\t@echo "$@ end $$($(STAMP))" >> $(TIMINGS)
+
+%(pch_rule)s
+ANNarchyCore%(net_id)s.o: ANNarchyCore%(net_id)s.cpp compile_flags
+\t@echo "$@ start $$($(STAMP))" >> $(TIMINGS)
+\t$(CXX) $(CXXFLAGS) $(DEPFLAGS) -c $< -o $@ $(INCLUDES)
+\t@echo "$@ end $$($(STAMP))" >> $(TIMINGS)
+
+%%.o: %%.cpp $(PCH) compile_flags
+\t@echo "$@ start $$($(STAMP))" >> $(TIMINGS)
+\t$(CXX) $(CXXFLAGS) $(DEPFLAGS) $(PCH_FLAGS) -c $< -o $@ $(INCLUDES)
+\t@echo "$@ end $$($(STAMP))" >> $(TIMINGS)
+
+ANNarchyCore%(net_id)s.so: $(OBJECTS)
+\t@echo "$@ start $$($(STAMP))" >> $(TIMINGS)
+\t$(CXX) $(CXXFLAGS) -shared $(OBJECTS) %(add_sources)s -o $@ \\
+        $(INCLUDES) \\
         %(python_lib)s \\
         %(python_libpath)s %(extra_libs)s
-\tmv ANNarchyCore%(net_id)s.so ../..
+\t@echo "$@ end $$($(STAMP))" >> $(TIMINGS)
+
+-include $(OBJECTS:.o=.d)
 
 clean:
-\trm -rf *.o
+\trm -rf *.o *.d
 \trm -rf *.so
 """
 
@@ -36,34 +88,90 @@ clean:
 
 # OSX, with clang, Seq only
 osx_clang_template = """# Makefile generated by ANNarchy
-all:
+CXX = %(compiler)s
+CXXFLAGS = -stdlib=libc++ -std=c++14 %(cpu_flags)s -fpermissive %(openmp)s
+INCLUDES = %(python_include)s -I%(numpy_include)s -I%(annarchy_include)s %(cython_ext)s
+OBJECTS = %(objects)s
+DEPFLAGS = -MMD -MP
+PCH = %(pch)s
+PCH_FLAGS = $(if $(wildcard $(PCH)),-include %(pch_header)s,)
+STAMP = %(python)s -S -c "import time; print(time.time())"
+TIMINGS = %(timings)s
+
+all: ANNarchyCore%(net_id)s.so
+\tmv ANNarchyCore%(net_id)s.so ../..
+
+ANNarchyCore%(net_id)s.cpp: ANNarchyCore%(net_id)s.pyx
+\t@echo "$@ start $$($(STAMP))" >> $(TIMINGS)
 \t%(cython)s -%(py_major)s --cplus %(cython_ext)s -D ANNarchyCore%(net_id)s.pyx
-\t%(compiler)s -stdlib=libc++ -std=c++14 -dynamiclib -flat_namespace %(cpu_flags)s -fpermissive %(openmp)s \\
-        *.cpp -o ANNarchyCore%(net_id)s.so \\
-        %(python_include)s -I%(numpy_include)s -I%(annarchy_include)s \\
-        %(cython_ext)s \\
+\t@echo "$@ end $$($(STAMP))" >> $(TIMINGS)
+
+%(pch_rule)s
+ANNarchyCore%(net_id)s.o: ANNarchyCore%(net_id)s.cpp compile_flags
+\t@echo "$@ start $$($(STAMP))" >> $(TIMINGS)
+\t$(CXX) $(CXXFLAGS) $(DEPFLAGS) -c $< -o $@ $(INCLUDES)
+\t@echo "$@ end $$($(STAMP))" >> $(TIMINGS)
+
+%%.o: %%.cpp $(PCH) compile_flags
+\t@echo "$@ start $$($(STAMP))" >> $(TIMINGS)
+\t$(CXX) $(CXXFLAGS) $(DEPFLAGS) $(PCH_FLAGS) -c $< -o $@ $(INCLUDES)
+\t@echo "$@ end $$($(STAMP))" >> $(TIMINGS)
+
+ANNarchyCore%(net_id)s.so: $(OBJECTS)
+\t@echo "$@ start $$($(STAMP))" >> $(TIMINGS)
+\t$(CXX) $(CXXFLAGS) -dynamiclib -flat_namespace $(OBJECTS) -o $@ \\
         %(python_lib)s \\
         %(python_libpath)s  %(extra_libs)s
-\tmv ANNarchyCore%(net_id)s.so ../..
+\t@echo "$@ end $$($(STAMP))" >> $(TIMINGS)
+
+-include $(OBJECTS:.o=.d)
 
 clean:
-\trm -rf *.o
+\trm -rf *.o *.d
 \trm -rf *.so
 """
 
 # OSX, with gcc, OpenMP
 osx_gcc_template = """# Makefile generated by ANNarchy
-all:
+CXX = %(compiler)s
+CXXFLAGS = -std=c++14 %(cpu_flags)s -fpermissive %(openmp)s
+INCLUDES = %(python_include)s -I%(numpy_include)s -I%(annarchy_include)s %(cython_ext)s
+OBJECTS = %(objects)s
+DEPFLAGS = -MMD -MP
+PCH = %(pch)s
+PCH_FLAGS = $(if $(wildcard $(PCH)),-include %(pch_header)s,)
+STAMP = %(python)s -S -c "import time; print(time.time())"
+TIMINGS = %(timings)s
+
+all: ANNarchyCore%(net_id)s.so
+\tmv ANNarchyCore%(net_id)s.so ../..
+
+ANNarchyCore%(net_id)s.cpp: ANNarchyCore%(net_id)s.pyx
+\t@echo "$@ start $$($(STAMP))" >> $(TIMINGS)
 \t%(cython)s -%(py_major)s --cplus %(cython_ext)s -D ANNarchyCore%(net_id)s.pyx
-\t%(compiler)s -std=c++14 -dynamiclib -flat_namespace %(cpu_flags)s -fpermissive %(openmp)s \\
-        *.cpp -o ANNarchyCore%(net_id)s.so \\
-        %(python_include)s -I%(numpy_include)s -I%(annarchy_include)s \\
-        %(cython_ext)s \\
+\t@echo "$@ end $$($(STAMP))" >> $(TIMINGS)
+
+%(pch_rule)s
+ANNarchyCore%(net_id)s.o: ANNarchyCore%(net_id)s.cpp compile_flags
+\t@echo "$@ start $$($(STAMP))" >> $(TIMINGS)
+\t$(CXX) $(CXXFLAGS) $(DEPFLAGS) -c $< -o $@ $(INCLUDES)
+\t@echo "$@ end $$($(STAMP))" >> $(TIMINGS)
+
+%%.o: %%.cpp $(PCH) compile_flags
+\t@echo "$@ start $$($(STAMP))" >> $(TIMINGS)
+\t$(CXX) $(CXXFLAGS) $(DEPFLAGS) $(PCH_FLAGS) -c $< -o $@ $(INCLUDES)
+\t@echo "$@ end $$($(STAMP))" >> $(TIMINGS)
+
+ANNarchyCore%(net_id)s.so: $(OBJECTS)
+\t@echo "$@ start $$($(STAMP))" >> $(TIMINGS)
+\t$(CXX) $(CXXFLAGS) -dynamiclib -flat_namespace $(OBJECTS) -o $@ \\
         %(python_lib)s \\
         %(python_libpath)s  %(extra_libs)s
-\tmv ANNarchyCore%(net_id)s.so ../..
+\t@echo "$@ end $$($(STAMP))" >> $(TIMINGS)
+
+-include $(OBJECTS:.o=.d)
 
 clean:
-\trm -rf *.o
+\trm -rf *.o *.d
 \trm -rf *.so
 """
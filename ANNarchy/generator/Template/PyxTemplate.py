@@ -40,7 +40,7 @@ ctypedef unsigned int _ann_uint32
 ctypedef unsigned long _ann_uint64
 
 import ANNarchy
-from ANNarchy.core.cython_ext.Connector cimport LILConnectivity as LIL
+from ANNarchy.core.cython_ext.Connector cimport LILConnectivity as LIL, CSRConnectivity as CSR
 
 cdef extern from "ANNarchy.h":
 
@@ -209,6 +209,7 @@ pyx_default_pop_attribute_export = {
         %(ctype)s get_local_attribute_%(ctype_name)s(string, int)
         void set_local_attribute_all_%(ctype_name)s(string, vector[%(ctype)s])
         void set_local_attribute_%(ctype_name)s(string, int, %(ctype)s)
+        bool set_local_attributes_%(ctype_name)s(vector[string], %(ctype)s*, size_t)
 """,
     'global': """
         # Global attributes
@@ -235,6 +236,12 @@ pyx_default_pop_attribute_wrapper = {
     def set_local_attribute(self, name, rk, value, ctype):
         cpp_string = name.encode('utf-8')
 %(set_local)s
+
+    def set_local_attributes(self, names, np.ndarray values, ctype):
+        # values is a contiguous array of the given type, containing all attributes one after another
+        cdef vector[string] cpp_names = [name.encode('utf-8') for name in names]
+%(set_local_bulk)s
+        return False
 """,
     'global': """
     def get_global_attribute(self, name, ctype):
@@ -410,8 +417,8 @@ cdef class proj%(id_proj)s_wrapper :
 pyx_default_conn_export = """
         # Access connectivity
         vector[%(idx_type)s] get_post_rank()
-        vector[ vector[%(idx_type)s] ] get_pre_ranks()
-        vector[%(idx_type)s] get_dendrite_pre_rank(%(idx_type)s)
+        vector[ vector[%(col_idx_type)s] ] get_pre_ranks()
+        vector[%(col_idx_type)s] get_dendrite_pre_rank(%(idx_type)s)
         %(size_type)s nb_synapses()
         %(idx_type)s nb_dendrites()
         %(idx_type)s dendrite_size(%(idx_type)s)
@@ -442,6 +449,7 @@ pyx_proj_attribute_export = {
         void set_local_attribute_all_%(ctype_name)s(string, vector[vector[%(ctype)s]])
         void set_local_attribute_row_%(ctype_name)s(string, int, vector[%(ctype)s])
         void set_local_attribute_%(ctype_name)s(string, int, int, %(ctype)s)
+        bool set_local_attributes_%(ctype_name)s(vector[string], %(ctype)s*, size_t)
 """,
     'semiglobal': """
         # Semiglobal Attributes
@@ -483,6 +491,12 @@ pyx_proj_attribute_wrapper = {
     def set_local_attribute(self, name, rk_post, rk_pre, value, ctype):
         cpp_string = name.encode('utf-8')
 %(set_local)s
+
+    def set_local_attributes(self, names, np.ndarray values, ctype):
+        # values is a contiguous array of the given type, containing all attributes one after another (dendrite after dendrite)
+        cdef vector[string] cpp_names = [name.encode('utf-8') for name in names]
+%(set_local_bulk)s
+        return False
 """,
     'semiglobal': """
     # Semiglobal Attributes
@@ -299,6 +299,69 @@ def determine_idx_type_for_projection(proj):
 
     return cpp_idx_type, cython_idx_type, cpp_size_type, cython_size_type
 
+def determine_col_idx_type_for_projection(proj):
+    """
+    The column indices stored for each synapse (the pre-synaptic ranks) only
+    need to represent the pre-synaptic population, while the index type
+    returned by determine_idx_type_for_projection() covers both dimensions.
+
+    A separate column index type is currently supported by the LILMatrix and
+    CSRMatrix classes used for rate-coded projections. For all other formats
+    (and if the LIL matrix is split across threads) the index type is used.
+
+    Returns the C++ and the Cython type.
+    """
+    cpp_idx_type, cython_idx_type, _, _ = determine_idx_type_for_projection(proj)
+
+    # The user disabled this optimization or it is not available for CUDA
+    if cpp_idx_type == "int":
+        return cpp_idx_type, cython_idx_type
+
+    if proj.synapse_type.type != "rate" or proj._storage_order != "post_to_pre":
+        return cpp_idx_type, cython_idx_type
+
+    if proj._storage_format == "lil":
+        # the PartitionedMatrix uses one index type
+        if Global.config['num_threads'] > 1 and not proj._no_split_matrix:
+            return cpp_idx_type, cython_idx_type
+    elif proj._storage_format != "csr":
+        return cpp_idx_type, cython_idx_type
+
+    # Same boundaries as in determine_idx_type_for_projection()
+    pre_size = proj.pre.population.size if isinstance(proj.pre, PopulationView) else proj.pre.size
+    if pre_size < 255:
+        return "unsigned char", "_ann_uint8"
+    elif pre_size < 65534:
+        return "unsigned short int", "_ann_uint16"
+    else:
+        return "unsigned int", "_ann_uint32"
+
+def determine_delay_type_for_projection(proj):
+    """
+    The non-uniform delays are stored per synapse (in steps). Unless the user
+    disabled this optimization (only_int_delay_type), the smallest unsigned
+    type which can represent the maximal delay of the projection is used.
+
+    Please note, that the delays can then not be increased beyond the chosen
+    type after compile() (see Projection._set_delay()).
+
+    Returns the C++ and the Cython type.
+    """
+    # The user disabled this optimization.
+    if Global.config["only_int_delay_type"]:
+        return "int", "int"
+
+    # Non-uniform delays are not available on GPUs
+    if Global._check_paradigm("cuda"):
+        return "int", "int"
+
+    if proj.max_delay < 256:
+        return "unsigned char", "_ann_uint8"
+    elif proj.max_delay < 65536:
+        return "unsigned short int", "_ann_uint16"
+    else:
+        return "int", "int"
+
 def cpp_connector_available(connector_name, desired_format, storage_order):
     """
     Checks if a CPP implementation is available for the desired connection pattern
@@ -312,31 +375,21 @@ def cpp_connector_available(connector_name, desired_format, storage_order):
     cpp_patterns = {
         'st': {
             'post_to_pre': {
-                "lil": ["Random", "Random Convergent"],
-                "csr": ["Random", "Random Convergent"],
+                "lil": ["Random", "Random Convergent", "Random Divergent", "All-to-All", "One-to-One", "Gaussian", "Difference-of-Gaussian"],
+                "csr": ["Random", "Random Convergent", "Random Divergent", "All-to-All", "One-to-One", "Gaussian", "Difference-of-Gaussian"],
                 "coo": [],
                 "hyb": [],
                 "ell": [],
-                "dense": ["Random"]
+                "dense": ["Random", "Random Divergent", "All-to-All", "One-to-One", "Gaussian", "Difference-of-Gaussian"]
             },
             'pre_to_post': {
-                "csr": ["Random", "Random Convergent"]
+                "csr": ["Random", "Random Convergent", "Random Divergent", "All-to-All", "One-to-One"]
             }
         },
-        'omp': {
-            "lil": [],
-            "csr": [],
-            "coo": [],
-            "ell": []
-        },
-        'cuda': {
-            'post_to_pre': {
-                "csr": ["Random", "Random Convergent"],
-                "coo": [],
-                "ellr": ["Random", "Random Convergent"],
-                "dense": ["Random"]
-            }
-        }
+        # The patterns are constructed in Python for openMP with several
+        # threads and for CUDA
+        'omp': {},
+        'cuda': {}
     }
 
     if Global._check_paradigm("openmp"):
@@ -467,3 +520,19 @@ def check_avx_instructions(simd_instr_set="avx"):
             # give up and proceed without AVX
             return False
 
+
+def compiler_family(compiler):
+    """
+    Returns "gcc" or "clang" depending on the version string of the C++ compiler,
+    None if the compiler is unknown or can not be executed.
+    """
+    try:
+        version_str = subprocess.check_output([compiler, "--version"], stderr=subprocess.STDOUT).decode()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    if 'clang' in version_str:
+        return "clang"
+    elif 'Free Software Foundation' in version_str:
+        return "gcc"
+    return None
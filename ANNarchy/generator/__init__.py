@@ -1 +1 @@
-from .Compiler import compile
+from .Compiler import compile, check_rebuild
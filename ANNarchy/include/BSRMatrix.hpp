@@ -20,6 +20,8 @@
  */
 #pragma once
 
+#include "helper_functions.hpp"
+
 /**
  *	\brief		Implementation of a blocked compressed sparse row (BSR) format.
  *	\details	A blocked variant of the classic compressed sparse row matrix format. It is basically
@@ -84,7 +86,7 @@ class BSRMatrix {
     }
 
     // Attention: this function returns the LIL indices, this easier for the following processing
-    std::vector<std::vector<IT>> split_row_indices(std::vector<IT>& row_indices, IT nb_block_rows) {
+    std::vector<std::vector<IT>> split_row_indices(const std::vector<IT>& row_indices, IT nb_block_rows) {
     #ifdef _DEBUG
         std::cout << "BSRMatrix::split_row_indices()" << std::endl;
     #endif
@@ -174,13 +176,39 @@ class BSRMatrix {
     #ifdef _DEBUG
         std::cout << "BSRMatrix::init_matrix_from_lil()" << std::endl;
     #endif
+        // sanity checks
+        assert( (row_indices.size() == column_indices.size()) );
+
+        return init_tiles(row_indices, [&](IT lil_idx) {
+            return std::make_pair(column_indices[lil_idx].cbegin(), column_indices[lil_idx].cend());
+        });
+    }
+
+    /**
+     *  @brief      initialize connectivity based on a compressed row representation.
+     *  @details    the i-th row (row_indices[i]) contains the column indices col_idx[row_ptr[i]] to col_idx[row_ptr[i+1]-1].
+     */
+    template<typename PT, typename CT>
+    bool init_matrix_from_csr(const std::vector<IT> &row_indices, const PT* row_ptr, const CT* col_idx) {
+    #ifdef _DEBUG
+        std::cout << "BSRMatrix::init_matrix_from_csr()" << std::endl;
+    #endif
+        return init_tiles(row_indices, [&](IT lil_idx) {
+            return std::make_pair(col_idx + row_ptr[lil_idx], col_idx + row_ptr[lil_idx+1]);
+        });
+    }
+
+ protected:
+    /**
+     *  @brief      creates the dense tiles.
+     *  @details    columns_of(lil_idx) returns the begin and end iterators of the column indices of the row row_indices[lil_idx].
+     */
+    template<typename ColumnsOf>
+    bool init_tiles(const std::vector<IT> &row_indices, ColumnsOf columns_of) {
         clear();
 
         post_ranks_ = row_indices;
 
-        // sanity checks
-        assert( (row_indices.size() == column_indices.size()) );
-
         // data vector = vec[row_block][col_block]
         IT nb_block_rows = IT(ceil(double(this->num_rows_) / double(this->tile_size_)));
         IT nb_blocks_per_row = IT(ceil(double(this->num_columns_) / double(this->tile_size_)));
@@ -216,7 +244,8 @@ class BSRMatrix {
             for (auto lil_it = row_indices_chunked[b_r_idx].begin(); lil_it != row_indices_chunked[b_r_idx].end(); lil_it++) {
                 r_cast = row_indices[*lil_it];
 
-                for (auto col_it = column_indices[*lil_it].begin(); col_it != column_indices[*lil_it].end(); col_it++) {
+                auto columns = columns_of(*lil_it);
+                for (auto col_it = columns.first; col_it != columns.second; col_it++) {
                     c_cast = *col_it;
 
                     IT b_c_idx = c_cast / tile_size_;
@@ -295,6 +324,7 @@ class BSRMatrix {
         return true;
     }
 
+ public:
     //
     //  Accessors for the Python ANNarchy interface
     //
@@ -453,6 +483,17 @@ class BSRMatrix {
         }
     }
 
+    template <typename VT, typename DT, typename PT>
+    inline void update_matrix_variable_all(std::vector<VT> &variable, const CSRValues<DT, PT> &data) {
+    #ifdef _DEBUG
+        std::cout << "BSRMatrix::update_matrix_variable_all()" << std::endl;
+    #endif
+        // update matrix row by row
+        for (IT lil_idx = 0; lil_idx < post_ranks_.size(); lil_idx++ ) {
+            update_matrix_variable_row(variable, lil_idx, data.template row<VT>(lil_idx));
+        }
+    }
+
     template <typename VT>
     inline void update_matrix_variable_row(std::vector<VT> &variable, const IT lil_idx, const std::vector<VT> data) {
     #ifdef _DEBUG
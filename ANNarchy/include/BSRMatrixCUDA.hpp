@@ -140,6 +140,23 @@ public:
         return transfer_to_device();
     }
 
+    template<typename PT, typename CT>
+    bool init_matrix_from_csr(const std::vector<IT> &post_ranks, const PT* row_ptr, const CT* col_idx) {
+    #ifdef _DEBUG
+        std::cout << "BSRMatrixCUDA::init_matrix_from_csr()" << std::endl;
+    #endif
+
+        bool success = static_cast<BSRMatrix<IT, ST, false>*>(this)->init_matrix_from_csr(post_ranks, row_ptr, col_idx);
+        if (!success)
+            return false;
+
+        size_t required = this->block_row_pointer_.size() * sizeof(IT) + this->block_column_index_.size() * sizeof(IT) + this->tile_data_.size()*sizeof(char);
+        if( !check_free_memory(required) )
+            return false;
+
+        return transfer_to_device();
+    }
+
     template<typename VT>
     VT* init_matrix_variable_gpu(const std::vector<VT> &host_variable) {
     #ifdef _DEBUG
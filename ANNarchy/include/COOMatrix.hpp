@@ -20,6 +20,8 @@
  */
 #pragma once
 
+#include "helper_functions.hpp"
+
 /**
  *  @brief      Implementation of the *coordinate* (COO) sparse matrix format.
  *  @details    The coordinate format is probably the easiest format to represent sparse connectivity.
@@ -210,6 +212,33 @@ class COOMatrix {
         return true;
     }
 
+    /**
+     *  @brief      initialize connectivity based on a compressed row representation.
+     *  @details    the i-th row (post_ranks[i]) contains the column indices col_idx[row_ptr[i]] to col_idx[row_ptr[i+1]-1].
+     *  @see        LILMatrix::init_matrix_from_csr()
+     */
+    template<typename PT, typename CT>
+    bool init_matrix_from_csr(const std::vector<IT> &post_ranks, const PT* row_ptr, const CT* col_idx) {
+    #ifdef _DEBUG
+        std::cout << "COOMatrix::init_matrix_from_csr()" << std::endl;
+    #endif
+        clear();
+
+        post_ranks_ = post_ranks;
+
+        row_indices_.reserve(row_ptr[post_ranks.size()]);
+        column_indices_.reserve(row_ptr[post_ranks.size()]);
+        for (size_t i = 0; i < post_ranks.size(); i++) {
+            row_indices_.insert(row_indices_.end(), row_ptr[i+1] - row_ptr[i], post_ranks[i]);
+            column_indices_.insert(column_indices_.end(), col_idx + row_ptr[i], col_idx + row_ptr[i+1]);
+        }
+
+    #ifdef _DEBUG
+        std::cout << row_indices_.size() << " coordinate pairs created." << std::endl;
+    #endif
+        return true;
+    }
+
     /**
      *  @brief      reads in a .csv file which contains the matrix stored as COO.
      *  @details    this function creates also the variable array, which is usually performed afterwards.
@@ -332,6 +361,22 @@ class COOMatrix {
         }
     }
 
+    /**
+     *  @brief      Update all nonzeros from a compressed row representation.
+     *  @details    The values are stored row by row in the order of init_matrix_from_csr(), i. e. in the
+     *              same order as the coordinates.
+     */
+    template <typename VT, typename DT, typename PT>
+    inline void update_matrix_variable_all(std::vector<VT> &variable, const CSRValues<DT, PT> &data) {
+    #ifdef _DEBUG
+        std::cout << "COOMatrix::update_matrix_variable_all()" << std::endl;
+    #endif
+        auto dest = variable.begin();
+        for (size_t lil_idx = 0; lil_idx < post_ranks_.size(); lil_idx++) {
+            dest = data.copy_row(lil_idx, dest);
+        }
+    }
+
         // ATTENTION: we assume sorted indices (otherwise the copy here is not correct)
     template <typename VT>
     inline void update_matrix_variable_row(std::vector<VT> &variable, const IT lil_idx, const std::vector<VT> data) {
@@ -185,6 +185,21 @@ class COOMatrixCUDA: public COOMatrix<IT, ST> {
         return host_to_device_transfer();
     }
 
+    template<typename PT, typename CT>
+    bool init_matrix_from_csr(const std::vector<IT> &post_ranks, const PT* row_ptr, const CT* col_idx) {
+    #ifdef _DEBUG
+        std::cout << "COOMatrixCUDA::init_matrix_from_csr()" << std::endl;
+    #endif
+
+        bool success = static_cast<COOMatrix<IT, ST>*>(this)->init_matrix_from_csr(post_ranks, row_ptr, col_idx);
+        if (!success)
+            return false;
+
+        compute_segments();
+
+        return host_to_device_transfer();
+    }
+
     template<typename VT>
     VT* init_matrix_variable_gpu(const std::vector<VT> &host_variable) {
     #ifdef _DEBUG
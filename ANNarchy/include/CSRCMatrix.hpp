@@ -108,6 +108,26 @@ public:
         return true;
     }
 
+    /**
+     *  @brief      initialize from a compressed row representation.
+     *  @see        CSRMatrix::init_matrix_from_csr()
+     */
+    template<typename PT, typename CT>
+    bool init_matrix_from_csr(const std::vector<IT> &row_indices, const PT* row_ptr, const CT* col_idx) {
+    #ifdef _DEBUG
+        std::cout << "CSRCMatrix::init_matrix_from_csr():" << std::endl;
+    #endif
+        // create forward view
+        bool success = static_cast<CSRMatrix<IT, ST>*>(this)->init_matrix_from_csr(row_indices, row_ptr, col_idx);
+        if (!success)
+            return false;
+
+        // compute backward view
+        inverse_connectivity_matrix();
+
+        return true;
+    }
+
     /**
      *  @brief      initialize from a .csv file.
      *  @see        LILMatrix::init_matrix_from_csv()
@@ -162,6 +182,112 @@ public:
         delete lil_mat;
     }
 
+    /**
+     *  @see LILMatrix::fixed_number_post_pattern()
+     */
+    void fixed_number_post_pattern(std::vector<IT> post_ranks, std::vector<IT> pre_ranks, IT nnz_per_column, bool allow_self_connections, std::mt19937& rng) {
+    #ifdef _DEBUG
+        std::cout << "CSRCMatrix::fixed_number_post_pattern()" << std::endl;
+    #endif
+        clear();
+
+        // Generate post_to_pre LIL
+        auto lil_mat = new LILMatrix<IT, ST>(this->num_rows_, this->num_columns_);
+        lil_mat->fixed_number_post_pattern(post_ranks, pre_ranks, nnz_per_column, allow_self_connections, rng);
+
+        // Initialize from this LIL
+        init_matrix_from_lil(lil_mat->get_post_rank(), lil_mat->get_pre_ranks());
+
+        // cleanup
+        delete lil_mat;
+    }
+
+    /**
+     *  @see LILMatrix::all_to_all_pattern()
+     */
+    void all_to_all_pattern(std::vector<IT> post_ranks, std::vector<IT> pre_ranks, bool allow_self_connections) {
+    #ifdef _DEBUG
+        std::cout << "CSRCMatrix::all_to_all_pattern()" << std::endl;
+    #endif
+        clear();
+
+        // Generate post_to_pre LIL
+        auto lil_mat = new LILMatrix<IT, ST>(this->num_rows_, this->num_columns_);
+        lil_mat->all_to_all_pattern(post_ranks, pre_ranks, allow_self_connections);
+
+        // Initialize from this LIL
+        init_matrix_from_lil(lil_mat->get_post_rank(), lil_mat->get_pre_ranks());
+
+        // cleanup
+        delete lil_mat;
+    }
+
+    /**
+     *  @see LILMatrix::one_to_one_pattern()
+     */
+    void one_to_one_pattern(std::vector<IT> post_ranks, std::vector<IT> pre_ranks) {
+    #ifdef _DEBUG
+        std::cout << "CSRCMatrix::one_to_one_pattern()" << std::endl;
+    #endif
+        clear();
+
+        // Generate post_to_pre LIL
+        auto lil_mat = new LILMatrix<IT, ST>(this->num_rows_, this->num_columns_);
+        lil_mat->one_to_one_pattern(post_ranks, pre_ranks);
+
+        // Initialize from this LIL
+        init_matrix_from_lil(lil_mat->get_post_rank(), lil_mat->get_pre_ranks());
+
+        // cleanup
+        delete lil_mat;
+    }
+
+    /**
+     *  @see LILMatrix::gaussian_pattern()
+     */
+    template<typename VT>
+    std::vector< std::vector<VT> > gaussian_pattern(std::vector<int> pre_geometry, std::vector<int> post_geometry, float amp, float sigma, double limit, bool allow_self_connections) {
+    #ifdef _DEBUG
+        std::cout << "CSRCMatrix::gaussian_pattern()" << std::endl;
+    #endif
+        clear();
+
+        // Generate post_to_pre LIL
+        auto lil_mat = new LILMatrix<IT, ST>(this->num_rows_, this->num_columns_);
+        auto values = lil_mat->template gaussian_pattern<VT>(pre_geometry, post_geometry, amp, sigma, limit, allow_self_connections);
+
+        // Initialize from this LIL
+        init_matrix_from_lil(lil_mat->get_post_rank(), lil_mat->get_pre_ranks());
+
+        // cleanup
+        delete lil_mat;
+
+        return values;
+    }
+
+    /**
+     *  @see LILMatrix::dog_pattern()
+     */
+    template<typename VT>
+    std::vector< std::vector<VT> > dog_pattern(std::vector<int> pre_geometry, std::vector<int> post_geometry, float amp_pos, float sigma_pos, float amp_neg, float sigma_neg, double limit, bool allow_self_connections) {
+    #ifdef _DEBUG
+        std::cout << "CSRCMatrix::dog_pattern()" << std::endl;
+    #endif
+        clear();
+
+        // Generate post_to_pre LIL
+        auto lil_mat = new LILMatrix<IT, ST>(this->num_rows_, this->num_columns_);
+        auto values = lil_mat->template dog_pattern<VT>(pre_geometry, post_geometry, amp_pos, sigma_pos, amp_neg, sigma_neg, limit, allow_self_connections);
+
+        // Initialize from this LIL
+        init_matrix_from_lil(lil_mat->get_post_rank(), lil_mat->get_pre_ranks());
+
+        // cleanup
+        delete lil_mat;
+
+        return values;
+    }
+
     void inverse_connectivity_matrix() {
     #ifdef _DEBUG
         std::cout << "CSRCMatrix::inverse_connectivity_matrix()" << std::endl;
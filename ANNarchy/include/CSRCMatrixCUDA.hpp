@@ -151,6 +151,20 @@ public:
         return host_to_device_transfer();
     }
 
+    template<typename PT, typename CT>
+    bool init_matrix_from_csr(const std::vector<IT> &row_indices, const PT* row_ptr, const CT* col_idx) {
+    #ifdef _DEBUG
+        std::cout << "CSRCMatrixCUDA::init_matrix_from_csr() " << std::endl;
+    #endif
+        // host side
+        bool success = static_cast<CSRCMatrix<IT, ST>*>(this)->init_matrix_from_csr(row_indices, row_ptr, col_idx);
+        if (!success)
+            return false;
+
+        // copy to gpu
+        return host_to_device_transfer();
+    }
+
     bool fixed_probability_pattern(std::vector<IT> post_ranks, std::vector<IT> pre_ranks, double p, bool allow_self_connections, std::mt19937& rng) {
     #ifdef _DEBUG
         std::cout << "CSRCMatrixCUDA::fixed_probability_pattern() " << std::endl;
@@ -163,6 +163,40 @@ class CSRCMatrixT{
         return true;
     }
 
+    /**
+     *  @brief      Create CSRC_T from a compressed row representation of the non-empty rows.
+     *  @see        LILMatrix::init_matrix_from_csr()
+     */
+    template<typename PT, typename CT>
+    bool init_matrix_from_csr(const std::vector<IT> &post_ranks, const PT* row_ptr, const CT* col_idx) {
+    #ifdef _DEBUG
+        std::cout << "CSRCMatrixT::init_matrix_from_csr()" << std::endl;
+    #endif
+        clear();
+
+        // post_to_pre LIL
+        auto lil_mat = new LILMatrix<IT>(num_rows_, num_columns_);
+        lil_mat->init_matrix_from_csr(post_ranks, row_ptr, col_idx);
+
+        // switch dimensions
+        auto lil_mat_t = lil_mat->transpose();
+
+        // sanity check
+        if (lil_mat->nb_synapses() != lil_mat_t->nb_synapses())
+            std::cerr << "Transpose of the LIL matrix went possibly wrong ..." << std::endl;
+
+        // delete original LIL
+        delete lil_mat;
+
+        // Generate CSRC from transposed LIL
+        init_matrix_from_transposed_lil(lil_mat_t->get_post_rank(), lil_mat_t->get_pre_ranks());
+
+        // cleanup transposed LIL
+        delete lil_mat_t;
+
+        return true;
+    }
+
     /**
      *  @brief      reads in a .csv file which contains the matrix stored as COO.
      *  @see        LILMatrix::init_matrix_from_lil()
@@ -308,6 +342,66 @@ class CSRCMatrixT{
         delete lil_mat;
     }
 
+    /**
+     *  @see LILMatrix::fixed_number_post_pattern()
+     */
+    void fixed_number_post_pattern(std::vector<IT> post_ranks, std::vector<IT> pre_ranks, IT nnz_per_column, bool allow_self_connections, std::mt19937& rng) {
+    #ifdef _DEBUG
+        std::cout << "CSRCMatrixT::fixed_number_post_pattern()" << std::endl;
+    #endif
+        clear();
+
+        // Generate post_to_pre LIL
+        auto lil_mat = new LILMatrix<IT, ST>(this->num_rows_, this->num_columns_);
+        lil_mat->fixed_number_post_pattern(post_ranks, pre_ranks, nnz_per_column, allow_self_connections, rng);
+
+        // Initialize from this LIL
+        init_matrix_from_lil(lil_mat->get_post_rank(), lil_mat->get_pre_ranks());
+
+        // cleanup
+        delete lil_mat;
+    }
+
+    /**
+     *  @see LILMatrix::all_to_all_pattern()
+     */
+    void all_to_all_pattern(std::vector<IT> post_ranks, std::vector<IT> pre_ranks, bool allow_self_connections) {
+    #ifdef _DEBUG
+        std::cout << "CSRCMatrixT::all_to_all_pattern()" << std::endl;
+    #endif
+        clear();
+
+        // Generate post_to_pre LIL
+        auto lil_mat = new LILMatrix<IT, ST>(this->num_rows_, this->num_columns_);
+        lil_mat->all_to_all_pattern(post_ranks, pre_ranks, allow_self_connections);
+
+        // Initialize from this LIL
+        init_matrix_from_lil(lil_mat->get_post_rank(), lil_mat->get_pre_ranks());
+
+        // cleanup
+        delete lil_mat;
+    }
+
+    /**
+     *  @see LILMatrix::one_to_one_pattern()
+     */
+    void one_to_one_pattern(std::vector<IT> post_ranks, std::vector<IT> pre_ranks) {
+    #ifdef _DEBUG
+        std::cout << "CSRCMatrixT::one_to_one_pattern()" << std::endl;
+    #endif
+        clear();
+
+        // Generate post_to_pre LIL
+        auto lil_mat = new LILMatrix<IT, ST>(this->num_rows_, this->num_columns_);
+        lil_mat->one_to_one_pattern(post_ranks, pre_ranks);
+
+        // Initialize from this LIL
+        init_matrix_from_lil(lil_mat->get_post_rank(), lil_mat->get_pre_ranks());
+
+        // cleanup
+        delete lil_mat;
+    }
+
     /**
      *  @brief      computes the inverted view on the matrix
      */
@@ -444,6 +538,17 @@ class CSRCMatrixT{
         return var;
     }
 
+    template <typename VT>
+    std::vector<VT> init_matrix_variable_discrete_uniform(VT a, VT b, std::mt19937 &rng) {
+        // the distribution is not defined for char types (e. g. compact delays)
+        std::uniform_int_distribution< typename std::common_type<VT, int>::type > dis (a,b);
+
+        auto var = std::vector<VT>(num_non_zeros_, 0);
+        std::generate(var.begin(), var.end(), [&]{ return dis(rng); });
+
+        return var;
+    }
+
     template <typename VT>
     std::vector<VT> init_matrix_variable_normal(VT mean, VT sigma, std::mt19937 &rng) {
         std::normal_distribution<VT> dis (mean, sigma);
@@ -487,6 +592,17 @@ class CSRCMatrixT{
         }
     }
 
+    template <typename VT, typename DT, typename PT>
+    inline void update_matrix_variable_all(std::vector<VT> &variable, const CSRValues<DT, PT> &data) {
+        for (size_t r = 0; r < post_ranks_.size(); r++) {
+            IT rank = post_ranks_[r];
+            size_t j = 0;
+            for (auto c = col_ptr_[rank]; c < col_ptr_[rank+1]; c++, j++) {
+                variable[inv_idx_[c]] = data.get(r, j);
+            }
+        }
+    }
+
     template <typename VT>
     inline VT get_matrix_variable(const std::vector<VT> &variable, const IT lil_idx, const IT column_idx) {
         IT rank = post_ranks_[lil_idx];
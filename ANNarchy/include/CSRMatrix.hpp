@@ -57,15 +57,17 @@
  *                      - unsigned int (4 byte):         [0 .. 4.294.967.295]
  * 
  *              The chosen data type should be able to represent the maximum values (LILMatrix::num_rows_ and ::num_columns_)
+ *
+ *              CT      data type to store the column indices (CSRMatrix::col_idx_), it only needs to represent CSRMatrix::num_columns_.
  */
-template<typename IT = unsigned int, typename ST = unsigned long int>
+template<typename IT = unsigned int, typename ST = unsigned long int, typename CT = IT>
 class CSRMatrix {
 
   protected:
     std::vector<IT> post_ranks_;        ///< Needed to translate LIL indices to row_indicies.
     std::vector<ST> row_begin_;         ///< i-th element marks the begin of the i-th row. The chosen type for encoding should be able to
                                         ///< contain num_rows_ * num_columns_ elements (we choose size_t to be on the safe side)
-    std::vector<IT> col_idx_;           ///< contains the column indices in row major order order. To access row i, get indices from row_begin_.
+    std::vector<CT> col_idx_;           ///< contains the column indices in row major order order. To access row i, get indices from row_begin_.
 
     IT num_rows_;                       ///< number of rows in the dense matrix
     IT num_columns_;                    ///< number of columns in the dense matrix
@@ -81,7 +83,7 @@ class CSRMatrix {
 
         row_begin_ = std::vector<ST>(num_rows+1, 0);
         post_ranks_ = std::vector<IT>();
-        col_idx_ = std::vector<IT>();
+        col_idx_ = std::vector<CT>();
         num_non_zeros_ = 0;
     }
 
@@ -123,7 +125,7 @@ class CSRMatrix {
         return num_columns_;
     }
 
-    inline std::vector<IT> column_indices() {
+    inline std::vector<CT> column_indices() {
         return col_idx_;
     }
 
@@ -135,7 +137,7 @@ class CSRMatrix {
      *  @brief      Initialize CSR based on a LIL representation.
      *  @see        LILMatrix::init_matrix_from_lil()
      */
-    bool init_matrix_from_lil(std::vector<IT> row_indices, std::vector< std::vector<IT> > column_indices) {
+    bool init_matrix_from_lil(std::vector<IT> row_indices, std::vector< std::vector<CT> > column_indices) {
     #ifdef _DEBUG
         std::cout << "CSRMatrix::init_matrix_from_lil()" << std::endl;
     #endif
@@ -183,6 +185,48 @@ class CSRMatrix {
         return true;
     }
 
+    /**
+     *  @brief      Initialize CSR based on a compressed row representation of the non-empty rows.
+     *  @details    Contrary to init_matrix_from_lil() the column indices are already contiguous, only the
+     *              row pointers need to be extended by the empty rows.
+     *  @see        LILMatrix::init_matrix_from_csr()
+     */
+    template<typename PT, typename XT>
+    bool init_matrix_from_csr(const std::vector<IT> &row_indices, const PT* row_ptr, const XT* col_idx) {
+    #ifdef _DEBUG
+        std::cout << "CSRMatrix::init_matrix_from_csr()" << std::endl;
+    #endif
+        // sanity check of inputs
+        assert( (row_indices.size() < std::numeric_limits<IT>::max()) );
+        assert( (row_indices.size() <= num_rows_) );
+
+        // row_ptr[0] is non-zero for the partitions of a PartitionedMatrix
+        post_ranks_ = row_indices;
+        col_idx_ = std::vector<CT>(col_idx + row_ptr[0], col_idx + row_ptr[row_indices.size()]);
+        num_non_zeros_ = col_idx_.size();
+
+        // empty rows begin where the next stored row begins
+        size_t lil_row_idx = 0;
+        for (IT r = 0; r < num_rows_; r++) {
+            row_begin_[r] = row_ptr[lil_row_idx] - row_ptr[0];
+
+            if (lil_row_idx < row_indices.size() && r == row_indices[lil_row_idx])
+                lil_row_idx++;
+        }
+        row_begin_[num_rows_] = num_non_zeros_;
+
+        // sanity check after transformation
+        if (lil_row_idx != row_indices.size())
+            std::cerr << "something went wrong ..." << std::endl;
+
+    #ifdef _DEBUG
+        std::cout << "init completed" << std::endl;
+        std::cout << "  #nnz: " << num_non_zeros_ << std::endl;
+        std::cout << "  #empty rows: " << num_rows_ - post_ranks_.size() << std::endl;
+    #endif
+        return true;
+    }
+
     /**
      *  @brief      reads in a .csv file which contains the matrix stored as COO.
      *  @see        LILMatrix::init_matrix_from_lil()
@@ -287,7 +331,7 @@ class CSRMatrix {
             std::shuffle(pre_ranks.begin(), pre_ranks.end(), rng);
 
             // select nnz_per_row elements
-            auto tmp_col_indices = std::vector<IT>(pre_ranks.begin(), pre_ranks.begin()+nnz_per_row);
+            auto tmp_col_indices = std::vector<CT>(pre_ranks.begin(), pre_ranks.begin()+nnz_per_row);
 
             // sort the indices before storage
             std::sort(tmp_col_indices.begin(), tmp_col_indices.end());
@@ -306,7 +350,7 @@ class CSRMatrix {
         std::cout << " p: " << p << std::endl;
     #endif
         // Generate post_to_pre LIL
-        auto lil_mat = new LILMatrix<IT, ST>(this->num_rows_, this->num_columns_);
+        auto lil_mat = new LILMatrix<IT, ST, CT>(this->num_rows_, this->num_columns_);
         lil_mat->fixed_probability_pattern(post_ranks, pre_ranks, p, allow_self_connections, rng);
 
         // Generate CSR from this LIL
@@ -316,6 +360,102 @@ class CSRMatrix {
         delete lil_mat;
     }
 
+    /**
+     *  @see LILMatrix::fixed_number_post_pattern()
+     */
+    void fixed_number_post_pattern(std::vector<IT> post_ranks, std::vector<IT> pre_ranks, IT nnz_per_column, bool allow_self_connections, std::mt19937& rng) {
+    #ifdef _DEBUG
+        std::cout << "CSRMatrix::fixed_number_post_pattern()" << std::endl;
+    #endif
+        // Generate post_to_pre LIL
+        auto lil_mat = new LILMatrix<IT, ST, CT>(this->num_rows_, this->num_columns_);
+        lil_mat->fixed_number_post_pattern(post_ranks, pre_ranks, nnz_per_column, allow_self_connections, rng);
+
+        // Initialize from this LIL
+        init_matrix_from_lil(lil_mat->get_post_rank(), lil_mat->get_pre_ranks());
+
+        // cleanup
+        delete lil_mat;
+    }
+
+    /**
+     *  @see LILMatrix::all_to_all_pattern()
+     */
+    void all_to_all_pattern(std::vector<IT> post_ranks, std::vector<IT> pre_ranks, bool allow_self_connections) {
+    #ifdef _DEBUG
+        std::cout << "CSRMatrix::all_to_all_pattern()" << std::endl;
+    #endif
+        // Generate post_to_pre LIL
+        auto lil_mat = new LILMatrix<IT, ST, CT>(this->num_rows_, this->num_columns_);
+        lil_mat->all_to_all_pattern(post_ranks, pre_ranks, allow_self_connections);
+
+        // Initialize from this LIL
+        init_matrix_from_lil(lil_mat->get_post_rank(), lil_mat->get_pre_ranks());
+
+        // cleanup
+        delete lil_mat;
+    }
+
+    /**
+     *  @see LILMatrix::one_to_one_pattern()
+     */
+    void one_to_one_pattern(std::vector<IT> post_ranks, std::vector<IT> pre_ranks) {
+    #ifdef _DEBUG
+        std::cout << "CSRMatrix::one_to_one_pattern()" << std::endl;
+    #endif
+        // Generate post_to_pre LIL
+        auto lil_mat = new LILMatrix<IT, ST, CT>(this->num_rows_, this->num_columns_);
+        lil_mat->one_to_one_pattern(post_ranks, pre_ranks);
+
+        // Initialize from this LIL
+        init_matrix_from_lil(lil_mat->get_post_rank(), lil_mat->get_pre_ranks());
+
+        // cleanup
+        delete lil_mat;
+    }
+
+    /**
+     *  @see LILMatrix::gaussian_pattern()
+     */
+    template<typename VT>
+    std::vector< std::vector<VT> > gaussian_pattern(std::vector<int> pre_geometry, std::vector<int> post_geometry, float amp, float sigma, double limit, bool allow_self_connections) {
+    #ifdef _DEBUG
+        std::cout << "CSRMatrix::gaussian_pattern()" << std::endl;
+    #endif
+        // Generate post_to_pre LIL
+        auto lil_mat = new LILMatrix<IT, ST, CT>(this->num_rows_, this->num_columns_);
+        auto values = lil_mat->template gaussian_pattern<VT>(pre_geometry, post_geometry, amp, sigma, limit, allow_self_connections);
+
+        // Initialize from this LIL
+        init_matrix_from_lil(lil_mat->get_post_rank(), lil_mat->get_pre_ranks());
+
+        // cleanup
+        delete lil_mat;
+
+        return values;
+    }
+
+    /**
+     *  @see LILMatrix::dog_pattern()
+     */
+    template<typename VT>
+    std::vector< std::vector<VT> > dog_pattern(std::vector<int> pre_geometry, std::vector<int> post_geometry, float amp_pos, float sigma_pos, float amp_neg, float sigma_neg, double limit, bool allow_self_connections) {
+    #ifdef _DEBUG
+        std::cout << "CSRMatrix::dog_pattern()" << std::endl;
+    #endif
+        // Generate post_to_pre LIL
+        auto lil_mat = new LILMatrix<IT, ST, CT>(this->num_rows_, this->num_columns_);
+        auto values = lil_mat->template dog_pattern<VT>(pre_geometry, post_geometry, amp_pos, sigma_pos, amp_neg, sigma_neg, limit, allow_self_connections);
+
+        // Initialize from this LIL
+        init_matrix_from_lil(lil_mat->get_post_rank(), lil_mat->get_pre_ranks());
+
+        // cleanup
+        delete lil_mat;
+
+        return values;
+    }
+
     //
     //  Connectivity Accessor
     //
@@ -325,24 +465,24 @@ class CSRMatrix {
      *  @details    get column indices
      *  @returns    a list-in-list of column indices for all rows comprising of at least one element sorted by rows.
      */
-    std::vector<std::vector<IT>> get_pre_ranks() {
-        std::vector<std::vector<IT>> lil_pre_ranks;
+    std::vector<std::vector<CT>> get_pre_ranks() {
+        std::vector<std::vector<CT>> lil_pre_ranks;
 
         for(auto post_it=post_ranks_.begin(); post_it != post_ranks_.end(); post_it++) {
             auto beg = col_idx_.begin() + row_begin_[*post_it];
             auto end = col_idx_.begin() + row_begin_[*post_it+1];
 
-            lil_pre_ranks.push_back(std::vector<IT>(beg, end));
+            lil_pre_ranks.push_back(std::vector<CT>(beg, end));
         }
 
         return lil_pre_ranks;
     }
 
-    typename std::vector<IT> get_dendrite_pre_rank(IT lil_idx) {
+    typename std::vector<CT> get_dendrite_pre_rank(IT lil_idx) {
         IT row_idx = post_ranks_[lil_idx];
         auto beg = col_idx_.begin() + row_begin_[row_idx];
         auto end = col_idx_.begin() + row_begin_[row_idx+1];
-        return std::vector<IT>(beg, end);
+        return std::vector<CT>(beg, end);
     }
 
     /**
@@ -385,6 +525,18 @@ class CSRMatrix {
         return new_variable;
     }
 
+    template <typename VT>
+    std::vector<VT> init_matrix_variable_discrete_uniform(VT a, VT b, std::mt19937& rng) {
+    #ifdef _DEBUG
+        std::cout << "CSRMatrix::init_matrix_variable_discrete_uniform(): arguments = (" << a << ", " << b << ") and num_non_zeros_ = " << num_non_zeros_ << std::endl;
+    #endif
+        // the distribution is not defined for char types (e. g. compact delays)
+        std::uniform_int_distribution< typename std::common_type<VT, int>::type > dis (a,b);
+        auto new_variable = std::vector<VT>(num_non_zeros_, 0);
+        std::generate(new_variable.begin(), new_variable.end(), [&]{ return dis(rng); });
+        return new_variable;
+    }
+
     template <typename VT>
     std::vector<VT> init_matrix_variable_normal(VT mean, VT sigma, std::mt19937& rng) {
     #ifdef _DEBUG
@@ -427,6 +579,18 @@ class CSRMatrix {
         }
     }
 
+    /**
+     *  @brief      Update all nonzeros from a compressed row representation.
+     *  @details    The values are stored row by row in the order of init_matrix_from_csr() and converted to VT.
+     */
+    template <typename VT, typename DT, typename PT>
+    inline void update_matrix_variable_all(std::vector<VT> &variable, const CSRValues<DT, PT> &data)
+    {
+        for (size_t i = 0; i < post_ranks_.size(); i++) {
+            data.copy_row(i, variable.begin() + row_begin_[post_ranks_[i]]);
+        }
+    }
+
     template <typename VT>
     inline VT get_matrix_variable(const std::vector<VT> &variable, const IT lil_idx, const IT column_idx) {
         IT row_idx = post_ranks_[lil_idx];
@@ -523,7 +687,7 @@ class CSRMatrix {
         size += row_begin_.capacity() * sizeof(ST);
 
         size += sizeof(std::vector<IT>);
-        size += col_idx_.capacity() * sizeof(IT);
+        size += col_idx_.capacity() * sizeof(CT);
 
         size += sizeof(std::vector<IT>);
         size += post_ranks_.capacity() * sizeof(IT);
@@ -132,6 +132,20 @@ public:
         return host_to_device();
     }
 
+    template<typename PT, typename CT>
+    bool init_matrix_from_csr(const std::vector<IT> &row_indices, const PT* row_ptr, const CT* col_idx) {
+    #ifdef _DEBUG
+        std::cout << "CSRMatrixCUDA::init_matrix_from_csr() " << std::endl;
+    #endif
+        // Initialization on host side
+        bool success = static_cast<CSRMatrix<IT, ST>*>(this)->init_matrix_from_csr(row_indices, row_ptr, col_idx);
+        if (!success)
+            return false;
+
+        // transfer to GPU
+        return host_to_device();
+    }
+
     void fixed_number_pre_pattern(std::vector<IT> post_ranks, std::vector<IT> pre_ranks, IT nnz_per_row, std::mt19937& rng) {
     #ifdef _DEBUG
         std::cout << "CSRMatrixCUDA::fixed_number_pre_pattern()" << std::endl;
@@ -21,6 +21,9 @@
  */
 #pragma once
 
+// the C++ connectors build a temporary LIL
+#include "LILMatrix.hpp"
+
 /*
  *  @brief              Connectivity representation using a full matrix.
  *  @details            Contrary to all other classes in this template library this matrix format is not a sparse matrix.
@@ -272,7 +275,7 @@ public:
      *  @brief      initialize connectivity based on a provided LIL representation.
      *  @details    simply sets the post_rank and pre_rank arrays without further sanity checking.
      */
-    bool init_matrix_from_lil(std::vector<IT> &post_ranks, std::vector< std::vector<IT> > &pre_ranks) {
+    virtual bool init_matrix_from_lil(std::vector<IT> &post_ranks, std::vector< std::vector<IT> > &pre_ranks) {
     #ifdef _DEBUG
         std::cout << "DenseMatrix::init_matrix_from_lil()" << std::endl;
     #endif
@@ -301,6 +304,36 @@ public:
         return true;
     }
 
+    /**
+     *  @brief      initialize connectivity based on a compressed row representation.
+     *  @details    the i-th row (post_ranks[i]) contains the column indices col_idx[row_ptr[i]] to col_idx[row_ptr[i+1]-1].
+     */
+    template<typename PT, typename CT>
+    bool init_matrix_from_csr(const std::vector<IT> &post_ranks, const PT* row_ptr, const CT* col_idx) {
+    #ifdef _DEBUG
+        std::cout << "DenseMatrix::init_matrix_from_csr()" << std::endl;
+    #endif
+        // Sanity check: enough memory?
+        if (!check_free_memory(num_columns_ * num_rows_ * sizeof(MT)))
+            return false;
+
+        // Allocate mask
+        mask_ = std::vector<MT>(num_rows_ * num_columns_, static_cast<MT>(false));
+
+        // Iterate over the rows and update mask entries to *true* if nonzeros are existing.
+        for (IT lil_idx = 0; lil_idx < post_ranks.size(); lil_idx++) {
+            IT row_idx = post_ranks[lil_idx];
+            for (PT j = row_ptr[lil_idx]; j < row_ptr[lil_idx+1]; j++) {
+                if (row_major)
+                    mask_[row_idx * num_columns_ + col_idx[j]] = static_cast<MT>(true);
+                else
+                    mask_[col_idx[j] * num_rows_ + row_idx] = static_cast<MT>(true);
+            }
+        }
+
+        return true;
+    }
+
     /**
      *  @brief      reads in a .csv file which contains the matrix stored as COO.
      *  @details    this function creates also the variable array which is usually created in a separate
@@ -416,6 +449,112 @@ public:
         }
     }
 
+    /**
+     *  @see LILMatrix::fixed_number_post_pattern()
+     */
+    void fixed_number_post_pattern(std::vector<IT> post_ranks, std::vector<IT> pre_ranks, IT nnz_per_column, bool allow_self_connections, std::mt19937& rng) {
+    #ifdef _DEBUG
+        std::cout << "DenseMatrix::fixed_number_post_pattern()" << std::endl;
+    #endif
+        // Generate post_to_pre LIL
+        auto lil_mat = new LILMatrix<IT, ST>(this->num_rows_, this->num_columns_);
+        lil_mat->fixed_number_post_pattern(post_ranks, pre_ranks, nnz_per_column, allow_self_connections, rng);
+
+        // Initialize from this LIL
+        auto post_ranks_lil = lil_mat->get_post_rank();
+        auto pre_ranks_lil = lil_mat->get_pre_ranks();
+        init_matrix_from_lil(post_ranks_lil, pre_ranks_lil);
+
+        // cleanup
+        delete lil_mat;
+    }
+
+    /**
+     *  @see LILMatrix::all_to_all_pattern()
+     */
+    void all_to_all_pattern(std::vector<IT> post_ranks, std::vector<IT> pre_ranks, bool allow_self_connections) {
+    #ifdef _DEBUG
+        std::cout << "DenseMatrix::all_to_all_pattern()" << std::endl;
+    #endif
+        // Generate post_to_pre LIL
+        auto lil_mat = new LILMatrix<IT, ST>(this->num_rows_, this->num_columns_);
+        lil_mat->all_to_all_pattern(post_ranks, pre_ranks, allow_self_connections);
+
+        // Initialize from this LIL
+        auto post_ranks_lil = lil_mat->get_post_rank();
+        auto pre_ranks_lil = lil_mat->get_pre_ranks();
+        init_matrix_from_lil(post_ranks_lil, pre_ranks_lil);
+
+        // cleanup
+        delete lil_mat;
+    }
+
+    /**
+     *  @see LILMatrix::one_to_one_pattern()
+     */
+    void one_to_one_pattern(std::vector<IT> post_ranks, std::vector<IT> pre_ranks) {
+    #ifdef _DEBUG
+        std::cout << "DenseMatrix::one_to_one_pattern()" << std::endl;
+    #endif
+        // Generate post_to_pre LIL
+        auto lil_mat = new LILMatrix<IT, ST>(this->num_rows_, this->num_columns_);
+        lil_mat->one_to_one_pattern(post_ranks, pre_ranks);
+
+        // Initialize from this LIL
+        auto post_ranks_lil = lil_mat->get_post_rank();
+        auto pre_ranks_lil = lil_mat->get_pre_ranks();
+        init_matrix_from_lil(post_ranks_lil, pre_ranks_lil);
+
+        // cleanup
+        delete lil_mat;
+    }
+
+    /**
+     *  @see LILMatrix::gaussian_pattern()
+     */
+    template<typename VT>
+    std::vector< std::vector<VT> > gaussian_pattern(std::vector<int> pre_geometry, std::vector<int> post_geometry, float amp, float sigma, double limit, bool allow_self_connections) {
+    #ifdef _DEBUG
+        std::cout << "DenseMatrix::gaussian_pattern()" << std::endl;
+    #endif
+        // Generate post_to_pre LIL
+        auto lil_mat = new LILMatrix<IT, ST>(this->num_rows_, this->num_columns_);
+        auto values = lil_mat->template gaussian_pattern<VT>(pre_geometry, post_geometry, amp, sigma, limit, allow_self_connections);
+
+        // Initialize from this LIL
+        auto post_ranks_lil = lil_mat->get_post_rank();
+        auto pre_ranks_lil = lil_mat->get_pre_ranks();
+        init_matrix_from_lil(post_ranks_lil, pre_ranks_lil);
+
+        // cleanup
+        delete lil_mat;
+
+        return values;
+    }
+
+    /**
+     *  @see LILMatrix::dog_pattern()
+     */
+    template<typename VT>
+    std::vector< std::vector<VT> > dog_pattern(std::vector<int> pre_geometry, std::vector<int> post_geometry, float amp_pos, float sigma_pos, float amp_neg, float sigma_neg, double limit, bool allow_self_connections) {
+    #ifdef _DEBUG
+        std::cout << "DenseMatrix::dog_pattern()" << std::endl;
+    #endif
+        // Generate post_to_pre LIL
+        auto lil_mat = new LILMatrix<IT, ST>(this->num_rows_, this->num_columns_);
+        auto values = lil_mat->template dog_pattern<VT>(pre_geometry, post_geometry, amp_pos, sigma_pos, amp_neg, sigma_neg, limit, allow_self_connections);
+
+        // Initialize from this LIL
+        auto post_ranks_lil = lil_mat->get_post_rank();
+        auto pre_ranks_lil = lil_mat->get_pre_ranks();
+        init_matrix_from_lil(post_ranks_lil, pre_ranks_lil);
+
+        // cleanup
+        delete lil_mat;
+
+        return values;
+    }
+
     /**
      *  @details    Initialize a num_rows_ by num_columns_ matrix based on the stored connectivity.
      *  @tparam     VT              data type of the variable.
@@ -138,6 +138,20 @@ public:
         return host_to_device();
     }
 
+    template<typename PT, typename CT>
+    bool init_matrix_from_csr(const std::vector<IT> &row_indices, const PT* row_ptr, const CT* col_idx) {
+    #ifdef _DEBUG
+        std::cout << "DenseMatrixCUDA::init_matrix_from_csr() " << std::endl;
+    #endif
+        // Initialization on host side
+        bool success = static_cast<DenseMatrix<IT, ST, MT, row_major>*>(this)->init_matrix_from_csr(row_indices, row_ptr, col_idx);
+        if (!success)
+            return false;
+
+        // transfer to GPU
+        return host_to_device();
+    }
+
     void fixed_probability_pattern(std::vector<int> post_ranks, std::vector<int> pre_ranks, double p, bool allow_self_connections, std::mt19937& rng) {
     #ifdef _DEBUG
         std::cout << "CSRMatrixCUDA::fixed_probability_pattern() " << std::endl;
@@ -175,6 +175,38 @@ public:
         return true;
     }
 
+    /**
+     *  @brief      initialize connectivity based on a compressed row representation.
+     *  @details    the i-th row (post_ranks[i]) contains the column indices col_idx[row_ptr[i]] to col_idx[row_ptr[i+1]-1].
+     */
+    template<typename PT, typename CT>
+    bool init_matrix_from_csr(const std::vector<IT> &post_ranks, const PT* row_ptr, const CT* col_idx) {
+    #ifdef _DEBUG
+        std::cout << "DenseMatrixOffsets::init_matrix_from_csr()" << std::endl;
+    #endif
+        // Sanity check: enough memory?
+        if (!this->check_free_memory(this->num_columns_ * this->num_rows_ * sizeof(MT)))
+            return false;
+
+        // Allocate mask
+        this->mask_ = std::vector<MT>(this->num_rows_ * this->num_columns_, static_cast<MT>(false));
+
+        // Iterate over the rows and update mask entries to *true* if nonzeros are existing.
+        for (IT lil_idx = 0; lil_idx < post_ranks.size(); lil_idx++) {
+            IT row_idx = post_ranks[lil_idx] - low_row_rank_;
+
+            for (PT j = row_ptr[lil_idx]; j < row_ptr[lil_idx+1]; j++) {
+                IT column_idx = col_idx[j] - low_column_rank_;
+                if (row_major)
+                    this->mask_[row_idx * this->num_columns_ + column_idx] = static_cast<MT>(true);
+                else
+                    this->mask_[column_idx * this->num_rows_ + row_idx] = static_cast<MT>(true);
+            }
+        }
+
+        return true;
+    }
+
     /**
      *  @brief      get a list of pre-synaptic neuron ranks and their efferent connections.
      *  @details    while the LILMatrix::nb_synapses and LILMatrix::nb_synapses_per_dendrite are row-centered this
@@ -20,6 +20,8 @@
  */
 #pragma once
 
+#include "helper_functions.hpp"
+
 /**
  *  @brief      ELLPACK sparse matrix representation according to Kincaid et al. (1989) with some
  *              minor modifications as described below.
@@ -394,6 +396,56 @@ class ELLMatrix {
         return true;
     }
 
+    /**
+     *  @brief      initialize connectivity based on a compressed row representation.
+     *  @details    the i-th row (post_ranks[i]) contains the column indices col_idx[row_ptr[i]] to col_idx[row_ptr[i+1]-1].
+     *  @see        ELLMatrix::init_matrix_from_lil()
+     */
+    template<typename PT, typename CT>
+    bool init_matrix_from_csr(const std::vector<IT> &post_ranks, const PT* row_ptr, const CT* col_idx) {
+    #ifdef _DEBUG
+        std::cout << "ELLMatrix::init_matrix_from_csr()" << std::endl;
+        std::cout << "received " << post_ranks.size() << " rows." << std::endl;
+    #endif
+        assert( (post_ranks.size() <= num_rows_) );
+
+        // maximum row length
+        post_ranks_ = post_ranks;
+        maxnzr_ = std::numeric_limits<IT>::min();
+        for (size_t r = 0; r < post_ranks.size(); r++) {
+            if ( maxnzr_ < static_cast<IT>(row_ptr[r+1] - row_ptr[r]) ) {
+                maxnzr_ = row_ptr[r+1] - row_ptr[r];
+            }
+        }
+
+        // Test if we produce an overflow for ST
+        assert( (static_cast<unsigned long int>(post_ranks.size() * maxnzr_) < static_cast<unsigned long int>(std::numeric_limits<ST>::max())) );
+
+        // Test if the matrix fits into memory
+        if (!check_free_memory(maxnzr_ * post_ranks_.size() * sizeof(IT))) {
+            clear();
+            return false;
+        }
+
+        // copy the indices, std::numeric_limits<IT>::max() encodes the non-existing elements
+        col_idx_ = std::vector<IT>(maxnzr_ * post_ranks_.size(), std::numeric_limits<IT>::max());
+        int num_rows = post_ranks_.size();
+        for (int r = 0; r < num_rows; r++) {
+            for (PT j = row_ptr[r]; j < row_ptr[r+1]; j++) {
+                if (row_major)
+                    col_idx_[r * maxnzr_ + (j - row_ptr[r])] = col_idx[j];
+                else
+                    col_idx_[(j - row_ptr[r]) * num_rows + r] = col_idx[j];
+            }
+        }
+    #ifdef _DEBUG
+        std::cout << "created ELLMatrix:" << std::endl;
+        this->print_matrix_statistics();
+    #endif
+
+        return true;
+    }
+
     /**
      *  @brief      reads in a .csv file which contains the matrix stored as COO.
      *  @details    this function creates also the variable array, which is usually performed afterwards.
@@ -526,6 +578,29 @@ class ELLMatrix {
         }
     }
 
+    /**
+     *  @details    Updates all matrix values based on a compressed row representation
+     *  @tparam     VT              data type of the variable.
+     *  @param[in]  variable        ELLPACK variable container
+     *  @param[in]  data            values stored row by row in the order of init_matrix_from_csr()
+     */
+    template <typename VT, typename DT, typename PT>
+    inline void update_matrix_variable_all(std::vector<VT> &variable, const CSRValues<DT, PT> &data) {
+    #ifdef _DEBUG
+        std::cout << "ELLMatrix::update_matrix_variable_all()" << std::endl;
+    #endif
+        int num_rows = post_ranks_.size();
+        for(IT r = 0; r < num_rows; r++) {
+            if (row_major) {
+                data.copy_row(r, variable.begin() + r*maxnzr_);
+            } else {
+                for(IT c = 0; c < data.row_size(r); c++) {
+                    variable[c*num_rows+r] = data.get(r, c);
+                }
+            }
+        }
+    }
+
     /**
      *  @details    Updates a row of the matrix.
      *  @tparam     VT              data type of the variable.
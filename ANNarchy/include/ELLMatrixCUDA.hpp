@@ -134,6 +134,22 @@ public:
         return host_to_device_transfer();
     }
 
+    template<typename PT, typename CT>
+    bool init_matrix_from_csr(const std::vector<IT> &post_ranks, const PT* row_ptr, const CT* col_idx) {
+        assert( (post_ranks.size() > 0) );
+
+    #ifdef _DEBUG
+        std::cout << "ELLMatrixCUDA::init_matrix_from_csr()" << std::endl;
+    #endif
+        // Initialize on host
+        bool success = static_cast<ELLMatrix<IT, ST, false>*>(this)->init_matrix_from_csr(post_ranks, row_ptr, col_idx);
+        if(!success)
+            return false;
+
+        // Initialize on device and transfer data
+        return host_to_device_transfer();
+    }
+
     void fixed_number_pre_pattern(std::vector<IT> post_ranks, std::vector<IT> pre_ranks, IT nnz_per_row, std::mt19937& rng) {
     #ifdef _DEBUG
         std::cout << "ELLMatrixCUDA::fixed_number_pre_pattern()" << std::endl;
@@ -331,6 +331,51 @@ public:
         return true;
     }
 
+    /**
+     *  @brief      initialize connectivity based on a compressed row representation.
+     *  @details    the i-th row (post_ranks[i]) contains the column indices col_idx[row_ptr[i]] to col_idx[row_ptr[i+1]-1].
+     *  @see        ELLRMatrix::init_matrix_from_lil()
+     */
+    template<typename PT, typename CT>
+    bool init_matrix_from_csr(const std::vector<IT> &post_ranks, const PT* row_ptr, const CT* col_idx) {
+    #ifdef _DEBUG
+        std::cout << "ELLRMatrix::init_matrix_from_csr()" << std::endl;
+    #endif
+        // Store the LIL ranks
+        post_ranks_ = post_ranks;
+
+        // row lengths and maximum row length
+        rl_ = std::vector<IT>(post_ranks_.size());
+        for (size_t r = 0; r < post_ranks_.size(); r++) {
+            rl_[r] = row_ptr[r+1] - row_ptr[r];
+        }
+        maxnzr_ = rl_.empty() ? 0 : *std::max_element(rl_.begin(), rl_.end());
+
+        // Test if we produce an overflow for ST
+        assert( (static_cast<unsigned long int>(post_ranks_.size() * maxnzr_) < static_cast<unsigned long int>(std::numeric_limits<ST>::max())) );
+
+        // Test if the matrix fits into memory
+        if (!check_free_memory(maxnzr_ * post_ranks_.size() * sizeof(IT)))
+            return false;
+
+        // copy the indices, rl_ encodes the "real" row length
+        int num_rows = post_ranks_.size();
+        col_idx_ = std::vector<IT>(maxnzr_ * num_rows, 0);
+        for (int r = 0; r < num_rows; r++) {
+            for (PT j = row_ptr[r]; j < row_ptr[r+1]; j++) {
+                if (row_major)
+                    col_idx_[r * maxnzr_ + (j - row_ptr[r])] = col_idx[j];
+                else
+                    col_idx_[(j - row_ptr[r]) * num_rows + r] = col_idx[j];
+            }
+        }
+    #ifdef _DEBUG
+        std::cout << "created ELLRMatrix:" << std::endl;
+        this->print_matrix_statistics();
+    #endif
+        return true;
+    }
+
     /**
      *  @brief      reads in a .csv file which contains the matrix stored as COO.
      *  @details    this function creates also the variable array, which is usually performed afterwards.
@@ -522,6 +567,25 @@ public:
         }
     }
 
+    /**
+     *  @details    Updates all matrix values based on a compressed row representation
+     *  @tparam     VT              data type of the variable.
+     *  @param[in]  variable        ELLPACK variable container
+     *  @param[in]  data            values stored row by row in the order of init_matrix_from_csr()
+     */
+    template <typename VT, typename DT, typename PT>
+    inline void update_matrix_variable_all(std::vector<VT> &variable, const CSRValues<DT, PT> &data) {
+        for(IT r = 0; r < post_ranks_.size(); r++) {
+            if (row_major) {
+                data.copy_row(r, variable.begin() + r*maxnzr_);
+            } else {
+                for(IT c = 0; c < rl_[r]; c++) {
+                    variable[c*post_ranks_.size()+r] = data.get(r, c);
+                }
+            }
+        }
+    }
+
     /**
      *  @details    Updates a row of the matrix.
      *  @tparam     VT              data type of the variable.
@@ -147,6 +147,22 @@ public:
         return host_to_device_transfer();
     }
 
+    template<typename PT, typename CT>
+    bool init_matrix_from_csr(const std::vector<IT> &post_ranks, const PT* row_ptr, const CT* col_idx) {
+        assert( (post_ranks.size() > 0) );
+
+    #ifdef _DEBUG
+        std::cout << "ELLRMatrixCUDA::init_matrix_from_csr()" << std::endl;
+    #endif
+        bool success = static_cast<ELLRMatrix<IT, ST, false>*>(this)->init_matrix_from_csr(post_ranks, row_ptr, col_idx);
+        if (!success) {
+            std::cerr << "ELLRMatrixCUDA::init_matrix_from_csr(): host side construction failed." << std::endl;
+            return false;
+        }
+
+        return host_to_device_transfer();
+    }
+
     bool fixed_number_pre_pattern(std::vector<IT> post_ranks, std::vector<IT> pre_ranks, IT nnz_per_row, std::mt19937& rng) {
     #ifdef _DEBUG
         std::cout << "ELLRMatrixCUDA::fixed_number_pre_pattern()" << std::endl;
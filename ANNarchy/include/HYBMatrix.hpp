@@ -87,6 +87,27 @@ class HYBMatrix {
             row_length_hist[it->size()]++;
         }
 
+        return select_ell_size(row_length_hist);
+    }
+
+    /**
+     *  @brief      determines the ELLPACK partition size from a compressed row representation.
+     *  @see        HYBMatrix::determine_ell_size_hist()
+     */
+    template<typename PT>
+    IT determine_ell_size_hist(const std::vector<IT> &row_indices, const PT* row_ptr) {
+        std::map<IT, int> row_length_hist;
+        for (size_t lil_idx = 0; lil_idx < row_indices.size(); lil_idx++) {
+            row_length_hist[row_ptr[lil_idx+1] - row_ptr[lil_idx]]++;
+        }
+
+        return select_ell_size(row_length_hist);
+    }
+
+    /**
+     *  @brief      selects the most frequent row-length of a histogram.
+     */
+    IT select_ell_size(const std::map<IT, int> &row_length_hist) {
     #ifdef _DEBUG
         std::cout << "Row-length distribution: " << std::endl;
         for (auto it = row_length_hist.begin(); it != row_length_hist.end(); it++) {
@@ -329,6 +350,43 @@ class HYBMatrix {
         return true;
     }
 
+    /**
+     *  @brief      initialize connectivity based on a compressed row representation.
+     *  @details    the i-th row (row_indices[i]) contains the column indices col_idx[row_ptr[i]] to col_idx[row_ptr[i+1]-1].
+     *              The first ell_size entries of each row are stored in the ELLPACK partition, the remaining ones in the
+     *              COO partition.
+     */
+    template<typename PT, typename CT>
+    bool init_matrix_from_csr(const std::vector<IT> &row_indices, const PT* row_ptr, const CT* col_idx, unsigned int ell_size=std::numeric_limits<unsigned int>::max()) {
+        if (ell_size != std::numeric_limits<unsigned int>::max()) {
+            ell_size_ = ell_size;
+        } else {
+            ell_size_ = determine_ell_size_hist(row_indices, row_ptr);
+        }
+    #ifdef _DEBUG
+        std::cout << "HYBMatrix::init_matrix_from_csr()" << std::endl;
+        std::cout << "  ell_size = " << ell_size_ << std::endl;
+    #endif
+
+        std::vector<PT> ell_row_ptr(1, 0), coo_row_ptr(1, 0);
+        std::vector<CT> ell_col_idx, coo_col_idx;
+        for (size_t lil_idx = 0; lil_idx < row_indices.size(); lil_idx++) {
+            PT row_split = std::min<PT>(row_ptr[lil_idx] + ell_size_, row_ptr[lil_idx+1]);
+
+            ell_col_idx.insert(ell_col_idx.end(), col_idx + row_ptr[lil_idx], col_idx + row_split);
+            coo_col_idx.insert(coo_col_idx.end(), col_idx + row_split, col_idx + row_ptr[lil_idx+1]);
+            ell_row_ptr.push_back(ell_col_idx.size());
+            coo_row_ptr.push_back(coo_col_idx.size());
+        }
+
+        bool ell_success = ell_matrix_->init_matrix_from_csr(row_indices, ell_row_ptr.data(), ell_col_idx.data());
+        bool coo_success = coo_matrix_->init_matrix_from_csr(row_indices, coo_row_ptr.data(), coo_col_idx.data());
+        if (!ell_success || !coo_success)
+            return false;
+
+        return true;
+    }
+
     /**
      *  @brief      reads in a .csv file which contains the matrix stored as COO.
      *  @details    this function creates also the variable array, which is usually performed afterwards.
@@ -446,6 +504,23 @@ class HYBMatrix {
         }
     }
 
+    template <typename VT, typename DT, typename PT>
+    inline void update_matrix_variable_all(hyb_local<VT>* variable, const CSRValues<DT, PT> &data) {
+    #ifdef _DEBUG
+        std::cout << "HYBMatrix()::update_matrix_variable_all()" << std::endl;
+    #endif
+
+        for (int lil_idx = 0; lil_idx < ell_matrix_->nb_dendrites(); lil_idx++) {
+            auto row = data.template row<VT>(lil_idx);
+            if (row.size() <= ell_size_) {
+                ell_matrix_->update_matrix_variable_row(variable->ell, lil_idx, row);
+            } else {
+                ell_matrix_->update_matrix_variable_row(variable->ell, lil_idx, std::vector<VT>(row.begin(), row.begin()+ell_size_));
+                coo_matrix_->update_matrix_variable_row(variable->coo, lil_idx, std::vector<VT>(row.begin()+ell_size_, row.end()));
+            }
+        }
+    }
+
     template <typename VT>
     inline void update_matrix_variable_row(hyb_local<VT>* variable, const IT lil_idx, const std::vector<VT> data) {
         std::cerr << "Not implemented" << std::endl;
@@ -117,6 +117,35 @@ class HYBMatrixCUDA: public HYBMatrix<IT, ST, false>
         return true;
     }
 
+    template<typename PT, typename CT>
+    bool init_matrix_from_csr(const std::vector<IT> &row_indices, const PT* row_ptr, const CT* col_idx, unsigned int ell_size=std::numeric_limits<unsigned int>::max()) {
+    #ifdef _DEBUG
+        std::cout << "HYBMatrixCUDA::init_matrix_from_csr()" << std::endl;
+    #endif
+        // Create matrix on host-side
+        bool success = static_cast<HYBMatrix<IT, ST, false>*>(this)->init_matrix_from_csr(row_indices, row_ptr, col_idx, ell_size);
+        if (!success)
+            return false;
+
+        // store sizes for verification
+        auto ell_nb_synapses = static_cast<HYBMatrix<IT, ST, false>*>(this)->get_ell_instance()->nb_synapses();
+        auto coo_nb_synapses = static_cast<HYBMatrix<IT, ST, false>*>(this)->get_coo_instance()->nb_synapses();
+
+        // Initialize GPU side
+        ell_matrix_gpu = new ELLMatrixCUDA<IT, ST>(static_cast<HYBMatrix<IT, ST, false>*>(this)->get_ell_instance());
+        coo_matrix_gpu = new COOMatrixCUDA<IT, ST>(static_cast<HYBMatrix<IT, ST, false>*>(this)->get_coo_instance());
+        
+        // Re-assign host side pointer: they will first destroy the already existing instances and then set the
+        // new pointers
+        this->replace_pointer( static_cast<ELLMatrix<IT, ST, false>*>(ell_matrix_gpu), static_cast<COOMatrix<IT, ST>*>(coo_matrix_gpu) );
+
+        // verify
+        assert( (ell_nb_synapses == static_cast<HYBMatrix<IT, ST, false>*>(this)->get_ell_instance()->nb_synapses()) );
+        assert( (coo_nb_synapses == static_cast<HYBMatrix<IT, ST, false>*>(this)->get_coo_instance()->nb_synapses()) );
+
+        return true;
+    }
+
     template<typename VT>
     hyb_local_gpu<VT>* init_matrix_variable_gpu(const hyb_local<VT>* host_variable) {
         auto new_variable = new hyb_local_gpu<VT>();
@@ -148,6 +148,26 @@ public:
         return true;
     }
 
+    /**
+     *  @see    LILMatrix::init_matrix_from_csr()
+     */
+    template<typename PT, typename CT>
+    bool init_matrix_from_csr(const std::vector<IT> &row_indices, const PT* row_ptr, const CT* col_idx) {
+    #ifdef _DEBUG
+        std::cout << "LILInvMatrix::init_matrix_from_csr():" << std::endl;
+    #endif
+        // create forward view
+        bool success = static_cast<LILMatrix<IT, ST>*>(this)->init_matrix_from_csr(row_indices, row_ptr, col_idx);
+        if (!success)
+            return false;
+
+        // compute backward view
+        inverse_connectivity_matrix();
+
+        // done
+        return true;
+    }
+
     /**
      *  @brief      reads in a .csv file which contains the matrix stored as COO.
      *  @details    this function creates also the variable array which is usually created/initialized afterwards.
@@ -198,6 +218,82 @@ public:
         inverse_connectivity_matrix();
     }
 
+    /**
+     *  @see LILMatrix::fixed_number_post_pattern()
+     */
+    void fixed_number_post_pattern(std::vector<IT> post_ranks, std::vector<IT> pre_ranks, IT nnz_per_column, bool allow_self_connections, std::mt19937& rng) {
+    #ifdef _DEBUG
+        std::cout << "LILInvMatrix::fixed_number_post_pattern():" << std::endl;
+    #endif
+        // create forward view
+        static_cast<LILMatrix<IT, ST>*>(this)->fixed_number_post_pattern(post_ranks, pre_ranks, nnz_per_column, allow_self_connections, rng);
+
+        // compute backward view
+        inverse_connectivity_matrix();
+    }
+
+    /**
+     *  @see LILMatrix::all_to_all_pattern()
+     */
+    void all_to_all_pattern(std::vector<IT> post_ranks, std::vector<IT> pre_ranks, bool allow_self_connections) {
+    #ifdef _DEBUG
+        std::cout << "LILInvMatrix::all_to_all_pattern():" << std::endl;
+    #endif
+        // create forward view
+        static_cast<LILMatrix<IT, ST>*>(this)->all_to_all_pattern(post_ranks, pre_ranks, allow_self_connections);
+
+        // compute backward view
+        inverse_connectivity_matrix();
+    }
+
+    /**
+     *  @see LILMatrix::one_to_one_pattern()
+     */
+    void one_to_one_pattern(std::vector<IT> post_ranks, std::vector<IT> pre_ranks) {
+    #ifdef _DEBUG
+        std::cout << "LILInvMatrix::one_to_one_pattern():" << std::endl;
+    #endif
+        // create forward view
+        static_cast<LILMatrix<IT, ST>*>(this)->one_to_one_pattern(post_ranks, pre_ranks);
+
+        // compute backward view
+        inverse_connectivity_matrix();
+    }
+
+    /**
+     *  @see LILMatrix::gaussian_pattern()
+     */
+    template<typename VT>
+    std::vector< std::vector<VT> > gaussian_pattern(std::vector<int> pre_geometry, std::vector<int> post_geometry, float amp, float sigma, double limit, bool allow_self_connections) {
+    #ifdef _DEBUG
+        std::cout << "LILInvMatrix::gaussian_pattern():" << std::endl;
+    #endif
+        // create forward view
+        auto values = static_cast<LILMatrix<IT, ST>*>(this)->template gaussian_pattern<VT>(pre_geometry, post_geometry, amp, sigma, limit, allow_self_connections);
+
+        // compute backward view
+        inverse_connectivity_matrix();
+
+        return values;
+    }
+
+    /**
+     *  @see LILMatrix::dog_pattern()
+     */
+    template<typename VT>
+    std::vector< std::vector<VT> > dog_pattern(std::vector<int> pre_geometry, std::vector<int> post_geometry, float amp_pos, float sigma_pos, float amp_neg, float sigma_neg, double limit, bool allow_self_connections) {
+    #ifdef _DEBUG
+        std::cout << "LILInvMatrix::dog_pattern():" << std::endl;
+    #endif
+        // create forward view
+        auto values = static_cast<LILMatrix<IT, ST>*>(this)->template dog_pattern<VT>(pre_geometry, post_geometry, amp_pos, sigma_pos, amp_neg, sigma_neg, limit, allow_self_connections);
+
+        // compute backward view
+        inverse_connectivity_matrix();
+
+        return values;
+    }
+
     void print_data_representation() {
         // Forward view
         static_cast<LILMatrix<IT, ST>*>(this)->print_data_representation();
@@ -23,6 +23,8 @@
  */
 #pragma once
 
+#include "helper_functions.hpp"
+
 /**
  *  @brief      Implementation of the *list-in-list* (LIL) sparse matrix format.
  *  @details    The LIL format comprises of a nested vector *pre_rank*, where the top-level indicates a row and the sub-level vector
@@ -99,15 +101,18 @@
  * 
  *              ST      the second type should be used if the index type IT could overflow. For instance, the nb_synapses method should return ST as
  *                      the maximum value in case a full dense matrix would be IT times IT entries.
+ *
+ *              CT      data type to store the column indices (LILMatrix::pre_rank). It only needs to represent LILMatrix::num_columns_, so it can be
+ *                      smaller than IT if the matrix has less columns than rows.
  */
-template<typename IT = unsigned int, typename ST = unsigned long int>
+template<typename IT = unsigned int, typename ST = unsigned long int, typename CT = IT>
 class LILMatrix {
 public:
     const IT num_rows_;                     ///< maximum number of rows which equals the maximum length of post_rank as well as maximum size of top-level of pre_rank.
     const IT num_columns_;                  ///< maximum number of columns which equals the maximum available size in the sub-level vectors.
 
     std::vector<IT> post_rank;              ///< indices of existing rows
-    std::vector<std::vector<IT> > pre_rank; ///< column indices sorted by rows
+    std::vector<std::vector<CT> > pre_rank; ///< column indices sorted by rows
 
 public:
     /**
@@ -119,6 +124,7 @@ public:
         num_rows_(num_rows), num_columns_(num_columns) {
         assert ( (static_cast<unsigned long int>(num_rows) <= static_cast<unsigned long int>(std::numeric_limits<IT>::max())) );
         assert ( (static_cast<unsigned long int>(num_columns) <= static_cast<unsigned long int>(std::numeric_limits<IT>::max())) );
+        assert ( (static_cast<unsigned long int>(num_columns) <= static_cast<unsigned long int>(std::numeric_limits<CT>::max())) );
 
     #ifdef _DEBUG
         std::cout << "LILMatrix::LILMatrix() with dense dimensions " << static_cast<long>(this->num_rows_) << " times " << static_cast<long>(this->num_columns_) << std::endl;
@@ -162,14 +168,14 @@ public:
      *  @details    get column indices
      *  @returns    a list-in-list of column indices for all rows comprising of at least one element sorted by rows.
      */
-    std::vector<std::vector<IT>> get_pre_ranks() { return pre_rank; }
+    std::vector<std::vector<CT>> get_pre_ranks() { return pre_rank; }
 
     /**
      *  @details    get column indices of a specific row.
      *  @param[in]  lil_idx     index of the selected row. To get the correct index use the post_rank array, e. g. lil_idx = post_ranks.find(row_idx).
      *  @returns    a list of column indices of a specific row.
      */
-    std::vector<IT> get_dendrite_pre_rank(IT lil_idx) {
+    std::vector<CT> get_dendrite_pre_rank(IT lil_idx) {
         assert( (lil_idx < pre_rank.size()) );
 
         return pre_rank[lil_idx];
@@ -212,7 +218,7 @@ public:
      *  @brief      initialize connectivity based on a provided LIL representation.
      *  @details    simply sets the post_rank and pre_rank arrays without further sanity checking.
      */
-    bool init_matrix_from_lil(std::vector<IT> &post_ranks, std::vector< std::vector<IT> > &pre_ranks) {
+    bool init_matrix_from_lil(std::vector<IT> &post_ranks, std::vector< std::vector<CT> > &pre_ranks) {
     #ifdef _DEBUG
         std::cout << "LILMatrix::init_matrix_from_lil()" << std::endl;
     #endif
@@ -230,6 +236,34 @@ public:
         return true;
     }
 
+    /**
+     *  @brief      initialize connectivity based on a compressed row representation.
+     *  @details    the i-th row (post_ranks[i]) contains the column indices col_idx[row_ptr[i]] to col_idx[row_ptr[i+1]-1],
+     *              i. e. row_ptr contains post_ranks.size()+1 entries. Avoids the nested vectors required by init_matrix_from_lil().
+     *  @tparam     PT          data type of the row pointers
+     *  @tparam     XT          data type of the provided column indices
+     */
+    template<typename PT, typename XT>
+    bool init_matrix_from_csr(const std::vector<IT> &post_ranks, const PT* row_ptr, const XT* col_idx) {
+    #ifdef _DEBUG
+        std::cout << "LILMatrix::init_matrix_from_csr()" << std::endl;
+    #endif
+        // Sanity checks
+        assert ( (post_ranks.size() <= num_rows_) );
+
+        // store the data
+        this->post_rank = post_ranks;
+        this->pre_rank = std::vector< std::vector<CT> >(post_ranks.size());
+        for (size_t i = 0; i < post_ranks.size(); i++) {
+            this->pre_rank[i] = std::vector<CT>(col_idx + row_ptr[i], col_idx + row_ptr[i+1]);
+        }
+
+    #ifdef _DEBUG
+        print_matrix_statistics();
+    #endif
+        return true;
+    }
+
     /**
      *  @brief      reads in a .csv file which contains the matrix stored as COO.
      *  @details    this function creates also the variable array which is usually created in a separate
@@ -243,7 +277,7 @@ public:
     #ifdef _DEBUG
         std::cout << "LILMatrix::init_matrix_from_csv()" << std::endl;
     #endif
-        auto tmp_col_idx = std::vector< std::vector < IT > >(num_rows_, std::vector<IT>());
+        auto tmp_col_idx = std::vector< std::vector < CT > >(num_rows_, std::vector<CT>());
         auto tmp_values = std::vector< std::vector < VT > >(num_rows_, std::vector<VT>());
 
         // Load as LIL
@@ -255,7 +289,8 @@ public:
             auto coo_triplet = std::vector<std::string>(3);
 
             std::string line = "";
-            IT r_cast, c_cast;
+            IT r_cast;
+            CT c_cast;
             VT v_cast;
 
             // Iterate through each line and split the content using delimeter
@@ -272,11 +307,11 @@ public:
 
                 if (zero_based) {
                     r_cast = static_cast<IT>(atoi(coo_triplet[0].data()));
-                    c_cast = static_cast<IT>(atoi(coo_triplet[1].data()));
+                    c_cast = static_cast<CT>(atoi(coo_triplet[1].data()));
                     v_cast = static_cast<VT>(atof(coo_triplet[2].data()));
                 } else {
                     r_cast = static_cast<IT>(atoi(coo_triplet[0].data()) -1);
-                    c_cast = static_cast<IT>(atoi(coo_triplet[1].data()) -1);
+                    c_cast = static_cast<CT>(atoi(coo_triplet[1].data()) -1);
                     v_cast = static_cast<VT>(atof(coo_triplet[2].data()));
                 }
                 //std::cout << r_cast << ", " << c_cast << ", " << v_cast << std::endl;
@@ -287,7 +322,7 @@ public:
 
         // create a LIL from the read data
         auto lil_ranks = std::vector<IT>();
-        auto lil_col_idx = std::vector<std::vector<IT>>();
+        auto lil_col_idx = std::vector<std::vector<CT>>();
         auto lil_values = std::vector<std::vector<VT>>();
         for(auto row = 0; row < num_rows_; row++) {
             
@@ -323,7 +358,7 @@ public:
         std::cout << " nnz per row: " << nnz_per_row << std::endl;
     #endif
         post_rank = post_ranks;
-        pre_rank = std::vector< std::vector<IT> >(post_rank.size(), std::vector<IT>());
+        pre_rank = std::vector< std::vector<CT> >(post_rank.size(), std::vector<CT>());
 
         // for each row we select a subset of the provided pre ranks
         for(auto lil_idx = 0; lil_idx < post_ranks.size(); lil_idx++) {
@@ -331,7 +366,7 @@ public:
             std::shuffle(pre_ranks.begin(), pre_ranks.end(), rng);
 
             // select nnz_per_row elements
-            auto tmp_col_indices = std::vector<IT>(pre_ranks.begin(), pre_ranks.begin()+nnz_per_row);
+            auto tmp_col_indices = std::vector<CT>(pre_ranks.begin(), pre_ranks.begin()+nnz_per_row);
             
             // sort the indices before storage
             std::sort(tmp_col_indices.begin(), tmp_col_indices.end());
@@ -359,7 +394,7 @@ public:
         auto dis = std::uniform_real_distribution<double>(0.0, 1.0);
 
         post_rank = post_ranks;
-        pre_rank = std::vector< std::vector<IT> >(post_rank.size(), std::vector<IT>());
+        pre_rank = std::vector< std::vector<CT> >(post_rank.size(), std::vector<CT>());
 
         for(auto lil_idx = 0; lil_idx < post_ranks.size(); lil_idx++) {
             // only relevant if allow_self_connections == false
@@ -371,7 +406,7 @@ public:
                     continue;
 
                 if (dis(rng) < p)
-                    pre_rank[lil_idx].push_back(*it);
+                    pre_rank[lil_idx].push_back(static_cast<CT>(*it));
             }
 
             // free unnecessary allocated memory
@@ -381,6 +416,255 @@ public:
         return true;
     }
 
+    /**
+     *  @brief      initialize connectivity using a fixed_number_post pattern
+     *  @details    For more details on this pattern see the ANNarchy Documentation.
+     *  @param[in]  post_ranks      list of row indices which are potential targets.
+     *  @param[in]  pre_ranks       list of column indices, each pre-synaptic neuron is connected to nnz_per_column rows.
+     *  @param[in]  nnz_per_column  number of post-synaptic neurons which should be randomly selected for each pre-synaptic neuron.
+     *  @param[in]  rng             a merseanne twister generator (need to be seeded in prior if necessary)
+     */
+    bool fixed_number_post_pattern(std::vector<IT> post_ranks, std::vector<IT> pre_ranks, IT nnz_per_column, bool allow_self_connections, std::mt19937& rng) {
+    #ifdef _DEBUG
+        std::cout << "LILMatrix::fixed_number_post_pattern()" << std::endl;
+        std::cout << " columns: " << pre_ranks.size() << std::endl;
+        std::cout << " nnz per column: " << nnz_per_column << std::endl;
+        std::cout << " self_connections: " << allow_self_connections << std::endl;
+    #endif
+        auto tmp_pre_rank = std::vector< std::vector<CT> >(post_ranks.size(), std::vector<CT>());
+
+        // positions[location[r]] == r, the first entries of positions are the selected rows
+        auto positions = std::vector<IT>(post_ranks.size());
+        auto location = std::vector<IT>(post_ranks.size());
+        for (IT pos = 0; pos < positions.size(); pos++) {
+            positions[pos] = pos;
+            location[pos] = pos;
+        }
+        auto swap_positions = [&](IT i, IT j) {
+            std::swap(positions[i], positions[j]);
+            location[positions[i]] = i;
+            location[positions[j]] = j;
+        };
+
+        // row of each post-synaptic rank, to exclude self-connections
+        auto row_of_rank = std::map<IT, IT>();
+        if (!allow_self_connections) {
+            for (IT pos = 0; pos < post_ranks.size(); pos++)
+                row_of_rank[post_ranks[pos]] = pos;
+        }
+
+        // the pre-synaptic ranks are visited in order, so the rows are sorted
+        std::sort(pre_ranks.begin(), pre_ranks.end());
+        for (auto col_it = pre_ranks.cbegin(); col_it != pre_ranks.cend(); col_it++) {
+            // the row of the same neuron is moved to the end and excluded
+            IT nb_candidates = positions.size();
+            if (!allow_self_connections) {
+                auto self = row_of_rank.find(*col_it);
+                if (self != row_of_rank.end()) {
+                    swap_positions(location[self->second], nb_candidates-1);
+                    nb_candidates--;
+                }
+            }
+
+            // partial Fisher-Yates shuffle over the candidates
+            IT nb_selected = std::min(nnz_per_column, nb_candidates);
+            for (IT i = 0; i < nb_selected; i++) {
+                auto dis = std::uniform_int_distribution<IT>(i, nb_candidates-1);
+                swap_positions(i, dis(rng));
+                tmp_pre_rank[positions[i]].push_back(static_cast<CT>(*col_it));
+            }
+        }
+
+        // empty rows are not stored
+        post_rank.clear();
+        pre_rank.clear();
+        for (IT lil_idx = 0; lil_idx < post_ranks.size(); lil_idx++) {
+            if (tmp_pre_rank[lil_idx].empty())
+                continue;
+            post_rank.push_back(post_ranks[lil_idx]);
+            pre_rank.push_back(std::move(tmp_pre_rank[lil_idx]));
+        }
+
+        return true;
+    }
+
+    /**
+     *  @brief      initialize connectivity using an all_to_all pattern
+     *  @details    For more details on this pattern see the ANNarchy Documentation.
+     *  @param[in]  post_ranks  list of row indices.
+     *  @param[in]  pre_ranks   list of column indices, every row contains all of them.
+     */
+    bool all_to_all_pattern(std::vector<IT> post_ranks, std::vector<IT> pre_ranks, bool allow_self_connections) {
+    #ifdef _DEBUG
+        std::cout << "LILMatrix::all_to_all_pattern()" << std::endl;
+        std::cout << " rows: " << post_ranks.size() << std::endl;
+        std::cout << " self_connections: " << allow_self_connections << std::endl;
+    #endif
+        std::sort(pre_ranks.begin(), pre_ranks.end());
+
+        post_rank.clear();
+        pre_rank.clear();
+        for (auto row_it = post_ranks.cbegin(); row_it != post_ranks.cend(); row_it++) {
+            auto row = std::vector<CT>();
+            row.reserve(pre_ranks.size());
+            for (auto col_it = pre_ranks.cbegin(); col_it != pre_ranks.cend(); col_it++) {
+                if ( (!allow_self_connections) && (*row_it == *col_it) )
+                    continue;
+                row.push_back(static_cast<CT>(*col_it));
+            }
+
+            if (row.empty())
+                continue;
+            post_rank.push_back(*row_it);
+            pre_rank.push_back(std::move(row));
+        }
+
+        return true;
+    }
+
+    /**
+     *  @brief      initialize connectivity using a one_to_one pattern
+     *  @details    The i-th post-synaptic neuron is connected to the i-th pre-synaptic one.
+     *  @param[in]  post_ranks  list of row indices.
+     *  @param[in]  pre_ranks   list of column indices.
+     */
+    bool one_to_one_pattern(std::vector<IT> post_ranks, std::vector<IT> pre_ranks) {
+    #ifdef _DEBUG
+        std::cout << "LILMatrix::one_to_one_pattern()" << std::endl;
+        std::cout << " rows: " << post_ranks.size() << std::endl;
+    #endif
+        auto nb_rows = std::min(post_ranks.size(), pre_ranks.size());
+
+        post_rank = std::vector<IT>(post_ranks.begin(), post_ranks.begin() + nb_rows);
+        pre_rank = std::vector< std::vector<CT> >(nb_rows);
+        for (std::size_t lil_idx = 0; lil_idx < nb_rows; lil_idx++)
+            pre_rank[lil_idx] = std::vector<CT>(1, static_cast<CT>(pre_ranks[lil_idx]));
+
+        return true;
+    }
+
+    /**
+     *  @brief      initialize connectivity using a gaussian pattern
+     *  @details    Each post-synaptic neuron is connected to the pre-synaptic neurons around the same normalized coordinates,
+     *              the weight of a synapse is amp * exp(-d^2 / (2*sigma^2)). Synapses with a weight below limit*amp are not
+     *              created. For more details on this pattern see the ANNarchy Documentation.
+     *  @tparam     VT              data type of the weights.
+     *  @param[in]  pre_geometry    geometry of the pre-synaptic population.
+     *  @param[in]  post_geometry   geometry of the post-synaptic population.
+     *  @param[in]  amp             amplitude of the gaussian.
+     *  @param[in]  sigma           width of the gaussian (in normalized coordinates).
+     *  @param[in]  limit           proportion of amp below which synapses are not created.
+     *  @returns    the weights of the synapses, sorted like LILMatrix::pre_rank.
+     */
+    template<typename VT>
+    std::vector< std::vector<VT> > gaussian_pattern(std::vector<int> pre_geometry, std::vector<int> post_geometry, float amp, float sigma, double limit, bool allow_self_connections) {
+    #ifdef _DEBUG
+        std::cout << "LILMatrix::gaussian_pattern()" << std::endl;
+        std::cout << " amp: " << amp << ", sigma: " << sigma << ", limit: " << limit << std::endl;
+        std::cout << " self_connections: " << allow_self_connections << std::endl;
+    #endif
+        // The arithmetic (single and double precision) follows Connector.pyx
+        const double scale = 2.0 * (sigma * sigma);
+
+        // Only the pre-synaptic neurons closer than max_distance can pass the limit
+        double max_distance = std::numeric_limits<double>::infinity();
+        if (amp > 0.0 && limit > 0.0)
+            max_distance = (limit < 1.0) ? -scale * std::log(limit) : -1.0;
+
+        auto profile = [&](float distance, float &value) {
+            value = amp * std::exp(-static_cast<double>(distance) / scale);
+            return value > limit * amp;
+        };
+
+        return distance_pattern<VT>(GridWindow(pre_geometry, post_geometry), max_distance, scale, allow_self_connections, profile);
+    }
+
+    /**
+     *  @brief      initialize connectivity using a difference-of-gaussians pattern
+     *  @details    Same as gaussian_pattern(), the weight of a synapse is the difference of a positive and a negative gaussian.
+     *              Synapses with an absolute weight below limit*|amp_pos - amp_neg| are not created.
+     *  @tparam     VT              data type of the weights.
+     *  @param[in]  pre_geometry    geometry of the pre-synaptic population.
+     *  @param[in]  post_geometry   geometry of the post-synaptic population.
+     *  @param[in]  amp_pos         amplitude of the positive gaussian.
+     *  @param[in]  sigma_pos       width of the positive gaussian.
+     *  @param[in]  amp_neg         amplitude of the negative gaussian.
+     *  @param[in]  sigma_neg       width of the negative gaussian.
+     *  @param[in]  limit           proportion of |amp_pos - amp_neg| below which synapses are not created.
+     *  @returns    the weights of the synapses, sorted like LILMatrix::pre_rank.
+     */
+    template<typename VT>
+    std::vector< std::vector<VT> > dog_pattern(std::vector<int> pre_geometry, std::vector<int> post_geometry, float amp_pos, float sigma_pos, float amp_neg, float sigma_neg, double limit, bool allow_self_connections) {
+    #ifdef _DEBUG
+        std::cout << "LILMatrix::dog_pattern()" << std::endl;
+        std::cout << " amp: " << amp_pos << "/" << amp_neg << ", sigma: " << sigma_pos << "/" << sigma_neg << ", limit: " << limit << std::endl;
+        std::cout << " self_connections: " << allow_self_connections << std::endl;
+    #endif
+        const double scale_pos = 2.0 * (sigma_pos * sigma_pos);
+        const double scale_neg = 2.0 * (sigma_neg * sigma_neg);
+        const double threshold = limit * std::fabs(amp_pos - amp_neg);
+
+        // |value| is bounded by the larger of both gaussians
+        double max_distance = std::numeric_limits<double>::infinity();
+        if (amp_pos >= 0.0 && amp_neg >= 0.0 && threshold > 0.0) {
+            max_distance = -1.0;
+            if (amp_pos > threshold)
+                max_distance = std::fmax(max_distance, scale_pos * std::log(amp_pos / threshold));
+            if (amp_neg > threshold)
+                max_distance = std::fmax(max_distance, scale_neg * std::log(amp_neg / threshold));
+        }
+
+        auto profile = [&](float distance, float &value) {
+            value = amp_pos * std::exp(-static_cast<double>(distance) / scale_pos) - amp_neg * std::exp(-static_cast<double>(distance) / scale_neg);
+            return std::fabs(value) > threshold;
+        };
+
+        return distance_pattern<VT>(GridWindow(pre_geometry, post_geometry), max_distance, std::fmax(scale_pos, scale_neg), allow_self_connections, profile);
+    }
+
+    /**
+     *  @brief      connects each post-synaptic neuron to the candidates of the window which pass the profile.
+     *  @details    Used by gaussian_pattern() and dog_pattern(), rows without synapses are not stored.
+     *  @param[in]  window          coordinates of both populations.
+     *  @param[in]  max_distance    (squared) distance beyond which no synapse is created.
+     *  @param[in]  scale           squared width of the profile, see GridWindow::candidates().
+     *  @param[in]  profile         bool(float distance, float &value), computes the weight and returns true if the synapse is created.
+     *  @returns    the weights of the synapses, sorted like LILMatrix::pre_rank.
+     */
+    template<typename VT, typename Profile>
+    std::vector< std::vector<VT> > distance_pattern(const GridWindow &window, double max_distance, double scale, bool allow_self_connections, Profile profile) {
+        post_rank.clear();
+        pre_rank.clear();
+        auto values = std::vector< std::vector<VT> >();
+
+        auto candidates = std::vector<int>();
+        auto distances = std::vector<float>();
+        float value;
+        for (int post = 0; post < window.post_size(); post++) {
+            window.candidates(post, max_distance, scale, candidates, distances);
+
+            auto row = std::vector<CT>();
+            auto row_values = std::vector<VT>();
+            for (std::size_t idx = 0; idx < candidates.size(); idx++) {
+                if ( (!allow_self_connections) && (candidates[idx] == post) )
+                    continue;
+
+                if (profile(distances[idx], value)) {
+                    row.push_back(static_cast<CT>(candidates[idx]));
+                    row_values.push_back(static_cast<VT>(value));
+                }
+            }
+
+            if (row.empty())
+                continue;
+            post_rank.push_back(static_cast<IT>(post));
+            pre_rank.push_back(std::move(row));
+            values.push_back(std::move(row_values));
+        }
+
+        return values;
+    }
+
     /**
      *  @details    Initialize a num_rows_ by num_columns_ matrix based on the stored connectivity.
      *  @tparam     VT              data type of the variable.
@@ -438,7 +722,8 @@ public:
     #ifdef _DEBUG
         std::cout << "Initialize variable with discrete Uniform(" << a << ", " << b << ")" << std::endl;
     #endif
-        std::uniform_int_distribution<VT> dis (a,b);
+        // the distribution is not defined for char types (e. g. compact delays)
+        std::uniform_int_distribution< typename std::common_type<VT, int>::type > dis (a,b);
         auto new_variable = std::vector< std::vector<VT> >(post_rank.size(), std::vector<VT>());
         for (auto post = 0; post < post_rank.size(); post++) {
             new_variable[post] = std::vector<VT>(pre_rank[post].size(), 0.0);
@@ -591,6 +876,23 @@ public:
         }
     }
 
+    /**
+     *  @details    Updates all *existing* entries of a matrix from a compressed row representation.
+     *  @tparam     VT          data type of the variable.
+     *  @param[in]  variable    Variable container initialized with LILMatrix::init_matrix_variable() and similiar functions.
+     *  @param[in]  data        new values stored row by row in the order of LILMatrix::init_matrix_from_csr(), they are converted to VT.
+     */
+    template <typename VT, typename DT, typename PT>
+    inline void update_matrix_variable_all(std::vector< std::vector<VT> > &variable,
+                             const CSRValues<DT, PT> &data)
+    {
+        assert( (variable.size() == post_rank.size()) );
+
+        for (size_t i = 0; i < post_rank.size(); i++) {
+            data.copy_row(i, variable[i].begin());
+        }
+    }
+
     /**
      *  @brief      retrieve a LIL representation for a given variable.
      *  @details    this function is only called by the Python interface retrieve the current value of a *local* variable.
@@ -704,22 +1006,22 @@ public:
         size += post_rank.capacity() * sizeof(IT);  // data
 
         // pre ranks
-        size += sizeof(std::vector<std::vector<IT>>);                   // top-level container
-        size += pre_rank.capacity() * sizeof(std::vector<IT>);          // inner container
+        size += sizeof(std::vector<std::vector<CT>>);                   // top-level container
+        size += pre_rank.capacity() * sizeof(std::vector<CT>);          // inner container
         for( auto it = pre_rank.cbegin(); it != pre_rank.cend(); it++ )
-            size += it->capacity() * sizeof(IT);                        // data of inner container
+            size += it->capacity() * sizeof(CT);                        // data of inner container
 
         return size;
     }
 
-    LILMatrix<IT>* slice_across_rows(IT beg, IT end) {
+    LILMatrix<IT, ST, CT>* slice_across_rows(IT beg, IT end) {
         assert( (beg >= 0) );
         assert( (end >= 0) );
 
-        auto sliced_matrix = new LILMatrix<IT>(num_rows_, num_columns_);
+        auto sliced_matrix = new LILMatrix<IT, ST, CT>(num_rows_, num_columns_);
 
         sliced_matrix->post_rank = std::vector<IT>(post_rank.begin()+beg, post_rank.begin()+end);
-        sliced_matrix->pre_rank = std::vector<std::vector<IT>>(pre_rank.begin()+beg, pre_rank.begin()+end);
+        sliced_matrix->pre_rank = std::vector<std::vector<CT>>(pre_rank.begin()+beg, pre_rank.begin()+end);
 
         return sliced_matrix;
     }
@@ -21,6 +21,8 @@
  */
 #pragma once
 
+#include "helper_functions.hpp"
+
 /**
  *  @brief      Wrapper class for handling multiple instances of LIL.
  *  @details    In order to support the parallel evaluation of expecially spiking networks
@@ -197,6 +199,30 @@ public:
         return true;
     }
 
+    template<typename PT, typename CT>
+    bool init_matrix_from_csr(std::vector<IT> &post_ranks, const PT* row_ptr, const CT* col_idx, const IT num_partitions) {
+    #ifdef _DEBUG
+        std::cout << "ParallelLIL::init_matrix_from_csr():" << std::endl;
+    #endif
+        // determine partitions
+        divide_post_ranks(post_ranks, num_partitions);
+
+        auto slice_it = slices_.begin();
+        int part_idx = 0;
+        for(; slice_it != slices_.end(); slice_it++, part_idx++) {
+            // the sub matrices share the column indices, only the row pointer is shifted
+            auto post_rank_slice = std::vector<IT>(post_ranks.begin()+slice_it->first, post_ranks.begin()+slice_it->second);
+
+            bool success = sub_matrices_[part_idx]->init_matrix_from_csr(post_rank_slice, row_ptr + slice_it->first, col_idx);
+            if (!success) {
+                std::cerr << "Failed to initialize partition " << part_idx << std::endl;
+                return false;
+            }
+        }
+
+        return true;
+    }
+
     /**
      *  @brief      reads in a .csv file which contains the matrix stored as COO.
      *  @details    this function creates also the variable array, which is usually performed afterwards.
@@ -436,6 +462,19 @@ public:
         }
     }
 
+    template <typename VT, typename PART_TYPE, typename DT, typename PT>
+    inline void update_matrix_variable_all(std::vector< PART_TYPE > &variable, const CSRValues<DT, PT> &data)
+    {
+        assert ( (variable.size() == num_partitions_) );
+        assert ( (slices_.size() == num_partitions_) );
+
+        auto it = slices_.begin();
+        int part_idx = 0;
+        for(; it != slices_.end(); it++, part_idx++) {
+            sub_matrices_[part_idx]->update_matrix_variable_all(variable[part_idx], data.rows_from(it->first));
+        }
+    }
+
     //
     //  Access matrix variables
     //
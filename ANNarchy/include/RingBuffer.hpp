@@ -0,0 +1,122 @@
+/*
+ *    RingBuffer.hpp
+ *
+ *    This file is part of ANNarchy.
+ *
+ *    This program is free software: you can redistribute it and/or modify
+ *    it under the terms of the GNU General Public License as published by
+ *    the Free Software Foundation, either version 3 of the License, or
+ *    (at your option) any later version.
+ *
+ *    ANNarchy is distributed in the hope that it will be useful,
+ *    but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *    GNU General Public License for more details.
+ *
+ *    You should have received a copy of the GNU General Public License
+ *    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ */
+#pragma once
+
+#include <vector>
+#include <algorithm>
+#include <type_traits>
+
+/**
+ *  @brief      Storage of the delayed values of a local population variable.
+ *  @details    The last *max_delay* values of a variable with *size* elements are stored in one contiguous array of
+ *              max_delay x size elements. A head index marks the most recent row, so storing a new value is a single
+ *              copy without any allocation (contrary to a std::deque< std::vector<T> > with push_front()/pop_back()).
+ *
+ *              The access follows the semantics of the former deque: buffer[0] is the most recent value, buffer[d]
+ *              the value stored d steps before. A row is returned as RingBuffer<T>::Row which offers operator[], data()
+ *              and size() and can be converted to a std::vector<T>.
+ *
+ *              As std::vector<bool> offers no contiguous storage, boolean variables are stored as char.
+ */
+template<typename T>
+class RingBuffer {
+public:
+    typedef typename std::conditional<std::is_same<T, bool>::value, char, T>::type storage_type;
+
+    /**
+     *  @brief      View on one stored value of the variable.
+     */
+    class Row {
+        storage_type* data_;
+        std::size_t size_;
+
+    public:
+        Row(storage_type* data, std::size_t size): data_(data), size_(size) {}
+
+        inline storage_type& operator[](std::size_t idx) const { return data_[idx]; }
+        inline storage_type* data() const { return data_; }
+        inline std::size_t size() const { return size_; }
+        inline storage_type* begin() const { return data_; }
+        inline storage_type* end() const { return data_ + size_; }
+
+        operator std::vector<T>() const { return std::vector<T>(data_, data_ + size_); }
+    };
+
+    RingBuffer(): max_delay_(0), size_(0), head_(0) {}
+
+    /**
+     *  @brief      Allocates the buffer for max_delay steps and initializes all rows with value.
+     */
+    RingBuffer(const std::size_t max_delay, const std::size_t size, const T value):
+        buffer_(max_delay * size, static_cast<storage_type>(value)), max_delay_(max_delay), size_(size), head_(0) {}
+
+    /**
+     *  @brief      Returns the value stored delay steps before the most recent one.
+     */
+    inline Row operator[](const std::size_t delay) {
+        std::size_t row = head_ + delay;
+        if (row >= max_delay_)
+            row -= max_delay_;
+        return Row(buffer_.data() + row * size_, size_);
+    }
+
+    /**
+     *  @brief      Number of stored steps.
+     */
+    inline std::size_t size() const { return max_delay_; }
+
+    /**
+     *  @brief      Stores a new value, the oldest one is overwritten.
+     */
+    inline void push_front(const std::vector<T> &values) {
+        head_ = (head_ == 0) ? max_delay_ - 1 : head_ - 1;
+        std::copy(values.begin(), values.end(), buffer_.begin() + head_ * size_);
+    }
+
+    /**
+     *  @brief      Sets all stored steps to the given value (e. g. after a reset).
+     */
+    void fill(const std::vector<T> &values) {
+        for (std::size_t d = 0; d < max_delay_; d++)
+            std::copy(values.begin(), values.end(), buffer_.begin() + d * size_);
+        head_ = 0;
+    }
+
+    /**
+     *  @brief      Changes the number of stored steps. The stored values are kept, new steps are initialized with value.
+     */
+    void resize(const std::size_t max_delay, const T value) {
+        std::vector<storage_type> buffer(max_delay * size_, static_cast<storage_type>(value));
+
+        for (std::size_t d = 0; d < std::min(max_delay, max_delay_); d++) {
+            auto row = (*this)[d];
+            std::copy(row.begin(), row.end(), buffer.begin() + d * size_);
+        }
+
+        buffer_.swap(buffer);
+        max_delay_ = max_delay;
+        head_ = 0;
+    }
+
+private:
+    std::vector<storage_type> buffer_;
+    std::size_t max_delay_;
+    std::size_t size_;
+    std::size_t head_;
+};
@@ -268,6 +268,81 @@ class SELLMatrix {
         return true;
     }
 
+    /**
+     *  @brief      initialize connectivity based on a compressed row representation.
+     *  @details    the i-th row (row_indices[i]) contains the column indices col_idx[row_ptr[i]] to col_idx[row_ptr[i+1]-1].
+     *  @see        SELLMatrix::init_matrix_from_lil()
+     */
+    template<typename PT, typename CT>
+    bool init_matrix_from_csr(const std::vector<IT> &row_indices, const PT* row_ptr, const CT* col_idx) {
+    #ifdef _DEBUG
+        std::cout << "SELLMatrix::init_matrix_from_csr()" << std::endl;
+    #endif
+        post_ranks_ = row_indices;
+
+        //compute number of blocks
+        unsigned int num_blocks = num_rows_ / block_size_;
+        if (num_rows_ % block_size_)num_blocks++;
+        num_blocks_ = num_blocks;
+        std::vector<unsigned int> blocklength(num_blocks, 0);
+
+        //get row length
+        std::vector<IT> row_length_(num_rows_, 0);
+        for (size_t lil_row_idx = 0; lil_row_idx < row_indices.size(); lil_row_idx++) {
+            row_length_[row_indices[lil_row_idx]] = row_ptr[lil_row_idx+1] - row_ptr[lil_row_idx];
+        }
+
+        //compute blocklength in each block
+        for (int i = 0; i < num_blocks; i++) {
+            unsigned int rowbegin = i * block_size_;
+            blocklength[i] = row_length_[rowbegin];
+            for (int j = 1; j < block_size_; j++) {
+                int row_now = rowbegin + j;
+                if ((row_now) >= num_rows_)break;
+                if (blocklength[i] < row_length_[row_now]) blocklength[i] = row_length_[row_now];
+            }
+        }
+
+        size_t lil_row_idx = 0;
+        unsigned int sell_row_idx = 0;
+
+        // start to convert CSR to SELL
+        for (int i = 0; i < num_blocks; i++) {
+            std::vector<IT> temp_block_col(block_size_ * blocklength[i], 0);
+            std::vector<char> temp_block_mask(block_size_ * blocklength[i], false);
+            row_ptr_.push_back(col_idx_.size());
+
+            for (int j = 0; j < block_size_; j++) {
+                sell_row_idx = j + i * block_size_;
+                if (sell_row_idx >= num_rows_)
+                    break;
+
+                if (lil_row_idx < row_indices.size() && sell_row_idx == row_indices[lil_row_idx]) {
+                    for (PT c = 0; c < row_ptr[lil_row_idx+1] - row_ptr[lil_row_idx]; c++) {
+                        ST idx = row_major ? (j * blocklength[i] + c) : (c * block_size_ + j);
+                        temp_block_col[idx] = col_idx[row_ptr[lil_row_idx] + c];
+                        temp_block_mask[idx] = true; //encode mask
+                    }
+                    num_non_zeros_ += row_ptr[lil_row_idx+1] - row_ptr[lil_row_idx];
+                    // next row in CSR
+                    lil_row_idx++;
+                }
+            }
+            col_idx_.insert(col_idx_.end(), temp_block_col.begin(), temp_block_col.end());
+            mask_.insert(mask_.end(), temp_block_mask.begin(), temp_block_mask.end());
+        }
+
+        row_ptr_.push_back(col_idx_.size());
+
+        // sanity check
+        if (lil_row_idx != row_indices.size()) {
+            std::cerr << "SELLMatrix::init_matrix_from_csr() something went wrong ..." << std::endl;
+            return false;
+        }
+
+        return true;
+    }
+
     /**
      *  @brief      print the matrix representation to console.
      *  @details    All important fields are printed. 
@@ -616,6 +691,32 @@ class SELLMatrix {
         
     }
 
+    /**
+     *  @details    Updates all *existing* entries of a matrix from a compressed row representation.
+     *  @tparam     VT          data type of the variable.
+     */
+    template <typename VT, typename DT, typename PT>
+    inline void update_matrix_variable_all(std::vector<VT>& variable, const CSRValues<DT, PT>& data)
+    {
+    #ifdef _DEBUG
+        std::cout << "SELLMatrix::update_matrix_variable_all()" << std::endl;
+    #endif
+        for (size_t i = 0; i < post_ranks_.size(); i++) {
+            IT row_idx = post_ranks_[i];
+            IT block_idx = row_idx / block_size_;
+            IT block_length = (row_ptr_[block_idx + 1] - row_ptr_[block_idx]) / block_size_;
+            IT local_row = row_idx % block_size_;
+
+            if (row_major) {
+                data.copy_row(i, variable.begin() + row_ptr_[block_idx] + local_row * block_length);
+            } else {
+                for (size_t c = 0; c < data.row_size(i); c++) {
+                    variable[c * block_size_ + row_ptr_[block_idx] + local_row] = data.get(i, c);
+                }
+            }
+        }
+    }
+
 
     /**
      *  @brief      retruns a single value from the given variable.
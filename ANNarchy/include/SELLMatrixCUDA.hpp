@@ -131,6 +131,20 @@ class SELLMatrixCUDA : public SELLMatrix<IT, ST, false> {
         return true;
     }
 
+    template<typename PT, typename CT>
+    bool init_matrix_from_csr(const std::vector<IT> &post_ranks, const PT* row_ptr, const CT* col_idx) {
+        assert((post_ranks.size() > 0));
+
+    #ifdef _DEBUG
+            std::cout << "SELLMatrixCUDA::init_matrix_from_csr()" << std::endl;
+    #endif
+        static_cast<SELLMatrix<IT, ST, false>*>(this)->init_matrix_from_csr(post_ranks, row_ptr, col_idx);
+
+        host_to_device_transfer();
+
+        return true;
+    }
+
     bool fixed_number_pre_pattern(std::vector<IT> post_ranks, std::vector<IT> pre_ranks, IT nnz_per_row, std::mt19937& rng) {
     #ifdef _DEBUG
             std::cout << "SELLMatrixCUDA::fixed_number_pre_pattern()" << std::endl;
@@ -21,6 +21,12 @@
  */
 #pragma once
 
+#include <type_traits>
+#include <algorithm>
+#include <cmath>
+#include <limits>
+#include <vector>
+
 // Sort criterion must be in a. The values
 // are sorted ascending.
 template<typename Type1, typename Type2>
@@ -45,3 +51,204 @@ void pairsort(Type1 *a, Type2 *b, int n)
         b[i] = pairt[i].second;
     }
 }
+
+// Conversion of a LIL-like nested vector into another element type,
+// e. g. the delays (int) into the compact type of a projection. If
+// the types are equal, no copy is created.
+template<typename VT, typename DT>
+inline typename std::enable_if< std::is_same<VT, DT>::value, const std::vector< std::vector<VT> >& >::type
+convert_lil(const std::vector< std::vector<DT> > &data)
+{
+    return data;
+}
+
+template<typename VT, typename DT>
+inline typename std::enable_if< !std::is_same<VT, DT>::value, std::vector< std::vector<VT> > >::type
+convert_lil(const std::vector< std::vector<DT> > &data)
+{
+    auto result = std::vector< std::vector<VT> >(data.size());
+    for (std::size_t i = 0; i < data.size(); i++)
+        result[i] = std::vector<VT>(data[i].begin(), data[i].end());
+    return result;
+}
+
+// Values of a compressed row representation, e. g. the weights or delays
+// passed to init_from_csr(): the j-th value of the i-th row is stored in
+// data[row_ptr[i]+j]. The element access of a LIL-like nested vector
+// (values[i][j]) is provided without copying the array. If no data is
+// given (e. g. uniform delays), all elements have the default value.
+template<typename DT, typename PT>
+class CSRValues {
+    const PT* row_ptr_;
+    const DT* data_;
+    std::size_t nb_data_;
+    DT default_value_;
+
+public:
+    // Values of a single row
+    class Row {
+        const CSRValues* values_;
+        std::size_t row_;
+    public:
+        Row(const CSRValues* values, std::size_t row) : values_(values), row_(row) {}
+
+        inline std::size_t size() const { return values_->row_size(row_); }
+        inline DT operator[](std::size_t col) const { return values_->get(row_, col); }
+
+        // copy into a vector of the requested type, e. g. for update_matrix_variable_row()
+        template<typename VT>
+        operator std::vector<VT>() const { return values_->template row<VT>(row_); }
+    };
+
+    CSRValues(const PT* row_ptr, const DT* data, std::size_t nb_data, DT default_value) :
+        row_ptr_(row_ptr), data_(data), nb_data_(nb_data), default_value_(default_value) {}
+
+    inline std::size_t row_size(std::size_t row) const {
+        return row_ptr_[row+1] - row_ptr_[row];
+    }
+
+    inline DT get(std::size_t row, std::size_t col) const {
+        return (nb_data_ == 0) ? default_value_ : data_[row_ptr_[row] + col];
+    }
+
+    inline Row operator[](std::size_t row) const {
+        return Row(this, row);
+    }
+
+    // Copies the values of a row to dest, the elements are converted to the type of dest.
+    template<typename OutputIt>
+    inline OutputIt copy_row(std::size_t row, OutputIt dest) const {
+        if (nb_data_ == 0)
+            return std::fill_n(dest, row_size(row), default_value_);
+        return std::copy(data_ + row_ptr_[row], data_ + row_ptr_[row+1], dest);
+    }
+
+    template<typename VT>
+    inline std::vector<VT> row(std::size_t row) const {
+        auto result = std::vector<VT>(row_size(row));
+        copy_row(row, result.begin());
+        return result;
+    }
+
+    // Values of the rows first, first+1, ... (e. g. the slice of a partition)
+    inline CSRValues rows_from(std::size_t first) const {
+        return CSRValues(row_ptr_ + first, data_, nb_data_, default_value_);
+    }
+};
+
+// The elements of CSRValues are converted when they are copied into the
+// variable (see update_matrix_variable_all() of the formats).
+template<typename VT, typename DT, typename PT>
+inline const CSRValues<DT, PT>& convert_lil(const CSRValues<DT, PT> &data)
+{
+    return data;
+}
+
+// Normalized coordinates of the neurons of two populations, used by the
+// distance-based patterns (gaussian, dog). The neurons of a population form
+// a regular grid, so the pre-synaptic neurons within a given distance of a
+// post-synaptic neuron are found by iterating over a bounding box of grid
+// indices instead of the whole population. The coordinates and distances
+// are rounded like in _GridWindow (Connector.pyx), so the C++ and Python
+// constructions create the same synapses.
+class GridWindow {
+    int pre_size_, post_size_;
+    std::vector<int> pre_shape_, pre_strides_, post_shape_, post_strides_;
+    std::vector< std::vector<double> > pre_coords_, post_coords_;
+
+    // Shape, row-major strides and normalized coordinates along each
+    // dimension, returns the number of neurons.
+    static int grid_setup(const std::vector<int> &geometry, std::vector<int> &shape, std::vector<int> &strides, std::vector< std::vector<double> > &coords) {
+        int dim = geometry.size();
+        shape = geometry;
+        strides = std::vector<int>(dim);
+        coords = std::vector< std::vector<double> >(dim);
+
+        int size = 1;
+        for (int k = dim - 1; k >= 0; k--) {
+            strides[k] = size;
+            size *= shape[k];
+
+            coords[k] = std::vector<double>(shape[k]);
+            for (int i = 0; i < shape[k]; i++) {
+                double coord = (shape[k] > 1) ? i / static_cast<double>(shape[k] - 1) : 0.0;
+                // single precision for 2D and 3D geometries, like the Coordinates module
+                if (dim == 2 || dim == 3)
+                    coord = static_cast<float>(coord);
+                coords[k][i] = coord;
+            }
+        }
+
+        return size;
+    }
+
+public:
+    GridWindow(const std::vector<int> &pre_geometry, const std::vector<int> &post_geometry) {
+        pre_size_ = grid_setup(pre_geometry, pre_shape_, pre_strides_, pre_coords_);
+        post_size_ = grid_setup(post_geometry, post_shape_, post_strides_, post_coords_);
+    }
+
+    inline int pre_size() const { return pre_size_; }
+    inline int post_size() const { return post_size_; }
+
+    // Fills ranks (in ascending order) and distances (squared) with the
+    // pre-synaptic neurons in the bounding box around the post-synaptic
+    // neuron, all neurons if max_distance is infinite and none if it is
+    // negative. The box is slightly enlarged (relative to scale, the squared
+    // width of the profile) to be robust against rounding.
+    void candidates(int post, double max_distance, double scale, std::vector<int> &ranks, std::vector<float> &distances) const {
+        ranks.clear();
+        distances.clear();
+        if (max_distance < 0.0)
+            return;
+
+        const int dim = pre_shape_.size();
+        const double infinity = std::numeric_limits<double>::infinity();
+        double radius = (max_distance < infinity) ? std::sqrt(max_distance * (1.0 + 1e-5) + 1e-5 * scale) + 1e-6 : infinity;
+
+        auto lower = std::vector<int>(dim);
+        auto upper = std::vector<int>(dim);
+        auto center = std::vector<double>(dim);
+        for (int k = 0; k < dim; k++) {
+            center[k] = post_coords_[k][(post / post_strides_[k]) % post_shape_[k]];
+            if (pre_shape_[k] == 1 || radius == infinity) {
+                lower[k] = 0;
+                upper[k] = pre_shape_[k] - 1;
+                continue;
+            }
+            lower[k] = static_cast<int>(std::max(std::ceil((center[k] - radius) * (pre_shape_[k] - 1)), 0.0));
+            upper[k] = static_cast<int>(std::min(std::floor((center[k] + radius) * (pre_shape_[k] - 1)), static_cast<double>(pre_shape_[k] - 1)));
+            if (lower[k] > upper[k])
+                return;
+        }
+
+        // Iterate over the box in row-major order, the squared distance is
+        // accumulated over the dimensions in the same order as in Python
+        auto idx = lower;
+        auto partial = std::vector<float>(dim + 1, 0.0);
+        int k = 0;
+        while (true) {
+            // descend to the last dimension
+            for (; k < dim; k++) {
+                double diff = pre_coords_[k][idx[k]] - center[k];
+                partial[k+1] = partial[k] + diff * diff;
+            }
+
+            int rank = 0;
+            for (int d = 0; d < dim; d++)
+                rank += idx[d] * pre_strides_[d];
+            ranks.push_back(rank);
+            distances.push_back(partial[dim]);
+
+            // next index (odometer), the last dimension varies fastest
+            k = dim - 1;
+            while (k >= 0 && idx[k] == upper[k]) {
+                idx[k] = lower[k];
+                k--;
+            }
+            if (k < 0)
+                return;
+            idx[k]++;
+        }
+    }
+};
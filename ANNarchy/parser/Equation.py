@@ -23,6 +23,7 @@
 #===============================================================================
 import ANNarchy.core.Global as Global
 from .ParserTemplate import create_local_dict, user_functions
+from .ParserCache import _parser_cache, _context_key
 
 import sympy as sp
 import re
@@ -78,6 +79,7 @@ class Equation(object):
         self.untouched = untouched
         self.method = method
         self.num_flops = 0
+        self._dependencies = None # set if the result was taken from the cache
 
         # Determine the type of the equation
         if not type:
@@ -104,6 +106,13 @@ class Equation(object):
 
     def parse(self):
         "Main method called after creating the object."
+        # Identical equations are only analysed once
+        key = self._cache_key()
+        cached = _parser_cache.lookup(key)
+        if cached is not None:
+            code, self._dependencies, self.num_flops = cached
+            return code
+
         try:
             if self.type == 'ODE':
                 code = self.analyse_ODE(self.expression)
@@ -118,8 +127,27 @@ class Equation(object):
         except Exception as e:
             Global._print(e)
             Global._error('Parser: cannot analyse', self.expression)
+
+        _parser_cache.store(key, (code, self.dependencies(), self.num_flops))
         return code
 
+    def _cache_key(self):
+        "Everything the result of parse() depends on."
+        return (
+            'Equation',
+            self.name,
+            self.expression,
+            self.type,
+            self.method,
+            tuple(self.attributes),
+            tuple(self.local_attributes),
+            tuple(self.semiglobal_attributes),
+            tuple(self.global_attributes),
+            tuple(self.local_functions),
+            tuple(self.variables),
+            tuple(sorted(self.untouched)),
+        ) + _context_key()
+
     def identify_type(self):
         """
         Identifies which type has the equation:
@@ -732,6 +760,8 @@ class Equation(object):
 
     def dependencies(self):
         "Returns all dependencies of the equation"
+        if self._dependencies is not None:
+            return list(self._dependencies)
         deps = []
         for att in self.attributes:
             if self.local_dict[att] in self.analysed.atoms():
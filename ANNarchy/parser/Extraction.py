@@ -385,10 +385,9 @@ def extract_functions(description, local_global=False):
         arguments = [arg.strip() for arg in arguments]
 
         # Check the function name is not reserved by Sympy
-        from inspect import getmembers
+        # (dir() is sufficient, inspect.getmembers() would evaluate every member of sympy)
         import sympy
-        functions_list = [o[0] for o in getmembers(sympy)]
-        if func_name in functions_list:
+        if func_name in dir(sympy):
             Global._error('The function name', func_name, 'is reserved by sympy. Use another one.')
 
         # Extract their types
@@ -24,6 +24,7 @@
 import ANNarchy.core.Global as Global
 from ANNarchy.parser.Equation import transform_condition
 from .ParserTemplate import parser_dict, functions_dict, user_functions
+from .ParserCache import _parser_cache, _context_key
 
 import sympy as sp
 from sympy.parsing.sympy_parser import parse_expr, standard_transformations, convert_xor, auto_number
@@ -81,6 +82,12 @@ class FunctionParser(object):
         if not part:
             part = self.eq
 
+        # Identical functions are only translated once
+        key = ('FunctionParser', tuple(self.args), part) + _context_key()
+        code = _parser_cache.lookup(key)
+        if code is not None:
+            return code
+
         expression = transform_condition(part)
 
         # Check if there is a == in the condition
@@ -110,9 +117,12 @@ class FunctionParser(object):
             Global._print(expression)
             Global._error('The function depends on unknown variables.')
 
-        return sp.ccode(eq, precision=8,
+        code = sp.ccode(eq, precision=8,
             user_functions=self.user_functions)
 
+        _parser_cache.store(key, code)
+        return code
+
     def dependencies(self):
         "For compatibility with Equation."
         return self.args
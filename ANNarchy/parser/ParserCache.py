@@ -0,0 +1,173 @@
+#===============================================================================
+#
+#     ParserCache.py
+#
+#     This file is part of ANNarchy.
+#
+#     Copyright (C) 2013-2022  Julien Vitay <julien.vitay@gmail.com>,
+#     Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     ANNarchy is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#===============================================================================
+import os
+import json
+import pickle
+import tempfile
+from copy import deepcopy
+
+import ANNarchy
+import ANNarchy.core.Global as Global
+
+class ParserCache(object):
+    """
+    Content-keyed memoization of parsed and translated equations.
+
+    The sympy analysis of an equation only depends on the equation string and on
+    a few properties of the surrounding neuron/synapse (names and locality of the
+    attributes, functions, precision, ...). The parser classes build a key from
+    these properties and store the resulting C++ code together with the
+    information queried afterwards (dependencies, number of operations), so that
+    identical equations of different Neuron/Synapse objects are analysed only once.
+
+    The cache is always active in memory. If ``setup(parser_cache=True)`` is set,
+    the entries are additionally loaded from and stored to the user-level cache
+    directory (default: ~/.cache/ANNarchy, see the "cache" section of annarchy.json).
+    """
+    # Upper limit for the number of entries, the oldest ones are dropped first
+    max_entries = 50000
+
+    def __init__(self):
+        self._entries = {}
+        self._loaded = False
+        self._modified = False
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, key):
+        """
+        Returns a copy of the stored value for *key* or None.
+        """
+        if Global.config['parser_cache'] and not self._loaded:
+            self.load()
+
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return deepcopy(value)
+
+    def store(self, key, value):
+        "Inserts a value, the object is copied to avoid later modifications by the caller."
+        self._entries[key] = deepcopy(value)
+        self._modified = True
+
+        if len(self._entries) > self.max_entries:
+            # dictionaries preserve the insertion order
+            del self._entries[next(iter(self._entries))]
+
+    def clear(self):
+        "Removes all entries from memory and resets the statistics."
+        self._entries = {}
+        self._modified = False
+        self.hits = 0
+        self.misses = 0
+
+    def hit_rate(self):
+        "Returns the fraction of lookups which could be served from the cache."
+        total = self.hits + self.misses
+        return float(self.hits) / total if total > 0 else 0.0
+
+    def report(self):
+        "Prints the hit rate of the cache."
+        total = self.hits + self.misses
+        if total == 0:
+            return
+        Global._print('Equation parser cache:', self.hits, 'of', total, 'equations re-used (' + str(round(100.0 * self.hit_rate(), 1)) + '%)')
+
+    @staticmethod
+    def _file_path():
+        "Location of the on-disk cache, the directory can be set in annarchy.json."
+        path = "~/.cache/ANNarchy"
+        json_path = os.path.expanduser('~/.config/ANNarchy/annarchy.json')
+        if os.path.exists(json_path):
+            try:
+                with open(json_path, 'r') as rfile:
+                    user_config = json.load(rfile)
+                path = user_config['cache']['path']
+            except (ValueError, KeyError, TypeError, OSError):
+                pass
+        return os.path.expanduser(path) + '/parser.pickle'
+
+    @staticmethod
+    def _version():
+        # the translation differs between sympy versions
+        import sympy
+        return (ANNarchy.__release__, sympy.__version__)
+
+    def load(self):
+        "Reads the on-disk entries, entries already in memory have precedence."
+        self._loaded = True
+        try:
+            with open(self._file_path(), 'rb') as rfile:
+                data = pickle.load(rfile)
+        except Exception:
+            # does not exist yet or is corrupted
+            return
+
+        if not isinstance(data, dict) or data.get('version') != self._version():
+            return
+
+        entries = data['entries']
+        entries.update(self._entries)
+        self._entries = entries
+
+    def save(self):
+        "Writes the entries to disk if something changed."
+        if not self._modified:
+            return
+
+        path = self._file_path()
+        tmp_path = None
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            with os.fdopen(fd, 'wb') as wfile:
+                pickle.dump({'version': self._version(), 'entries': self._entries}, wfile)
+            # rename is atomic on POSIX systems, concurrent writers simply overwrite each other
+            os.replace(tmp_path, path)
+            tmp_path = None
+            self._modified = False
+        except OSError as e:
+            Global._debug('ParserCache.save():', e)
+        finally:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+# Instance shared by all parser classes
+_parser_cache = ParserCache()
+
+def _context_key():
+    """
+    Global state influencing the translation of each equation: precision, names of
+    the constants and of the functions defined with add_function().
+    """
+    return (
+        Global.config['precision'],
+        tuple(sorted(obj.name for obj in Global._objects['constants'])),
+        tuple(sorted(func[0] for func in Global._objects['functions'])),
+    )
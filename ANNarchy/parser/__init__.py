@@ -1,2 +1,10 @@
-from .AnalyseNeuron import analyse_neuron
-from .AnalyseSynapse import analyse_synapse
+# The parser depends on sympy, which is expensive to import. The analysis
+# modules are therefore only loaded when the first model is analysed.
+
+def analyse_neuron(neuron):
+    from .AnalyseNeuron import analyse_neuron as _analyse_neuron
+    return _analyse_neuron(neuron)
+
+def analyse_synapse(synapse):
+    from .AnalyseSynapse import analyse_synapse as _analyse_synapse
+    return _analyse_synapse(synapse)
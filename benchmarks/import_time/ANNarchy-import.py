@@ -0,0 +1,62 @@
+"""
+Measures the time needed by ``import ANNarchy`` in a fresh interpreter.
+
+Usage:
+
+    python ANNarchy-import.py [--budget 1.0] [--repeat 10]
+
+The script fails (exit code 1) if the median import time exceeds the budget
+(in seconds) or if one of the modules which should only be loaded on demand
+(sympy, scipy, the code generators, the report) was imported.
+"""
+import sys
+import json
+import argparse
+import subprocess
+
+# Modules which are not needed to load and simulate a compiled network
+lazy_modules = [
+    'sympy',
+    'scipy',
+    'matplotlib',
+    'ANNarchy.parser.AnalyseNeuron',
+    'ANNarchy.parser.AnalyseSynapse',
+    'ANNarchy.parser.report.LatexReport',
+    'ANNarchy.parser.report.MarkdownReport',
+    'ANNarchy.generator.CodeGenerator',
+]
+
+measurement = """
+import sys, time, json
+t0 = time.perf_counter()
+import ANNarchy
+t1 = time.perf_counter()
+sys.stdout.write('\\n' + json.dumps({'time': t1 - t0, 'modules': [m for m in %(lazy)s if m in sys.modules]}))
+""" % {'lazy': repr(lazy_modules)}
+
+parser = argparse.ArgumentParser()
+parser.add_argument('--budget', type=float, default=1.0, help="maximal median import time in seconds (default: 1.0)")
+parser.add_argument('--repeat', type=int, default=10, help="number of measurements (default: 10)")
+args = parser.parse_args()
+
+times = []
+loaded = set()
+for _ in range(args.repeat):
+    out = subprocess.check_output([sys.executable, '-c', measurement]).decode()
+    result = json.loads(out.strip().splitlines()[-1])
+    times.append(result['time'])
+    loaded.update(result['modules'])
+
+times.sort()
+median = times[len(times)//2]
+print('import ANNarchy: median', round(median, 3), 's, min', round(times[0], 3), 's, max', round(times[-1], 3), 's (budget', args.budget, 's)')
+
+success = True
+if median > args.budget:
+    print('FAILED: the import time exceeds the budget.')
+    success = False
+if len(loaded) > 0:
+    print('FAILED: the following modules should be loaded on demand:', ', '.join(sorted(loaded)))
+    success = False
+
+sys.exit(0 if success else 1)
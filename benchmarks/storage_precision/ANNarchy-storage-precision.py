@@ -0,0 +1,62 @@
+"""
+Compares the simulation time of a rate-coded projection storing its weights in
+double precision (network precision) and in single precision
+(``storage_precision="float32"``, the weighted sum is still accumulated in
+double precision).
+
+Usage:
+
+    python ANNarchy-storage-precision.py [--size 4000] [--format dense] [--steps 300]
+
+Each configuration is compiled and simulated in a separate interpreter, the
+fastest of three runs is reported together with the speedup.
+"""
+import sys
+import json
+import argparse
+import subprocess
+
+measurement = """
+import sys, time, json
+import numpy as np
+from ANNarchy import *
+
+size, storage_format, steps, precision = %(size)d, %(format)r, %(steps)d, %(precision)r
+
+inp = Population(size, Neuron(parameters="r = 0.0"))
+out = Population(size, Neuron(equations="r = sum(exc)"))
+proj = Projection(inp, out, 'exc', storage_precision=precision)
+proj.connect_all_to_all(Uniform(0.0, 1.0), storage_format=storage_format)
+compile(directory='annarchy_' + storage_format + '_' + str(precision), silent=True)
+
+inp.r = np.random.random(size)
+simulate(10.0)
+durations = []
+for _ in range(3):
+    t0 = time.time()
+    simulate(steps * dt())
+    durations.append(time.time() - t0)
+
+with open('annarchy_' + storage_format + '_' + str(precision) + '/generate/net0/proj0.cpp') as rfile:
+    vectorized = 'cvtps_pd(' in rfile.read()
+
+sys.stdout.write('\\n' + json.dumps({'time': min(durations), 'vectorized': vectorized}))
+"""
+
+parser = argparse.ArgumentParser()
+parser.add_argument('--size', type=int, default=4000, help="size of the pre- and post-synaptic populations (default: 4000)")
+parser.add_argument('--format', type=str, default="dense", help="storage format of the projection (default: dense)")
+parser.add_argument('--steps', type=int, default=300, help="number of simulated steps (default: 300)")
+args = parser.parse_args()
+
+results = {}
+for precision in [None, "float32"]:
+    code = measurement % {'size': args.size, 'format': args.format, 'steps': args.steps, 'precision': precision}
+    out = subprocess.check_output([sys.executable, '-c', code]).decode()
+    results[precision] = json.loads(out.strip().splitlines()[-1])
+
+print(args.format, str(args.size) + 'x' + str(args.size), ',', args.steps, 'steps')
+print('    double weights :', round(results[None]['time'], 3), 's')
+print('    float32 weights:', round(results['float32']['time'], 3), 's',
+      '(mixed-precision SIMD kernel)' if results['float32']['vectorized'] else '(scalar kernel)')
+print('    speedup        :', round(results[None]['time'] / results['float32']['time'], 2))
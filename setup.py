@@ -199,12 +199,16 @@ package_data = [
                 'thirdparty/*.hpp'
                 ]
 
+# The connectivity patterns can be generated in parallel (setup(connectivity_threads=...)),
+# without openMP support the loops are executed sequentially
+openmp_args = [] if sys.platform.startswith('darwin') else ["-fopenmp"]
+
 extensions = [
     Extension("ANNarchy.core.cython_ext.Connector",
             ["ANNarchy/core/cython_ext/Connector.pyx"],
             include_dirs=[np.get_include()],
-            extra_compile_args=extra_compile_args,
-            extra_link_args=extra_link_args,
+            extra_compile_args=extra_compile_args + openmp_args,
+            extra_link_args=extra_link_args + openmp_args,
             language="c++"),
     Extension("ANNarchy.core.cython_ext.Coordinates",
             ["ANNarchy/core/cython_ext/Coordinates.pyx"],
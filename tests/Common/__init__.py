@@ -8,3 +8,4 @@ from .test_NumericalMethod import (test_Explicit, test_Exponential,
                                    test_Precision)
 from .test_BuiltinFunctions import test_BuiltinFunctions
 from .test_CustomFunc import test_CustomFunc
+from .test_ParserCache import test_ParserCache
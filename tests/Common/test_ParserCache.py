@@ -0,0 +1,70 @@
+"""
+
+    test_ParserCache.py
+
+    This file is part of ANNarchy.
+
+    Copyright (C) 2022 Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    ANNarchy is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import unittest
+
+from ANNarchy import Neuron
+from ANNarchy.parser.ParserCache import _parser_cache
+
+def _neuron(equation):
+    return Neuron(
+        parameters = "tau = 10.0 : population",
+        equations = """
+            tau * dmp/dt + mp = sum(exc) + f(mp)
+            r = pos(mp) : min=0.0
+        """ + equation,
+        functions = "f(x) = 0.1 * x"
+    )
+
+class test_ParserCache(unittest.TestCase):
+    """
+    Identical equations of different neuron types are analysed only once.
+    """
+    def test_identical_neurons(self):
+        """
+        The second analysis of the same model is served from the cache and
+        produces the same code.
+        """
+        first = _neuron("")
+        first._analyse()
+
+        hits = _parser_cache.hits
+        second = _neuron("")
+        second._analyse()
+
+        self.assertGreater(_parser_cache.hits, hits)
+        for var1, var2 in zip(first.description['variables'], second.description['variables']):
+            self.assertEqual(var1['cpp'], var2['cpp'])
+            self.assertEqual(var1['dependencies'], var2['dependencies'])
+
+    def test_modified_equation(self):
+        """
+        A different equation is not taken from the cache.
+        """
+        _neuron("")._analyse()
+
+        misses = _parser_cache.misses
+        neuron = _neuron("x = 2.0 * r")
+        neuron._analyse()
+
+        self.assertGreater(_parser_cache.misses, misses)
+        self.assertIn('2.0', neuron.description['variables'][2]['cpp'])
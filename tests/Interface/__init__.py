@@ -3,3 +3,14 @@ from .test_IO import test_IO_Rate, test_IO_Spiking
 from .test_Record import test_Record
 from .test_Report import test_Report_Rate, test_Report_Spiking
 from .test_TimedArray import test_TimedArray
+from .test_BuildCache import test_BuildCache
+from .test_Rebuild import test_Rebuild, test_RebuildValues
+from .test_Import import test_Import
+from .test_PrecompiledHeader import test_PrecompiledHeader
+from .test_PGO import test_PGO
+from .test_Timings import test_Timings
+from .test_FormatAutotuner import test_FormatAutotuner
+from .test_BulkInit import test_BulkInit
+from .test_StepScheduling import test_StepScheduling
+from .test_IndexTypes import test_IndexTypes
+from .test_IncrementalBuild import test_IncrementalBuild
@@ -0,0 +1,120 @@
+"""
+
+    test_BuildCache.py
+
+    This file is part of ANNarchy.
+
+    Copyright (C) 2022 Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    ANNarchy is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import os
+import time
+import shutil
+import tempfile
+import unittest
+
+from ANNarchy.generator.BuildCache import BuildCache
+
+class test_BuildCache(unittest.TestCase):
+    """
+    Test the lookup, insertion and eviction of the user-level build cache.
+    """
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.cache = BuildCache({'cache': {'path': self.tmp_dir + '/cache', 'max_size': 1, 'max_age': 1}})
+
+        self.source_dir = self.tmp_dir + '/generate'
+        os.mkdir(self.source_dir)
+        with open(self.source_dir + '/ANNarchy.cpp', 'w') as wfile:
+            wfile.write("int main() { return 0; }")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, True)
+
+    def _library(self, name, size):
+        path = self.tmp_dir + '/' + name
+        with open(path, 'wb') as wfile:
+            wfile.write(b'0' * size)
+        return path
+
+    def test_key(self):
+        """
+        The key depends on the generated code and the build configuration.
+        """
+        key = BuildCache.compute_key(self.source_dir, {'compiler': 'g++'})
+        self.assertEqual(key, BuildCache.compute_key(self.source_dir, {'compiler': 'g++'}))
+        self.assertNotEqual(key, BuildCache.compute_key(self.source_dir, {'compiler': 'clang++'}))
+
+        with open(self.source_dir + '/ANNarchy.cpp', 'a') as wfile:
+            wfile.write("\n// modified")
+        self.assertNotEqual(key, BuildCache.compute_key(self.source_dir, {'compiler': 'g++'}))
+
+    def test_key_dependencies(self):
+        """
+        The key depends on the content of additional sources and libraries
+        and on the Cython and Numpy versions.
+        """
+        source = self._library('extra.cpp', 16)
+        key = BuildCache.compute_key(self.source_dir, {'compiler': 'g++'}, dependencies=[source])
+        self.assertEqual(key, BuildCache.compute_key(self.source_dir, {'compiler': 'g++'}, dependencies=[source]))
+        self.assertNotEqual(key, BuildCache.compute_key(self.source_dir, {'compiler': 'g++'}))
+
+        with open(source, 'a') as wfile:
+            wfile.write("// modified")
+        self.assertNotEqual(key, BuildCache.compute_key(self.source_dir, {'compiler': 'g++'}, dependencies=[source]))
+
+        import numpy
+        from ANNarchy.generator import BuildCache as build_cache_module
+        key = BuildCache.compute_key(self.source_dir, {'compiler': 'g++'})
+        numpy_version = numpy.__version__
+        cython_version = build_cache_module._cython_version
+        try:
+            numpy.__version__ = "0.0.0"
+            self.assertNotEqual(key, BuildCache.compute_key(self.source_dir, {'compiler': 'g++'}))
+            numpy.__version__ = numpy_version
+            build_cache_module._cython_version = "0.0.0"
+            self.assertNotEqual(key, BuildCache.compute_key(self.source_dir, {'compiler': 'g++'}))
+        finally:
+            numpy.__version__ = numpy_version
+            build_cache_module._cython_version = cython_version
+
+    def test_lookup(self):
+        """
+        A stored library can be retrieved by its key.
+        """
+        key = BuildCache.compute_key(self.source_dir, {'compiler': 'g++'})
+        target = self.tmp_dir + '/ANNarchyCore0.so'
+
+        self.assertFalse(self.cache.lookup(key, target))
+        self.cache.store(key, self._library('lib.so', 128))
+        self.assertTrue(self.cache.lookup(key, target))
+        self.assertEqual(os.path.getsize(target), 128)
+
+    def test_eviction(self):
+        """
+        The least recently used entries are removed if the size limit (1 MB) is exceeded.
+        """
+        lib = self._library('lib.so', 400 * 1024)
+        for idx in range(3):
+            self.cache.store('key' + str(idx), lib)
+            # ensure distinct modification times
+            os.utime(self.cache._entry_path('key' + str(idx)), (time.time() - 10 + idx, time.time() - 10 + idx))
+
+        self.cache.store('key3', lib)
+
+        self.assertLessEqual(self.cache.size_in_bytes(), 1024 * 1024)
+        self.assertFalse(os.path.isfile(self.cache._entry_path('key0')))
+        self.assertTrue(os.path.isfile(self.cache._entry_path('key3')))
@@ -0,0 +1,101 @@
+"""
+
+    test_BulkInit.py
+
+    This file is part of ANNarchy.
+
+    Copyright (C) 2022 Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    ANNarchy is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import unittest
+import numpy
+
+from ANNarchy import Neuron, Synapse, Population, Projection, Network, Uniform
+
+class test_BulkInit(unittest.TestCase):
+    """
+    Test the transfer of the initial values of local attributes as one buffer per data type.
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Compile the network for this test
+        """
+        neuron = Neuron(
+            parameters = """
+                tau = 10.0 : population
+                baseline = 0.5
+                flag = True : bool
+                n = 3 : int
+            """,
+            equations = "tau * dr/dt + r = baseline + sum(exc)"
+        )
+
+        synapse = Synapse(
+            parameters = """
+                eta = 0.1
+                k = 2 : int
+            """,
+            equations = "dx/dt = -x"
+        )
+
+        pop = Population(10, neuron)
+        pop.baseline = Uniform(1.0, 2.0)
+        proj = Projection(pop, pop, "exc", synapse)
+        proj.connect_fixed_number_pre(3, weights=1.0)
+        proj.init['x'] = Uniform(-1.0, 0.0)
+
+        cls.test_net = Network()
+        cls.test_net.add([pop, proj])
+        cls.test_net.compile(silent=True)
+
+        cls.net_pop = cls.test_net.get(pop)
+        cls.net_proj = cls.test_net.get(proj)
+
+    def test_bulk_setter(self):
+        """
+        The generated wrappers provide the bulk setter.
+        """
+        self.assertTrue(hasattr(self.net_pop.cyInstance, 'set_local_attributes'))
+        self.assertTrue(hasattr(self.net_proj.cyInstance, 'set_local_attributes'))
+
+    def test_population_values(self):
+        """
+        Constant and random initial values of populations.
+        """
+        baseline = self.net_pop.baseline
+        self.assertTrue(numpy.all(baseline >= 1.0) and numpy.all(baseline <= 2.0))
+        self.assertGreater(len(numpy.unique(baseline)), 1)
+        numpy.testing.assert_array_equal(self.net_pop.flag, numpy.ones(10, dtype=bool))
+        numpy.testing.assert_array_equal(self.net_pop.n, 3 * numpy.ones(10))
+        self.assertEqual(self.net_pop.tau, 10.0)
+
+    def test_projection_values(self):
+        """
+        Constant and random initial values of projections.
+        """
+        for dendrite in self.net_proj.dendrites:
+            numpy.testing.assert_allclose(dendrite.eta, [0.1] * 3)
+            self.assertEqual(dendrite.k, [2] * 3)
+            self.assertTrue(numpy.all(numpy.array(dendrite.x) >= -1.0) and numpy.all(numpy.array(dendrite.x) <= 0.0))
+
+    def test_mismatching_size(self):
+        """
+        Buffers with the wrong number of values are rejected.
+        """
+        values = numpy.zeros(5)
+        self.assertFalse(self.net_pop.cyInstance.set_local_attributes(['baseline'], values, 'double'))
+        self.assertFalse(self.net_proj.cyInstance.set_local_attributes(['eta'], values, 'double'))
@@ -0,0 +1,114 @@
+"""
+
+    test_FormatAutotuner.py
+
+    This file is part of ANNarchy.
+
+    Copyright (C) 2022 Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    ANNarchy is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import os
+import json
+import shutil
+import tempfile
+import unittest
+
+from ANNarchy import Neuron, Population, Projection, Synapse, Network
+from ANNarchy.core import Global
+from ANNarchy.generator.FormatAutotuner import FormatAutotuner
+
+class test_FormatAutotuner(unittest.TestCase):
+    """
+    Test the measurement-based selection of the storage format.
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        The projection is not compiled, only its connectivity is generated.
+        """
+        neuron = Neuron(
+            parameters = "tau = 10.0",
+            equations = "tau * dr/dt + r = sum(exc)"
+        )
+        synapse = Synapse(equations="dw/dt = 0.001 * pre.r * post.r")
+
+        pre = Population(20, neuron)
+        post = Population(10, neuron)
+        cls.proj = Projection(pre, post, "exc", synapse)
+        cls.proj.connect_fixed_probability(0.5, 0.1, storage_format="lil")
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.tuner = FormatAutotuner(path=os.path.join(self.tmp_dir, 'storage_formats.json'))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, True)
+
+    def test_candidates(self):
+        """
+        A storage order set by the user restricts the candidates.
+        """
+        candidates = FormatAutotuner.candidates(self.proj, "auto")
+        self.assertIn(("csr", "post_to_pre"), candidates)
+        self.assertTrue(all(order == "post_to_pre" for _, order in FormatAutotuner.candidates(self.proj, "post_to_pre")))
+
+    def test_cached_selection(self):
+        """
+        A stored result is re-used without measurement.
+        """
+        lil = self.proj._connection_method(*((self.proj.pre, self.proj.post,) + self.proj._connection_args))
+        self.proj._lil_connectivity = lil
+        self.tuner.store(FormatAutotuner.compute_key(self.proj, lil), "dense", "post_to_pre", {})
+
+        self.assertEqual(self.tuner.select(self.proj, "auto"), ("dense", "post_to_pre"))
+
+    def test_measurement(self):
+        """
+        The fastest of the compiled candidates is selected and stored.
+        """
+        candidates = [("lil", "post_to_pre"), ("csr", "post_to_pre")]
+        selection = self.tuner.select(self.proj, "auto", candidates=candidates)
+
+        self.assertIn(selection, candidates)
+        with open(self.tuner.path, 'r') as rfile:
+            results = json.load(rfile)
+        self.assertEqual(len(list(results.values())[0]['timings']), 2)
+
+    def test_measurement_after_parallel_simulation(self):
+        """
+        The measurement also succeeds once this process executed an openMP
+        parallel region (which deadlocks a forked child process).
+        """
+        neuron = Neuron(
+            parameters = "tau = 10.0",
+            equations = "tau * dr/dt + r = sum(exc) + 1.0"
+        )
+        pop = Population(10, neuron)
+        proj = Projection(pop, pop, "exc")
+        proj.connect_all_to_all(0.1)
+
+        num_threads = Global.config['num_threads']
+        Global.config['num_threads'] = 2
+        try:
+            net = Network()
+            net.add([pop, proj])
+            net.compile(silent=True)
+            net.simulate(10.0)
+        finally:
+            Global.config['num_threads'] = num_threads
+
+        candidates = [("lil", "post_to_pre"), ("csr", "post_to_pre")]
+        self.assertIn(self.tuner.select(self.proj, "auto", candidates=candidates), candidates)
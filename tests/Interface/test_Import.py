@@ -0,0 +1,50 @@
+"""
+
+    test_Import.py
+
+    This file is part of ANNarchy.
+
+    Copyright (C) 2022 Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    ANNarchy is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import sys
+import subprocess
+import unittest
+
+class test_Import(unittest.TestCase):
+    """
+    The parser (sympy) and the code generators are only loaded on demand.
+    """
+    def _loaded_modules(self, statement):
+        code = "import sys\n" + statement + "\nprint(' '.join(sys.modules.keys()))"
+        out = subprocess.check_output([sys.executable, '-c', code]).decode()
+        return out.strip().splitlines()[-1].split(' ')
+
+    def test_import(self):
+        """
+        ``import ANNarchy`` does not load sympy or the code generators.
+        """
+        modules = self._loaded_modules("import ANNarchy")
+        self.assertNotIn('sympy', modules)
+        self.assertNotIn('scipy', modules)
+        self.assertNotIn('ANNarchy.generator.CodeGenerator', modules)
+
+    def test_analyse(self):
+        """
+        The parser is loaded when a neuron model is analysed.
+        """
+        modules = self._loaded_modules("from ANNarchy import *\nNeuron(equations='r = 1.0')._analyse()")
+        self.assertIn('sympy', modules)
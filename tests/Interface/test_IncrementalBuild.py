@@ -0,0 +1,93 @@
+"""
+
+    test_IncrementalBuild.py
+
+    This file is part of ANNarchy.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    ANNarchy is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import os
+import time
+import shutil
+import unittest
+import subprocess
+
+from ANNarchy import Neuron, Population, Projection, Network
+
+@unittest.skipIf(shutil.which('make') is None, "make is not available")
+class test_IncrementalBuild(unittest.TestCase):
+    """
+    Each object file only depends on the headers it includes (listed by the
+    compiler in a .d file), so changing the header of a projection does not
+    rebuild the unrelated populations.
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Compile the network for this test
+        """
+        neuron = Neuron(
+            parameters = "tau = 10.0",
+            equations = "tau * dr/dt + r = sum(exc)"
+        )
+
+        pop1 = Population(10, neuron)
+        pop2 = Population(10, neuron)
+        pop3 = Population(10, neuron)
+        proj = Projection(pop1, pop2, "exc")
+        proj.connect_all_to_all(0.1)
+
+        cls.test_net = Network()
+        cls.test_net.add([pop1, pop2, pop3, proj])
+        cls.test_net.compile(silent=True)
+
+        cls.pop3 = cls.test_net.get(pop3)
+        cls.proj = cls.test_net.get(proj)
+        cls.build_dir = os.path.abspath('annarchy') + '/build/net' + str(cls.test_net.id)
+
+    def _up_to_date(self, target):
+        "make -q returns 0 if the target does not need to be rebuilt."
+        return subprocess.call(['make', '-q', target], cwd=self.build_dir,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL) == 0
+
+    def _touch(self, file):
+        "Sets the modification time of a file of the build directory into the future."
+        future = time.time() + 10.0
+        os.utime(self.build_dir + '/' + file, (future, future))
+
+    def test_dependency_files(self):
+        """
+        The headers included by a translation unit are listed in its .d file.
+        """
+        with open(self.build_dir + '/proj' + str(self.proj.id) + '.d', 'r') as rfile:
+            dependencies = rfile.read()
+
+        self.assertIn('proj' + str(self.proj.id) + '.hpp', dependencies)
+        self.assertNotIn('pop' + str(self.pop3.id) + '.hpp', dependencies)
+
+    def test_changed_header(self):
+        """
+        Only the objects including a modified header are outdated.
+        """
+        pop_object = 'pop' + str(self.pop3.id) + '.o'
+        proj_object = 'proj' + str(self.proj.id) + '.o'
+
+        self.assertTrue(self._up_to_date(pop_object))
+        self.assertTrue(self._up_to_date(proj_object))
+
+        self._touch('proj' + str(self.proj.id) + '.hpp')
+
+        self.assertTrue(self._up_to_date(pop_object))
+        self.assertFalse(self._up_to_date(proj_object))
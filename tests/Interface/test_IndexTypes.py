@@ -0,0 +1,149 @@
+"""
+
+    test_IndexTypes.py
+
+    This file is part of ANNarchy.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    ANNarchy is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import os
+import unittest
+import numpy
+
+from ANNarchy import Neuron, Population, Projection, Network, Synapse
+from ANNarchy.core import Global
+
+class test_IndexTypes(unittest.TestCase):
+    """
+    The ranks of a projection are stored in the smallest unsigned type
+    suitable for the population sizes (if only_int_idx_type is False), the
+    column indices of rate-coded LIL/CSR projections in a type suitable for
+    the pre-synaptic population. Spiking projections and, with several openMP
+    threads, formats other than LIL keep using int.
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Compile the same projections with one and with two threads.
+        """
+        input_neuron = Neuron(parameters="r = 0.0")
+        rate_neuron = Neuron(equations="r = sum(exc)")
+
+        spike_neuron = Neuron(
+            parameters = "v_input = 0.0",
+            equations = "v = v_input + g_exc",
+            spike = "v >= 1.0",
+            reset = "v = 0.0"
+        )
+
+        # 40 pre-synaptic neurons (1 byte) and 300 post-synaptic ones (2 bytes)
+        pop1 = Population(40, input_neuron)
+        pop2 = Population(300, rate_neuron)
+        proj = Projection(pop1, pop2, "exc")
+        proj.connect_all_to_all(weights=0.1, storage_format="csr")
+        lil_proj = Projection(pop1, pop2, "exc")
+        lil_proj.connect_all_to_all(weights=0.1, storage_format="lil")
+
+        # accumulates the received inputs
+        integrator = Neuron(
+            equations = "v = v + g_exc",
+            spike = "v >= 1000.0",
+            reset = "v = 0.0"
+        )
+
+        pop3 = Population(40, spike_neuron)
+        pop4 = Population(300, integrator)
+        spike_proj = Projection(pop3, pop4, "exc", synapse=Synapse(pre_spike="g_target += w"))
+        spike_proj.connect_all_to_all(weights=0.1, storage_format="csr")
+
+        cls.objects = [pop1, pop2, proj, lil_proj, pop3, pop4, spike_proj]
+
+        prev_idx_type = Global.config['only_int_idx_type']
+        num_threads = Global.config['num_threads']
+        Global.config['only_int_idx_type'] = False
+        try:
+            cls.networks = {}
+            for threads in [1, 2]:
+                Global.config['num_threads'] = threads
+                cls.networks[threads] = Network()
+                cls.networks[threads].add(cls.objects)
+                cls.networks[threads].compile(silent=True)
+        finally:
+            Global.config['only_int_idx_type'] = prev_idx_type
+            Global.config['num_threads'] = num_threads
+
+    def setUp(self):
+        """
+        Automatically called before each test method, basically to reset the
+        network after every test.
+        """
+        for net in self.networks.values():
+            net.reset()
+
+    def _generated_code(self, threads, obj):
+        net = self.networks[threads]
+        source = os.path.abspath('annarchy') + '/generate/net' + str(net.id) + '/proj' + str(net.get(obj).id) + '.hpp'
+        with open(source, 'r') as rfile:
+            return rfile.read()
+
+    def _transmit(self, threads):
+        """
+        Inputs received through the CSR and the LIL projection.
+        """
+        net = self.networks[threads]
+        pop1, pop2 = self.objects[0], self.objects[1]
+        net.get(pop1).r = numpy.linspace(0.0, 1.0, 40)
+        net.simulate(1)
+        return net.get(pop2).sum("exc")
+
+    def test_rate_coded_column_type(self):
+        """
+        With one thread, the column indices are stored in one byte, the rows
+        in two bytes.
+        """
+        self.assertIn('CSRMatrix<unsigned short int, unsigned short int, unsigned char>', self._generated_code(1, self.objects[2]))
+        self.assertIn('LILMatrix<unsigned short int, unsigned short int, unsigned char>', self._generated_code(1, self.objects[3]))
+
+        expected = numpy.full(300, 2 * 0.1 * numpy.sum(numpy.linspace(0.0, 1.0, 40)))
+        numpy.testing.assert_allclose(self._transmit(1), expected)
+
+    def test_openmp_formats(self):
+        """
+        With two threads, only the LIL format uses the compact index types
+        (the rate-coded matrix is not split by default).
+        """
+        self.assertIn('LILMatrix<unsigned short int, unsigned short int, unsigned char>', self._generated_code(2, self.objects[3]))
+        self.assertIn('CSRMatrix<int, int, int>', self._generated_code(2, self.objects[2]))
+
+        expected = numpy.full(300, 2 * 0.1 * numpy.sum(numpy.linspace(0.0, 1.0, 40)))
+        numpy.testing.assert_allclose(self._transmit(2), expected)
+
+    def test_spiking_csr(self):
+        """
+        A spiking projection uses int, every post-synaptic neuron receives
+        the spikes of all pre-synaptic ones.
+        """
+        pop3, pop4, spike_proj = self.objects[4], self.objects[5], self.objects[6]
+        for threads, net in self.networks.items():
+            self.assertIn('CSRCMatrix<int, int>', self._generated_code(threads, spike_proj))
+            self.assertEqual(net.get(spike_proj).nb_synapses, 40 * 300)
+
+            # 10 of the pre-synaptic neurons spike in the first step, the spikes
+            # are received in the second one
+            v_input = numpy.zeros(40)
+            v_input[:10] = 1.0
+            net.get(pop3).v_input = v_input
+            net.simulate(2)
+            numpy.testing.assert_allclose(net.get(pop4).v, numpy.full(300, 1.0))
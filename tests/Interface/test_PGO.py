@@ -0,0 +1,102 @@
+"""
+
+    test_PGO.py
+
+    This file is part of ANNarchy.
+
+    Copyright (C) 2022 Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    ANNarchy is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import os
+import json
+import shutil
+import tempfile
+import unittest
+import numpy
+
+from ANNarchy import Neuron, Population, Projection, Monitor, Network
+from ANNarchy.core import Global
+from ANNarchy.generator.Compiler import Compiler
+
+class test_PGO(unittest.TestCase):
+    """
+    Test the configuration of the profile-guided optimization.
+    """
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, True)
+
+    def _compiler(self, user_config):
+        path_to_json = self.tmp_dir + '/annarchy.json'
+        with open(path_to_json, 'w') as wfile:
+            json.dump(user_config, wfile)
+
+        return Compiler(annarchy_dir=self.tmp_dir, clean=False, compiler="default", compiler_flags="default",
+                        add_sources="", extra_libs="", path_to_json=path_to_json, silent=True,
+                        cuda_config={'device': 0}, debug_build=False, profile_enabled=False,
+                        populations=[], projections=[], net_id=0)
+
+    def test_compile_argument(self):
+        """
+        The argument of compile() is either a boolean or the warm-up duration.
+        """
+        compiler = self._compiler({'openmp': {'compiler': 'g++', 'flags': '-O2'}})
+        self.assertIsNone(compiler.pgo_duration(False))
+        self.assertEqual(compiler.pgo_duration(True), 1000.0)
+        self.assertEqual(compiler.pgo_duration(250), 250.0)
+
+    def test_annarchy_json(self):
+        """
+        The "pgo" section of annarchy.json enables PGO and sets the default duration.
+        """
+        compiler = self._compiler({'openmp': {'compiler': 'g++', 'flags': '-O2'}, 'pgo': {'enabled': True, 'duration': 500.0}})
+        self.assertEqual(compiler.pgo_duration(False), 500.0)
+        self.assertEqual(compiler.pgo_duration(100.0), 100.0)
+
+    def test_warm_up_after_parallel_simulation(self):
+        """
+        The profile is also recorded once this process executed an openMP
+        parallel region (which deadlocks a forked child process).
+        """
+        neuron = Neuron(
+            parameters = "tau = 10.0",
+            equations = "tau * dr/dt + r = sum(exc) + 1.0"
+        )
+        pop = Population(10, neuron)
+        proj = Projection(pop, pop, "exc")
+        proj.connect_all_to_all(0.1)
+        mon = Monitor(pop, 'r')
+
+        num_threads = Global.config['num_threads']
+        Global.config['num_threads'] = 2
+        try:
+            net = Network()
+            net.add([pop, proj])
+            net.compile(silent=True)
+            net.simulate(10.0)
+        finally:
+            Global.config['num_threads'] = num_threads
+
+        pgo_net = Network()
+        pgo_net.add([pop, proj, mon])
+        pgo_net.compile(silent=True, pgo=10.0)
+
+        self.assertTrue(os.path.isfile('annarchy/pgo/net' + str(pgo_net.id) + '/key'))
+
+        pgo_net.simulate(10.0)
+        numpy.testing.assert_allclose(pgo_net.get(mon).get('r')[-1], net.get(pop).r)
@@ -0,0 +1,65 @@
+"""
+
+    test_PrecompiledHeader.py
+
+    This file is part of ANNarchy.
+
+    Copyright (C) 2022 Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    ANNarchy is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+from ANNarchy.generator.PrecompiledHeader import PrecompiledHeader
+
+class test_PrecompiledHeader(unittest.TestCase):
+    """
+    Test the location of the shared precompiled headers.
+    """
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.pch = PrecompiledHeader({'cache': {'path': self.tmp_dir}})
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, True)
+
+    def test_key(self):
+        """
+        Each compiler configuration uses its own header.
+        """
+        key = PrecompiledHeader.compute_key('g++', 'g++ 12.2.0', {'cpu_flags': '-O2'})
+        self.assertEqual(key, PrecompiledHeader.compute_key('g++', 'g++ 12.2.0', {'cpu_flags': '-O2'}))
+        self.assertNotEqual(key, PrecompiledHeader.compute_key('g++', 'g++ 12.2.0', {'cpu_flags': '-O3'}))
+        self.assertNotEqual(key, PrecompiledHeader.compute_key('g++', 'g++ 13.1.0', {'cpu_flags': '-O2'}))
+
+    def test_unsupported_compiler(self):
+        """
+        No header is created for an unknown compiler.
+        """
+        header, _ = self.pch.prepare('annarchy-unknown-compiler', {'cpu_flags': '-O2'})
+        self.assertIsNone(header)
+
+    @unittest.skipIf(shutil.which('g++') is None, "g++ is not available")
+    def test_prepare(self):
+        """
+        The header is written into the cache directory.
+        """
+        header, extension = self.pch.prepare('g++', {'cpu_flags': '-O2'})
+        self.assertTrue(os.path.isfile(header))
+        self.assertTrue(header.startswith(self.tmp_dir))
+        self.assertIn(extension, ['.gch', '.pch'])
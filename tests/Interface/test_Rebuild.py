@@ -0,0 +1,127 @@
+"""
+
+    test_Rebuild.py
+
+    This file is part of ANNarchy.
+
+    Copyright (C) 2022 Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    ANNarchy is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+import subprocess
+
+import ANNarchy
+from ANNarchy import Neuron, Population, Projection, Network, check_rebuild
+
+# Model script executed in a new interpreter, like a user re-running a script
+# after editing it. Prints the result of check_rebuild() and whether compile()
+# re-used the existing library.
+model_script = """
+import os, sys
+from ANNarchy import *
+
+tau, c_value, threshold = float(sys.argv[1]), float(sys.argv[2]), float(sys.argv[3])
+
+c = Constant('c', c_value)
+neuron = Neuron(
+    parameters = "tau = %f" % tau,
+    equations = "tau * dr/dt + r = c * sum(exc) : init = 0.5, min = %f" % threshold
+)
+pop = Population(10, neuron)
+proj = Projection(pop, pop, "exc")
+proj.connect_all_to_all(0.1)
+
+changed = check_rebuild(silent=True)
+library = 'annarchy/ANNarchyCore0.so'
+mtime = os.path.getmtime(library) if os.path.isfile(library) else None
+compile(silent=True)
+sys.stdout.write('\\n' + str(len(changed)) + ' ' + str(mtime == os.path.getmtime(library)))
+"""
+
+class test_Rebuild(unittest.TestCase):
+    """
+    Test the detection of changes which require a recompilation.
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Compile the network for this test
+        """
+        neuron = Neuron(
+            parameters = "tau = 10.0",
+            equations = "tau * dr/dt + r = sum(exc) : init = 0.5"
+        )
+
+        pop = Population(10, neuron)
+        proj = Projection(pop, pop, "exc")
+        proj.connect_all_to_all(0.1)
+
+        cls.test_net = Network()
+        cls.test_net.add([pop, proj])
+        cls.test_net.compile(silent=True)
+
+    def test_unchanged(self):
+        """
+        The compiled network does not need a rebuild.
+        """
+        self.assertEqual(check_rebuild(net_id=self.test_net.id, silent=True), [])
+
+    def test_not_compiled(self):
+        """
+        A rebuild is necessary if no library exists.
+        """
+        self.assertNotEqual(check_rebuild(directory='annarchy_not_compiled', net_id=self.test_net.id, silent=True), [])
+
+class test_RebuildValues(unittest.TestCase):
+    """
+    The values of parameters and constants are set at runtime: a script in
+    which only these values were edited re-uses the existing library.
+    """
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+        with open(self.work_dir + '/model.py', 'w') as wfile:
+            wfile.write(model_script)
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, True)
+
+    def run_model(self, tau, c, threshold):
+        "Returns the number of modified files and if the library was re-used."
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.path.dirname(os.path.dirname(os.path.abspath(ANNarchy.__file__)))
+        output = subprocess.check_output(
+            [sys.executable, 'model.py', str(tau), str(c), str(threshold)],
+            cwd=self.work_dir, env=env, stderr=subprocess.DEVNULL
+        ).decode()
+        nb_changed, reused = output.strip().splitlines()[-1].split()
+        return int(nb_changed), reused == 'True'
+
+    def test_parameter_and_constant(self):
+        """
+        Changing the value of a parameter and of a Constant does not require a
+        rebuild, while a numerical value inside an equation does.
+        """
+        self.assertEqual(self.run_model(10.0, 1.0, 0.0), (1, False))
+        self.assertEqual(self.run_model(20.0, 1.0, 0.0), (0, True))
+        self.assertEqual(self.run_model(20.0, 2.0, 0.0), (0, True))
+
+        nb_changed, reused = self.run_model(20.0, 2.0, -1.0)
+        self.assertGreater(nb_changed, 0)
+        self.assertFalse(reused)
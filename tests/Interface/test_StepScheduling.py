@@ -0,0 +1,85 @@
+"""
+
+    test_StepScheduling.py
+
+    This file is part of ANNarchy.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    ANNarchy is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import unittest
+import numpy
+
+from ANNarchy import Neuron, Population, Projection, Monitor, Network
+from ANNarchy.core import Global
+
+class test_StepScheduling(unittest.TestCase):
+    """
+    The results of a simulation must not depend on the chosen
+    *step_scheduling* (only relevant for more than one openMP thread).
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Compile the same network for both schedules.
+        """
+        input_neuron = Neuron(
+            parameters = "r = 0.0"
+        )
+
+        leaky_neuron = Neuron(
+            parameters = "tau = 10.0",
+            equations = "tau * dr/dt + r = sum(exc) : min=0.0"
+        )
+
+        inp = Population(10, input_neuron)
+        pops = [Population(5, leaky_neuron) for _ in range(3)]
+
+        projs = []
+        pre = inp
+        for idx, pop in enumerate(pops):
+            proj = Projection(pre, pop, "exc")
+            proj.connect_all_to_all(0.1, delays=2.0 if idx == 1 else 0.0)
+            projs.append(proj)
+            pre = pop
+
+        mon = Monitor(pops[-1], 'r')
+
+        cls.networks = {}
+        prev_scheduling = Global.config['step_scheduling']
+        try:
+            for scheduling in ["phases", "dependencies"]:
+                Global.config['step_scheduling'] = scheduling
+
+                net = Network()
+                net.add([inp] + pops + projs + [mon])
+                net.compile(silent=True)
+
+                cls.networks[scheduling] = (net, net.get(inp), net.get(mon))
+        finally:
+            Global.config['step_scheduling'] = prev_scheduling
+
+    def test_same_results(self):
+        """
+        Both schedules compute the same rates.
+        """
+        rates = {}
+        for scheduling, (net, inp, mon) in self.networks.items():
+            net.reset()
+            inp.r = numpy.linspace(0.0, 1.0, 10)
+            net.simulate(20)
+            rates[scheduling] = mon.get('r')
+
+        self.assertEqual(rates['phases'].shape, (20, 5))
+        numpy.testing.assert_allclose(rates['dependencies'], rates['phases'])
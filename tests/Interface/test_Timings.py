@@ -0,0 +1,79 @@
+"""
+
+    test_Timings.py
+
+    This file is part of ANNarchy.
+
+    Copyright (C) 2022 Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    ANNarchy is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from ANNarchy import Neuron, Population, Projection, Network, compile_timings
+
+class test_Timings(unittest.TestCase):
+    """
+    Test the timing report of compile().
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Compile the network for this test
+        """
+        neuron = Neuron(
+            parameters = "tau = 10.0",
+            equations = "tau * dr/dt + r = sum(exc)"
+        )
+
+        pop = Population(10, neuron, name="pop")
+        proj = Projection(pop, pop, "exc", name="proj")
+        proj.connect_all_to_all(0.1)
+
+        cls.test_net = Network()
+        cls.test_net.add([pop, proj])
+        cls.test_net.compile(silent=True)
+
+    def test_stages(self):
+        """
+        All stages of compile() are contained.
+        """
+        timings = self.test_net.compile_timings()
+
+        for stage in ['analysis', 'generate', 'compilation', 'instantiate', 'total']:
+            self.assertIn(stage, timings)
+        self.assertIn('PyxGenerator', timings['generate'])
+        self.assertIn('load_library', timings['instantiate'])
+        self.assertIn('pop', timings['analysis']['populations'])
+        self.assertIn('init_attributes', timings['instantiate']['populations']['pop'])
+        self.assertIn('connect', timings['instantiate']['projections']['proj'])
+        self.assertGreaterEqual(timings['total'], timings['instantiate']['total'])
+
+    def test_json(self):
+        """
+        The report can be stored as JSON file.
+        """
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            filename = os.path.join(tmp_dir, 'timings.json')
+            timings = compile_timings(net_id=self.test_net.id, filename=filename)
+            with open(filename, 'r') as rfile:
+                self.assertEqual(json.load(rfile), timings)
+        finally:
+            shutil.rmtree(tmp_dir, True)
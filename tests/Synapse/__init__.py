@@ -7,6 +7,12 @@ from .test_RateTransmission import (test_RateTransmission,
                                     test_CustomConnectivityUniformDelay)
 from .test_Dendrite import test_DendriteDefaultSynapse, test_DendriteModifiedSynapse
 from .test_Projection import test_Projection
+from .test_Connector import (test_SpatialConnectors, test_ParallelConnectors,
+                             test_CSRConnectivity, test_SparseConnectivity,
+                             test_ChunkedConnectivity, test_MatrixMarket,
+                             test_ConnectivityMemory, test_CppConnectors,
+                             test_Validation, test_BinaryConnectivity,
+                             test_ConnectivityCache, test_ConnectivityStatistics)
 
 # Operations
 from .test_RateSynapse import test_Locality, test_AccessPSP, test_ModifiedPSP
@@ -22,12 +28,13 @@ from .test_SpecificProjections import test_CurrentInjection
 
 # Some features and accordingly Unittests are only allowed on specific platforms
 if _check_paradigm('openmp'):
-    from .test_RateDelays import test_NonuniformDelay
+    from .test_RateDelays import test_NonuniformDelay, test_IntDelayType, test_DelayedVariableStorage
     from .test_RateTransmission import test_CustomConnectivityNonUniformDelay
     from .test_SpikingTransmission import test_SpikeTransmissionNonUniformDelay
     from .test_StructuralPlasticity import test_StructuralPlasticityEnvironment, test_StructuralPlasticityModel
     from .test_Convolution import test_Convolution
     from .test_Pooling import test_Pooling
+    from .test_Projection import test_StoragePrecision
 
 # Contains mapping which formats are allowed for which operation
 from .storage_formats import single_thread, open_mp, cuda, p2p
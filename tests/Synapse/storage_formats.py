@@ -28,11 +28,12 @@
 
 single_thread = {
     # test_RateTransmission.py
-    "test_RateTransmission":                    ["lil", "csr", "ell"],
+    "test_RateTransmission":                    ["lil", "csr", "ell", "dense"],
     "test_CustomConnectivityNoDelay":           ["lil", "csr", "ell"],
     "test_CustomConnectivityUniformDelay":      ["lil", "csr", "ell"],
     "test_CustomConnectivityNonUniformDelay":   ["lil", "csr", "ell"],
     "test_Projection":                          ["lil", "csr"],
+    "test_StoragePrecision":                    ["lil", "csr", "dense"],
     # test_ContinuousUpdate.py
     "test_RateCodedContinuousUpdate":           ["lil", "csr"],
     "test_SpikingContinuousUpdate":             ["lil", "csr"],
@@ -46,7 +47,9 @@ single_thread = {
     # from test_RateDelays
     "test_NoDelay":                             ["lil", "csr", "ell"],
     "test_UniformDelay":                        ["lil", "csr"],
-    "test_NonUniformDelay":                     ["lil", "csr"],
+    "test_DelayedVariableStorage":              ["lil", "csr"],
+    "test_NonuniformDelay":                     ["lil", "csr"],
+    "test_IntDelayType":                        ["lil", "csr"],
     "test_SynapseOperations":                   ["lil"],
     "test_SynapticAccess":                      ["lil", "csr"],
     # from test_SpikingSynapse
@@ -65,11 +68,12 @@ single_thread = {
 
 open_mp = {
     # test_RateTransmission.py
-    "test_RateTransmission":                    ["lil", "csr", "ell"],
+    "test_RateTransmission":                    ["lil", "csr", "ell", "dense"],
     "test_CustomConnectivityNoDelay":           ["lil", "csr", "ell"],
     "test_CustomConnectivityUniformDelay":      ["lil", "csr", "ell"],
     "test_CustomConnectivityNonUniformDelay":   ["lil", "csr", "ell"],
     "test_Projection":                          ["lil", "csr"],
+    "test_StoragePrecision":                    ["lil", "csr", "dense"],
     # from test_ContinuousUpdate.py
     "test_RateCodedContinuousUpdate":           ["lil", "csr"],
     "test_SpikingContinuousUpdate":             ["lil", "csr"],
@@ -83,7 +87,9 @@ open_mp = {
     # from test_RateDelays
     "test_NoDelay":                             ["lil", "csr", "ell"],
     "test_UniformDelay":                        ["lil", "csr"],
-    "test_NonUniformDelay":                     ["lil", "csr"],
+    "test_DelayedVariableStorage":              ["lil", "csr"],
+    "test_NonuniformDelay":                     ["lil", "csr"],
+    "test_IntDelayType":                        ["lil", "csr"],
     "test_SynapseOperations":                   ["lil"],
     "test_SynapticAccess":                      ["lil", "csr"],
     # from test_SpikingSynapse
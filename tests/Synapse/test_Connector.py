@@ -0,0 +1,942 @@
+"""
+
+    test_Connector.py
+
+    This file is part of ANNarchy.
+
+    Copyright (C) 2013-2022 Julien Vitay <julien.vitay@gmail.com>,
+    Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    ANNarchy is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import os
+import sys
+import tempfile
+import unittest
+import subprocess
+from math import exp
+import numpy
+
+from scipy import sparse
+
+from ANNarchy import Network, Neuron, Population, Projection, Synapse, Uniform, setup
+from ANNarchy.core import Global
+from ANNarchy.core.cython_ext.Connector import LILConnectivity, CSRConnectivity
+from ANNarchy.core.cython_ext import Coordinates
+
+class test_SpatialConnectors(unittest.TestCase):
+    """
+    The distance-based connectors (gaussian, dog) only visit the pre-synaptic
+    neurons near each post-synaptic neuron. The result is compared with the
+    evaluation of all pairs.
+    """
+    @classmethod
+    def setUpClass(cls):
+        neuron = Neuron(equations="r = 0.0")
+        cls.pops = {
+            '1d': (Population(25, neuron), Population(10, neuron)),
+            '2d': (Population((12, 9), neuron), Population((6, 5), neuron)),
+            '3d': (Population((5, 4, 3), neuron), Population((5, 4, 3), neuron)),
+        }
+
+    @staticmethod
+    def all_pairs(pre, post, profile, threshold, allow_self_connections):
+        "Evaluates the profile for every pair of neurons."
+        funcs = {
+            1: (lambda rk, geo: (rk/float(geo[0]-1), ), Coordinates.comp_dist1D),
+            2: (Coordinates.get_normalized_2d_coord, Coordinates.comp_dist2D),
+            3: (Coordinates.get_normalized_3d_coord, Coordinates.comp_dist3D),
+        }
+        coord, dist = funcs[len(pre.geometry)]
+        result = []
+        for post_rk in range(post.size):
+            post_coord = coord(post_rk, post.geometry)
+            ranks, values = [], []
+            for pre_rk in range(pre.size):
+                if not allow_self_connections and pre_rk == post_rk:
+                    continue
+                value = profile(dist(coord(pre_rk, pre.geometry), post_coord))
+                if abs(value) > threshold:
+                    ranks.append(pre_rk)
+                    values.append(value)
+            result.append((ranks, values))
+        return result
+
+    def check(self, lil, expected):
+        self.assertEqual(list(lil.post_rank), list(range(len(expected))))
+        for idx, (ranks, values) in enumerate(expected):
+            self.assertEqual(list(lil.pre_rank[idx]), ranks)
+            for w, v in zip(lil.w[idx], values):
+                self.assertAlmostEqual(w, v, places=5)
+
+    def test_gaussian(self):
+        """
+        Gaussian profile for different geometries and limits.
+        """
+        for key, (pre, post) in self.pops.items():
+            for sigma, limit in [(0.1, 0.01), (0.3, 0.2), (0.3, 0.0)]:
+                lil = LILConnectivity()
+                lil.gaussian(pre, post, 2.0, sigma, 0.0, limit, False)
+                expected = self.all_pairs(pre, post, lambda d: 2.0*exp(-d/(2.0*sigma**2)), 2.0*limit, False)
+                self.check(lil, expected)
+
+    def test_dog(self):
+        """
+        Difference-of-Gaussians profile for different geometries and limits.
+        """
+        for key, (pre, post) in self.pops.items():
+            for amp_neg, sigma_neg, limit in [(0.5, 0.4, 0.01), (1.5, 0.3, 0.1), (1.0, 0.4, 0.05)]:
+                lil = LILConnectivity()
+                lil.dog(pre, post, 1.0, 0.1, amp_neg, sigma_neg, 0.0, limit, True)
+                profile = lambda d: 1.0*exp(-d/(2.0*0.1**2)) - amp_neg*exp(-d/(2.0*sigma_neg**2))
+                expected = self.all_pairs(pre, post, profile, limit*abs(1.0-amp_neg), True)
+                self.check(lil, expected)
+
+class test_ParallelConnectors(unittest.TestCase):
+    """
+    With setup(connectivity_threads=...), the random patterns only depend on
+    the seed and not on the number of threads.
+    """
+    @classmethod
+    def setUpClass(cls):
+        neuron = Neuron(equations="r = 0.0")
+        cls.pop1 = Population(200, neuron)
+        cls.pop2 = Population(150, neuron)
+
+    def tearDown(self):
+        Global.config['connectivity_threads'] = None
+
+    def build(self, threads, pattern, pre, post, *args):
+        Global.config['connectivity_threads'] = threads
+        numpy.random.seed(1)
+        lil = LILConnectivity()
+        getattr(lil, pattern)(pre, post, *args)
+        return list(lil.post_rank), [list(r) for r in lil.pre_rank], [list(w) for w in lil.w]
+
+    def test_thread_count(self):
+        """
+        Identical connectivity and weights for 1 and 3 threads.
+        """
+        for pattern, args in [
+                ('all_to_all', (Uniform(0.0, 1.0), 0.0, False)),
+                ('fixed_probability', (0.2, Uniform(0.0, 1.0), 0.0, False)),
+                ('fixed_number_pre', (20, 1.0, 0.0, False)),
+                ('fixed_number_post', (20, 1.0, 0.0, False))]:
+            for pre, post in [(self.pop1, self.pop2), (self.pop1, self.pop1)]:
+                self.assertEqual(self.build(1, pattern, pre, post, *args), self.build(3, pattern, pre, post, *args))
+
+    def test_sequential_fixed_number_post(self):
+        """
+        Without connectivity_threads, fixed_number_post() draws with numpy as
+        in the previous releases, so seeded scripts keep their connectivity.
+        """
+        numpy.random.seed(1)
+        post_ranks = self.pop1.ranks.tolist()
+        expected = {rk: [] for rk in post_ranks}
+        for rk_pre in self.pop1.ranks:
+            tmp = numpy.random.choice(post_ranks, size=20, replace=False)
+            while rk_pre in list(tmp):
+                tmp = numpy.random.choice(post_ranks, size=20, replace=False)
+            for rk in tmp:
+                expected[rk].append(rk_pre)
+
+        post_rank, pre_rank, _ = self.build(None, 'fixed_number_post', self.pop1, self.pop1, 20, 1.0, 0.0, False)
+        self.assertEqual(dict(zip(post_rank, pre_rank)), {rk: row for rk, row in expected.items() if row})
+
+    def test_patterns(self):
+        """
+        The rows are sorted and respect the pattern, self-connections are excluded.
+        """
+        post_rank, pre_rank, _ = self.build(2, 'fixed_number_pre', self.pop1, self.pop1, 20, 1.0, 0.0, False)
+        for rk, row in zip(post_rank, pre_rank):
+            self.assertEqual(len(row), 20)
+            self.assertEqual(row, sorted(set(row)))
+            self.assertNotIn(rk, row)
+
+        post_rank, pre_rank, _ = self.build(2, 'fixed_number_post', self.pop1, self.pop1, 20, 1.0, 0.0, False)
+        targets = numpy.zeros(self.pop1.size)
+        for rk, row in zip(post_rank, pre_rank):
+            self.assertNotIn(rk, row)
+            targets[row] += 1
+        numpy.testing.assert_array_equal(targets, 20)
+
+        post_rank, pre_rank, _ = self.build(2, 'fixed_probability', self.pop1, self.pop1, 0.2, 1.0, 0.0, False)
+        nb_synapses = sum(len(row) for row in pre_rank)
+        self.assertAlmostEqual(nb_synapses / (200.0 * 199.0), 0.2, delta=0.02)
+        for rk, row in zip(post_rank, pre_rank):
+            self.assertEqual(row, sorted(set(row)))
+            self.assertNotIn(rk, row)
+
+    def test_fixed_number_post_bounds(self):
+        """
+        An error is raised if the post-synaptic population has not enough
+        neurons, the excluded self-connection included.
+        """
+        from ANNarchy.core.Global import ANNarchyException
+        for threads in [None, 2]:
+            with self.assertRaises(ANNarchyException):
+                self.build(threads, 'fixed_number_post', self.pop1, self.pop2, 151, 1.0, 0.0, False)
+            with self.assertRaises(ANNarchyException):
+                self.build(threads, 'fixed_number_post', self.pop1, self.pop1, 200, 1.0, 0.0, False)
+
+            # all post-synaptic neurons except itself
+            post_rank, pre_rank, _ = self.build(threads, 'fixed_number_post', self.pop1, self.pop1, 199, 1.0, 0.0, False)
+            self.assertEqual(sum(len(row) for row in pre_rank), 200 * 199)
+
+class test_CSRConnectivity(unittest.TestCase):
+    """
+    The pre-defined patterns are stored in CSRConnectivity, which has to
+    contain the same synapses as LILConnectivity.
+    """
+    @classmethod
+    def setUpClass(cls):
+        neuron = Neuron(equations="r = 0.0")
+        cls.pop1 = Population(100, neuron)
+        cls.pop2 = Population(80, neuron)
+
+    def build(self, cls):
+        numpy.random.seed(1)
+        connectivity = cls()
+        connectivity.fixed_probability(self.pop1, self.pop2, 0.2, Uniform(0.0, 1.0), Uniform(1.0, 5.0), False)
+        return connectivity
+
+    def test_arrays(self):
+        """
+        Row pointers, column indices and values correspond to the rows of the LIL.
+        """
+        lil = self.build(LILConnectivity)
+        csr = self.build(CSRConnectivity)
+
+        self.assertEqual(list(csr.post_rank), list(lil.post_rank))
+        self.assertEqual(csr.nb_synapses, lil.nb_synapses)
+        self.assertEqual(csr.max_delay, lil.max_delay)
+        self.assertEqual(list(csr.row_ptr), [0] + list(numpy.cumsum([len(r) for r in lil.pre_rank])))
+        self.assertEqual(list(csr.col_idx), [rk for r in lil.pre_rank for rk in r])
+        numpy.testing.assert_allclose(csr.values, [w for r in lil.w for w in r])
+        self.assertEqual(list(csr.delays), [d for r in lil.delay for d in r])
+
+    def test_delays(self):
+        """
+        Uniform delays are not stored, until a row with a different delay is added.
+        """
+        csr = CSRConnectivity()
+        csr.push_back(0, [1, 2], [0.5], [2.0 * Global.config['dt']])
+        csr.push_back(1, [0, 3], [0.5], [2.0 * Global.config['dt']])
+        self.assertEqual(csr.uniform_delay, 2)
+        self.assertEqual(list(csr.delays), [])
+
+        csr.push_back(2, [1], [0.5], [3.0 * Global.config['dt']])
+        self.assertEqual(csr.uniform_delay, -1)
+        self.assertEqual(list(csr.delays), [2, 2, 2, 2, 3])
+
+        lil = csr.to_lil()
+        self.assertEqual([list(r) for r in lil.pre_rank], [[1, 2], [0, 3], [1]])
+        self.assertEqual([list(d) for d in lil.delay], [[2, 2], [2, 2], [3]])
+        self.assertEqual(lil.max_delay, 3)
+
+class test_SparseConnectivity(unittest.TestCase):
+    """
+    connect_from_sparse() converts the matrix into a CSRConnectivity with array
+    operations, the rows are sorted by post-synaptic rank.
+    """
+    @classmethod
+    def setUpClass(cls):
+        neuron = Neuron(equations="r = 0.0")
+        cls.pop1 = Population(20, neuron)
+        cls.pop2 = Population(10, neuron)
+
+    def test_population_views(self):
+        """
+        Ranks of PopulationViews, empty columns and per-synapse delays.
+        """
+        pre = self.pop1[[3, 7, 1, 12]]
+        post = self.pop2[[6, 2, 9]]
+
+        weights = sparse.lil_matrix((4, 3))
+        weights[0, 0] = 0.1
+        weights[2, 0] = 0.2
+        weights[1, 1] = 0.3
+        weights[3, 1] = 0.4
+        delays = sparse.lil_matrix((4, 3))
+        delays[0, 0] = 1.0
+        delays[2, 0] = 2.0
+        delays[1, 1] = 3.0
+        delays[3, 1] = 4.0
+
+        proj = Projection(pre, post, "exc")
+        proj.connect_from_sparse(weights, delays=delays)
+        csr = proj._connection_method(*((proj.pre, proj.post,) + proj._connection_args))
+
+        dt = Global.config['dt']
+        self.assertEqual(list(csr.post_rank), [2, 6])
+        self.assertEqual(list(csr.row_ptr), [0, 2, 4])
+        self.assertEqual(list(csr.col_idx), [7, 12, 3, 1])
+        numpy.testing.assert_allclose(csr.values, [0.3, 0.4, 0.1, 0.2])
+        self.assertEqual(list(csr.delays), [round(d/dt) for d in [3.0, 4.0, 1.0, 2.0]])
+        self.assertEqual(csr.max_delay, round(4.0/dt))
+        self.assertEqual(proj.uniform_delay, -1)
+
+    def test_constant_delay(self):
+        """
+        A constant delay is not stored per synapse.
+        """
+        weights = sparse.random(20, 10, density=0.3, format='csr', random_state=1)
+        proj = Projection(self.pop1, self.pop2, "exc")
+        proj.connect_from_sparse(weights, delays=2.0)
+        csr = proj._connection_method(*((proj.pre, proj.post,) + proj._connection_args))
+
+        self.assertEqual(csr.nb_synapses, weights.nnz)
+        self.assertEqual(csr.uniform_delay, round(2.0/Global.config['dt']))
+        self.assertEqual(list(csr.delays), [])
+        numpy.testing.assert_allclose(csr.to_lil().w[0], weights.tocsc()[:, csr.post_rank[0]].data)
+
+class test_ChunkedConnectivity(unittest.TestCase):
+    """
+    connect_from_chunks() appends blocks of synapses to a CSRConnectivity.
+    """
+    @classmethod
+    def setUpClass(cls):
+        neuron = Neuron(equations="r = 0.0")
+        cls.pop1 = Population(20, neuron)
+        cls.pop2 = Population(10, neuron)
+
+    def test_blocks(self):
+        """
+        Unsorted blocks of rows lead to the same connectivity as the whole matrix.
+        """
+        weights = sparse.random(10, 20, density=0.3, format='coo', random_state=2)
+        def blocks():
+            for start in [4, 0, 8]:
+                mask = (weights.row >= start) & (weights.row < start + 4)
+                yield weights.row[mask][::-1], weights.col[mask][::-1], weights.data[mask][::-1]
+
+        proj = Projection(self.pop1, self.pop2, "exc")
+        proj.connect_from_chunks(blocks(), delays=2.0)
+        csr = proj._connection_method(*((proj.pre, proj.post,) + proj._connection_args))
+
+        self.assertEqual(csr.nb_synapses, weights.nnz)
+        self.assertEqual(csr.uniform_delay, round(2.0/Global.config['dt']))
+        self.assertEqual(list(csr.delays), [])
+        dense = numpy.zeros((10, 20))
+        lil = csr.to_lil()
+        for rk, ranks, w in zip(lil.post_rank, lil.pre_rank, lil.w):
+            self.assertEqual(list(ranks), sorted(ranks))
+            dense[rk, list(ranks)] = list(w)
+        numpy.testing.assert_allclose(dense, weights.toarray())
+
+    def test_delays(self):
+        """
+        Delays become non-uniform when a block has a different delay.
+        """
+        dt = Global.config['dt']
+        proj = Projection(self.pop1, self.pop2, "exc")
+        proj.connect_from_chunks([
+            ([0, 0], [1, 2], 0.5),
+            ([3], [4], 0.5, [3.0 * dt]),
+        ], delays=2.0 * dt)
+        csr = proj._connection_method(*((proj.pre, proj.post,) + proj._connection_args))
+
+        self.assertEqual(csr.uniform_delay, -1)
+        self.assertEqual(list(csr.delays), [2, 2, 3])
+        self.assertEqual(csr.max_delay, 3)
+        self.assertEqual(proj.uniform_delay, -1)
+
+class test_ConnectivityMemory(unittest.TestCase):
+    """
+    The generated projections are initialized from the arrays of the
+    CSRConnectivity without copying the weights or the column indices into
+    nested vectors, i. e. the peak memory of the compilation is given by these
+    arrays and the storage format itself.
+    """
+    # post-synaptic neurons are connected to all pre-synaptic ones
+    size = 2000
+
+    code = """
+import resource
+import numpy
+from ANNarchy import Neuron, Population, Projection, Uniform, setup, compile
+
+setup(num_threads=%(num_threads)s)
+pre = Population(%(size)s, Neuron(parameters="r = 0.0"))
+post = Population(%(size)s, Neuron(equations="r = sum(exc)"))
+proj = Projection(pre, post, "exc")
+%(connect)s
+
+before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+compile(silent=True)
+after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(proj.nb_synapses, (after - before) * 1024)
+"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.directory, True)
+
+    def peak_memory(self, connect):
+        """
+        Compiles the network in a separate process and returns the number of
+        synapses and the increase of its peak memory (in bytes).
+        """
+        code = self.code % {
+            'num_threads': Global.config['num_threads'],
+            'size': self.size,
+            'connect': connect,
+        }
+        out = subprocess.check_output([sys.executable, '-c', code], cwd=self.directory).decode()
+        nb_synapses, peak = out.strip().splitlines()[-1].split(' ')
+        return int(nb_synapses), int(peak)
+
+    def check(self, connect, lazy):
+        nb_synapses, peak = self.peak_memory(connect)
+        self.assertEqual(nb_synapses, self.size * self.size)
+
+        # column index (at most an int) and weight (double) of each synapse
+        # in the projection, the pre-defined patterns (lazy) additionally
+        # create the CSRConnectivity during compile()
+        arrays = nb_synapses * (4 + 8)
+        if lazy:
+            arrays *= 2
+        self.assertLess(peak, arrays + 8 * 1024 * 1024)
+
+    def test_pattern(self):
+        """
+        Pre-defined pattern stored as LIL.
+        """
+        self.check('proj.connect_all_to_all(weights=Uniform(0.0, 1.0), storage_format="lil")', lazy=True)
+
+    def test_chunks(self):
+        """
+        connect_from_chunks() stored as CSR.
+        """
+        self.check("""
+def blocks():
+    ranks = numpy.arange(%(size)s)
+    for post_rank in range(0, %(size)s, 100):
+        rows = numpy.repeat(numpy.arange(post_rank, post_rank + 100), %(size)s)
+        yield rows, numpy.tile(ranks, 100), numpy.random.uniform(0.0, 1.0, rows.size)
+proj.connect_from_chunks(blocks(), nb_synapses=%(size)s * %(size)s, storage_format="csr")""" % {'size': self.size}, lazy=False)
+
+@unittest.skipIf(Global.config['num_threads'] > 1, "the C++ connectors are only available for a single thread")
+class test_CppConnectors(unittest.TestCase):
+    """
+    With setup(use_cpp_connectors=True), the pre-defined patterns are
+    generated in C++ for the LIL, CSR and dense formats. The resulting
+    projections have the same number of synapses as the ones generated by the
+    Cython implementation, the distance-based patterns the same synapses.
+    """
+    # synapse type, storage format and storage order
+    configurations = [
+        ("rate", "lil", "post_to_pre"),
+        ("rate", "csr", "post_to_pre"),
+        ("rate", "dense", "post_to_pre"),
+        ("spike", "lil", "post_to_pre"),
+        ("spike", "csr", "post_to_pre"),
+        ("spike", "csr", "pre_to_post"),
+    ]
+
+    # fixed_number_pre has no C++ implementation for dense
+    no_dense_connector = ["fixed_number_pre"]
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Compile the same projections with and without use_cpp_connectors.
+        """
+        patterns = {
+            'fixed_probability': lambda proj, fmt, order: proj.connect_fixed_probability(0.3, weights=0.5, storage_format=fmt, storage_order=order),
+            'fixed_number_pre': lambda proj, fmt, order: proj.connect_fixed_number_pre(10, weights=0.5, storage_format=fmt, storage_order=order),
+            'fixed_number_post': lambda proj, fmt, order: proj.connect_fixed_number_post(5, weights=0.5, storage_format=fmt, storage_order=order),
+            'all_to_all': lambda proj, fmt, order: proj.connect_all_to_all(weights=0.5, storage_format=fmt, storage_order=order),
+            'one_to_one': lambda proj, fmt, order: proj.connect_one_to_one(weights=0.5, storage_format=fmt, storage_order=order),
+        }
+
+        pre = Population(40, Neuron(parameters="r = 0.0"))
+        post = Population(40, Neuron(equations="r = sum(exc)"))
+
+        spike_neuron = Neuron(equations="v = g_exc", spike="v > 1000.0")
+        spike_pre = Population(40, spike_neuron)
+        spike_post = Population(40, spike_neuron)
+        spike_synapse = Synapse(pre_spike="g_target += w")
+
+        cls.projections = {}
+        for config in cls.configurations:
+            syn_type, fmt, order = config
+            for method, connect in patterns.items():
+                if syn_type == "rate":
+                    proj = Projection(pre, post, "exc")
+                else:
+                    proj = Projection(spike_pre, spike_post, "exc", synapse=spike_synapse)
+                connect(proj, fmt, order)
+                cls.projections[(config, method)] = proj
+
+        # distance-based patterns between 2D populations, always post_to_pre.
+        # The dog projection is recurrent, without self-connections.
+        distance_patterns = {
+            'gaussian': lambda proj, fmt: proj.connect_gaussian(amp=1.0, sigma=0.3, storage_format=fmt),
+            'dog': lambda proj, fmt: proj.connect_dog(amp_pos=1.0, sigma_pos=0.2, amp_neg=0.4, sigma_neg=0.5, storage_format=fmt),
+        }
+        grids = {
+            'rate': (Population((8, 8), Neuron(parameters="r = 0.0")), Population((6, 6), Neuron(equations="r = sum(exc)"))),
+            'spike': (Population((8, 8), spike_neuron), Population((6, 6), spike_neuron)),
+        }
+
+        for config in cls.configurations:
+            syn_type, fmt, order = config
+            if order != "post_to_pre":
+                continue
+            grid_pre, grid_post = grids[syn_type]
+            for method, connect in distance_patterns.items():
+                source = grid_pre if method == "gaussian" else grid_post
+                if syn_type == "rate":
+                    proj = Projection(source, grid_post, "exc")
+                else:
+                    proj = Projection(source, grid_post, "exc", synapse=spike_synapse)
+                connect(proj, fmt)
+                cls.projections[(config, method)] = proj
+
+        # delays in steps: constant or drawn from a uniform distribution
+        cls.uniform_delay = Projection(pre, post, "exc")
+        cls.uniform_delay.connect_all_to_all(weights=0.5, delays=3.0, storage_format="csr")
+        cls.random_delay = Projection(pre, post, "exc")
+        cls.random_delay.connect_all_to_all(weights=Uniform(0.0, 1.0), delays=Uniform(1.0, 5.0), storage_format="lil")
+
+        objects = [pre, post, spike_pre, spike_post] + [pop for pops in grids.values() for pop in pops]
+        objects += [cls.uniform_delay, cls.random_delay] + list(cls.projections.values())
+        use_cpp_connectors = Global.config['use_cpp_connectors']
+        try:
+            setup(use_cpp_connectors=True)
+            cls.cpp_net = Network()
+            cls.cpp_net.add(objects)
+            cls.cpp_net.compile(silent=True)
+
+            setup(use_cpp_connectors=False)
+            cls.cython_net = Network()
+            cls.cython_net.add(objects)
+            cls.cython_net.compile(silent=True)
+        finally:
+            setup(use_cpp_connectors=use_cpp_connectors)
+
+    def compare(self, method, expected):
+        """
+        The wrappers of the C++ network export the connector (if it exists for
+        the format), both networks have the expected number of synapses.
+
+        Returns the dendrite sizes and pre-synaptic ranks of both networks.
+        """
+        connectivity = []
+        for config in self.configurations:
+            if (config, method) not in self.projections:
+                continue
+            cpp_proj = self.cpp_net.get(self.projections[(config, method)])
+            cython_proj = self.cython_net.get(self.projections[(config, method)])
+
+            has_cpp_connector = not (config[1] == "dense" and method in self.no_dense_connector)
+            self.assertEqual(hasattr(cpp_proj.cyInstance, method), has_cpp_connector)
+            self.assertFalse(hasattr(cython_proj.cyInstance, method))
+
+            for proj in [cpp_proj, cython_proj]:
+                if isinstance(expected, tuple):
+                    self.assertGreaterEqual(proj.nb_synapses, expected[0])
+                    self.assertLessEqual(proj.nb_synapses, expected[1])
+                else:
+                    self.assertEqual(proj.nb_synapses, expected)
+                self.assertEqual(sum(proj.nb_synapses_per_dendrite()), proj.nb_synapses)
+                numpy.testing.assert_allclose(numpy.hstack(proj.w) if isinstance(proj.w, list) else proj.w, 0.5)
+                connectivity.append((proj.nb_synapses_per_dendrite(), [rk for d in proj.dendrites for rk in d.pre_ranks]))
+
+        return connectivity
+
+    def test_fixed_probability(self):
+        """
+        p = 0.3 of 1600 possible synapses, within 5 standard deviations.
+        """
+        self.compare('fixed_probability', (480 - 92, 480 + 92))
+
+    def test_fixed_number_pre(self):
+        """
+        10 synapses per post-synaptic neuron.
+        """
+        for sizes, _ in self.compare('fixed_number_pre', 400):
+            self.assertEqual(list(sizes), [10] * 40)
+
+    def test_fixed_number_post(self):
+        """
+        5 synapses per pre-synaptic neuron.
+        """
+        for _, pre_ranks in self.compare('fixed_number_post', 200):
+            self.assertEqual(list(numpy.bincount(pre_ranks, minlength=40)), [5] * 40)
+
+    def test_all_to_all(self):
+        """
+        All pairs of neurons are connected.
+        """
+        self.compare('all_to_all', 1600)
+
+    def test_one_to_one(self):
+        """
+        Each post-synaptic neuron receives the neuron of the same rank.
+        """
+        for _, pre_ranks in self.compare('one_to_one', 40):
+            self.assertEqual(pre_ranks, list(range(40)))
+
+    def compare_distance(self, method):
+        """
+        The C++ and the Cython construction of a distance-based pattern create
+        the same synapses and weights.
+        """
+        for config in self.configurations:
+            if (config, method) not in self.projections:
+                continue
+            cpp_proj = self.cpp_net.get(self.projections[(config, method)])
+            cython_proj = self.cython_net.get(self.projections[(config, method)])
+
+            self.assertTrue(hasattr(cpp_proj.cyInstance, method))
+            self.assertFalse(hasattr(cython_proj.cyInstance, method))
+
+            self.assertGreater(cython_proj.nb_synapses, 0)
+            self.assertEqual(cpp_proj.nb_synapses, cython_proj.nb_synapses)
+            self.assertEqual(cpp_proj.post_ranks, cython_proj.post_ranks)
+            for cpp_dendrite, cython_dendrite in zip(cpp_proj.dendrites, cython_proj.dendrites):
+                self.assertEqual(cpp_dendrite.pre_ranks, cython_dendrite.pre_ranks)
+                numpy.testing.assert_allclose(cpp_dendrite.w, cython_dendrite.w)
+
+    def test_gaussian(self):
+        """
+        Gaussian pattern between an 8x8 and a 6x6 population.
+        """
+        self.compare_distance('gaussian')
+
+    def test_dog(self):
+        """
+        Recurrent difference-of-gaussians pattern, without self-connections.
+        """
+        self.compare_distance('dog')
+        for config in self.configurations:
+            if (config, 'dog') in self.projections:
+                for dendrite in self.cpp_net.get(self.projections[(config, 'dog')]).dendrites:
+                    self.assertNotIn(dendrite.post_rank, dendrite.pre_ranks)
+
+    def test_delays(self):
+        """
+        The delays are passed in steps, the drawn ones are integral numbers
+        of steps within the range of the distribution. The weights are drawn
+        in C++.
+        """
+        proj = self.cpp_net.get(self.uniform_delay)
+        self.assertTrue(hasattr(proj.cyInstance, 'all_to_all'))
+        self.assertEqual(proj.cyInstance.get_delay(), round(3.0 / Global.config['dt']))
+
+        proj = self.cpp_net.get(self.random_delay)
+        self.assertTrue(hasattr(proj.cyInstance, 'all_to_all'))
+        delays = numpy.concatenate(proj.delay)
+        self.assertEqual(delays.size, 1600)
+        self.assertGreaterEqual(delays.min(), 1.0)
+        self.assertLessEqual(delays.max(), 5.0)
+        numpy.testing.assert_allclose(delays, numpy.round(delays / Global.config['dt']) * Global.config['dt'])
+        self.assertGreater(len(numpy.unique(delays)), 1)
+
+        weights = numpy.concatenate(proj.w)
+        self.assertGreaterEqual(weights.min(), 0.0)
+        self.assertLessEqual(weights.max(), 1.0)
+
+class test_MatrixMarket(unittest.TestCase):
+    """
+    connect_from_matrix_market() parses sparse files in parallel into a
+    CSRConnectivity.
+    """
+    @classmethod
+    def setUpClass(cls):
+        neuron = Neuron(equations="r = 0.0")
+        cls.pop1 = Population(20, neuron)
+        cls.pop2 = Population(10, neuron)
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        for fname in os.listdir(self.directory):
+            os.remove(os.path.join(self.directory, fname))
+        os.rmdir(self.directory)
+
+    def load(self, content, pre, post, num_threads):
+        filename = os.path.join(self.directory, 'proj.mtx')
+        with open(filename, 'w') as wfile:
+            wfile.write(content)
+
+        Global.config['connectivity_threads'] = num_threads
+        try:
+            proj = Projection(pre, post, "exc")
+            proj.connect_from_matrix_market(filename)
+        finally:
+            Global.config['connectivity_threads'] = None
+        return proj._connection_method(*((proj.pre, proj.post,) + proj._connection_args))
+
+    def test_coordinate(self):
+        """
+        Unsorted entries, comments and empty rows give the same result for any number of threads.
+        """
+        content = "%%MatrixMarket matrix coordinate real general\n% comment\n4 5 5\n3 5 0.5\n1 2 -1e-1\n\n3 1 2.5\n1 1 1\n% comment\n4 3 +3"
+        for num_threads in [1, 3, 8]:
+            csr = self.load(content, self.pop1, self.pop2, num_threads)
+            self.assertEqual(list(csr.post_rank), [0, 2, 3])
+            self.assertEqual(list(csr.row_ptr), [0, 2, 4, 5])
+            self.assertEqual(list(csr.col_idx), [0, 1, 0, 4, 2])
+            numpy.testing.assert_allclose(csr.values, [1.0, -0.1, 2.5, 0.5, 3.0])
+            self.assertEqual(csr.uniform_delay, 0)
+
+    def test_symmetric_views(self):
+        """
+        The lower triangle of symmetric patterns is mirrored, the indices are ranks of the PopulationViews.
+        """
+        content = "%%MatrixMarket matrix coordinate pattern symmetric\n3 3 3\n1 1\n3 1\n3 2\n"
+        csr = self.load(content, self.pop1[[7, 3, 5]], self.pop2[[2, 4, 6]], 2)
+        self.assertEqual(list(csr.post_rank), [2, 4, 6])
+        self.assertEqual(list(csr.row_ptr), [0, 2, 3, 5])
+        self.assertEqual(list(csr.col_idx), [5, 7, 5, 3, 7])
+        numpy.testing.assert_allclose(csr.values, [1.0] * 5)
+
+class test_Validation(unittest.TestCase):
+    """
+    validate() sorts the rows in place and returns a report of the duplicated
+    synapses and the ranks outside of the populations.
+    """
+    def test_lil(self):
+        """
+        Rows of the same post-synaptic neuron are merged, weights and delays follow the sorted ranks.
+        """
+        dt = Global.config['dt']
+        lil = LILConnectivity()
+        lil.push_back(3, [4, 1, 2], [0.4, 0.1, 0.2], [4 * dt, 1 * dt, 2 * dt])
+        lil.push_back(0, [5], [0.5], [dt])
+        lil.push_back(3, [0], [0.7], [dt])
+
+        report = lil.validate(list(range(10)), list(range(5)))
+        self.assertTrue(report['valid'])
+        self.assertEqual(report['duplicate_rows'], 1)
+        self.assertEqual(list(lil.post_rank), [0, 3])
+        self.assertEqual([list(r) for r in lil.pre_rank], [[5], [0, 1, 2, 4]])
+        numpy.testing.assert_allclose(lil.w[1], [0.7, 0.1, 0.2, 0.4])
+        self.assertEqual(list(lil.delay[1]), [1, 1, 2, 4])
+
+    def test_errors(self):
+        """
+        Duplicated synapses and invalid ranks are counted, the faulty rows are reported.
+        """
+        lil = LILConnectivity()
+        lil.push_back(1, [2, 2, 3], [0.5], [0.0])
+        lil.push_back(2, [0, 12], [0.5], [0.0])
+        lil.push_back(7, [1], [0.5], [0.0])
+
+        report = lil.validate(list(range(10)), list(range(5)))
+        self.assertFalse(report['valid'])
+        self.assertEqual(report['duplicate_synapses'], 1)
+        self.assertEqual(report['invalid_pre_ranks'], 1)
+        self.assertEqual(report['invalid_post_ranks'], 1)
+        self.assertEqual(report['faulty_rows'], [1, 2, 7])
+
+        csr = CSRConnectivity()
+        csr.push_back(1, [2, 0], [0.5], [0.0])
+        csr.push_back(1, [3], [0.5], [0.0])
+        report = csr.validate()
+        self.assertFalse(report['valid'])
+        self.assertEqual(report['duplicate_rows'], 1)
+        self.assertEqual(list(csr.col_idx), [0, 2, 3])
+
+class test_BinaryConnectivity(unittest.TestCase):
+    """
+    Files in the binary connectivity format (.ann) are loaded by
+    connect_from_file() into a CSRConnectivity.
+    """
+    @classmethod
+    def setUpClass(cls):
+        neuron = Neuron(equations="r = 0.0")
+        cls.pop1 = Population(20, neuron)
+        cls.pop2 = Population(10, neuron)
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        for fname in os.listdir(self.directory):
+            os.remove(os.path.join(self.directory, fname))
+        os.rmdir(self.directory)
+
+    def load(self, data):
+        from ANNarchy.core.IO import _save_connectivity_binary
+        filename = os.path.join(self.directory, 'proj.ann')
+        _save_connectivity_binary(filename, data)
+
+        proj = Projection(self.pop1, self.pop2, "exc")
+        proj.connect_from_file(filename)
+        return proj, proj._connection_method(*((proj.pre, proj.post,) + proj._connection_args))
+
+    def test_nonuniform_delays(self):
+        """
+        Ranks, weights and delays (in steps) of each synapse.
+        """
+        proj, csr = self.load({
+            'post_ranks': [1, 4], 'row_ptr': [0, 2, 5], 'col_idx': [0, 3, 2, 7, 19],
+            'w': [0.1, 0.2, 0.3, 0.4, 0.5], 'delay': [1, 2, 3, 4, 5],
+            'max_delay': 5, 'uniform_delay': -1, 'dt': Global.config['dt']
+        })
+        self.assertEqual(list(csr.post_rank), [1, 4])
+        self.assertEqual(list(csr.row_ptr), [0, 2, 5])
+        self.assertEqual(list(csr.col_idx), [0, 3, 2, 7, 19])
+        numpy.testing.assert_allclose(csr.values, [0.1, 0.2, 0.3, 0.4, 0.5])
+        self.assertEqual(list(csr.delays), [1, 2, 3, 4, 5])
+        self.assertEqual(proj.max_delay, 5)
+        self.assertEqual(proj.uniform_delay, -1)
+
+    def test_single_weight(self):
+        """
+        A single weight and a uniform delay, saved with a different dt.
+        """
+        proj, csr = self.load({
+            'post_ranks': [0], 'row_ptr': [0, 3], 'col_idx': [1, 2, 3],
+            'w': [0.5], 'delay': [],
+            'max_delay': 2, 'uniform_delay': 2, 'dt': 2.0 * Global.config['dt']
+        })
+        numpy.testing.assert_allclose(csr.values, 0.5)
+        self.assertTrue(proj._single_constant_weight)
+        self.assertEqual(csr.uniform_delay, 4)
+        self.assertEqual(proj.uniform_delay, 4)
+
+class test_ConnectivityCache(unittest.TestCase):
+    """
+    The connectivity generated by the pre-defined patterns is stored in and
+    re-used from the connectivity cache.
+    """
+    @classmethod
+    def setUpClass(cls):
+        neuron = Neuron(equations="r = 0.0")
+        cls.pop1 = Population(50, neuron)
+        cls.pop2 = Population(40, neuron)
+
+    def setUp(self):
+        from ANNarchy.core.ConnectivityCache import ConnectivityCache
+        self.directory = tempfile.mkdtemp()
+        self.cache = ConnectivityCache({'cache': {'path': self.directory}})
+        self.seed = Global.config['seed']
+        Global.config['seed'] = 42
+
+    def tearDown(self):
+        import shutil
+        Global.config['seed'] = self.seed
+        shutil.rmtree(self.directory, True)
+
+    def generate(self, delays=0.0):
+        proj = Projection(self.pop1, self.pop2, "exc")
+        proj.connect_fixed_probability(0.2, weights=Uniform(0.0, 1.0), delays=delays)
+        return self.cache.generate(proj)
+
+    def test_hit(self):
+        """
+        A second generation from the same random state is loaded from the cache
+        and leaves the random generator in the same state as the generation.
+        """
+        numpy.random.seed(1)
+        csr = self.generate(delays=Uniform(1.0, 5.0))
+        after = numpy.random.get_state()[1].copy()
+        self.assertEqual(len(os.listdir(os.path.join(self.directory, 'connectivity'))), 2)
+
+        numpy.random.seed(1)
+        cached = self.generate(delays=Uniform(1.0, 5.0))
+        numpy.testing.assert_array_equal(numpy.random.get_state()[1], after)
+
+        self.assertEqual(list(cached.post_rank), list(csr.post_rank))
+        self.assertEqual(list(cached.row_ptr), list(csr.row_ptr))
+        self.assertEqual(list(cached.col_idx), list(csr.col_idx))
+        numpy.testing.assert_array_equal(cached.values, csr.values)
+        self.assertEqual(list(cached.delays), list(csr.delays))
+        self.assertEqual(cached.max_delay, csr.max_delay)
+        self.assertEqual(cached.nb_synapses, csr.nb_synapses)
+
+    def test_miss(self):
+        """
+        A different random state or different arguments create new entries.
+        """
+        numpy.random.seed(1)
+        self.generate()
+        numpy.random.seed(2)
+        self.generate()
+        numpy.random.seed(2)
+        self.generate(delays=2.0)
+        self.assertEqual(len(os.listdir(os.path.join(self.directory, 'connectivity'))), 6)
+
+    def test_eviction(self):
+        """
+        The least recently used entries are removed if the size limit is exceeded.
+        """
+        numpy.random.seed(1)
+        self.generate()
+        size = self.cache.size_in_bytes()
+
+        self.cache.max_size = 2.5 * size
+        numpy.random.seed(2)
+        self.generate()
+        # the first entry was used a long time ago
+        for fname in os.listdir(os.path.join(self.directory, 'connectivity')):
+            os.utime(os.path.join(self.directory, 'connectivity', fname), (0, 0))
+        numpy.random.seed(1)
+        self.generate()
+        numpy.random.seed(3)
+        self.generate()
+
+        names = os.listdir(os.path.join(self.directory, 'connectivity'))
+        self.assertEqual(len(names), 4)
+        self.assertLessEqual(self.cache.size_in_bytes(), self.cache.max_size)
+
+        # the entry of seed 2 was evicted, not the re-used one of seed 1
+        numpy.random.seed(1)
+        key = self.cache.compute_key(Projection(self.pop1, self.pop2, "exc").connect_fixed_probability(0.2, weights=Uniform(0.0, 1.0), delays=0.0))
+        self.assertIn(key + '.ann', names)
+
+class test_ConnectivityStatistics(unittest.TestCase):
+    """
+    storage_format="auto" estimates the density and the average row length
+    without generating the connectivity.
+    """
+    @classmethod
+    def setUpClass(cls):
+        neuron = Neuron(equations="r = 0.0")
+        cls.pop1 = Population((20, 20), neuron)
+        cls.pop2 = Population((10, 10), neuron)
+
+    def compare(self, proj, places):
+        density, avg_nnz_per_row = proj._connectivity_statistics()
+        self.assertFalse(proj._lil_connectivity)
+
+        numpy.random.seed(1)
+        synapses = proj._connection_method(*((proj.pre, proj.post,) + proj._connection_args))
+        self.assertAlmostEqual(density, synapses.nb_synapses / float(proj.pre.size * proj.post.size), places=places)
+        self.assertAlmostEqual(avg_nnz_per_row / float(proj.pre.size), synapses.compute_average_row_length()[0] / float(proj.pre.size), places=places)
+
+    def test_random(self):
+        """
+        Expected values of the random patterns.
+        """
+        self.compare(Projection(self.pop1, self.pop2, "exc").connect_fixed_probability(0.1, 1.0, storage_format="auto"), 2)
+        self.compare(Projection(self.pop1, self.pop2, "exc").connect_fixed_number_pre(20, 1.0, storage_format="auto"), 7)
+        self.compare(Projection(self.pop1, self.pop2, "exc").connect_fixed_number_post(5, 1.0, storage_format="auto"), 7)
+
+    def test_distance_based(self):
+        """
+        Sampled rows of the distance-based patterns (all rows for small populations).
+        """
+        self.compare(Projection(self.pop1, self.pop2, "exc").connect_gaussian(1.0, 0.2, storage_format="auto"), 7)
+        self.compare(Projection(self.pop1, self.pop2, "exc").connect_dog(1.0, 0.2, 0.5, 0.5, storage_format="auto"), 7)
@@ -21,10 +21,13 @@
     along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 """
+import os
 import numpy
 from scipy import sparse
 
 from ANNarchy import Neuron, Synapse, Population, Projection, Network
+from ANNarchy.core import Global
+from ANNarchy.generator.Utils import check_avx_instructions
 
 class test_Projection():
     """
@@ -154,3 +157,83 @@ class test_Projection():
         neurons recieving synapses.
         """
         self.assertEqual(self.net_proj.post_ranks, [1, 3])
+
+class test_StoragePrecision():
+    """
+    Tests a projection storing its weights with reduced precision
+    (*storage_precision* argument of *Projection*). The weighted sum
+    should still be computed in the precision of the network.
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Compile the network for this test
+        """
+        input_neuron = Neuron(
+            parameters = "r=0.0"
+        )
+
+        output_neuron = Neuron(
+            equations = "r = sum(exc)"
+        )
+
+        # the rows are long enough to be processed by the SIMD kernels
+        pop1 = Population((40), neuron=input_neuron)
+        pop2 = Population((4), neuron=output_neuron)
+
+        proj = Projection(
+            pre = pop1,
+            post = pop2,
+            target = "exc",
+            storage_precision = "float32"
+        )
+        cls.weights = numpy.linspace(0.1, 0.8, 160).reshape((4, 40))
+        proj.connect_from_matrix(cls.weights,
+                                 storage_format=cls.storage_format,
+                                 storage_order=cls.storage_order)
+
+        cls.test_net = Network()
+        cls.test_net.add([pop1, pop2, proj])
+        cls.test_net.compile(silent=True)
+
+        cls.net_pop1 = cls.test_net.get(pop1)
+        cls.net_pop2 = cls.test_net.get(pop2)
+        cls.net_proj = cls.test_net.get(proj)
+
+    def setUp(self):
+        """
+        In our *setUp()* function we reset the network before every test.
+        """
+        self.test_net.reset()
+
+    def test_get_w(self):
+        """
+        The weights are returned with single precision.
+        """
+        self.assertEqual(self.net_proj._get_attribute_cpp_type("w"), "float")
+        numpy.testing.assert_allclose(self.net_proj.connectivity_matrix(),
+                                      self.weights, rtol=1e-6)
+
+    def test_transmission(self):
+        """
+        The weighted sum uses the stored weights.
+        """
+        r = numpy.linspace(0.0, 1.0, 40)
+        self.net_pop1.r = r
+        self.test_net.simulate(2)
+
+        expected = self.weights.astype(numpy.float32).dot(r)
+        numpy.testing.assert_allclose(self.net_pop2.r, expected, rtol=1e-6)
+
+    def test_vectorized_kernel(self):
+        """
+        With SIMD support, the weights are converted to double precision inside
+        the vectorized kernel instead of falling back to the scalar loop.
+        """
+        if Global.config['precision'] != "double" or not check_avx_instructions("avx"):
+            self.skipTest("requires AVX and a network in double precision")
+
+        source = os.path.abspath('annarchy') + '/generate/net' + str(self.test_net.id) + '/proj' + str(self.net_proj.id) + '.cpp'
+        with open(source, 'r') as rfile:
+            code = rfile.read()
+        self.assertIn('cvtps_pd(', code)
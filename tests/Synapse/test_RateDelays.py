@@ -25,6 +25,7 @@
 """
 import numpy
 
+from ANNarchy.core import Global
 from ANNarchy import clear, DiscreteUniform, Network, Neuron, Population, \
     Projection, Synapse, Uniform
 
@@ -308,6 +309,107 @@ class test_UniformDelay():
         self.test_net.simulate(4)
         numpy.testing.assert_allclose(self.net_pop2.sum("ff_glob"), 9.0)
 
+class test_DelayedVariableStorage():
+    """
+    Delayed local variables are stored in a RingBuffer, delayed global
+    variables in a std::deque. The same sequence is stored both as local (r)
+    and as global variable (glob_r), so both projections have to transmit the
+    same values in each step, also when the buffer wraps around, is resized
+    by a larger delay or is refilled by reset().
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Compile the network for this test, the maximal delay is 3 steps.
+        """
+        input_neuron = Neuron(
+            equations="""
+                glob_r = glob_r + t : init = -1, population
+                r = r + t : init = -1
+            """
+        )
+
+        neuron2 = Neuron(
+            equations="""
+                r = sum(ff)
+            """
+        )
+
+        synapse_glob = Synapse(psp="pre.glob_r * w")
+
+        pop1 = Population((3), input_neuron)
+        pop2 = Population((3), neuron2)
+
+        proj = Projection(pre=pop1, post=pop2, target="ff")
+        proj.connect_one_to_one(weights=1.0, delays=3.0,
+                                storage_format=cls.storage_format,
+                                storage_order=cls.storage_order)
+
+        proj2 = Projection(pre=pop1, post=pop2, target="ff_glob",
+                           synapse=synapse_glob)
+        proj2.connect_one_to_one(weights=1.0, delays=3.0,
+                                 storage_format=cls.storage_format,
+                                 storage_order=cls.storage_order)
+
+        cls.test_net = Network()
+        cls.test_net.add([pop1, pop2, proj, proj2])
+        cls.test_net.compile(silent=True)
+
+        cls.net_proj = cls.test_net.get(proj)
+        cls.net_proj2 = cls.test_net.get(proj2)
+        cls.net_pop2 = cls.test_net.get(pop2)
+
+    def setUp(self):
+        """
+        Reset the network and the delays after every test.
+        """
+        self.test_net.reset()
+        self.net_proj.delay = 3.0
+        self.net_proj2.delay = 3.0
+
+    def compare(self, steps):
+        """
+        Simulates step by step, the local and global values are identical.
+        Returns the transmitted values.
+        """
+        values = []
+        for _ in range(steps):
+            self.test_net.simulate(1)
+            numpy.testing.assert_allclose(self.net_pop2.sum("ff"), self.net_pop2.sum("ff_glob"))
+            values.append(self.net_pop2.sum("ff")[0])
+        return values
+
+    def test_wrap_around(self):
+        """
+        The buffer of 3 steps wraps around several times.
+        """
+        values = self.compare(30)
+        # r_t = [-1, 0, 2, 5, 9, ...] received 3 steps later
+        self.assertEqual(values[:6], [-1.0, -1.0, -1.0, -1.0, 0.0, 2.0])
+
+    def test_resize(self):
+        """
+        A delay larger than the maximal delay resizes the buffers, the stored
+        steps are kept.
+        """
+        self.compare(10)
+        self.net_proj.delay = 7.0
+        self.net_proj2.delay = 7.0
+        values = self.compare(20)
+        # only the last 3 steps (t = 7, 8, 9) were stored before the resize,
+        # the older ones (t = 3, ..., 6) are received as 0
+        self.assertEqual(values[:5], [0.0, 0.0, 0.0, 0.0, 27.0])
+        self.assertEqual(values[-1], -1.0 + sum(range(23)))
+
+    def test_reset(self):
+        """
+        reset() refills the buffer with the initial value.
+        """
+        self.compare(10)
+        self.test_net.reset()
+        values = self.compare(10)
+        self.assertEqual(values[:4], [-1.0, -1.0, -1.0, -1.0])
+
 class test_NonuniformDelay():
     """
     One major function for rate-coded neurons is the computation of continuous
@@ -387,6 +489,80 @@ class test_NonuniformDelay():
         # should access (t-3)th element
         numpy.testing.assert_allclose(self.net_pop2.sum("ff"), [20.0, 20.0, 20.0])
 
+    def test_exceeding_delay_type(self):
+        """
+        The delays are stored in the smallest type suitable for the maximal
+        delay at compile() (here 1 byte), larger values are rejected.
+        """
+        from ANNarchy.core.Global import ANNarchyException
+        with self.assertRaises(ANNarchyException):
+            self.net_proj.delay = [[300.0], [3.0], [3.0]]
+
+        # the previous delays are kept
+        numpy.testing.assert_allclose(self.net_proj.delay, [[3.0], [5.0], [2.0]])
+
+class test_IntDelayType():
+    """
+    If only_int_delay_type is set, the non-uniform delays are stored as
+    integers and can be increased after compile() beyond the range of the
+    compact type.
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Compile the network for this test.
+        """
+        input_neuron = Neuron(
+            equations="""
+                r = r + t : init = -1
+            """
+        )
+
+        neuron2 = Neuron(
+            equations="""
+                r = sum(ff)
+            """
+        )
+
+        pop1 = Population((3), input_neuron)
+        pop2 = Population((3), neuron2)
+
+        proj = Projection(pop1, pop2, target="ff")
+        proj.connect_one_to_one(weights=1.0, delays=DiscreteUniform(1, 5),
+                                storage_format=cls.storage_format,
+                                storage_order=cls.storage_order)
+
+        prev_delay_type = Global.config['only_int_delay_type']
+        try:
+            Global.config['only_int_delay_type'] = True
+
+            cls.test_net = Network()
+            cls.test_net.add([pop1, pop2, proj])
+            cls.test_net.compile(silent=True)
+        finally:
+            Global.config['only_int_delay_type'] = prev_delay_type
+
+        cls.net_proj = cls.test_net.get(proj)
+        cls.net_pop2 = cls.test_net.get(pop2)
+
+    def setUp(self):
+        """
+        basic setUp() method to reset the network after every test
+        """
+        self.test_net.reset()
+        self.net_proj.delay = [[3], [5], [2]]
+
+    def test_exceeding_delay_type(self):
+        """
+        Delays beyond 255 steps can be set.
+        """
+        self.net_proj.delay = [[300.0], [3.0], [3.0]]
+        numpy.testing.assert_allclose(self.net_proj.delay, [[300.0], [3.0], [3.0]])
+
+        # run 10 ms, should access (t-3)th element for the last two neurons
+        self.test_net.simulate(10)
+        numpy.testing.assert_allclose(self.net_pop2.sum("ff")[1:], [20.0, 20.0])
+
 class test_SynapseOperations():
     """
     Next to the weighted sum across inputs we allow the application of global